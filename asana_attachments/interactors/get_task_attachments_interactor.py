@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Dict, Any, Union
 from asana_attachments.interactors.storage_interfaces.storage_interface import (
     StorageInterface
 )
@@ -9,6 +9,7 @@ from asana_attachments.constants.constants import (
     DEFAULT_OFFSET,
     DEFAULT_LIMIT,
 )
+from asana_backend.utils.pagination import build_next_page
 
 
 class GetTaskAttachmentsInteractor:
@@ -23,8 +24,9 @@ class GetTaskAttachmentsInteractor:
     def get_task_attachments(
         self,
         task_gid: str,
-        offset: int = DEFAULT_OFFSET,
-        limit: int = DEFAULT_LIMIT
+        offset: Union[int, str] = DEFAULT_OFFSET,
+        limit: int = DEFAULT_LIMIT,
+        request=None
     ) -> Dict[str, Any]:
         attachments = self.storage.get_task_attachments(
             task_gid=task_gid,
@@ -55,5 +57,10 @@ class GetTaskAttachmentsInteractor:
             for attachment in attachments
         ]
 
-        return self.presenter.get_attachments_response(attachments_list)
+        response = self.presenter.get_attachments_response(attachments_list)
 
+        next_page = build_next_page(request, attachments.next_offset)
+        if next_page:
+            response['next_page'] = next_page
+
+        return response
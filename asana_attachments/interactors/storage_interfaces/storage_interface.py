@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Union
 from asana_attachments.models.attachment import Attachment
 
 
@@ -12,7 +12,7 @@ class StorageInterface(ABC):
     def get_task_attachments(
         self,
         task_gid: str,
-        offset: int = 0,
+        offset: Union[int, str] = 0,
         limit: int = 50
     ) -> List[Attachment]:
         pass
@@ -1,8 +1,9 @@
-from typing import List, Optional
+from typing import List, Optional, Union
 from asana_attachments.models.attachment import Attachment
 from asana_attachments.interactors.storage_interfaces.storage_interface import (
     StorageInterface
 )
+from asana_backend.utils.pagination import paginate_queryset
 
 
 class StorageImplementation(StorageInterface):
@@ -15,12 +16,14 @@ class StorageImplementation(StorageInterface):
     def get_task_attachments(
         self,
         task_gid: str,
-        offset: int = 0,
+        offset: Union[int, str] = 0,
         limit: int = 50
     ) -> List[Attachment]:
-        return list(
-            Attachment.objects.filter(
-                task__gid=task_gid
-            ).order_by('-created_at')[offset:offset + limit]
+        # Newest first; gid breaks ties between rows created together
+        return paginate_queryset(
+            Attachment.objects.filter(task__gid=task_gid),
+            offset,
+            limit,
+            ordering=('-created_at', '-gid')
         )
 
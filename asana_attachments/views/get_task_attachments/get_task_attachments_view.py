@@ -1,3 +1,4 @@
+from django.core.exceptions import ValidationError
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -35,11 +36,17 @@ class GetTaskAttachmentsView(APIView):
             )
 
         # Validate and normalize pagination params
-        offset, limit = validate_pagination_params(
-            offset=request.query_params.get('offset'),
-            limit=request.query_params.get('limit'),
-            max_limit=MAX_LIMIT
-        )
+        try:
+            offset, limit = validate_pagination_params(
+                offset=request.query_params.get('offset'),
+                limit=request.query_params.get('limit'),
+                max_limit=MAX_LIMIT
+            )
+        except ValidationError as e:
+            return Response(
+                {'errors': [{'message': e.messages[0]}]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
 
         storage = StorageImplementation()
         presenter = GetTaskAttachmentsPresenterImplementation()
@@ -51,7 +58,8 @@ class GetTaskAttachmentsView(APIView):
         response = interactor.get_task_attachments(
             task_gid=task_gid,
             offset=offset,
-            limit=limit
+            limit=limit,
+            request=request
         )
         return Response(response, status=status.HTTP_200_OK)
 
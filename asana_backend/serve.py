@@ -0,0 +1,100 @@
+"""
+Production launcher.
+
+    python -m asana_backend.serve [--worker-class gthread] [--bind 0.0.0.0:8000]
+
+Runs the API under gunicorn with ``asana_backend.settings.prod`` (unless
+DJANGO_SETTINGS_MODULE says otherwise) and the tuning in gunicorn.conf.py.
+The sync and gthread workers serve the WSGI application; the uvicorn
+worker serves the ASGI one, with the async variants of the busiest reads
+(ASANA_ASYNC_VIEWS). Options not listed here can be set through
+the environment variables gunicorn.conf.py reads, and anything after
+``--`` is passed to gunicorn as is.
+
+Reload code and settings without dropping requests with
+``kill -HUP <master pid>``.
+"""
+import argparse
+import os
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+# worker class -> (gunicorn worker class, application)
+WORKER_CLASSES = {
+    'sync': ('sync', 'asana_backend.wsgi:application'),
+    'gthread': ('gthread', 'asana_backend.wsgi:application'),
+    'uvicorn': ('uvicorn_worker.UvicornWorker', 'asana_backend.asgi:application'),
+}
+# Environment defaults per worker class
+WORKER_ENVIRONMENT = {
+    'uvicorn': {'ASANA_ASYNC_VIEWS': 'true'},
+}
+DEFAULT_WORKER_CLASS = 'gthread'
+DEFAULT_THREADS = 4
+MAX_WORKERS = 16
+
+
+def default_workers(worker_class: str, cpu_count: Optional[int] = None) -> int:
+    """
+    Worker processes for ``worker_class`` on this machine. Sync workers
+    serve one request at a time, so they follow gunicorn's 2 * CPUs + 1;
+    gthread and uvicorn workers overlap requests themselves and need about
+    one process per CPU.
+    """
+    cpus = cpu_count or os.cpu_count() or 1
+    if worker_class == 'sync':
+        workers = 2 * cpus + 1
+    else:
+        workers = cpus + 1
+    return min(workers, MAX_WORKERS)
+
+
+def build_command(
+    worker_class: str,
+    bind: Optional[str] = None,
+    workers: Optional[int] = None,
+    extra_args: Optional[List[str]] = None
+) -> List[str]:
+    gunicorn_worker_class, application = WORKER_CLASSES[worker_class]
+    command = [
+        sys.executable, '-m', 'gunicorn',
+        '--config', str(BASE_DIR / 'gunicorn.conf.py'),
+        '--worker-class', gunicorn_worker_class,
+    ]
+    if bind:
+        command += ['--bind', bind]
+    if workers:
+        command += ['--workers', str(workers)]
+    return command + list(extra_args or []) + [application]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument(
+        '--worker-class',
+        choices=sorted(WORKER_CLASSES),
+        default=os.environ.get('ASANA_WORKER_CLASS', DEFAULT_WORKER_CLASS)
+    )
+    parser.add_argument('--bind', help="Address to listen on (default: 0.0.0.0:8000).")
+    parser.add_argument('--workers', type=int, help="Worker processes (default: from the CPU count).")
+    parser.add_argument('gunicorn_args', nargs=argparse.REMAINDER)
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'asana_backend.settings.prod')
+    os.environ['ASANA_WORKER_CLASS'] = args.worker_class
+    for name, value in WORKER_ENVIRONMENT.get(args.worker_class, {}).items():
+        os.environ.setdefault(name, value)
+    extra_args = args.gunicorn_args
+    if extra_args[:1] == ['--']:
+        extra_args = extra_args[1:]
+
+    command = build_command(args.worker_class, args.bind, args.workers, extra_args)
+    os.chdir(BASE_DIR)
+    os.execv(command[0], command)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,8 @@
 """
 Base settings for asana_backend project.
 """
+import copy
+import os
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
@@ -24,12 +26,17 @@ INSTALLED_APPS = [
     'asana_workspaces',
     'asana_users',
     'asana_projects',
+    'asana_sections',
     'asana_teams',
     'asana_tasks',
     'asana_stories',
     'asana_tags',
     'asana_attachments',
     'asana_webhooks',
+    'asana_batch_api',
+    'asana_jobs',
+    'asana_events',
+    'asana_typeahead',
 ]
 
 MIDDLEWARE = [
@@ -37,10 +44,14 @@ MIDDLEWARE = [
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
+    'django.middleware.http.ConditionalGetMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'asana_backend.utils.rate_limiting.middleware.ApiRateLimitMiddleware',
+    'asana_backend.utils.replica_routing.ReplicaRoutingMiddleware',
+    'asana_backend.utils.identity_map.IdentityMapMiddleware',
 ]
 
 ROOT_URLCONF = 'asana_backend.urls'
@@ -62,11 +73,104 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'asana_backend.wsgi.application'
 
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+# SQLite (db.sqlite3) unless ASANA_DB_ENGINE=postgres, which connects to
+# PostgreSQL with the ASANA_DB_* variables. SQLite lets one writer in at a
+# time across every worker; PostgreSQL serves writes concurrently.
+ASANA_DB_ENGINE = os.environ.get('ASANA_DB_ENGINE', 'sqlite')
+
+if ASANA_DB_ENGINE == 'postgres':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': os.environ.get('ASANA_DB_NAME', 'asana'),
+            'USER': os.environ.get('ASANA_DB_USER', 'asana'),
+            'PASSWORD': os.environ.get('ASANA_DB_PASSWORD', ''),
+            'HOST': os.environ.get('ASANA_DB_HOST', 'localhost'),
+            'PORT': os.environ.get('ASANA_DB_PORT', '5432'),
+            # Streamed pages (QuerySet.iterator()) read through server-side
+            # cursors; a pgbouncer in transaction mode cannot keep those
+            'DISABLE_SERVER_SIDE_CURSORS': os.environ.get(
+                'ASANA_DB_DISABLE_SERVER_SIDE_CURSORS', 'false'
+            ).lower() == 'true',
+            'OPTIONS': {},
+        }
+    }
+    # A psycopg connection pool per worker process, shared by its threads;
+    # ASANA_DB_POOL_MAX_SIZE=0 turns it off in favour of CONN_MAX_AGE
+    _pool_max_size = int(os.environ.get('ASANA_DB_POOL_MAX_SIZE', 10))
+    if _pool_max_size:
+        DATABASES['default']['OPTIONS']['pool'] = {
+            'min_size': min(2, _pool_max_size),
+            'max_size': _pool_max_size,
+            'timeout': float(os.environ.get('ASANA_DB_POOL_TIMEOUT', 10)),
+        }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': os.environ.get('ASANA_SQLITE_PATH', BASE_DIR / 'db.sqlite3'),
+            'OPTIONS': {},
+            # A file rather than Django's shared in-memory database, whose
+            # connections fail at once with "database table is locked"
+            # instead of queueing, so tests can run concurrent writers
+            'TEST': {'NAME': str(BASE_DIR / 'test_db.sqlite3')},
+        }
+    }
+
+# SQLite tuning, applied to every new connection unless
+# ASANA_SQLITE_TUNING=false. In WAL mode readers carry on while a write
+# commits, and synchronous=NORMAL then only risks the last commits on
+# power loss, never corruption. Writers queue for up to busy_timeout ms
+# instead of failing with "database is locked". cache_size is in KiB when
+# negative; cache and mmap_size are per connection.
+ASANA_SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': int(os.environ.get('ASANA_SQLITE_BUSY_TIMEOUT_MS', 5000)),
+    'cache_size': -int(os.environ.get('ASANA_SQLITE_CACHE_KIB', 64 * 1024)),
+    'mmap_size': int(os.environ.get('ASANA_SQLITE_MMAP_BYTES', 256 * 1024 * 1024)),
+    'temp_store': 'MEMORY',
+}
+if ASANA_DB_ENGINE != 'postgres' and os.environ.get(
+    'ASANA_SQLITE_TUNING', 'true'
+).lower() != 'false':
+    DATABASES['default']['OPTIONS'].update({
+        'init_command': ';'.join(
+            f'PRAGMA {name} = {value}'
+            for name, value in ASANA_SQLITE_PRAGMAS.items()
+        ),
+        # Take the write lock when a transaction begins. A transaction
+        # that reads and then writes would otherwise fail at once with
+        # "database is locked" when another writer got in between,
+        # without waiting out busy_timeout.
+        'transaction_mode': 'IMMEDIATE',
+    })
+
+# Read replicas: each path in ASANA_SQLITE_REPLICA_PATHS (each host in
+# ASANA_DB_REPLICA_HOSTS on PostgreSQL) is a replica_<n> database that
+# GET requests read the API's models from; a client that writes reads
+# from the primary for PIN_SECONDS afterwards. Replicas are kept in sync
+# outside Django. Tests read them through the primary.
+# See asana_backend.utils.replica_routing.
+_replicas = [
+    replica for replica in os.environ.get(
+        'ASANA_DB_REPLICA_HOSTS' if ASANA_DB_ENGINE == 'postgres'
+        else 'ASANA_SQLITE_REPLICA_PATHS',
+        ''
+    ).split(',') if replica
+]
+for _number, _replica in enumerate(_replicas, start=1):
+    DATABASES[f'replica_{_number}'] = {
+        **copy.deepcopy(DATABASES['default']),
+        'HOST' if ASANA_DB_ENGINE == 'postgres' else 'NAME': _replica,
+        'TEST': {'MIRROR': 'default'},
     }
+DATABASE_ROUTERS = ['asana_backend.utils.replica_routing.ReplicaRouter']
+ASANA_DB_ROUTING = {
+    'REPLICAS': [f'replica_{number}' for number in range(1, len(_replicas) + 1)],
+    'PIN_SECONDS': float(os.environ.get('ASANA_DB_REPLICA_PIN_SECONDS', 5)),
+    'PIN_CACHE': 'default',
+    'APPS': [app for app in INSTALLED_APPS if app.startswith('asana_')],
 }
 
 AUTH_PASSWORD_VALIDATORS = [
@@ -107,10 +211,11 @@ REST_FRAMEWORK = {
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 50,
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'asana_backend.utils.renderers.JSONRenderer',
         'rest_framework.renderers.BrowsableAPIRenderer',  # Added for browsable API
     ],
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+    'EXCEPTION_HANDLER': 'asana_backend.utils.error_responses.api_exception_handler',
 }
 
 # DRF Spectacular settings for API documentation
@@ -126,15 +231,77 @@ SPECTACULAR_SETTINGS = {
 CORS_ALLOW_ALL_ORIGINS = True
 
 # Rate limiting configuration
-# django-ratelimit uses Django's cache framework
 CACHES = {
     'default': {
         'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
-        'LOCATION': 'asana-rate-limit-cache',
-    }
+        'LOCATION': 'asana-default-cache',
+    },
+    # Cached task/project/user/workspace responses; LocMemCache evicts
+    # the least recently used tenth when full
+    'objects': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'asana-objects',
+        'OPTIONS': {'MAX_ENTRIES': 10000, 'CULL_FREQUENCY': 10},
+    },
+    'object_versions': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'asana-object-versions',
+        'OPTIONS': {'MAX_ENTRIES': 100000, 'CULL_FREQUENCY': 10},
+    },
+}
+
+# Versioned cache of GET task/project/user/workspace responses (see
+# asana_backend.utils.object_cache). VERSION_CACHE must be shared by all
+# workers serving the API; prod.py uses a SQLite file (see
+# asana_backend.utils.sqlite_cache).
+ASANA_OBJECT_CACHE = {
+    'ENABLED': os.environ.get('ASANA_OBJECT_CACHE', 'true').lower() != 'false',
+    'CACHE': 'objects',
+    'VERSION_CACHE': 'object_versions',
+    'TIMEOUT': int(os.environ.get('ASANA_OBJECT_CACHE_TIMEOUT', 300)),
+    'SETTLE_SECONDS': 1.0,
 }
 
-# Rate limit settings
-RATELIMIT_ENABLE = True
-RATELIMIT_USE_CACHE = 'default'
+# Rate limit settings. Buckets live in STORE; MemoryStore is per process,
+# so deployments running several workers use SQLiteStore (see prod.py).
+# Workers lease LEASE_FRACTION of a bucket at a time to spare the store;
+# buckets under 2 / LEASE_FRACTION tokens (every per-view @ratelimit) are
+# not leased and take one store transaction per request. API_LIMITS are
+# the per token and per workspace rates every API request is also held to
+# (see asana_backend.utils.rate_limiting.middleware); an empty rate turns
+# one off.
+RATELIMIT_ENABLE = os.environ.get('ASANA_RATELIMIT_ENABLE', 'true').lower() != 'false'
+ASANA_RATE_LIMITS = {
+    'STORE': 'asana_backend.utils.rate_limiting.memory_store.MemoryStore',
+    'OPTIONS': {},
+    'LEASE_FRACTION': 0.05,
+    'API_LIMITS': {
+        'token': os.environ.get('ASANA_RATE_LIMIT_PER_TOKEN', '1500/m'),
+        'workspace': os.environ.get('ASANA_RATE_LIMIT_PER_WORKSPACE', '6000/m'),
+    },
+}
 
+# Serve the busiest reads (a task, task lists, a project's tasks, a task's
+# stories) with async views. Worth it under an ASGI server, where one
+# worker overlaps their database waits; `python -m asana_backend.serve
+# --worker-class uvicorn` turns it on.
+ASANA_ASYNC_VIEWS = os.environ.get('ASANA_ASYNC_VIEWS', 'false').lower() == 'true'
+
+# Background jobs (project/task duplication). With RUN_IN_PROCESS the web
+# process runs queued jobs on WORKERS background threads; set it to False
+# and run `python manage.py run_job_workers` to process them elsewhere.
+ASANA_JOBS = {
+    'RUN_IN_PROCESS': True,
+    'WORKERS': 2,
+}
+
+# Bulk list clients. A request carrying one of BULK_CLIENT_TOKENS in the
+# X-Bulk-Client-Token header may page tasks, projects, stories and users
+# up to BULK_MAX_LIMIT rows at a time; such pages are streamed.
+ASANA_STREAMING = {
+    'BULK_CLIENT_TOKENS': [
+        token for token in
+        os.environ.get('ASANA_BULK_CLIENT_TOKENS', '').split(',') if token
+    ],
+    'BULK_MAX_LIMIT': 10000,
+}
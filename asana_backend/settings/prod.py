@@ -1,6 +1,7 @@
 """
 Production settings.
 """
+import os
 from .base import *
 
 DEBUG = False
@@ -9,3 +10,53 @@ ALLOWED_HOSTS = ['*']
 
 CORS_ALLOW_ALL_ORIGINS = False
 
+# Keep database connections open across requests in each worker thread
+# instead of reconnecting every time; a connection that has gone away is
+# noticed before the request uses it. A PostgreSQL connection pool keeps
+# them open itself, and Django refuses CONN_MAX_AGE alongside it.
+for database in DATABASES.values():
+    if 'pool' not in database.get('OPTIONS', {}):
+        database['CONN_MAX_AGE'] = int(os.environ.get('ASANA_CONN_MAX_AGE', 60))
+    database['CONN_HEALTH_CHECKS'] = True
+
+# One bucket store for all worker processes on the host
+ASANA_RATE_LIMITS = {
+    **ASANA_RATE_LIMITS,
+    'STORE': 'asana_backend.utils.rate_limiting.sqlite_store.SQLiteStore',
+    'OPTIONS': {
+        'path': os.environ.get(
+            'ASANA_RATE_LIMIT_DB',
+            str(BASE_DIR / 'ratelimit.sqlite3')
+        ),
+    },
+}
+
+# Clients pinned to the primary after a write must be pinned in every
+# worker process on the host. Pins expire after PIN_SECONDS, so the cache
+# holds about as many entries as clients writing in that window.
+CACHES['replica_pins'] = {
+    'BACKEND': 'asana_backend.utils.sqlite_cache.SQLiteCache',
+    'LOCATION': os.environ.get(
+        'ASANA_REPLICA_PIN_DB',
+        str(BASE_DIR / 'replica_pins.sqlite3')
+    ),
+    'OPTIONS': {'MAX_ENTRIES': 50000, 'CULL_FREQUENCY': 10},
+}
+ASANA_DB_ROUTING = {**ASANA_DB_ROUTING, 'PIN_CACHE': 'replica_pins'}
+
+# Object versions must change for every worker process on the host when
+# one of them saves. They never expire, so the cache grows to one entry
+# per object read or saved; beyond MAX_ENTRIES the least recently used
+# tenth is dropped, and reading one of those objects again costs a cache
+# miss and a new settle window. Size it above the objects read daily.
+CACHES['object_versions'] = {
+    'BACKEND': 'asana_backend.utils.sqlite_cache.SQLiteCache',
+    'LOCATION': os.environ.get(
+        'ASANA_OBJECT_VERSION_DB',
+        str(BASE_DIR / 'object_versions.sqlite3')
+    ),
+    'OPTIONS': {
+        'MAX_ENTRIES': int(os.environ.get('ASANA_OBJECT_VERSION_ENTRIES', 500000)),
+        'CULL_FREQUENCY': 10,
+    },
+}
@@ -73,6 +73,7 @@ def api_info_view(request):
                     'delete': 'DELETE /api/1.0/projects/{project_gid}/',
                     'duplicate': 'POST /api/1.0/projects/{project_gid}/duplicate/',
                     'tasks': 'GET /api/1.0/projects/{project_gid}/tasks/',
+                    'task_counts': 'GET /api/1.0/projects/{project_gid}/task_counts',
                     'add_members': 'POST /api/1.0/projects/{project_gid}/addMembers/',
                     'remove_members': 'POST /api/1.0/projects/{project_gid}/removeMembers/',
                     'add_followers': 'POST /api/1.0/projects/{project_gid}/addFollowers/',
@@ -86,9 +87,14 @@ def api_info_view(request):
                     'detail': 'GET /api/1.0/tasks/{task_gid}/',
                     'update': 'PUT /api/1.0/tasks/{task_gid}/',
                     'delete': 'DELETE /api/1.0/tasks/{task_gid}/',
+                    'duplicate': 'POST /api/1.0/tasks/{task_gid}/duplicate/',
                     'subtasks': 'GET /api/1.0/tasks/{task_gid}/subtasks/',
                     'create_subtask': 'POST /api/1.0/tasks/{task_gid}/subtasks/',
                     'set_parent': 'POST /api/1.0/tasks/{task_gid}/setParent/',
+                    'upstream': 'GET /api/1.0/tasks/{task_gid}/dependencies/upstream/',
+                    'downstream': 'GET /api/1.0/tasks/{task_gid}/dependents/downstream/',
+                    'critical_path': 'GET /api/1.0/projects/{project_gid}/critical_path/',
+                    'section_tasks': 'GET /api/1.0/sections/{section_gid}/tasks/',
                     'search': 'GET /api/1.0/workspaces/{workspace_gid}/tasks/search/',
                 },
                 'users': {
@@ -102,6 +108,19 @@ def api_info_view(request):
                 'tags': {
                     'list': 'GET /api/1.0/tags/',
                     'detail': 'GET /api/1.0/tags/{tag_gid}/',
+                },
+                'batch': {
+                    'submit': 'POST /api/1.0/batch/',
+                },
+                'jobs': {
+                    'detail': 'GET /api/1.0/jobs/{job_gid}/',
+                },
+                'events': {
+                    'resource': 'GET /api/1.0/events/?resource={resource_gid}&sync={sync_token}',
+                    'workspace': 'GET /api/1.0/workspaces/{workspace_gid}/events?sync={sync_token}',
+                },
+                'typeahead': {
+                    'workspace': 'GET /api/1.0/workspaces/{workspace_gid}/typeahead?resource_type={type}&query={query}',
                 }
             }
         }
@@ -130,4 +149,8 @@ urlpatterns = [
     path('api/1.0/', include('asana_stories.urls')),
     path('api/1.0/', include('asana_attachments.urls')),
     path('api/1.0/', include('asana_webhooks.urls')),
+    path('api/1.0/', include('asana_batch_api.urls')),
+    path('api/1.0/', include('asana_jobs.urls')),
+    path('api/1.0/', include('asana_events.urls')),
+    path('api/1.0/', include('asana_typeahead.urls')),
 ]
@@ -0,0 +1,93 @@
+"""
+Async views.
+
+DRF's APIView is synchronous, so the endpoints with async variants (served
+in place of the DRF views when ``ASANA_ASYNC_VIEWS`` is on, as it is for
+the uvicorn worker) subclass ``AsyncAPIView``: a plain Django view whose
+handlers are coroutines and which renders its responses with the API's
+JSONRenderer. Methods it has no handler for are passed on to the DRF view
+named by ``sync_view``.
+
+Their database work goes through ``run_in_thread``, which runs a callable
+on a pooled worker thread that keeps its connection between requests.
+Django's own async ORM methods (``aget``, ``aexists``...) would run every
+query of a request on that request's one sync thread, which asgiref
+starts afresh for each request, with a new connection each time, and
+which cannot overlap two queries. Independent reads of one request can be
+in flight at the same time:
+
+    tags, followers = await asyncio.gather(
+        run_in_thread(load_tags), run_in_thread(load_followers)
+    )
+
+Only use it for reads that need nothing from the request's transaction.
+"""
+from typing import Any, Optional, Type
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError
+from django.db import close_old_connections
+from django.http import HttpResponse
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework.views import APIView
+from asana_backend.utils.error_responses import bad_request_error
+from asana_backend.utils.renderers import JSONRenderer
+
+
+def _call_with_connection(fn, *args, **kwargs):
+    # Worker threads outlive requests: drop connections past CONN_MAX_AGE
+    # or broken ones around each call, as request_started/finished do for
+    # the request's own thread
+    close_old_connections()
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        close_old_connections()
+
+
+async def run_in_thread(fn, *args, **kwargs) -> Any:
+    """Await ``fn(*args, **kwargs)`` run on a worker thread."""
+    return await sync_to_async(_call_with_connection, thread_sensitive=False)(
+        fn, *args, **kwargs
+    )
+
+
+class AsyncAPIView(View):
+    # The DRF view serving the methods this view has no handler for
+    sync_view: Optional[Type[APIView]] = None
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # Like DRF's views: API clients authenticate by token, not cookie
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    async def dispatch(self, request, *args, **kwargs):
+        # As api_exception_handler does for the DRF views
+        try:
+            return await super().dispatch(request, *args, **kwargs)
+        except ValidationError as e:
+            return self.render(
+                request, bad_request_error(e.messages[0]), status=400
+            )
+
+    def render(self, request, data: Any, status: int = 200) -> HttpResponse:
+        return HttpResponse(
+            JSONRenderer().render(data, renderer_context={'request': request}),
+            status=status,
+            content_type='application/json'
+        )
+
+    async def http_method_not_allowed(self, request, *args, **kwargs):
+        if self.sync_view is None:
+            return await super().http_method_not_allowed(
+                request, *args, **kwargs
+            )
+        return await sync_to_async(self._call_sync_view)(
+            request, *args, **kwargs
+        )
+
+    def _call_sync_view(self, request, *args, **kwargs):
+        response = self.sync_view.as_view()(request, *args, **kwargs)
+        if hasattr(response, 'render'):
+            response.render()
+        return response
@@ -1,14 +1,26 @@
 """
 Rate limiting decorator for API views.
+
+Limits are token buckets kept in the store configured by
+``ASANA_RATE_LIMITS`` (see asana_backend.utils.rate_limiting), so they hold
+across worker processes. A limited request gets a 429 with a Retry-After
+header giving the seconds until a token is free.
 """
+import hashlib
 import json
+import math
 import re
 from functools import wraps
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
 from django.http import HttpResponse
-from django_ratelimit import ALL, UNSAFE
-from django_ratelimit.core import is_ratelimited
+from asana_backend.utils.rate_limiting import get_limiter
+from asana_backend.utils.async_views import run_in_thread
+
+__all__ = ['ratelimit', 'rate_limited_response']
 
-__all__ = ['ratelimit']
+ALL = None
+UNSAFE = ['DELETE', 'PATCH', 'POST', 'PUT']
 
 RATE_LIMIT_EXCEEDED = (
     "You've reached the maximum number of requests. Please try again after {wait_time}.",
@@ -16,14 +28,76 @@ RATE_LIMIT_EXCEEDED = (
 )
 
 
+def _client_ip(request, view_kwargs):
+    return request.META.get('REMOTE_ADDR')
+
+
+def _token(request, view_kwargs):
+    """The API token sent by the client, hashed; the IP without one."""
+    authorization = request.META.get('HTTP_AUTHORIZATION', '')
+    _, _, token = authorization.partition(' ')
+    if not token:
+        return _client_ip(request, view_kwargs)
+    return hashlib.sha256(token.strip().encode()).hexdigest()
+
+
+def _user(request, view_kwargs):
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated:
+        return str(user.pk)
+    return _client_ip(request, view_kwargs)
+
+
+def _workspace(request, view_kwargs):
+    """The workspace in the URL or the ``workspace`` query parameter."""
+    return view_kwargs.get('workspace_gid') or request.GET.get('workspace')
+
+
+KEY_FUNCTIONS = {
+    'ip': _client_ip,
+    'token': _token,
+    'user': _user,
+    'workspace': _workspace,
+}
+
+
+def get_key_value(request, key, view_kwargs):
+    """
+    Resolve ``key`` for ``request``: one of KEY_FUNCTIONS or a callable
+    taking the request. None means the limit does not apply.
+    """
+    if callable(key):
+        return key(request)
+    return KEY_FUNCTIONS[key](request, view_kwargs)
+
+
+def rate_limited_response(retry_after: float) -> HttpResponse:
+    """The 429 for a request that may be retried in ``retry_after`` seconds."""
+    retry_seconds = max(1, math.ceil(retry_after))
+    wait_time = convert_time_to_readable(f'{retry_seconds}s')
+    body = {
+        "res_status": RATE_LIMIT_EXCEEDED[1],
+        "http_status_code": 429,
+        "response": RATE_LIMIT_EXCEEDED[0].format(wait_time=wait_time),
+    }
+    response = HttpResponse(
+        json.dumps(body),
+        status=429,
+        content_type='application/json'
+    )
+    response['Retry-After'] = str(retry_seconds)
+    return response
+
+
 def ratelimit(group=None, key=None, rate=None, method=ALL, block=True):
     """
     Rate limit decorator for Django views.
     
     Args:
-        group: Rate limit group name
-        key: Key function to identify the client (e.g., 'ip', 'user')
-        rate: Rate limit string (e.g., '5/m', '100/m', '1000/h')
+        group: Rate limit group name (defaults to the view's dotted name)
+        key: What requests are counted by: 'ip', 'token' (the API token),
+            'user', 'workspace' or a callable taking the request
+        rate: Rate limit string (e.g., '5/m', '100/m', '1000/h', '5/10s')
         method: HTTP methods to rate limit (ALL, UNSAFE, or specific methods)
         block: Whether to block requests when rate limit is exceeded
     
@@ -31,10 +105,23 @@ def ratelimit(group=None, key=None, rate=None, method=ALL, block=True):
         @ratelimit(key='ip', rate='5/m')
         def my_view(request):
             ...
+
+    Coroutine views (see asana_backend.utils.async_views) are wrapped in
+    a coroutine.
+
+    Stack the decorator to limit by several keys. Every API request is
+    also limited per token and per workspace by ApiRateLimitMiddleware
+    (see asana_backend.utils.rate_limiting.middleware).
     """
     def decorator(fn):
-        @wraps(fn)
-        def _wrapped(*args, **kw):
+        bucket_group = group or f'{fn.__module__}.{fn.__qualname__}'
+        key_name = key if isinstance(key, str) else key.__qualname__
+        methods = None if method is ALL else (
+            [method] if isinstance(method, str) else list(method)
+        )
+
+        def limited_response(args, kw):
+            """The 429 for this call, or None if it may go ahead."""
             # Handle both function-based views and class-based views
             # For class methods: args = (self, request, ...)
             # For functions: args = (request, ...)
@@ -46,31 +133,48 @@ def ratelimit(group=None, key=None, rate=None, method=ALL, block=True):
                 request = args[0]
             else:
                 raise ValueError("No request found in arguments")
-            
+
+            # Actions inside a batch request were counted with the batch
+            if getattr(request, 'is_batch_action', False):
+                return None
+
+            if not getattr(settings, 'RATELIMIT_ENABLE', True) or (
+                methods is not None and request.method not in methods
+            ):
+                return None
+
             old_limited = getattr(request, 'limited', False)
-            ratelimited = is_ratelimited(
-                request=request,
-                group=group,
-                fn=fn,
-                key=key,
-                rate=rate,
-                method=method,
-                increment=True
-            )
+            ratelimited, retry_after = False, 0.0
+            key_value = get_key_value(request, key, kw)
+            if key_value is not None:
+                allowed, retry_after = get_limiter().acquire(
+                    f'{bucket_group}:{rate}:{key_name}:{key_value}',
+                    rate
+                )
+                ratelimited = not allowed
             request.limited = ratelimited or old_limited
             
             if ratelimited and block:
-                wait_time = convert_time_to_readable(rate.split("/")[1])
-                body = {
-                    "res_status": RATE_LIMIT_EXCEEDED[1],
-                    "http_status_code": 429,
-                    "response": RATE_LIMIT_EXCEEDED[0].format(
-                        wait_time=wait_time
-                    ),
-                }
-                data = json.dumps(body)
-                return HttpResponse(data, status=429, content_type='application/json')
-            
+                return rate_limited_response(retry_after)
+            return None
+
+        if iscoroutinefunction(fn):
+            @wraps(fn)
+            async def _wrapped_async(*args, **kw):
+                # Key functions may load request.user and the store may be
+                # a database, so the check runs off the event loop
+                response = await run_in_thread(limited_response, args, kw)
+                if response is not None:
+                    return response
+                return await fn(*args, **kw)
+
+            return _wrapped_async
+
+        @wraps(fn)
+        def _wrapped(*args, **kw):
+            response = limited_response(args, kw)
+            if response is not None:
+                return response
             return fn(*args, **kw)
         
         return _wrapped
@@ -13,6 +13,10 @@ Generates error responses matching the exact Asana API spec schema:
 }
 """
 import random
+from django.core.exceptions import ValidationError
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import exception_handler
 
 
 # Asana-style error phrases (used for 500 errors)
@@ -110,3 +114,17 @@ def invalid_field_error(field_name: str, reason: str):
 def invalid_gid_error(resource_type: str):
     """Error for invalid GID format"""
     return bad_request_error(f"{resource_type}: Invalid GID format")
+
+
+def api_exception_handler(exc, context):
+    """
+    DRF exception handler that also answers Django ValidationErrors left
+    uncaught by a view, such as a tampered offset token found invalid
+    while a page is read, with a 400 instead of a 500.
+    """
+    if isinstance(exc, ValidationError):
+        return Response(
+            bad_request_error(exc.messages[0]),
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    return exception_handler(exc, context)
@@ -0,0 +1,257 @@
+"""
+Field projection utilities.
+
+Turns an Asana ``opt_fields`` string (including dotted paths such as
+``assignee.name`` or ``projects.name``) into the columns, joins and
+prefetches a queryset needs, and shapes the loaded rows into response
+dicts that carry only the requested properties. Values are left as the
+model holds them (UUIDs, datetimes, dates); the JSON renderer formats them.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from django.db.models import Model, Prefetch, QuerySet
+
+
+def parse_opt_fields(opt_fields: Optional[str]) -> List[str]:
+    """
+    Split a comma-separated opt_fields string into field paths.
+    Empty entries and surrounding whitespace are dropped.
+    """
+    if not opt_fields:
+        return []
+    return [field.strip() for field in opt_fields.split(',') if field.strip()]
+
+
+class RelatedResource:
+    """
+    A nested resource embedded in a response (e.g. ``assignee``).
+
+    ``fields`` maps response keys to columns on the related model.
+    ``compact`` lists the keys returned when the relation is requested
+    without a dotted sub-field.
+    """
+
+    many = False
+
+    def __init__(
+        self,
+        name: str,
+        resource_type: str,
+        fields: Dict[str, str],
+        attname: Optional[str] = None,
+        compact: Sequence[str] = ('resource_type', 'name')
+    ):
+        self.name = name
+        self.resource_type = resource_type
+        self.fields = fields
+        self.attname = attname or name
+        self.compact = tuple(compact)
+
+    def resolve_subfields(self, requested: Iterable[str]) -> List[str]:
+        subfields = []
+        for subfield in requested:
+            if subfield == 'resource_type' or subfield in self.fields:
+                if subfield not in subfields:
+                    subfields.append(subfield)
+        return subfields or list(self.compact)
+
+    def columns(self, subfields: Iterable[str]) -> List[str]:
+        return [
+            self.fields[subfield]
+            for subfield in subfields
+            if subfield in self.fields
+        ]
+
+    def serialize(self, obj: Optional[Model], subfields: Iterable[str]):
+        if obj is None:
+            return None
+        data = {'gid': obj.pk}
+        for subfield in subfields:
+            if subfield == 'resource_type':
+                data['resource_type'] = self.resource_type
+            else:
+                data[subfield] = getattr(obj, self.fields[subfield])
+        return data
+
+
+class RelatedResourceList(RelatedResource):
+    """
+    A list of nested resources read through a link model, such as a task's
+    ``projects`` via ``TaskProject``.
+
+    ``link_accessor`` is the reverse accessor from the root model to the
+    link rows, ``link_model`` the link model itself, ``root_field`` the FK on
+    the link model pointing back at the root and ``target_field`` the FK
+    pointing at the nested resource.
+    """
+
+    many = True
+
+    def __init__(
+        self,
+        name: str,
+        resource_type: str,
+        fields: Dict[str, str],
+        link_accessor: str,
+        link_model,
+        root_field: str,
+        target_field: str,
+        compact: Sequence[str] = ('resource_type', 'name')
+    ):
+        super().__init__(
+            name=name,
+            resource_type=resource_type,
+            fields=fields,
+            attname=link_accessor,
+            compact=compact
+        )
+        self.link_accessor = link_accessor
+        self.link_model = link_model
+        self.root_field = root_field
+        self.target_field = target_field
+
+    def prefetch(self, subfields: Iterable[str]) -> Prefetch:
+        only = [self.root_field, self.target_field]
+        only.extend(
+            f'{self.target_field}__{column}'
+            for column in self.columns(subfields)
+        )
+        queryset = self.link_model.objects.select_related(
+            self.target_field
+        ).only(*only)
+        return Prefetch(self.link_accessor, queryset=queryset)
+
+    def serialize(self, obj: Model, subfields: Iterable[str]):
+        return [
+            super(RelatedResourceList, self).serialize(
+                getattr(link, self.target_field),
+                subfields
+            )
+            for link in getattr(obj, self.link_accessor).all()
+        ]
+
+
+class ProjectionSpec:
+    """
+    Describes how a resource can be projected.
+
+    ``fields`` maps response keys to model columns (``modified_at`` can map
+    to ``updated_at``), ``relations`` lists the embeddable nested resources
+    and ``compact`` is the default field list for compact records.
+    """
+
+    def __init__(
+        self,
+        resource_type: str,
+        fields: Dict[str, str],
+        relations: Sequence[RelatedResource] = (),
+        compact: Sequence[str] = ('resource_type', 'name')
+    ):
+        self.resource_type = resource_type
+        self.fields = fields
+        self.relations = {relation.name: relation for relation in relations}
+        self.compact = tuple(compact)
+
+
+class FieldProjection:
+    """
+    The resolved projection for one request.
+
+    Unknown field names are ignored so clients can pass the same opt_fields
+    to several endpoints. The ``gid`` is always included.
+    """
+
+    def __init__(
+        self,
+        spec: ProjectionSpec,
+        opt_fields: Optional[str] = None,
+        default: Optional[Sequence[str]] = None
+    ):
+        self.spec = spec
+        paths = parse_opt_fields(opt_fields) or list(default or spec.compact)
+
+        self.fields: List[str] = []
+        requested_subfields: Dict[str, List[str]] = {}
+        for path in paths:
+            name, _, subfield = path.partition('.')
+            if name in spec.relations:
+                subfields = requested_subfields.setdefault(name, [])
+                if subfield:
+                    subfields.append(subfield)
+                if name not in self.fields:
+                    self.fields.append(name)
+            elif (name == 'resource_type' or name in spec.fields) and \
+                    name not in self.fields:
+                self.fields.append(name)
+
+        self.relations: Dict[str, Tuple[RelatedResource, List[str]]] = {
+            name: (
+                spec.relations[name],
+                spec.relations[name].resolve_subfields(subfields)
+            )
+            for name, subfields in requested_subfields.items()
+        }
+
+    @property
+    def only_fields(self) -> List[str]:
+        """Columns to load on the root model (and its to-one joins)."""
+        columns = ['pk']
+        for name in self.fields:
+            if name in self.spec.fields:
+                columns.append(self.spec.fields[name])
+        for relation, subfields in self.relations.values():
+            if relation.many:
+                continue
+            columns.append(relation.attname)
+            columns.extend(
+                f'{relation.attname}__{column}'
+                for column in relation.columns(subfields)
+            )
+        return columns
+
+    @property
+    def select_related(self) -> List[str]:
+        return [
+            relation.attname
+            for relation, _ in self.relations.values()
+            if not relation.many
+        ]
+
+    @property
+    def prefetch_related(self) -> List[Prefetch]:
+        return [
+            relation.prefetch(subfields)
+            for relation, subfields in self.relations.values()
+            if relation.many
+        ]
+
+    def apply(self, queryset: QuerySet) -> QuerySet:
+        """Restrict a queryset to the columns and joins this projection needs."""
+        only = [
+            column if column != 'pk' else queryset.model._meta.pk.name
+            for column in self.only_fields
+        ]
+        queryset = queryset.only(*only)
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+        return queryset
+
+    def serialize(self, obj: Model) -> Dict[str, Any]:
+        """Build the response dict for a row loaded through ``apply``."""
+        data = {'gid': obj.pk}
+        for name in self.fields:
+            if name == 'resource_type':
+                data['resource_type'] = self.spec.resource_type
+            elif name in self.relations:
+                relation, subfields = self.relations[name]
+                if relation.many:
+                    data[name] = relation.serialize(obj, subfields)
+                else:
+                    data[name] = relation.serialize(
+                        getattr(obj, relation.attname),
+                        subfields
+                    )
+            else:
+                data[name] = getattr(obj, self.spec.fields[name])
+        return data
@@ -0,0 +1,120 @@
+"""
+Request-scoped identity map.
+
+Within an ``identity_map_scope()`` (opened for every request by
+``IdentityMapMiddleware``) each storage lookup of the same row returns the
+instance loaded the first time instead of querying again, and
+``load_many`` fetches all rows it has not seen yet with a single ``IN``
+query. Outside a scope lookups go straight to the database.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.db.models import Model
+
+_current_identity_map: ContextVar[Optional['IdentityMap']] = ContextVar(
+    'identity_map',
+    default=None
+)
+
+
+def _key(model: Type[Model], pk: Any) -> Tuple[Type[Model], str]:
+    # Normalise so '1b4e...' and UUID('1b4e...') share one entry
+    return (model, str(model._meta.pk.to_python(pk)))
+
+
+class IdentityMap:
+    """Maps (model, pk) to the instance loaded for the current request."""
+
+    def __init__(self):
+        self._objects: Dict[Tuple[Type[Model], str], Model] = {}
+
+    def get_many(
+        self,
+        model: Type[Model],
+        pks: Iterable[Any]
+    ) -> Dict[str, Model]:
+        """
+        Return the rows for ``pks`` keyed by normalised pk, loading the ones
+        not seen yet with one ``IN`` query. Missing rows are left out.
+        """
+        keys = [_key(model, pk) for pk in pks]
+        missing = {key[1] for key in keys if key not in self._objects}
+        if missing:
+            for obj in model.objects.filter(pk__in=missing):
+                self._objects[_key(model, obj.pk)] = obj
+        return {
+            key[1]: self._objects[key]
+            for key in keys
+            if key in self._objects
+        }
+
+    def clear(self) -> None:
+        self._objects.clear()
+
+
+def get_identity_map() -> Optional[IdentityMap]:
+    """Return the identity map of the current request, if one is active."""
+    return _current_identity_map.get()
+
+
+@contextmanager
+def identity_map_scope():
+    """Activate a fresh identity map for the duration of the block."""
+    identity_map = IdentityMap()
+    token = _current_identity_map.set(identity_map)
+    try:
+        yield identity_map
+    finally:
+        _current_identity_map.reset(token)
+
+
+def load_many(model: Type[Model], pks: Iterable[Any]) -> List[Model]:
+    """
+    Load the ``model`` rows for ``pks``, in order, with at most one query.
+    Raises ``model.DoesNotExist`` if any of them does not exist, like
+    ``model.objects.get`` would.
+    """
+    pks = list(pks)
+    identity_map = get_identity_map() or IdentityMap()
+    found = identity_map.get_many(model, pks)
+
+    objects = []
+    for pk in pks:
+        obj = found.get(_key(model, pk)[1])
+        if obj is None:
+            raise model.DoesNotExist(
+                f"{model._meta.object_name} matching query does not exist: {pk}"
+            )
+        objects.append(obj)
+    return objects
+
+
+def load(model: Type[Model], pk: Any) -> Model:
+    """``model.objects.get(pk=pk)`` through the identity map."""
+    return load_many(model, [pk])[0]
+
+
+class IdentityMapMiddleware:
+    """
+    Opens an identity map for the lifetime of each request. It is async
+    capable, so under ASGI async views are not pushed onto a thread.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with identity_map_scope():
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        with identity_map_scope():
+            return await self.get_response(request)
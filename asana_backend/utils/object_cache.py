@@ -0,0 +1,264 @@
+"""
+Versioned cache of GET detail responses (a task, project, user or
+workspace).
+
+Every API object has a version token in ``VERSION_CACHE``, replaced when
+the object is saved or deleted, or when a row that shows up in its
+response is (a task's tags, followers and projects; a subtask, for its
+parent's ``num_subtasks``). See ``INVALIDATES``. Responses are kept in
+``CACHE`` under (resource type, gid, version, opt_fields) together with
+the versions of the objects they embed (a task's assignee, parent,
+projects, tags...), so renaming a tag drops the cached tasks showing it
+on their next read.
+
+Tokens are replaced when the change is made and again once its
+transaction commits, and a response is only stored once every version
+it depends on has been stable for ``SETTLE_SECONDS`` (the replica pin
+when it was read from a replica), so a response built from rows read
+while they were being changed is never kept. Writes that skip model
+signals (``bulk_create``, ``QuerySet.update``) call ``invalidate``
+themselves.
+
+The versions a response was got or built with also make its ETag and
+Last-Modified (``CachedObject.validators``), so a client holding the
+current response is answered with a 304 before anything is built.
+
+Entries cost a version lookup and a lookup of the embedded objects'
+versions, so ``VERSION_CACHE`` should be fast and shared by every worker;
+``CACHE`` may be per process and should evict least recently used
+entries, as LocMemCache does.
+"""
+import hashlib
+import time
+import uuid
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from asana_backend.utils.conditional import Validators, make_etag
+from asana_backend.utils.replica_routing import (
+    get_db_routing_settings,
+    reads_from_replica,
+)
+
+ObjectRef = Tuple[str, Any]
+
+# Rows whose saves and deletes change cached responses, by model label,
+# with the (resource type, gid) of the objects whose responses they change
+INVALIDATES: Dict[str, Callable[[Any], List[ObjectRef]]] = {
+    'asana_tasks.Task': lambda task: [('task', task.pk), ('task', task.parent_id)],
+    'asana_tasks.TaskProject': lambda link: [('task', link.task_id)],
+    'asana_tasks.TaskTag': lambda link: [('task', link.task_id)],
+    'asana_tasks.TaskFollower': lambda link: [('task', link.task_id)],
+    'asana_projects.Project': lambda project: [('project', project.pk)],
+    'asana_users.User': lambda user: [('user', user.pk)],
+    'asana_workspaces.Workspace': lambda workspace: [('workspace', workspace.pk)],
+    'asana_tags.Tag': lambda tag: [('tag', tag.pk)],
+    'asana_teams.Team': lambda team: [('team', team.pk)],
+}
+
+
+def get_object_cache_settings() -> Dict[str, Any]:
+    return {
+        'ENABLED': True,
+        'CACHE': 'default',
+        'VERSION_CACHE': 'default',
+        'TIMEOUT': 300,
+        'SETTLE_SECONDS': 1.0,
+        **getattr(settings, 'ASANA_OBJECT_CACHE', {}),
+    }
+
+
+def _normalize_gid(gid: Any) -> str:
+    # '1B4E...' and UUID('1b4e...') are one object
+    try:
+        return str(uuid.UUID(str(gid)))
+    except ValueError:
+        return str(gid)
+
+
+def _version_key(resource_type: str, gid: Any) -> str:
+    return f'object-version:{resource_type}:{_normalize_gid(gid)}'
+
+
+def _new_token(changed_at: float) -> str:
+    return f'{changed_at:.6f}:{uuid.uuid4().hex}'
+
+
+def _changed_at(token: str) -> float:
+    return float(token.partition(':')[0])
+
+
+def _tokens(keys: List[str]) -> Dict[str, str]:
+    version_cache = caches[get_object_cache_settings()['VERSION_CACHE']]
+    tokens = version_cache.get_many(keys)
+    for key in keys:
+        if key not in tokens:
+            # Never changed, or evicted: a new token still sets apart
+            # entries built with the old one. It counts as a change now, as
+            # one may have been lost with the old token
+            version_cache.add(key, _new_token(time.time()), None)
+            tokens[key] = version_cache.get(key) or _new_token(time.time())
+    return tokens
+
+
+def bump_versions(objects: Iterable[ObjectRef]) -> None:
+    """Give each (resource type, gid) in ``objects`` a new version."""
+    now = time.time()
+    version_cache = caches[get_object_cache_settings()['VERSION_CACHE']]
+    version_cache.set_many(
+        {
+            _version_key(resource_type, gid): _new_token(now)
+            for resource_type, gid in objects
+            if gid is not None
+        },
+        None
+    )
+
+
+def invalidate(objects: Iterable[ObjectRef]) -> None:
+    """
+    Drop the cached responses of ``objects``, (resource type, gid) pairs,
+    now and again when the current transaction commits.
+    """
+    objects = list(objects)
+    bump_versions(objects)
+    transaction.on_commit(partial(bump_versions, objects))
+
+
+def _embedded(value: Any) -> Iterator[ObjectRef]:
+    # Every compact resource nested in a response
+    if isinstance(value, dict):
+        if 'gid' in value and 'resource_type' in value:
+            yield value['resource_type'], value['gid']
+        for nested in value.values():
+            yield from _embedded(nested)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _embedded(item)
+
+
+class CachedObject:
+    """
+    The cache entry for one object's response. ``get`` must be called
+    before the response is built, as it reads the version the response
+    is stored under.
+    """
+
+    def __init__(
+        self,
+        resource_type: str,
+        gid: str,
+        opt_fields: Optional[str] = None
+    ):
+        self.resource_type = resource_type
+        self.gid = _normalize_gid(gid)
+        self.opt_fields = opt_fields or ''
+        self.token: Optional[str] = None
+        # The versions of the objects the response embeds
+        self.versions: Optional[Dict[str, str]] = None
+
+    def get(self) -> Optional[Dict[str, Any]]:
+        """The cached response, or None if there is no current one."""
+        cache_settings = get_object_cache_settings()
+        if not cache_settings['ENABLED']:
+            return None
+        version_key = _version_key(self.resource_type, self.gid)
+        self.token = _tokens([version_key])[version_key]
+        entry = caches[cache_settings['CACHE']].get(self._key())
+        if entry is None:
+            return None
+        embedded_tokens = entry['versions']
+        if embedded_tokens and _tokens(list(embedded_tokens)) != embedded_tokens:
+            return None
+        self.versions = embedded_tokens
+        return entry['data']
+
+    def set(self, data: Dict[str, Any]) -> None:
+        """Keep ``data``, the response built after ``get``."""
+        cache_settings = get_object_cache_settings()
+        if not cache_settings['ENABLED'] or self.token is None:
+            return
+        embedded_keys = list({
+            _version_key(resource_type, gid)
+            for value in data['data'].values()
+            for resource_type, gid in _embedded(value)
+        })
+        embedded_tokens = _tokens(embedded_keys) if embedded_keys else {}
+        self.versions = embedded_tokens
+
+        settle_seconds = cache_settings['SETTLE_SECONDS']
+        if reads_from_replica():
+            settle_seconds = max(
+                settle_seconds, get_db_routing_settings()['PIN_SECONDS']
+            )
+        if time.time() - self._changed_at() < settle_seconds:
+            # data may predate the embedded versions just read
+            self.versions = None
+            return
+        caches[cache_settings['CACHE']].set(
+            self._key(),
+            {'data': data, 'versions': embedded_tokens},
+            cache_settings['TIMEOUT']
+        )
+
+    def get_or_build(self, build: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        The cached response, or ``build()``'s, which is then cached. Errors
+        ``build`` raises (a missing object) are not cached.
+        """
+        data = self.get()
+        if data is None:
+            data = build()
+            self.set(data)
+        return data
+
+    def validators(self) -> Validators:
+        """
+        The ETag and Last-Modified of the response got or set: its versions
+        change whenever it does.
+        """
+        if self.token is None or self.versions is None:
+            return Validators()
+        return Validators(
+            etag=make_etag(
+                self.resource_type,
+                self.gid,
+                self.opt_fields,
+                self.token,
+                *sorted(self.versions.values())
+            ),
+            last_modified=self._changed_at()
+        )
+
+    def _changed_at(self) -> float:
+        return max(
+            _changed_at(token)
+            for token in [self.token, *self.versions.values()]
+        )
+
+    def _key(self) -> str:
+        fields = hashlib.sha256(self.opt_fields.encode()).hexdigest()[:16]
+        return f'object:{self.resource_type}:{self.gid}:{self.token}:{fields}'
+
+
+def _invalidate_row(sender, instance, raw=False, **kwargs):
+    if raw:
+        # Fixture loading
+        return
+    invalidate(INVALIDATES[sender._meta.label](instance))
+
+
+def connect_signals() -> None:
+    """Invalidate cached responses on saves and deletes of INVALIDATES."""
+    for label in INVALIDATES:
+        model = apps.get_model(label)
+        post_save.connect(
+            _invalidate_row, sender=model, dispatch_uid=f'object_cache_save:{label}'
+        )
+        post_delete.connect(
+            _invalidate_row, sender=model, dispatch_uid=f'object_cache_delete:{label}'
+        )
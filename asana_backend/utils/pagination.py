@@ -1,7 +1,71 @@
 """
 Pagination utilities.
+
+List endpoints page with opaque offset tokens, as the Asana API does. A
+token encodes the sort key of the last row on the previous page, so the
+next page is fetched with an index seek (``WHERE key > last``) instead of
+scanning and discarding ``offset`` rows.
 """
-from typing import Dict, Any, List, Optional
+import base64
+import json
+import uuid
+from datetime import date, datetime
+from typing import Dict, Any, List, Optional, Sequence, Union
+from urllib.parse import urlencode
+from django.core.exceptions import ValidationError
+from django.db import connections
+from django.db.models import Q, QuerySet
+
+API_BASE_PATH = '/api/1.0'
+# Rows fetched per round trip when a streamed page is read
+STREAM_CHUNK_SIZE = 500
+
+
+class Page(list):
+    """
+    A page of results.
+
+    Behaves like the list the storages used to return, and additionally
+    carries ``next_offset``: the token for the following page, or None when
+    this is the last page.
+    """
+
+    def __init__(self, items=(), next_offset: Optional[str] = None):
+        super().__init__(items)
+        self.next_offset = next_offset
+
+
+class StreamingPage:
+    """
+    A page read with ``QuerySet.iterator()``, so only ``chunk_size`` rows
+    are held in memory at a time, for responses that are written out as
+    they are read. Like Page it carries ``next_offset``, which is known
+    once the page has been iterated.
+    """
+
+    def __init__(
+        self,
+        queryset: QuerySet,
+        limit: int,
+        ordering: Sequence[str],
+        chunk_size: int
+    ):
+        self.queryset = queryset
+        self.limit = limit
+        self.ordering = ordering
+        self.chunk_size = chunk_size
+        self.next_offset: Optional[str] = None
+
+    def __iter__(self):
+        last = None
+        rows = self.queryset.iterator(chunk_size=self.chunk_size)
+        for index, row in enumerate(rows):
+            if index == self.limit:
+                # The extra row only tells that there is a next page
+                self.next_offset = _offset_token_for(last, self.ordering)
+                return
+            last = row
+            yield row
 
 
 def get_pagination_metadata(
@@ -24,3 +88,199 @@ def get_pagination_metadata(
         'has_more': (offset + len(items)) < total_count
     }
 
+
+def _encode_key_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def encode_offset_token(values: Sequence[Any]) -> str:
+    """Encode a sort key into an opaque, URL-safe offset token."""
+    payload = json.dumps(
+        [_encode_key_value(value) for value in values],
+        separators=(',', ':')
+    )
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode(
+        'ascii'
+    ).rstrip('=')
+
+
+def decode_offset_token(token: str) -> List[Any]:
+    """
+    Decode an offset token back into its sort key values.
+    Raises ValidationError if the token was not issued by the API.
+    """
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        values = json.loads(
+            base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8')
+        )
+    except (ValueError, TypeError, UnicodeError):
+        raise ValidationError(f"offset: Invalid offset token: {token}")
+
+    if not isinstance(values, list) or not values:
+        raise ValidationError(f"offset: Invalid offset token: {token}")
+    # Tokens only ever hold strings, integers and nulls
+    for value in values:
+        if value is not None and (
+            isinstance(value, bool) or not isinstance(value, (str, int))
+        ):
+            raise ValidationError(f"offset: Invalid offset token: {token}")
+    return values
+
+
+def is_offset_token(offset: Union[int, str, None]) -> bool:
+    """Return True for offset tokens, False for legacy integer offsets."""
+    return isinstance(offset, str) and not offset.isdigit()
+
+
+def _keyset_filter(
+    queryset: QuerySet,
+    ordering: Sequence[str],
+    values: List[Any]
+) -> Q:
+    """
+    Build the "rows after this key" condition for a multi-column ordering,
+    e.g. for ('-created_at', '-gid'):
+    created_at < v0 OR (created_at = v0 AND gid < v1)
+    Nullable columns follow the database's own NULL placement, which is
+    also where its indexes keep NULLs.
+    """
+    model = queryset.model
+    nulls_largest = connections[queryset.db].features.nulls_order_largest
+    fields = []
+    for field_name, raw_value in zip(ordering, values):
+        descending = field_name.startswith('-')
+        name = field_name.lstrip('-')
+        if name == 'pk':
+            name = model._meta.pk.name
+        model_field = model._meta.get_field(name)
+        try:
+            value = None if raw_value is None else model_field.to_python(raw_value)
+        except (ValidationError, TypeError, ValueError):
+            # A tampered token can hold any JSON value, such as a number
+            # or a list where a date is expected
+            raise ValidationError("offset: Invalid offset token")
+        fields.append((name, descending, model_field.null, value))
+
+    condition = Q()
+    for index, (name, descending, nullable, value) in enumerate(fields):
+        # NULLs come after every value when they sort largest ascending,
+        # or smallest descending
+        nulls_last = nulls_largest != descending
+        if value is None:
+            if nulls_last:
+                continue
+            clause = Q(**{f'{name}__isnull': False})
+        else:
+            clause = Q(**{f'{name}__{"lt" if descending else "gt"}': value})
+            if nullable and nulls_last:
+                clause |= Q(**{f'{name}__isnull': True})
+        for previous_name, _, _, previous_value in fields[:index]:
+            clause &= Q(**{previous_name: previous_value})
+        condition |= clause
+    return condition
+
+
+def _offset_token_for(row: Any, ordering: Sequence[str]) -> str:
+    return encode_offset_token([
+        getattr(row, name.lstrip('-')) for name in ordering
+    ])
+
+
+def paginate_queryset(
+    queryset: QuerySet,
+    offset: Union[int, str, None] = 0,
+    limit: int = 50,
+    ordering: Sequence[str] = ('pk',),
+    stream: bool = False
+) -> Union[Page, StreamingPage]:
+    """
+    Return one page of ``queryset`` ordered by ``ordering``.
+
+    ``offset`` is either an offset token from a previous page's
+    ``next_page`` or a legacy integer offset. The ordering must be unique
+    (end it with the primary key) so every row has a distinct sort key.
+    With ``stream`` the page is a StreamingPage that reads its rows in
+    chunks while it is iterated.
+    """
+    queryset = queryset.order_by(*ordering)
+
+    if is_offset_token(offset):
+        values = decode_offset_token(offset)
+        if len(values) != len(ordering):
+            raise ValidationError(f"offset: Invalid offset token: {offset}")
+        queryset = queryset.filter(
+            _keyset_filter(queryset, ordering, values)
+        )[:limit + 1]
+    else:
+        start = int(offset or 0)
+        queryset = queryset[start:start + limit + 1]
+
+    if stream:
+        return StreamingPage(queryset, limit, ordering, STREAM_CHUNK_SIZE)
+
+    rows = list(queryset)
+    next_offset = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_offset = _offset_token_for(rows[-1], ordering)
+
+    return Page(rows, next_offset=next_offset)
+
+
+def paginate_by_position(
+    queryset: QuerySet,
+    offset: Union[int, str, None] = 0,
+    limit: int = 50
+) -> Page:
+    """
+    Return one page of an already ordered ``queryset`` whose sort key is
+    not a column (e.g. a search relevance score) and so cannot be seeked
+    on. Offset tokens carry the position of the next row instead.
+    """
+    if is_offset_token(offset):
+        values = decode_offset_token(offset)
+        if len(values) != 1 or not isinstance(values[0], int) or values[0] < 0:
+            raise ValidationError(f"offset: Invalid offset token: {offset}")
+        start = values[0]
+    else:
+        start = int(offset or 0)
+
+    rows = list(queryset[start:start + limit + 1])
+    next_offset = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_offset = encode_offset_token([start + limit])
+    return Page(rows, next_offset=next_offset)
+
+
+def build_next_page(request, next_offset: Optional[str]) -> Optional[Dict[str, str]]:
+    """
+    Build the Asana ``next_page`` object ({offset, path, uri}) for a list
+    response, preserving the request's other query parameters.
+    """
+    if not next_offset or request is None:
+        return None
+
+    params = [
+        (key, value)
+        for key, values in request.GET.lists()
+        for value in values
+        if key != 'offset'
+    ]
+    params.append(('offset', next_offset))
+    full_path = f'{request.path}?{urlencode(params)}'
+
+    path = full_path
+    if path.startswith(API_BASE_PATH):
+        path = path[len(API_BASE_PATH):]
+
+    return {
+        'offset': next_offset,
+        'path': path,
+        'uri': request.build_absolute_uri(full_path),
+    }
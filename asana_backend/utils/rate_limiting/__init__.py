@@ -0,0 +1,3 @@
+from .limiter import TokenBucketLimiter, get_limiter, parse_rate
+
+__all__ = ['TokenBucketLimiter', 'get_limiter', 'parse_rate']
@@ -0,0 +1,118 @@
+"""
+Token bucket rate limiting.
+
+A rate such as ``'100/m'`` or ``'5/10s'`` is a bucket of 100 (5) tokens
+that refills at that rate; each request takes one token. Buckets live in
+the store named by ``ASANA_RATE_LIMITS['STORE']``.
+
+A store shared by all workers takes a cross-process lock. To go to it less
+often, a worker takes a lease of ``LEASE_FRACTION`` of a bucket at once and
+spends it locally. A lease runs out after the time the bucket needs to earn
+its tokens back, so unspent leases cannot pile up into bursts above the
+limit.
+
+Leasing only helps buckets of at least 2 / LEASE_FRACTION tokens (40 at
+the default 0.05), such as the API-wide ones of ApiRateLimitMiddleware.
+Smaller buckets, which includes every per-view @ratelimit, lease one token
+at a time: they are exact, and each request takes one store transaction.
+With SQLiteStore that is about 20 µs on an idle host.
+"""
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from django.conf import settings
+from django.utils.module_loading import import_string
+from asana_backend.utils.rate_limiting.store_interface import (
+    RateLimitStoreInterface
+)
+
+RATE_PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+RATE_PATTERN = re.compile(r'^(\d+)/(\d*)([smhd])$')
+# Drop spent leases once this many are held
+MAX_LEASES = 10000
+
+
+def get_rate_limit_settings() -> Dict[str, Any]:
+    return {
+        'STORE': 'asana_backend.utils.rate_limiting.memory_store.MemoryStore',
+        'OPTIONS': {},
+        'LEASE_FRACTION': 0.05,
+        'API_LIMITS': {},
+        **getattr(settings, 'ASANA_RATE_LIMITS', {}),
+    }
+
+
+def parse_rate(rate: str) -> Tuple[int, int]:
+    """``'100/10s'`` -> (100 requests, 10 seconds)."""
+    match = RATE_PATTERN.match(rate.strip().lower())
+    if not match:
+        raise ValueError(f"Invalid rate: {rate!r}")
+    count, multiplier, unit = match.groups()
+    return int(count), int(multiplier or 1) * RATE_PERIODS[unit]
+
+
+class TokenBucketLimiter:
+    def __init__(
+        self,
+        store: RateLimitStoreInterface,
+        lease_fraction: float = 0.05
+    ):
+        self.store = store
+        self.lease_fraction = lease_fraction
+        # bucket key -> [tokens left, lease expiry]
+        self._leases: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: str, rate: str) -> Tuple[bool, float]:
+        """
+        Take a token from bucket ``key`` limited to ``rate``. Returns
+        whether the request may go ahead and, if not, the seconds until it
+        may be retried.
+        """
+        now = time.time()
+        with self._lock:
+            lease = self._leases.get(key)
+            if lease and lease[0] >= 1 and lease[1] > now:
+                lease[0] -= 1
+                return True, 0.0
+
+        capacity, period = parse_rate(rate)
+        refill_rate = capacity / period
+        lease_size = max(1, int(capacity * self.lease_fraction))
+        granted, retry_after = self.store.take(
+            key, capacity, refill_rate, lease_size, now
+        )
+        if not granted:
+            return False, retry_after
+        if granted > 1:
+            with self._lock:
+                if len(self._leases) >= MAX_LEASES:
+                    self._leases = {
+                        lease_key: lease
+                        for lease_key, lease in self._leases.items()
+                        if lease[0] >= 1 and lease[1] > now
+                    }
+                self._leases[key] = [granted - 1, now + granted / refill_rate]
+        return True, 0.0
+
+
+_limiter: Optional[TokenBucketLimiter] = None
+_limiter_settings: Optional[Dict[str, Any]] = None
+_limiter_lock = threading.Lock()
+
+
+def get_limiter() -> TokenBucketLimiter:
+    """The process-wide limiter, rebuilt when ASANA_RATE_LIMITS changes."""
+    global _limiter, _limiter_settings
+    rate_limit_settings = get_rate_limit_settings()
+    if _limiter is None or rate_limit_settings != _limiter_settings:
+        with _limiter_lock:
+            if _limiter is None or rate_limit_settings != _limiter_settings:
+                store_class = import_string(rate_limit_settings['STORE'])
+                _limiter = TokenBucketLimiter(
+                    store_class(**rate_limit_settings['OPTIONS']),
+                    lease_fraction=rate_limit_settings['LEASE_FRACTION']
+                )
+                _limiter_settings = rate_limit_settings
+    return _limiter
@@ -0,0 +1,47 @@
+import threading
+from typing import Dict, Tuple
+from asana_backend.utils.rate_limiting.store_interface import (
+    RateLimitStoreInterface,
+    take_from_bucket
+)
+
+# Forget buckets that have refilled once every this many writes
+PRUNE_EVERY = 1000
+
+
+class MemoryStore(RateLimitStoreInterface):
+    """
+    Buckets in this process's memory. Only correct for a single process
+    (runserver, tests); use SQLiteStore when several workers serve the API.
+    """
+
+    def __init__(self):
+        # key -> (tokens, updated_at, time the bucket is full again)
+        self._buckets: Dict[str, Tuple[float, float, float]] = {}
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    def take(
+        self,
+        key: str,
+        capacity: float,
+        refill_rate: float,
+        count: int,
+        now: float
+    ) -> Tuple[int, float]:
+        with self._lock:
+            tokens, updated_at, _ = self._buckets.get(key, (capacity, now, now))
+            granted, tokens, retry_after = take_from_bucket(
+                tokens, updated_at, capacity, refill_rate, count, now
+            )
+            if granted:
+                full_at = now + (capacity - tokens) / refill_rate
+                self._buckets[key] = (tokens, now, full_at)
+                self._writes += 1
+                if self._writes % PRUNE_EVERY == 0:
+                    self._buckets = {
+                        bucket_key: bucket
+                        for bucket_key, bucket in self._buckets.items()
+                        if bucket[2] > now
+                    }
+            return granted, retry_after
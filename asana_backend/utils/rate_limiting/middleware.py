@@ -0,0 +1,54 @@
+"""
+API-wide rate limits.
+
+@ratelimit on each view limits a client's IP per endpoint. On top of that,
+every request under ``/api/`` takes a token from a bucket per API token and
+one per workspace, with the rates in ``ASANA_RATE_LIMITS['API_LIMITS']``
+(keyed by the key names of asana_backend.utils.decorators.ratelimit). These
+buckets are shared by all endpoints, so they are large enough for workers
+to lease tokens from the store rather than take them one at a time.
+
+The actions of a batch request are dispatched without going through the
+middleware, so a batch counts once.
+"""
+from django.conf import settings
+from django.utils.deprecation import MiddlewareMixin
+from asana_backend.utils.decorators.ratelimit import (
+    get_key_value,
+    rate_limited_response,
+)
+from asana_backend.utils.rate_limiting.limiter import (
+    get_limiter,
+    get_rate_limit_settings,
+)
+
+API_PREFIX = '/api/'
+
+
+class ApiRateLimitMiddleware(MiddlewareMixin):
+    """
+    Answers API requests over their token or workspace limit with a 429.
+    The check runs in process_view, where the URL's workspace is known.
+    """
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if not getattr(settings, 'RATELIMIT_ENABLE', True):
+            return None
+        if not request.path.startswith(API_PREFIX):
+            return None
+
+        limiter = get_limiter()
+        limited, retry_after = False, 0.0
+        for key, rate in get_rate_limit_settings()['API_LIMITS'].items():
+            if not rate:
+                continue
+            key_value = get_key_value(request, key, view_kwargs)
+            if key_value is None:
+                continue
+            allowed, wait = limiter.acquire(f'api:{rate}:{key}:{key_value}', rate)
+            if not allowed:
+                limited, retry_after = True, max(retry_after, wait)
+        if limited:
+            request.limited = True
+            return rate_limited_response(retry_after)
+        return None
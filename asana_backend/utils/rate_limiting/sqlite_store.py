@@ -0,0 +1,89 @@
+import os
+import sqlite3
+import threading
+from typing import Tuple
+from asana_backend.utils.rate_limiting.store_interface import (
+    RateLimitStoreInterface,
+    take_from_bucket
+)
+
+# Forget buckets that have refilled once every this many writes
+PRUNE_EVERY = 1000
+
+CREATE_TABLE = '''
+    CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+        key TEXT PRIMARY KEY,
+        tokens REAL NOT NULL,
+        updated_at REAL NOT NULL,
+        full_at REAL NOT NULL
+    ) WITHOUT ROWID
+'''
+
+
+class SQLiteStore(RateLimitStoreInterface):
+    """
+    Buckets in a SQLite file shared by every worker process on the host.
+
+    Each take is one short write transaction; WAL keeps readers of the
+    file unblocked and busy_timeout makes concurrent writers queue instead
+    of failing. The file holds throwaway counters, so it is not fsynced.
+    Connections are opened per thread and again after a fork.
+    """
+
+    def __init__(self, path: str, timeout: float = 5.0):
+        self.path = str(path)
+        self.timeout = timeout
+        self._local = threading.local()
+        self._writes = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(
+                self.path,
+                timeout=self.timeout,
+                isolation_level=None
+            )
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=OFF')
+            connection.execute(CREATE_TABLE)
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def take(
+        self,
+        key: str,
+        capacity: float,
+        refill_rate: float,
+        count: int,
+        now: float
+    ) -> Tuple[int, float]:
+        connection = self._connection()
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            row = connection.execute(
+                'SELECT tokens, updated_at FROM rate_limit_buckets WHERE key = ?',
+                (key,)
+            ).fetchone()
+            tokens, updated_at = row if row else (capacity, now)
+            granted, tokens, retry_after = take_from_bucket(
+                tokens, updated_at, capacity, refill_rate, count, now
+            )
+            if granted:
+                connection.execute(
+                    'INSERT OR REPLACE INTO rate_limit_buckets '
+                    '(key, tokens, updated_at, full_at) VALUES (?, ?, ?, ?)',
+                    (key, tokens, now, now + (capacity - tokens) / refill_rate)
+                )
+                self._writes += 1
+                if self._writes % PRUNE_EVERY == 0:
+                    connection.execute(
+                        'DELETE FROM rate_limit_buckets WHERE full_at <= ?',
+                        (now,)
+                    )
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        return granted, retry_after
@@ -0,0 +1,46 @@
+from abc import ABC, abstractmethod
+from typing import Tuple
+
+
+def take_from_bucket(
+    tokens: float,
+    updated_at: float,
+    capacity: float,
+    refill_rate: float,
+    count: int,
+    now: float
+) -> Tuple[int, float, float]:
+    """
+    Refill a bucket that held ``tokens`` at ``updated_at`` and take up to
+    ``count`` whole tokens from it. Returns the tokens taken, the tokens
+    left and, when none could be taken, the seconds until one can.
+    """
+    tokens = min(capacity, tokens + max(0.0, now - updated_at) * refill_rate)
+    granted = min(count, int(tokens))
+    if granted:
+        return granted, tokens - granted, 0.0
+    return 0, tokens, (1 - tokens) / refill_rate
+
+
+class RateLimitStoreInterface(ABC):
+    """
+    Where token buckets live. A store shared by all worker processes keeps
+    limits correct however many workers serve the API.
+    """
+
+    @abstractmethod
+    def take(
+        self,
+        key: str,
+        capacity: float,
+        refill_rate: float,
+        count: int,
+        now: float
+    ) -> Tuple[int, float]:
+        """
+        Atomically take up to ``count`` tokens from bucket ``key``, which
+        holds at most ``capacity`` tokens and gains ``refill_rate`` per
+        second; a bucket seen for the first time is full. Returns the
+        tokens taken and, when none were, the seconds until one is free.
+        """
+        pass
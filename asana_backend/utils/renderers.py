@@ -0,0 +1,86 @@
+"""
+JSON encoding for API responses.
+
+``dumps`` encodes with orjson when it is installed and with the standard
+library otherwise. Both write UUIDs, datetimes, dates, Decimals and lazy
+strings the way DRF's JSONEncoder does, so interactors can hand those
+values over as they are. ``JSONRenderer`` encodes each response once and
+only indents it in that single pass, when the request sets ``opt_pretty``.
+"""
+import json
+from typing import Any, Optional
+from rest_framework.renderers import JSONRenderer as BaseJSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+PRETTY_INDENT = 2
+
+_encoder = JSONEncoder()
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def _encode_stdlib(data: Any, indent: Optional[int]) -> bytes:
+    return json.dumps(
+        data,
+        cls=JSONEncoder,
+        indent=indent,
+        ensure_ascii=False,
+        separators=(',', ': ') if indent else (',', ':')
+    ).encode('utf-8')
+
+
+def dumps(data: Any, indent: Optional[int] = None) -> bytes:
+    """
+    ``data`` as UTF-8 JSON. orjson only indents by two spaces, so other
+    indents (the browsable API asks for 4) go through the standard library,
+    as does anything orjson rejects, such as integers beyond 64 bits.
+    """
+    if orjson is not None and indent in (None, PRETTY_INDENT):
+        options = _ORJSON_OPTIONS
+        if indent:
+            options |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, default=_encoder.default, option=options)
+        except orjson.JSONEncodeError:
+            pass
+    return _encode_stdlib(data, indent)
+
+
+def is_pretty(request) -> bool:
+    if request is None:
+        return False
+    return request.GET.get('opt_pretty', 'false').lower() == 'true'
+
+
+class JSONRenderer(BaseJSONRenderer):
+    """
+    DRF's JSONRenderer encoding through ``dumps``; ``opt_pretty=true``
+    indents the output.
+    """
+
+    def get_indent(self, accepted_media_type, renderer_context):
+        indent = super().get_indent(accepted_media_type, renderer_context)
+        if indent is None and is_pretty(renderer_context.get('request')):
+            return PRETTY_INDENT
+        return indent
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        content = dumps(
+            data,
+            indent=self.get_indent(accepted_media_type, renderer_context)
+        )
+        # Keep the output a strict JavaScript subset, as DRF does
+        if b'\xe2\x80\xa8' in content or b'\xe2\x80\xa9' in content:
+            content = content.replace(
+                b'\xe2\x80\xa8', b'\\u2028'
+            ).replace(b'\xe2\x80\xa9', b'\\u2029')
+        return content
@@ -0,0 +1,200 @@
+"""
+Read replica routing.
+
+With replicas configured (``ASANA_DB_ROUTING['REPLICAS']``, see settings),
+``ReplicaRouter`` sends the reads of GET and HEAD requests for the API's
+own models (``APPS``) to a replica, one per request, and everything else
+to the primary: writes, reads inside a transaction, reads of other
+requests and reads outside a request (job workers, management commands).
+
+Replicas lag behind the primary, so a client that has just written is
+pinned to the primary for ``PIN_SECONDS`` and its next reads see its own
+writes. ``ReplicaRoutingMiddleware`` pins a client when its request wrote
+anything, by its API token (its IP without one), in the ``PIN_CACHE``
+cache. Once a request has written, its remaining reads go to the primary
+too.
+"""
+import hashlib
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS, connections
+
+READ_METHODS = ('GET', 'HEAD')
+PIN_KEY_PREFIX = 'replica-pin:'
+
+
+def get_db_routing_settings() -> Dict[str, Any]:
+    return {
+        'REPLICAS': [],
+        'PIN_SECONDS': 5,
+        'PIN_CACHE': 'default',
+        'APPS': None,
+        **getattr(settings, 'ASANA_DB_ROUTING', {}),
+    }
+
+
+class RoutingState:
+    """How the current request's queries are routed."""
+
+    def __init__(self, use_replica: bool):
+        self.use_replica = use_replica
+        self.replica: Optional[str] = None
+        self.wrote = False
+
+
+_current_routing: ContextVar[Optional[RoutingState]] = ContextVar(
+    'replica_routing',
+    default=None
+)
+
+
+@contextmanager
+def routing_scope(use_replica: bool):
+    """Route the block's reads to a replica if ``use_replica``."""
+    state = RoutingState(use_replica)
+    token = _current_routing.set(state)
+    try:
+        yield state
+    finally:
+        _current_routing.reset(token)
+
+
+def reads_from_replica() -> bool:
+    """Whether the current request's reads of the API's models go to a replica."""
+    state = _current_routing.get()
+    return (
+        state is not None
+        and state.use_replica
+        and not state.wrote
+        # A transaction sees its own writes only on the primary
+        and not connections[DEFAULT_DB_ALIAS].in_atomic_block
+        and bool(get_db_routing_settings()['REPLICAS'])
+    )
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        routing = get_db_routing_settings()
+        apps = routing['APPS']
+        if not reads_from_replica() or (
+            apps is not None and model._meta.app_label not in apps
+        ):
+            return DEFAULT_DB_ALIAS
+        state = _current_routing.get()
+        # One replica per request, so its reads agree with each other
+        if state.replica is None:
+            state.replica = random.choice(routing['REPLICAS'])
+        return state.replica
+
+    def db_for_write(self, model, **hints):
+        state = _current_routing.get()
+        if state is not None:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the primary's rows
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in get_db_routing_settings()['REPLICAS']:
+            return False
+        return None
+
+
+def client_key(request) -> str:
+    """The client's API token, hashed; its IP without one."""
+    authorization = request.META.get('HTTP_AUTHORIZATION', '')
+    _, _, token = authorization.partition(' ')
+    if not token:
+        return f"{PIN_KEY_PREFIX}ip:{request.META.get('REMOTE_ADDR')}"
+    return PIN_KEY_PREFIX + hashlib.sha256(token.strip().encode()).hexdigest()
+
+
+# Streamed bodies are read after the middleware has returned, so each
+# chunk is produced back inside the request's scope
+def _in_scope(content, state: RoutingState):
+    iterator = iter(content)
+    while True:
+        token = _current_routing.set(state)
+        try:
+            chunk = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            _current_routing.reset(token)
+        yield chunk
+
+
+async def _ain_scope(content, state: RoutingState):
+    iterator = content.__aiter__()
+    while True:
+        token = _current_routing.set(state)
+        try:
+            chunk = await iterator.__anext__()
+        except StopAsyncIteration:
+            return
+        finally:
+            _current_routing.reset(token)
+        yield chunk
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Routes each GET/HEAD request's reads to a replica unless its client
+    is pinned to the primary, and pins clients whose requests write.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        routing = get_db_routing_settings()
+        use_replica = (
+            bool(routing['REPLICAS'])
+            and request.method in READ_METHODS
+            and caches[routing['PIN_CACHE']].get(client_key(request)) is None
+        )
+        with routing_scope(use_replica) as state:
+            response = self.get_response(request)
+        if state.wrote:
+            caches[routing['PIN_CACHE']].set(
+                client_key(request), 1, routing['PIN_SECONDS']
+            )
+        if response.streaming:
+            response.streaming_content = _in_scope(
+                response.streaming_content, state
+            )
+        return response
+
+    async def __acall__(self, request):
+        routing = get_db_routing_settings()
+        use_replica = (
+            bool(routing['REPLICAS'])
+            and request.method in READ_METHODS
+            and await caches[routing['PIN_CACHE']].aget(client_key(request)) is None
+        )
+        with routing_scope(use_replica) as state:
+            response = await self.get_response(request)
+        if state.wrote:
+            await caches[routing['PIN_CACHE']].aset(
+                client_key(request), 1, routing['PIN_SECONDS']
+            )
+        if response.streaming:
+            response.streaming_content = (
+                _ain_scope(response.streaming_content, state)
+                if response.is_async
+                else _in_scope(response.streaming_content, state)
+            )
+        return response
@@ -0,0 +1,250 @@
+"""
+A Django cache backend in a SQLite file, shared by every worker process
+on the host.
+
+It replaces FileBasedCache for small values that must be seen by all
+workers (object versions, replica pins). FileBasedCache lists its whole
+directory on every write once it holds MAX_ENTRIES files and then deletes
+a random 1/CULL_FREQUENCY of them; entries stored without a timeout, like
+object versions, are dropped whether they are in use or not. Here a write
+is one short transaction on an indexed table. When the table holds more
+than MAX_ENTRIES entries, expired entries go first, then the least
+recently used 1/CULL_FREQUENCY of the rest.
+
+Reads note when an entry was used, but at most once every TOUCH_SECONDS
+per entry, so that hot entries are not rewritten on every read. The
+recency is that coarse, and the size is checked every CHECK_EVERY writes
+of each process, so MAX_ENTRIES is a soft bound. Size it well above the
+number of entries in use.
+
+    CACHES['object_versions'] = {
+        'BACKEND': 'asana_backend.utils.sqlite_cache.SQLiteCache',
+        'LOCATION': '/var/lib/asana/object_versions.sqlite3',
+        'OPTIONS': {'MAX_ENTRIES': 200000, 'CULL_FREQUENCY': 10},
+    }
+"""
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+TOUCH_SECONDS = 60
+CHECK_EVERY = 100
+# SQLite's default limit on ? parameters in one statement is 32766
+BATCH_SIZE = 500
+
+CREATE_TABLE = '''
+    CREATE TABLE IF NOT EXISTS cache_entries (
+        key TEXT PRIMARY KEY,
+        value BLOB NOT NULL,
+        expires_at REAL,
+        used_at REAL NOT NULL
+    ) WITHOUT ROWID
+'''
+CREATE_INDEX = '''
+    CREATE INDEX IF NOT EXISTS cache_entries_used_at
+    ON cache_entries (used_at)
+'''
+
+
+def _batches(items: List[Any]) -> Iterable[List[Any]]:
+    for start in range(0, len(items), BATCH_SIZE):
+        yield items[start:start + BATCH_SIZE]
+
+
+class SQLiteCache(BaseCache):
+    """
+    Entries in the SQLite file at LOCATION. WAL keeps readers unblocked
+    and busy_timeout makes concurrent writers queue instead of failing.
+    Connections are opened per thread and again after a fork.
+    """
+
+    def __init__(self, location: str, params: Dict[str, Any]):
+        super().__init__(params)
+        self.path = str(location)
+        self.busy_timeout = params.get('OPTIONS', {}).get('BUSY_TIMEOUT', 5.0)
+        self._local = threading.local()
+        self._writes = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(
+                self.path,
+                timeout=self.busy_timeout,
+                isolation_level=None
+            )
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.execute(CREATE_TABLE)
+            connection.execute(CREATE_INDEX)
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def _write(self, statements: List[tuple]) -> int:
+        """
+        Run ``statements`` ((sql, params) pairs) in one transaction and
+        return the number of rows they changed.
+        """
+        connection = self._connection()
+        changed = 0
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            for sql, params in statements:
+                changed += connection.execute(sql, params).rowcount
+            self._writes += 1
+            if self._writes % CHECK_EVERY == 0:
+                self._cull(connection, time.time())
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        return changed
+
+    def _cull(self, connection: sqlite3.Connection, now: float) -> None:
+        (count,) = connection.execute(
+            'SELECT COUNT(*) FROM cache_entries'
+        ).fetchone()
+        if count <= self._max_entries:
+            return
+        count -= connection.execute(
+            'DELETE FROM cache_entries WHERE expires_at <= ?', (now,)
+        ).rowcount
+        if count <= self._max_entries:
+            return
+        if self._cull_frequency == 0:
+            connection.execute('DELETE FROM cache_entries')
+            return
+        keep = self._max_entries - self._max_entries // self._cull_frequency
+        connection.execute(
+            'DELETE FROM cache_entries WHERE key IN ('
+            'SELECT key FROM cache_entries ORDER BY used_at LIMIT ?)',
+            (max(0, count - keep),)
+        )
+
+    def _set_statement(self, key: str, value: Any, timeout: Any, now: float):
+        return (
+            'INSERT OR REPLACE INTO cache_entries '
+            '(key, value, expires_at, used_at) VALUES (?, ?, ?, ?)',
+            (
+                key,
+                pickle.dumps(value, pickle.HIGHEST_PROTOCOL),
+                self.get_backend_timeout(timeout),
+                now,
+            )
+        )
+
+    def get_many(self, keys: Iterable[Any], version: Optional[int] = None) -> Dict[Any, Any]:
+        key_map = {
+            self.make_and_validate_key(key, version=version): key
+            for key in keys
+        }
+        if not key_map:
+            return {}
+        now = time.time()
+        connection = self._connection()
+        found, stale = {}, []
+        for batch in _batches(list(key_map)):
+            rows = connection.execute(
+                'SELECT key, value, expires_at, used_at FROM cache_entries '
+                f'WHERE key IN ({", ".join("?" * len(batch))})',
+                batch
+            ).fetchall()
+            for key, value, expires_at, used_at in rows:
+                if expires_at is not None and expires_at <= now:
+                    continue
+                found[key_map[key]] = pickle.loads(value)
+                if used_at < now - TOUCH_SECONDS:
+                    stale.append(key)
+        if stale:
+            self._write([
+                (
+                    'UPDATE cache_entries SET used_at = ? '
+                    f'WHERE key IN ({", ".join("?" * len(batch))})',
+                    [now, *batch]
+                )
+                for batch in _batches(stale)
+            ])
+        return found
+
+    def get(self, key: Any, default: Any = None, version: Optional[int] = None) -> Any:
+        sentinel = object()
+        value = self.get_many([key], version=version).get(key, sentinel)
+        return default if value is sentinel else value
+
+    def set(self, key: Any, value: Any, timeout: Any = DEFAULT_TIMEOUT, version: Optional[int] = None) -> None:
+        key = self.make_and_validate_key(key, version=version)
+        self._write([self._set_statement(key, value, timeout, time.time())])
+
+    def set_many(self, data: Dict[Any, Any], timeout: Any = DEFAULT_TIMEOUT, version: Optional[int] = None) -> List[Any]:
+        if data:
+            now = time.time()
+            self._write([
+                self._set_statement(
+                    self.make_and_validate_key(key, version=version),
+                    value, timeout, now
+                )
+                for key, value in data.items()
+            ])
+        return []
+
+    def add(self, key: Any, value: Any, timeout: Any = DEFAULT_TIMEOUT, version: Optional[int] = None) -> bool:
+        key = self.make_and_validate_key(key, version=version)
+        now = time.time()
+        # Taking the place of an expired entry counts as adding
+        return bool(self._write([(
+            'INSERT INTO cache_entries (key, value, expires_at, used_at) '
+            'VALUES (?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET '
+            'value = excluded.value, expires_at = excluded.expires_at, '
+            'used_at = excluded.used_at '
+            'WHERE cache_entries.expires_at <= ?',
+            (
+                key,
+                pickle.dumps(value, pickle.HIGHEST_PROTOCOL),
+                self.get_backend_timeout(timeout),
+                now,
+                now,
+            )
+        )]))
+
+    def touch(self, key: Any, timeout: Any = DEFAULT_TIMEOUT, version: Optional[int] = None) -> bool:
+        key = self.make_and_validate_key(key, version=version)
+        now = time.time()
+        return bool(self._write([(
+            'UPDATE cache_entries SET expires_at = ?, used_at = ? '
+            'WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)',
+            (self.get_backend_timeout(timeout), now, key, now)
+        )]))
+
+    def delete(self, key: Any, version: Optional[int] = None) -> bool:
+        key = self.make_and_validate_key(key, version=version)
+        return bool(self._write([
+            ('DELETE FROM cache_entries WHERE key = ?', (key,))
+        ]))
+
+    def delete_many(self, keys: Iterable[Any], version: Optional[int] = None) -> None:
+        keys = [self.make_and_validate_key(key, version=version) for key in keys]
+        if keys:
+            self._write([
+                (
+                    'DELETE FROM cache_entries '
+                    f'WHERE key IN ({", ".join("?" * len(batch))})',
+                    batch
+                )
+                for batch in _batches(keys)
+            ])
+
+    def has_key(self, key: Any, version: Optional[int] = None) -> bool:
+        key = self.make_and_validate_key(key, version=version)
+        return self._connection().execute(
+            'SELECT 1 FROM cache_entries '
+            'WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)',
+            (key, time.time())
+        ).fetchone() is not None
+
+    def clear(self) -> None:
+        self._write([('DELETE FROM cache_entries', ())])
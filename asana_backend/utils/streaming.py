@@ -0,0 +1,116 @@
+"""
+Streamed JSON list responses.
+
+``StreamingListResponse`` writes a list body out while its rows are still
+being read: the items of an iterator-valued ``data`` are encoded a batch
+at a time as the storage's StreamingPage yields them, instead of the page
+being built into a list and rendered whole by DRF's JSONRenderer. Memory
+stays at one chunk of rows and the first bytes leave before the last row
+is read.
+
+Bulk clients, identified by one of ``ASANA_STREAMING['BULK_CLIENT_TOKENS']``
+in the X-Bulk-Client-Token header, may ask list endpoints for pages of up
+to ``BULK_MAX_LIMIT`` rows; pages above the usual limit are streamed.
+"""
+import hmac
+from collections.abc import Iterator
+from typing import Any, Dict
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from asana_backend.utils.renderers import dumps
+
+BULK_CLIENT_TOKEN_HEADER = 'HTTP_X_BULK_CLIENT_TOKEN'
+DEFAULT_BULK_MAX_LIMIT = 10000
+# Encoded items handed to the server per write
+DEFAULT_ITEMS_PER_WRITE = 100
+
+
+def get_streaming_settings() -> Dict[str, Any]:
+    return {
+        'BULK_CLIENT_TOKENS': [],
+        'BULK_MAX_LIMIT': DEFAULT_BULK_MAX_LIMIT,
+        'ITEMS_PER_WRITE': DEFAULT_ITEMS_PER_WRITE,
+        **getattr(settings, 'ASANA_STREAMING', {}),
+    }
+
+
+def is_bulk_client(request) -> bool:
+    token = request.META.get(BULK_CLIENT_TOKEN_HEADER)
+    if not token:
+        return False
+    return any(
+        hmac.compare_digest(token.encode(), trusted.encode())
+        for trusted in get_streaming_settings()['BULK_CLIENT_TOKENS']
+    )
+
+
+def get_max_limit(request, max_limit: int) -> int:
+    """The largest page ``request`` may ask for."""
+    if is_bulk_client(request):
+        return max(max_limit, get_streaming_settings()['BULK_MAX_LIMIT'])
+    return max_limit
+
+
+def iter_json(body: Dict[str, Any]):
+    """
+    Encode ``body`` as a JSON object piece by piece. Iterator values are
+    written as arrays item by item; callable values are called when they
+    are reached, so a ``next_page`` that depends on ``data`` having been
+    read can follow it.
+    """
+    items_per_write = get_streaming_settings()['ITEMS_PER_WRITE']
+
+    yield b'{'
+    for index, (key, value) in enumerate(body.items()):
+        if callable(value):
+            value = value()
+        prefix = (b',' if index else b'') + dumps(key) + b':'
+        if not isinstance(value, Iterator):
+            yield prefix + dumps(value)
+            continue
+
+        buffer = [prefix + b'[']
+        for position, item in enumerate(value):
+            buffer.append((b',' if position else b'') + dumps(item))
+            if len(buffer) >= items_per_write:
+                yield b''.join(buffer)
+                buffer = []
+        buffer.append(b']')
+        yield b''.join(buffer)
+    yield b'}'
+
+
+async def aiter_json(body: Dict[str, Any]):
+    """
+    ``iter_json`` for async views. Each chunk is encoded on the request's
+    sync thread, where the rows' cursor was opened, without holding up
+    the event loop.
+    """
+    chunks = iter_json(body)
+    next_chunk = sync_to_async(next, thread_sensitive=True)
+    while True:
+        chunk = await next_chunk(chunks, None)
+        if chunk is None:
+            return
+        yield chunk
+
+
+class StreamingListResponse(StreamingHttpResponse):
+    """
+    A JSON response whose body is encoded while it is sent; async views
+    pass ``asynchronous=True`` so ASGI servers need not read it whole
+    first.
+    """
+
+    def __init__(
+        self,
+        body: Dict[str, Any],
+        status: int = 200,
+        asynchronous: bool = False
+    ):
+        super().__init__(
+            aiter_json(body) if asynchronous else iter_json(body),
+            status=status,
+            content_type='application/json'
+        )
@@ -3,7 +3,7 @@ Utility functions for validation.
 """
 import re
 import uuid
-from typing import Optional
+from typing import Optional, Union
 from django.core.exceptions import ValidationError
 
 
@@ -48,16 +48,17 @@ def validate_hex_color(value: Optional[str]) -> Optional[str]:
 
 
 def validate_pagination_params(
-    offset: Optional[int] = None,
+    offset: Optional[Union[int, str]] = None,
     limit: Optional[int] = None,
     max_limit: int = 100
-) -> tuple[int, int]:
+) -> tuple[Union[int, str], int]:
     """
     Validate and normalize pagination parameters.
-    Returns (offset, limit) tuple.
+    Returns (offset, limit) tuple. The offset is either a legacy integer
+    offset or an offset token taken from a previous page's next_page.
     Raises ValidationError for invalid values.
     """
-    if offset is None:
+    if offset is None or offset == '':
         offset = 0
     else:
         try:
@@ -66,10 +67,13 @@ def validate_pagination_params(
                 raise ValidationError(
                     f"Offset must be >= 0, got: {offset}"
                 )
-        except (ValueError, TypeError) as e:
-            raise ValidationError(
-                f"Offset must be a valid integer, got: {offset}"
-            )
+        except (ValueError, TypeError):
+            if not isinstance(offset, str):
+                raise ValidationError(
+                    f"Offset must be a valid integer, got: {offset}"
+                )
+            from asana_backend.utils.pagination import decode_offset_token
+            decode_offset_token(offset)
 
     if limit is None:
         limit = 50
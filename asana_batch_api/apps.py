@@ -0,0 +1,5 @@
+from django.apps import AppConfig
+
+
+class AsanaBatchApiConfig(AppConfig):
+    name = 'asana_batch_api'
@@ -0,0 +1,12 @@
+# Asana accepts at most 10 actions per batch request
+MAX_ACTIONS = 10
+
+ALLOWED_METHODS = ('get', 'post', 'put', 'delete')
+
+# Batch action options mapped to the query parameters views read
+OPTION_QUERY_PARAMS = {
+    'limit': 'limit',
+    'offset': 'offset',
+    'fields': 'opt_fields',
+    'pretty': 'opt_pretty',
+}
@@ -0,0 +1,4 @@
+MISSING_ACTIONS = "actions: Missing input"
+TOO_MANY_ACTIONS = "actions: A batch request can contain at most {max_actions} actions"
+INVALID_METHOD = "method: Must be one of get, post, put, delete"
+INVALID_RELATIVE_PATH = "relative_path: Must be a path relative to /api/1.0"
@@ -0,0 +1,143 @@
+import inspect
+import json
+from io import BytesIO
+from typing import Any, Dict, Optional, Tuple
+from asgiref.sync import async_to_sync
+from django.core.handlers.wsgi import WSGIRequest
+from django.http import QueryDict
+from django.urls import Resolver404, resolve
+from asana_batch_api.interactors.dispatcher_interfaces.dispatcher_interface import (
+    DispatcherInterface
+)
+from asana_batch_api.constants.constants import OPTION_QUERY_PARAMS
+from asana_backend.utils.pagination import API_BASE_PATH
+from asana_backend.utils.error_responses import (
+    create_error_response,
+    server_error,
+)
+
+# Request metadata each action inherits from the batch request
+INHERITED_META = (
+    'REMOTE_ADDR',
+    'SERVER_NAME',
+    'SERVER_PORT',
+    'HTTP_HOST',
+    'HTTP_AUTHORIZATION',
+    'HTTP_USER_AGENT',
+    'HTTP_X_FORWARDED_FOR',
+    'wsgi.url_scheme',
+)
+
+
+async def _await(awaitable):
+    return await awaitable
+
+
+class DispatcherImplementation(DispatcherInterface):
+    """
+    Runs batch actions in-process: each action is resolved with the URL
+    resolver and handed to the same view a direct request would reach.
+    """
+
+    def __init__(self, request):
+        self.request = request
+
+    def dispatch_action(
+        self,
+        method: str,
+        relative_path: str,
+        data: Optional[Dict[str, Any]] = None,
+        options: Optional[Dict[str, Any]] = None
+    ) -> Tuple[int, Dict[str, str], Any]:
+        path, _, query_string = relative_path.partition('?')
+        path = f"{API_BASE_PATH}/{path.lstrip('/')}"
+
+        match = self._resolve(path)
+        if match is None:
+            return 404, {}, create_error_response(
+                f"relative_path: No route matches {relative_path}"
+            )
+        path, resolver_match = match
+
+        params = QueryDict(query_string, mutable=True)
+        for option, value in (options or {}).items():
+            param = OPTION_QUERY_PARAMS.get(option)
+            if param is None:
+                continue
+            if isinstance(value, (list, tuple)):
+                value = ','.join(str(item) for item in value)
+            elif isinstance(value, bool):
+                value = 'true' if value else 'false'
+            params[param] = str(value)
+
+        request = self._build_request(method, path, params.urlencode(), data)
+
+        try:
+            response = resolver_match.func(
+                request,
+                *resolver_match.args,
+                **resolver_match.kwargs
+            )
+            if inspect.isawaitable(response):
+                # An async view (ASANA_ASYNC_VIEWS)
+                response = async_to_sync(_await)(response)
+            if hasattr(response, 'render'):
+                response.render()
+        except Exception as e:
+            return 500, {}, server_error(str(e))
+
+        headers = {}
+        if response.has_header('Location'):
+            headers['Location'] = response['Location']
+
+        return response.status_code, headers, self._decode_body(response)
+
+    def _resolve(self, path: str):
+        # Most routes are registered with a trailing slash; accept both
+        candidates = [path]
+        if not path.endswith('/'):
+            candidates.append(path + '/')
+        for candidate in candidates:
+            try:
+                return candidate, resolve(candidate)
+            except Resolver404:
+                continue
+        return None
+
+    def _build_request(
+        self,
+        method: str,
+        path: str,
+        query_string: str,
+        data: Optional[Dict[str, Any]]
+    ) -> WSGIRequest:
+        body = b''
+        if method != 'get':
+            body = json.dumps(data or {}).encode('utf-8')
+
+        environ = {
+            key: self.request.META[key]
+            for key in INHERITED_META
+            if key in self.request.META
+        }
+        environ.update({
+            'REQUEST_METHOD': method.upper(),
+            'SCRIPT_NAME': '',
+            'PATH_INFO': path,
+            'QUERY_STRING': query_string,
+            'CONTENT_TYPE': 'application/json',
+            'CONTENT_LENGTH': str(len(body)),
+            'wsgi.input': BytesIO(body),
+        })
+        request = WSGIRequest(environ)
+        # The batch request was rate limited once for all of its actions
+        request.is_batch_action = True
+        return request
+
+    def _decode_body(self, response) -> Any:
+        if not response.content:
+            return None
+        try:
+            return json.loads(response.content)
+        except ValueError:
+            return response.content.decode('utf-8', errors='replace')
@@ -0,0 +1,9 @@
+from asana_batch_api.constants.exception_messages import (
+    MISSING_ACTIONS,
+)
+
+
+class InvalidBatchRequestException(Exception):
+    def __init__(self, message=MISSING_ACTIONS):
+        self.message = message
+        super().__init__(self.message)
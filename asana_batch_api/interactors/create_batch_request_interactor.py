@@ -0,0 +1,65 @@
+from typing import Dict, Any, List
+from asana_batch_api.interactors.dispatcher_interfaces.dispatcher_interface import (
+    DispatcherInterface
+)
+from asana_batch_api.interactors.presenter_interfaces.presenter_interface import (
+    PresenterInterface
+)
+from asana_batch_api.constants.constants import MAX_ACTIONS
+from asana_batch_api.constants.exception_messages import (
+    MISSING_ACTIONS,
+    TOO_MANY_ACTIONS,
+    INVALID_RELATIVE_PATH,
+)
+from asana_batch_api.exceptions.custom_exceptions import (
+    InvalidBatchRequestException
+)
+from asana_backend.utils.identity_map import identity_map_scope
+
+
+class CreateBatchRequestInteractor:
+    def __init__(
+        self,
+        dispatcher: DispatcherInterface,
+        presenter: PresenterInterface
+    ):
+        self.dispatcher = dispatcher
+        self.presenter = presenter
+
+    def create_batch_request(
+        self,
+        actions: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        if not actions:
+            raise InvalidBatchRequestException(MISSING_ACTIONS)
+        if len(actions) > MAX_ACTIONS:
+            raise InvalidBatchRequestException(
+                TOO_MANY_ACTIONS.format(max_actions=MAX_ACTIONS)
+            )
+        for action in actions:
+            path = action['relative_path'].split('?')[0].strip('/')
+            if not path or path.split('/')[0] == 'batch':
+                raise InvalidBatchRequestException(INVALID_RELATIVE_PATH)
+
+        results_list = []
+        # All actions share one identity map, so a workspace or user that
+        # several actions look up is loaded once
+        with identity_map_scope() as identity_map:
+            for action in actions:
+                status_code, headers, body = self.dispatcher.dispatch_action(
+                    method=action['method'],
+                    relative_path=action['relative_path'],
+                    data=action.get('data'),
+                    options=action.get('options')
+                )
+                # Writes may change or delete rows already in the map
+                if action['method'] != 'get':
+                    identity_map.clear()
+
+                results_list.append({
+                    'status_code': status_code,
+                    'headers': headers,
+                    'body': body,
+                })
+
+        return self.presenter.get_batch_response(results_list)
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Tuple
+
+
+class DispatcherInterface(ABC):
+    @abstractmethod
+    def dispatch_action(
+        self,
+        method: str,
+        relative_path: str,
+        data: Optional[Dict[str, Any]] = None,
+        options: Optional[Dict[str, Any]] = None
+    ) -> Tuple[int, Dict[str, str], Any]:
+        """
+        Execute one action and return (status_code, headers, body).
+        """
+        pass
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Any, List
+
+
+class PresenterInterface(ABC):
+    @abstractmethod
+    def get_batch_response(
+        self,
+        results_list: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        pass
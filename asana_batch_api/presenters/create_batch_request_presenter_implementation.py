@@ -0,0 +1,14 @@
+from typing import Dict, Any, List
+from asana_batch_api.interactors.presenter_interfaces.presenter_interface import (
+    PresenterInterface
+)
+
+
+class CreateBatchRequestPresenterImplementation(PresenterInterface):
+    def get_batch_response(
+        self,
+        results_list: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        return {
+            'data': results_list
+        }
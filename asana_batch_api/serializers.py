@@ -0,0 +1,39 @@
+from rest_framework import serializers
+from asana_batch_api.constants.constants import ALLOWED_METHODS
+
+
+class BatchRequestActionSerializer(serializers.Serializer):
+    """BatchRequestAction schema matching API spec"""
+    relative_path = serializers.CharField(required=True)
+    method = serializers.ChoiceField(choices=ALLOWED_METHODS, required=True)
+    data = serializers.DictField(required=False, allow_null=True)
+    options = serializers.DictField(required=False, allow_null=True)
+
+
+class BatchRequestDataSerializer(serializers.Serializer):
+    """BatchRequest schema matching API spec"""
+    actions = BatchRequestActionSerializer(many=True)
+
+
+class BatchRequestSerializer(serializers.Serializer):
+    """Request body for POST /batch"""
+    data = BatchRequestDataSerializer()
+
+
+class BatchResponseSerializer(serializers.Serializer):
+    """BatchResponse schema matching API spec"""
+    status_code = serializers.IntegerField()
+    headers = serializers.DictField(required=False)
+    body = serializers.JSONField(required=False, allow_null=True)
+
+
+class BatchListResponseSerializer(serializers.Serializer):
+    """Response wrapper for POST /batch"""
+    data = BatchResponseSerializer(many=True)
+
+
+class ErrorResponseSerializer(serializers.Serializer):
+    """Error response schema"""
+    errors = serializers.ListField(
+        child=serializers.DictField()
+    )
@@ -0,0 +1,10 @@
+from django.urls import path
+from asana_batch_api.views.create_batch_request.create_batch_request_view import (
+    CreateBatchRequestView
+)
+
+app_name = 'asana_batch_api'
+
+urlpatterns = [
+    path('batch/', CreateBatchRequestView.as_view(), name='create_batch_request'),  # POST
+]
@@ -0,0 +1,92 @@
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from drf_spectacular.utils import extend_schema, OpenApiResponse, OpenApiExample
+from asana_batch_api.interactors.create_batch_request_interactor import (
+    CreateBatchRequestInteractor
+)
+from asana_batch_api.dispatchers.dispatcher_implementation import (
+    DispatcherImplementation
+)
+from asana_batch_api.presenters.create_batch_request_presenter_implementation import (
+    CreateBatchRequestPresenterImplementation
+)
+from asana_batch_api.serializers import (
+    BatchRequestSerializer,
+    BatchListResponseSerializer,
+    ErrorResponseSerializer
+)
+from asana_batch_api.exceptions.custom_exceptions import (
+    InvalidBatchRequestException
+)
+from asana_backend.utils.decorators.ratelimit import ratelimit
+from asana_backend.utils.error_responses import bad_request_error
+
+
+class CreateBatchRequestView(APIView):
+    """
+    Submit parallel requests.
+    Matches Asana API: POST /batch
+    """
+
+    @extend_schema(
+        request=BatchRequestSerializer,
+        responses={
+            200: OpenApiResponse(
+                response=BatchListResponseSerializer,
+                description="Successfully completed the requested batch API operations.",
+                examples=[
+                    OpenApiExample(
+                        'Success Response',
+                        value={
+                            "data": [
+                                {
+                                    "status_code": 200,
+                                    "headers": {},
+                                    "body": {
+                                        "data": {
+                                            "gid": "12345",
+                                            "resource_type": "workspace",
+                                            "name": "My Company Workspace"
+                                        }
+                                    }
+                                }
+                            ]
+                        }
+                    )
+                ]
+            ),
+            400: OpenApiResponse(
+                response=ErrorResponseSerializer,
+                description="This usually occurs because of a missing or malformed parameter. Check the documentation and the syntax of your request and try again."
+            ),
+        },
+        summary="Submit parallel requests",
+        description="Make multiple requests in parallel to Asana's API. Each action is executed against the same endpoints a direct request would reach, and returns its own status code and body.",
+        tags=["Batch API"]
+    )
+    @ratelimit(key='ip', rate='5/s', method='POST')
+    def post(self, request):
+        serializer = BatchRequestSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(
+                bad_request_error(str(serializer.errors)),
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        interactor = CreateBatchRequestInteractor(
+            dispatcher=DispatcherImplementation(request),
+            presenter=CreateBatchRequestPresenterImplementation()
+        )
+
+        try:
+            response = interactor.create_batch_request(
+                actions=serializer.validated_data['data']['actions']
+            )
+        except InvalidBatchRequestException as e:
+            return Response(
+                bad_request_error(e.message),
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        return Response(response, status=status.HTTP_200_OK)
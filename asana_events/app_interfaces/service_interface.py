@@ -0,0 +1,43 @@
+from typing import Any, Dict, List, Optional
+from asana_events.interactors.get_events_interactor import GetEventsInteractor
+from asana_events.storages.storage_implementation import StorageImplementation
+from asana_events.presenters.get_events_presenter_implementation import (
+    GetEventsPresenterImplementation
+)
+from asana_events.models.event import Event
+from asana_events.utils.event_formatter import format_event
+
+
+class ServiceInterface:
+    """What other apps may use from asana_events."""
+
+    @staticmethod
+    def get_workspace_events(
+        workspace_gid: str,
+        sync_token: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Events in a workspace since ``sync_token``. Raises
+        InvalidSyncTokenException, carrying a fresh token, when the token is
+        missing or too old.
+        """
+        interactor = GetEventsInteractor(
+            storage=StorageImplementation(),
+            presenter=GetEventsPresenterImplementation()
+        )
+        return interactor.get_workspace_events(workspace_gid, sync_token)
+
+    @staticmethod
+    def get_latest_sequence() -> int:
+        """Sequence of the newest journal entry (0 when empty)."""
+        return StorageImplementation().get_latest_sequence()
+
+    @staticmethod
+    def get_events_after(after_sequence: int, limit: int) -> List[Event]:
+        """The change feed: journal entries after ``after_sequence``, in order."""
+        return StorageImplementation().get_events_after(after_sequence, limit)
+
+    @staticmethod
+    def format_event(event: Event) -> Dict[str, Any]:
+        """Event as sent to API clients and webhooks."""
+        return format_event(event)
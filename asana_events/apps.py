@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class AsanaEventsConfig(AppConfig):
+    name = 'asana_events'
+
+    def ready(self):
+        # Connect the journal to model save/delete signals
+        from asana_events import signals  # noqa: F401
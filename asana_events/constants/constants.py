@@ -0,0 +1,10 @@
+# Events returned per request; has_more tells the client to ask again
+EVENTS_PAGE_SIZE = 100
+
+# How long the journal keeps events (see `manage.py prune_events`). Sync
+# tokens older than the oldest kept event are rejected with a 412.
+EVENT_RETENTION_HOURS = 24
+
+# pg_advisory_xact_lock key serialising journal writers on PostgreSQL (see
+# asana_events.journal)
+JOURNAL_LOCK_ID = 0x61736e65
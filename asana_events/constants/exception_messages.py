@@ -0,0 +1,5 @@
+SYNC_TOKEN_INVALID = (
+    "Sync token invalid or too old. If you are attempting to keep resources "
+    "in sync, you must fetch the full dataset for this query now and use the "
+    "new sync token for the next sync."
+)
@@ -0,0 +1,10 @@
+from asana_events.constants.exception_messages import SYNC_TOKEN_INVALID
+
+
+class InvalidSyncTokenException(Exception):
+    """Raised with the fresh sync token the client should continue from."""
+
+    def __init__(self, sync: str, message=SYNC_TOKEN_INVALID):
+        self.sync = sync
+        self.message = message
+        super().__init__(self.message)
@@ -0,0 +1,77 @@
+from typing import Any, Callable, Dict, List, Optional
+from asana_events.interactors.storage_interfaces.storage_interface import (
+    StorageInterface
+)
+from asana_events.interactors.presenter_interfaces.presenter_interface import (
+    PresenterInterface
+)
+from asana_events.models.event import Event
+from asana_events.constants.constants import EVENTS_PAGE_SIZE
+from asana_events.exceptions.custom_exceptions import (
+    InvalidSyncTokenException
+)
+from asana_events.utils.event_formatter import format_event
+from asana_events.utils.sync_tokens import decode_sync_token, encode_sync_token
+
+
+class GetEventsInteractor:
+    def __init__(
+        self,
+        storage: StorageInterface,
+        presenter: PresenterInterface
+    ):
+        self.storage = storage
+        self.presenter = presenter
+
+    def get_events(
+        self,
+        resource_gid: str,
+        sync_token: Optional[str]
+    ) -> Dict[str, Any]:
+        return self._get_events_since(
+            self.storage.get_resource_events,
+            resource_gid,
+            sync_token
+        )
+
+    def get_workspace_events(
+        self,
+        workspace_gid: str,
+        sync_token: Optional[str]
+    ) -> Dict[str, Any]:
+        return self._get_events_since(
+            self.storage.get_workspace_events,
+            workspace_gid,
+            sync_token
+        )
+
+    def _get_events_since(
+        self,
+        fetch_events: Callable[[str, int, int], List[Event]],
+        gid: str,
+        sync_token: Optional[str]
+    ) -> Dict[str, Any]:
+        after_sequence = decode_sync_token(sync_token) if sync_token else None
+        if after_sequence is None or self._is_expired(after_sequence):
+            # No (usable) token: hand out one for "now" so the next poll
+            # starts from here
+            raise InvalidSyncTokenException(
+                sync=encode_sync_token(self.storage.get_latest_sequence())
+            )
+
+        events = fetch_events(gid, after_sequence, EVENTS_PAGE_SIZE + 1)
+        has_more = len(events) > EVENTS_PAGE_SIZE
+        events = events[:EVENTS_PAGE_SIZE]
+        if events:
+            after_sequence = events[-1].sequence
+
+        return self.presenter.get_events_response(
+            [format_event(event) for event in events],
+            sync=encode_sync_token(after_sequence),
+            has_more=has_more
+        )
+
+    def _is_expired(self, after_sequence: int) -> bool:
+        # Events after the token were pruned before the client saw them
+        oldest_sequence = self.storage.get_oldest_sequence()
+        return oldest_sequence is not None and after_sequence < oldest_sequence - 1
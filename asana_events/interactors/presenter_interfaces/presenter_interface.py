@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Any, List
+
+
+class PresenterInterface(ABC):
+    @abstractmethod
+    def get_events_response(
+        self,
+        events_list: List[Dict[str, Any]],
+        sync: str,
+        has_more: bool
+    ) -> Dict[str, Any]:
+        pass
@@ -0,0 +1,40 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+from asana_events.models.event import Event
+
+
+class StorageInterface(ABC):
+    @abstractmethod
+    def get_latest_sequence(self) -> int:
+        pass
+
+    @abstractmethod
+    def get_oldest_sequence(self) -> Optional[int]:
+        pass
+
+    @abstractmethod
+    def get_events_after(self, after_sequence: int, limit: int) -> List[Event]:
+        pass
+
+    @abstractmethod
+    def get_resource_events(
+        self,
+        resource_gid: str,
+        after_sequence: int,
+        limit: int
+    ) -> List[Event]:
+        pass
+
+    @abstractmethod
+    def get_workspace_events(
+        self,
+        workspace_gid: str,
+        after_sequence: int,
+        limit: int
+    ) -> List[Event]:
+        pass
+
+    @abstractmethod
+    def prune_events(self, created_before: datetime) -> int:
+        pass
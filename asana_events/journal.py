@@ -0,0 +1,153 @@
+"""
+Writes the event journal.
+
+``record`` is called from model signals (see ``asana_events.signals``);
+code that bulk-inserts journaled rows, which skips those signals, calls
+``record_many`` itself.
+
+Readers take every event after the last sequence they saw, so events
+must become visible in sequence order. Sequences are handed out at
+INSERT, not at commit: on PostgreSQL a transaction holding sequence 10
+could commit after another's 11, and a reader in between would move
+past 10 for good. Entries are therefore written under a transaction
+level advisory lock, held until the writing transaction ends, so the
+next writer's sequences are only drawn once the previous writer has
+committed. SQLite needs no lock: one writer holds the database at a
+time, from its first write to its commit.
+"""
+from typing import Any, Dict, Iterable, Optional
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import connection, transaction
+from django.db.models import Model
+from asana_events.constants.constants import JOURNAL_LOCK_ID
+from asana_events.models.event import Event
+
+
+def _task_workspace_gid(instance: Model) -> Optional[str]:
+    # Stories, attachments and link rows inherit the workspace of their task
+    try:
+        return str(instance.task.workspace_id)
+    except ObjectDoesNotExist:
+        return None
+
+
+def _describe_task(task) -> Dict[str, Any]:
+    return {
+        'resource_gid': task.gid,
+        'resource_type': 'task',
+        'resource_subtype': task.resource_subtype,
+        'resource_name': task.name,
+        'parent_gid': task.parent_id,
+        'parent_type': 'task' if task.parent_id else None,
+        'workspace_gid': task.workspace_id,
+    }
+
+
+def _describe_project(project) -> Dict[str, Any]:
+    return {
+        'resource_gid': project.gid,
+        'resource_type': 'project',
+        'resource_name': project.name,
+        'parent_gid': project.team_id,
+        'parent_type': 'team' if project.team_id else None,
+        'workspace_gid': project.workspace_id,
+    }
+
+
+def _describe_tag(tag) -> Dict[str, Any]:
+    return {
+        'resource_gid': tag.gid,
+        'resource_type': 'tag',
+        'resource_name': tag.name,
+        'workspace_gid': tag.workspace_id,
+    }
+
+
+def _describe_story(story) -> Dict[str, Any]:
+    return {
+        'resource_gid': story.gid,
+        'resource_type': 'story',
+        'resource_subtype': story.type,
+        'parent_gid': story.task_id,
+        'parent_type': 'task',
+        'workspace_gid': _task_workspace_gid(story),
+    }
+
+
+def _describe_attachment(attachment) -> Dict[str, Any]:
+    return {
+        'resource_gid': attachment.gid,
+        'resource_type': 'attachment',
+        'resource_name': attachment.name,
+        'parent_gid': attachment.task_id,
+        'parent_type': 'task',
+        'workspace_gid': _task_workspace_gid(attachment),
+    }
+
+
+def _describe_task_project(task_project) -> Dict[str, Any]:
+    # A task added to / removed from a project
+    return {
+        'resource_gid': task_project.task_id,
+        'resource_type': 'task',
+        'parent_gid': task_project.project_id,
+        'parent_type': 'project',
+        'workspace_gid': _task_workspace_gid(task_project),
+    }
+
+
+def _describe_task_tag(task_tag) -> Dict[str, Any]:
+    # A task added to / removed from a tag
+    return {
+        'resource_gid': task_tag.task_id,
+        'resource_type': 'task',
+        'parent_gid': task_tag.tag_id,
+        'parent_type': 'tag',
+        'workspace_gid': _task_workspace_gid(task_tag),
+    }
+
+
+# Journaled models, by app label, with how to describe their rows
+DESCRIBERS = {
+    'asana_tasks.Task': _describe_task,
+    'asana_projects.Project': _describe_project,
+    'asana_tags.Tag': _describe_tag,
+    'asana_stories.Story': _describe_story,
+    'asana_attachments.Attachment': _describe_attachment,
+    'asana_tasks.TaskProject': _describe_task_project,
+    'asana_tasks.TaskTag': _describe_task_tag,
+}
+
+
+def build_event(instance: Model, action: str) -> Event:
+    fields = DESCRIBERS[instance._meta.label](instance)
+    for key in ('resource_gid', 'parent_gid', 'workspace_gid'):
+        if fields.get(key) is not None:
+            fields[key] = str(fields[key])
+    return Event(action=action, **fields)
+
+
+def _lock_journal() -> None:
+    # Released when the current transaction commits or rolls back
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT pg_advisory_xact_lock(%s)', [JOURNAL_LOCK_ID])
+
+
+def record(instance: Model, action: str) -> Event:
+    event = build_event(instance, action)
+    # A transaction of its own in autocommit mode, so the lock covers the
+    # INSERT
+    with transaction.atomic(savepoint=False):
+        _lock_journal()
+        event.save()
+    return event
+
+
+def record_many(instances: Iterable[Model], action: str) -> None:
+    events = [build_event(instance, action) for instance in instances]
+    if not events:
+        return
+    with transaction.atomic(savepoint=False):
+        _lock_journal()
+        Event.objects.bulk_create(events)
@@ -0,0 +1,23 @@
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from asana_events.storages.storage_implementation import StorageImplementation
+from asana_events.constants.constants import EVENT_RETENTION_HOURS
+
+
+class Command(BaseCommand):
+    help = "Delete journaled events older than the retention window."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--hours',
+            type=int,
+            default=EVENT_RETENTION_HOURS,
+            help=f"Keep events from the last N hours (default: {EVENT_RETENTION_HOURS})."
+        )
+
+    def handle(self, *args, **options):
+        deleted = StorageImplementation().prune_events(
+            created_before=timezone.now() - timedelta(hours=options['hours'])
+        )
+        self.stdout.write(f"Deleted {deleted} event(s).")
@@ -0,0 +1,33 @@
+# Generated by Django 6.0 on 2026-10-17 03:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Event',
+            fields=[
+                ('sequence', models.BigAutoField(primary_key=True, serialize=False)),
+                ('resource_gid', models.CharField(max_length=36)),
+                ('resource_type', models.CharField(max_length=30)),
+                ('resource_subtype', models.CharField(blank=True, max_length=30, null=True)),
+                ('resource_name', models.CharField(blank=True, max_length=255, null=True)),
+                ('action', models.CharField(choices=[('added', 'Added'), ('changed', 'Changed'), ('removed', 'Removed'), ('deleted', 'Deleted')], max_length=20)),
+                ('parent_gid', models.CharField(blank=True, max_length=36, null=True)),
+                ('parent_type', models.CharField(blank=True, max_length=30, null=True)),
+                ('workspace_gid', models.CharField(blank=True, max_length=36, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'asana_events_event',
+                'indexes': [models.Index(fields=['resource_gid', 'sequence'], name='asana_event_resourc_4a58bd_idx'), models.Index(fields=['parent_gid', 'sequence'], name='asana_event_parent__67c720_idx'), models.Index(fields=['workspace_gid', 'sequence'], name='asana_event_workspa_09c7b2_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,40 @@
+from django.db import models
+
+
+class Event(models.Model):
+    """
+    Append-only journal of changes to tasks, projects, stories, tags and
+    attachments. ``sequence`` only ever grows, and entries become visible
+    in sequence order (see ``asana_events.journal``), so a sync token is
+    just the last sequence a client has seen and reading what changed
+    since is one index range scan.
+    """
+    ACTION_CHOICES = [
+        ('added', 'Added'),
+        ('changed', 'Changed'),
+        ('removed', 'Removed'),
+        ('deleted', 'Deleted'),
+    ]
+
+    sequence = models.BigAutoField(primary_key=True)
+    resource_gid = models.CharField(max_length=36)
+    resource_type = models.CharField(max_length=30)
+    resource_subtype = models.CharField(max_length=30, null=True, blank=True)
+    # Name at the time of the event, so deleted resources still have one
+    resource_name = models.CharField(max_length=255, null=True, blank=True)
+    action = models.CharField(max_length=20, choices=ACTION_CHOICES)
+    parent_gid = models.CharField(max_length=36, null=True, blank=True)
+    parent_type = models.CharField(max_length=30, null=True, blank=True)
+    workspace_gid = models.CharField(max_length=36, null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'asana_events_event'
+        indexes = [
+            models.Index(fields=['resource_gid', 'sequence']),
+            models.Index(fields=['parent_gid', 'sequence']),
+            models.Index(fields=['workspace_gid', 'sequence']),
+        ]
+
+    def __str__(self):
+        return f"{self.resource_type} {self.resource_gid} {self.action}"
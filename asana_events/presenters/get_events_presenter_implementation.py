@@ -0,0 +1,18 @@
+from typing import Dict, Any, List
+from asana_events.interactors.presenter_interfaces.presenter_interface import (
+    PresenterInterface
+)
+
+
+class GetEventsPresenterImplementation(PresenterInterface):
+    def get_events_response(
+        self,
+        events_list: List[Dict[str, Any]],
+        sync: str,
+        has_more: bool
+    ) -> Dict[str, Any]:
+        return {
+            'data': events_list,
+            'sync': sync,
+            'has_more': has_more
+        }
@@ -3,3 +3,38 @@ Serializers for events API endpoints.
 """
 from rest_framework import serializers
 
+
+
+class EventResourceSerializer(serializers.Serializer):
+    """Resource an event is about"""
+    gid = serializers.CharField(read_only=True)
+    resource_type = serializers.CharField(read_only=True)
+    name = serializers.CharField(read_only=True, required=False)
+    resource_subtype = serializers.CharField(read_only=True, required=False)
+
+
+class EventResponseSerializer(serializers.Serializer):
+    """EventResponse schema matching API spec"""
+    user = serializers.DictField(read_only=True, allow_null=True)
+    resource = EventResourceSerializer(read_only=True)
+    type = serializers.CharField(read_only=True)
+    action = serializers.ChoiceField(
+        choices=['added', 'changed', 'removed', 'deleted'],
+        read_only=True
+    )
+    parent = serializers.DictField(read_only=True, allow_null=True)
+    created_at = serializers.DateTimeField(read_only=True)
+
+
+class GetEventsResponseSerializer(serializers.Serializer):
+    """Response wrapper for GET /events"""
+    data = EventResponseSerializer(many=True)
+    sync = serializers.CharField()
+    has_more = serializers.BooleanField()
+
+
+class ErrorResponseSerializer(serializers.Serializer):
+    """Error response schema"""
+    errors = serializers.ListField(
+        child=serializers.DictField()
+    )
@@ -0,0 +1,31 @@
+"""
+Feeds the event journal from model saves and deletes. Adding a task to a
+project or tag (a TaskProject / TaskTag row) is journaled as the task being
+added to, or removed from, that parent.
+"""
+from django.apps import apps
+from django.db.models.signals import post_delete, post_save
+from asana_events.journal import DESCRIBERS, record
+
+# Action journaled when a row of the model is deleted
+DELETE_ACTIONS = {
+    'asana_tasks.TaskProject': 'removed',
+    'asana_tasks.TaskTag': 'removed',
+}
+
+
+def journal_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        # Fixture loading
+        return
+    record(instance, 'added' if created else 'changed')
+
+
+def journal_delete(sender, instance, **kwargs):
+    record(instance, DELETE_ACTIONS.get(sender._meta.label, 'deleted'))
+
+
+for label in DESCRIBERS:
+    model = apps.get_model(label)
+    post_save.connect(journal_save, sender=model, dispatch_uid=f'journal_save:{label}')
+    post_delete.connect(journal_delete, sender=model, dispatch_uid=f'journal_delete:{label}')
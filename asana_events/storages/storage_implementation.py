@@ -0,0 +1,57 @@
+from datetime import datetime
+from typing import List, Optional
+from django.db.models import Max, Min, Q
+from asana_events.models.event import Event
+from asana_events.interactors.storage_interfaces.storage_interface import (
+    StorageInterface
+)
+
+
+class StorageImplementation(StorageInterface):
+    def get_latest_sequence(self) -> int:
+        return Event.objects.aggregate(latest=Max('sequence'))['latest'] or 0
+
+    def get_oldest_sequence(self) -> Optional[int]:
+        return Event.objects.aggregate(oldest=Min('sequence'))['oldest']
+
+    def get_events_after(self, after_sequence: int, limit: int) -> List[Event]:
+        return list(
+            Event.objects.filter(
+                sequence__gt=after_sequence
+            ).order_by('sequence')[:limit]
+        )
+
+    def get_resource_events(
+        self,
+        resource_gid: str,
+        after_sequence: int,
+        limit: int
+    ) -> List[Event]:
+        """
+        Events on the resource itself and on its children (tasks of a
+        project, stories of a task, ...). Each side of the OR is a range
+        scan on its (gid, sequence) index.
+        """
+        return list(
+            Event.objects.filter(
+                Q(resource_gid=resource_gid) | Q(parent_gid=resource_gid),
+                sequence__gt=after_sequence
+            ).order_by('sequence')[:limit]
+        )
+
+    def get_workspace_events(
+        self,
+        workspace_gid: str,
+        after_sequence: int,
+        limit: int
+    ) -> List[Event]:
+        return list(
+            Event.objects.filter(
+                workspace_gid=workspace_gid,
+                sequence__gt=after_sequence
+            ).order_by('sequence')[:limit]
+        )
+
+    def prune_events(self, created_before: datetime) -> int:
+        deleted, _ = Event.objects.filter(created_at__lt=created_before).delete()
+        return deleted
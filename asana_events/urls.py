@@ -0,0 +1,8 @@
+from django.urls import path
+from asana_events.views.get_events_view.get_events_view import GetEventsView
+
+app_name = 'asana_events'
+
+urlpatterns = [
+    path('events/', GetEventsView.as_view(), name='get_events'),  # GET
+]
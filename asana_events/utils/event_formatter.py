@@ -0,0 +1,26 @@
+from typing import Any, Dict
+from asana_events.models.event import Event
+
+
+def format_event(event: Event) -> Dict[str, Any]:
+    """Event as returned by the API (Asana EventResponse)."""
+    resource = {
+        'gid': event.resource_gid,
+        'resource_type': event.resource_type,
+    }
+    if event.resource_name is not None:
+        resource['name'] = event.resource_name
+    if event.resource_subtype is not None:
+        resource['resource_subtype'] = event.resource_subtype
+
+    return {
+        'user': None,
+        'resource': resource,
+        'type': event.resource_type,
+        'action': event.action,
+        'parent': {
+            'gid': event.parent_gid,
+            'resource_type': event.parent_type
+        } if event.parent_gid else None,
+        'created_at': event.created_at.isoformat(),
+    }
@@ -0,0 +1,21 @@
+"""
+Sync tokens: the journal sequence a client has read up to, base64url
+encoded so clients treat it as opaque.
+"""
+import base64
+import binascii
+from typing import Optional
+
+
+def encode_sync_token(sequence: int) -> str:
+    return base64.urlsafe_b64encode(str(sequence).encode()).decode().rstrip('=')
+
+
+def decode_sync_token(token: str) -> Optional[int]:
+    """Return the sequence in ``token``, or None if it is not a sync token."""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        sequence = int(base64.urlsafe_b64decode(padded.encode()).decode())
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
+    return sequence if sequence >= 0 else None
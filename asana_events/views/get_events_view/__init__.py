@@ -0,0 +1 @@
+from .get_events_view import GetEventsView
@@ -7,10 +7,19 @@ from drf_spectacular.utils import (
     OpenApiParameter,
     OpenApiExample
 )
+from asana_events.interactors.get_events_interactor import GetEventsInteractor
+from asana_events.storages.storage_implementation import StorageImplementation
+from asana_events.presenters.get_events_presenter_implementation import (
+    GetEventsPresenterImplementation
+)
+from asana_events.serializers import GetEventsResponseSerializer
+from asana_events.exceptions.custom_exceptions import (
+    InvalidSyncTokenException
+)
 from asana_backend.utils.validators import validate_uuid
 from asana_backend.utils.decorators.ratelimit import ratelimit
 from asana_backend.utils.error_responses import (
-    not_found_error,
+    create_error_response,
     invalid_gid_error,
     missing_field_error,
     server_error,
@@ -37,16 +46,14 @@ class GetEventsView(APIView):
                 name='sync',
                 type=str,
                 location=OpenApiParameter.QUERY,
-                description='A sync token received from the last request, or none on first sync. Events will be returned from the point in time that the sync token was generated.
-*Note: On your first request, omit the sync token. The response will be the same as for an expired sync token, and will include a new valid sync token.If the sync token is too old (which may happen from time to time) the API will return a `412 Precondition Failed` error, and include a fresh sync token in the response.*',
+                description='A sync token received from the last request, or none on first sync. Events will be returned from the point in time that the sync token was generated. *Note: On your first request, omit the sync token. The response will be the same as for an expired sync token, and will include a new valid sync token.If the sync token is too old (which may happen from time to time) the API will return a `412 Precondition Failed` error, and include a fresh sync token in the response.*',
                 required=False
             ),
             OpenApiParameter(
                 name='opt_pretty',
                 type=str,
                 location=OpenApiParameter.QUERY,
-                description='Provides “pretty” output.
-Provides the response in a “pretty” format. In the case of JSON this means doing proper line breaking and indentation to make it readable. This will take extra time and increase the response size so it is advisable only to use this during debugging.',
+                description='Provides “pretty” output. Provides the response in a “pretty” format. In the case of JSON this means doing proper line breaking and indentation to make it readable. This will take extra time and increase the response size so it is advisable only to use this during debugging.',
                 required=False
             ),
             OpenApiParameter(
@@ -86,25 +93,39 @@ Provides the response in a “pretty” format. In the case of JSON this means d
         tags=["Events"]
     )
     def get(self, request):
+        resource_gid = request.query_params.get('resource')
+        if not resource_gid:
+            return Response(
+                missing_field_error("resource"),
+                status=status.HTTP_400_BAD_REQUEST
+            )
         try:
-            # TODO: Implement get logic
+            validate_uuid(resource_gid)
+        except Exception:
             return Response(
-                {'data': {'message': 'Not implemented yet'}},
-                status=status.HTTP_501_NOT_IMPLEMENTED
+                invalid_gid_error("resource"),
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        interactor = GetEventsInteractor(
+            storage=StorageImplementation(),
+            presenter=GetEventsPresenterImplementation()
+        )
+
+        try:
+            response = interactor.get_events(
+                resource_gid=resource_gid,
+                sync_token=request.query_params.get('sync')
+            )
+        except InvalidSyncTokenException as e:
+            return Response(
+                {**create_error_response(e.message), 'sync': e.sync},
+                status=status.HTTP_412_PRECONDITION_FAILED
             )
         except Exception as e:
-            error_response = {
-                'errors': [{
-                    'message': str(e),
-                    'help': (
-                        'For more information on API status codes and '
-                        'how to handle them, read the docs on errors: '
-                        'https://asana.github.io/developer-docs/#errors'
-                    ),
-                    'phrase': '6 sad squid snuggle softly'
-                }]
-            }
             return Response(
-                error_response,
+                server_error(str(e)),
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+        return Response(response, status=status.HTTP_200_OK)
@@ -0,0 +1,19 @@
+from typing import Any, Dict
+from asana_jobs.workers.job_queue import enqueue_job
+from asana_jobs.utils.job_formatter import format_job
+
+
+class ServiceInterface:
+    """What other apps may use from asana_jobs."""
+
+    @staticmethod
+    def enqueue_job(
+        resource_subtype: str,
+        params: Dict[str, Any],
+        unique: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Queue a job and return it formatted as a JobResponse. With
+        ``unique`` an identical job still waiting to run is reused.
+        """
+        return format_job(enqueue_job(resource_subtype, params, unique=unique))
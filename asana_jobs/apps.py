@@ -0,0 +1,5 @@
+from django.apps import AppConfig
+
+
+class AsanaJobsConfig(AppConfig):
+    name = 'asana_jobs'
@@ -0,0 +1,3 @@
+from .constants import *
+from .exception_messages import *
+
@@ -0,0 +1,14 @@
+JOB_STATUS_NOT_STARTED = 'not_started'
+JOB_STATUS_IN_PROGRESS = 'in_progress'
+JOB_STATUS_SUCCEEDED = 'succeeded'
+JOB_STATUS_FAILED = 'failed'
+
+# Worker pool defaults, overridable through settings.ASANA_JOBS
+DEFAULT_WORKERS = 2
+DEFAULT_POLL_INTERVAL_SECONDS = 1.0
+# An in_progress job whose worker has not finished it after this long is
+# assumed to have died with its worker and is handed out again
+DEFAULT_STALE_AFTER_SECONDS = 30 * 60
+
+# How many queued jobs a worker looks at per claim attempt
+CLAIM_CANDIDATES = 10
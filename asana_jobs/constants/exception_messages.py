@@ -0,0 +1,2 @@
+JOB_DOES_NOT_EXIST = "Job does not exist"
+UNKNOWN_JOB_TYPE = "Unknown job type: {resource_subtype}"
@@ -0,0 +1,16 @@
+from asana_jobs.constants.exception_messages import (
+    JOB_DOES_NOT_EXIST,
+    UNKNOWN_JOB_TYPE,
+)
+
+
+class JobDoesNotExistException(Exception):
+    def __init__(self, message=JOB_DOES_NOT_EXIST):
+        self.message = message
+        super().__init__(self.message)
+
+
+class UnknownJobTypeException(Exception):
+    def __init__(self, message=UNKNOWN_JOB_TYPE):
+        self.message = message
+        super().__init__(self.message)
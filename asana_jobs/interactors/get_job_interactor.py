@@ -0,0 +1,27 @@
+from typing import Dict, Any
+from asana_jobs.interactors.storage_interfaces.storage_interface import (
+    StorageInterface
+)
+from asana_jobs.interactors.presenter_interfaces.presenter_interface import (
+    PresenterInterface
+)
+from asana_jobs.exceptions.custom_exceptions import JobDoesNotExistException
+from asana_jobs.utils.job_formatter import format_job
+
+
+class GetJobInteractor:
+    def __init__(
+        self,
+        storage: StorageInterface,
+        presenter: PresenterInterface
+    ):
+        self.storage = storage
+        self.presenter = presenter
+
+    def get_job(self, job_gid: str) -> Dict[str, Any]:
+        job = self.storage.get_job(job_gid)
+
+        if not job:
+            raise JobDoesNotExistException()
+
+        return self.presenter.get_job_response(format_job(job))
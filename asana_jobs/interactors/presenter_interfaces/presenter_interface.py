@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Any
+
+
+class PresenterInterface(ABC):
+    @abstractmethod
+    def get_job_response(
+        self,
+        job_dict: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        pass
@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, Optional
+from asana_jobs.models.job import Job
+
+
+class StorageInterface(ABC):
+    @abstractmethod
+    def get_job(self, job_gid: str) -> Optional[Job]:
+        pass
+
+    @abstractmethod
+    def create_job(self, resource_subtype: str, params: Dict[str, Any]) -> Job:
+        pass
+
+    @abstractmethod
+    def get_pending_job(
+        self,
+        resource_subtype: str,
+        params: Dict[str, Any]
+    ) -> Optional[Job]:
+        pass
+
+    @abstractmethod
+    def claim_next_job(self, stale_before: datetime) -> Optional[Job]:
+        pass
+
+    @abstractmethod
+    def mark_job_succeeded(self, job_gid: str, **results) -> None:
+        pass
+
+    @abstractmethod
+    def mark_job_failed(self, job_gid: str, error: str) -> None:
+        pass
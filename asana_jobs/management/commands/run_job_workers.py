@@ -0,0 +1,53 @@
+import threading
+from django.core.management.base import BaseCommand
+from asana_jobs.storages.storage_implementation import StorageImplementation
+from asana_jobs.workers.job_queue import get_job_settings
+from asana_jobs.workers.job_worker import JobWorker
+
+
+class Command(BaseCommand):
+    help = "Run job workers that poll the job queue until interrupted."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            help="Worker threads in this process (default: ASANA_JOBS['WORKERS'])."
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help="Run the jobs queued right now, then exit."
+        )
+
+    def handle(self, *args, **options):
+        job_settings = get_job_settings()
+        worker = JobWorker(
+            storage=StorageImplementation(),
+            stale_after_seconds=job_settings['STALE_AFTER_SECONDS']
+        )
+
+        if options['once']:
+            count = worker.run_pending()
+            self.stdout.write(f"Ran {count} job(s).")
+            return
+
+        stop_event = threading.Event()
+        threads = [
+            threading.Thread(
+                target=worker.run_forever,
+                args=(stop_event, job_settings['POLL_INTERVAL_SECONDS']),
+                name=f'asana-job-worker-{index}'
+            )
+            for index in range(options['workers'] or job_settings['WORKERS'])
+        ]
+        for thread in threads:
+            thread.start()
+        self.stdout.write(f"Started {len(threads)} job worker(s).")
+        try:
+            for thread in threads:
+                thread.join()
+        except KeyboardInterrupt:
+            stop_event.set()
+            for thread in threads:
+                thread.join()
@@ -0,0 +1,37 @@
+# Generated by Django 6.0 on 2026-10-17 02:41
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('asana_projects', '0002_projectfollower_projectmember_and_more'),
+        ('asana_tasks', '0002_task_num_subtasks_task_parent_task_resource_subtype'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Job',
+            fields=[
+                ('gid', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('resource_subtype', models.CharField(choices=[('duplicate_project', 'Duplicate Project'), ('duplicate_task', 'Duplicate Task')], max_length=30)),
+                ('status', models.CharField(choices=[('not_started', 'Not Started'), ('in_progress', 'In Progress'), ('succeeded', 'Succeeded'), ('failed', 'Failed')], default='not_started', max_length=20)),
+                ('params', models.JSONField(blank=True, default=dict)),
+                ('error', models.TextField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('new_project', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='asana_projects.project')),
+                ('new_task', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='asana_tasks.task')),
+            ],
+            options={
+                'db_table': 'asana_jobs_job',
+                'indexes': [models.Index(fields=['status', 'created_at'], name='asana_jobs__status_0a55fd_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-17 06:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('asana_jobs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='job',
+            name='resource_subtype',
+            field=models.CharField(choices=[('duplicate_project', 'Duplicate Project'), ('duplicate_task', 'Duplicate Task'), ('rebalance_task_ranks', 'Rebalance Task Ranks')], max_length=30),
+        ),
+    ]
@@ -0,0 +1,66 @@
+import uuid
+from django.db import models
+
+
+class Job(models.Model):
+    """
+    Job model for work that runs outside the request that started it, such
+    as duplicating a project. The table doubles as the job queue: workers
+    claim rows that are not_started.
+    """
+    RESOURCE_SUBTYPE_CHOICES = [
+        ('duplicate_project', 'Duplicate Project'),
+        ('duplicate_task', 'Duplicate Task'),
+        ('rebalance_task_ranks', 'Rebalance Task Ranks'),
+    ]
+
+    STATUS_CHOICES = [
+        ('not_started', 'Not Started'),
+        ('in_progress', 'In Progress'),
+        ('succeeded', 'Succeeded'),
+        ('failed', 'Failed'),
+    ]
+
+    gid = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False
+    )
+    resource_subtype = models.CharField(
+        max_length=30,
+        choices=RESOURCE_SUBTYPE_CHOICES
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default='not_started'
+    )
+    # Arguments for the job handler
+    params = models.JSONField(default=dict, blank=True)
+    new_project = models.ForeignKey(
+        'asana_projects.Project',
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name='+'
+    )
+    new_task = models.ForeignKey(
+        'asana_tasks.Task',
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name='+'
+    )
+    error = models.TextField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'asana_jobs_job'
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.resource_subtype} job {self.gid} ({self.status})"
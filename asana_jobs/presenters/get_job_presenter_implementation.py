@@ -0,0 +1,14 @@
+from typing import Dict, Any
+from asana_jobs.interactors.presenter_interfaces.presenter_interface import (
+    PresenterInterface
+)
+
+
+class GetJobPresenterImplementation(PresenterInterface):
+    def get_job_response(
+        self,
+        job_dict: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        return {
+            'data': job_dict
+        }
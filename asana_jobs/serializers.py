@@ -3,3 +3,29 @@ Serializers for jobs API endpoints.
 """
 from rest_framework import serializers
 
+
+
+class JobResponseSerializer(serializers.Serializer):
+    """JobResponse schema matching API spec"""
+    gid = serializers.CharField(read_only=True)
+    resource_type = serializers.CharField(read_only=True)
+    resource_subtype = serializers.CharField(read_only=True)
+    status = serializers.ChoiceField(
+        choices=['not_started', 'in_progress', 'succeeded', 'failed'],
+        read_only=True
+    )
+    new_project = serializers.DictField(read_only=True, allow_null=True)
+    new_task = serializers.DictField(read_only=True, allow_null=True)
+    new_project_template = serializers.DictField(read_only=True, allow_null=True)
+
+
+class GetJobResponseSerializer(serializers.Serializer):
+    """Response wrapper for GET /jobs/{job_gid}"""
+    data = JobResponseSerializer()
+
+
+class ErrorResponseSerializer(serializers.Serializer):
+    """Error response schema"""
+    errors = serializers.ListField(
+        child=serializers.DictField()
+    )
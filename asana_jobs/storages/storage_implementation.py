@@ -0,0 +1,80 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+from django.db.models import Q
+from django.utils import timezone
+from asana_jobs.models.job import Job
+from asana_jobs.interactors.storage_interfaces.storage_interface import (
+    StorageInterface
+)
+from asana_jobs.constants.constants import (
+    JOB_STATUS_NOT_STARTED,
+    JOB_STATUS_IN_PROGRESS,
+    JOB_STATUS_SUCCEEDED,
+    JOB_STATUS_FAILED,
+    CLAIM_CANDIDATES,
+)
+
+
+class StorageImplementation(StorageInterface):
+    def get_job(self, job_gid: str) -> Optional[Job]:
+        try:
+            return Job.objects.select_related(
+                'new_project', 'new_task'
+            ).get(gid=job_gid)
+        except Job.DoesNotExist:
+            return None
+
+    def create_job(self, resource_subtype: str, params: Dict[str, Any]) -> Job:
+        return Job.objects.create(
+            resource_subtype=resource_subtype,
+            params=params
+        )
+
+    def get_pending_job(
+        self,
+        resource_subtype: str,
+        params: Dict[str, Any]
+    ) -> Optional[Job]:
+        """A not_started job of this type with exactly these params."""
+        return Job.objects.filter(
+            resource_subtype=resource_subtype,
+            status=JOB_STATUS_NOT_STARTED,
+            params=params
+        ).first()
+
+    def claim_next_job(self, stale_before: datetime) -> Optional[Job]:
+        """
+        Hand the oldest runnable job to the calling worker. The claim is a
+        conditional UPDATE, so when several workers (threads or processes)
+        race for the same row exactly one of them gets it.
+        """
+        claimable = Q(status=JOB_STATUS_NOT_STARTED) | Q(
+            status=JOB_STATUS_IN_PROGRESS,
+            started_at__lt=stale_before
+        )
+        candidates = Job.objects.filter(claimable).order_by(
+            'created_at'
+        ).values_list('gid', flat=True)[:CLAIM_CANDIDATES]
+
+        for job_gid in candidates:
+            claimed = Job.objects.filter(claimable, gid=job_gid).update(
+                status=JOB_STATUS_IN_PROGRESS,
+                started_at=timezone.now()
+            )
+            if claimed:
+                return Job.objects.get(gid=job_gid)
+        return None
+
+    def mark_job_succeeded(self, job_gid: str, **results) -> None:
+        Job.objects.filter(gid=job_gid).update(
+            status=JOB_STATUS_SUCCEEDED,
+            completed_at=timezone.now(),
+            **results
+        )
+
+    def mark_job_failed(self, job_gid: str, error: str) -> None:
+        Job.objects.filter(gid=job_gid).update(
+            status=JOB_STATUS_FAILED,
+            error=error,
+            completed_at=timezone.now()
+        )
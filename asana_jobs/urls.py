@@ -0,0 +1,8 @@
+from django.urls import path
+from asana_jobs.views.get_job_view.get_job_view import GetJobView
+
+app_name = 'asana_jobs'
+
+urlpatterns = [
+    path('jobs/<str:job_gid>/', GetJobView.as_view(), name='get_job'),  # GET
+]
@@ -0,0 +1,24 @@
+from typing import Any, Dict
+from asana_jobs.models.job import Job
+
+
+def format_job(job: Job) -> Dict[str, Any]:
+    """Job as returned by the API (Asana JobResponse)."""
+    return {
+        'gid': str(job.gid),
+        'resource_type': 'job',
+        'resource_subtype': job.resource_subtype,
+        'status': job.status,
+        'new_project': {
+            'gid': str(job.new_project.gid),
+            'resource_type': 'project',
+            'name': job.new_project.name
+        } if job.new_project else None,
+        'new_task': {
+            'gid': str(job.new_task.gid),
+            'resource_type': 'task',
+            'name': job.new_task.name,
+            'resource_subtype': job.new_task.resource_subtype
+        } if job.new_task else None,
+        'new_project_template': None,
+    }
@@ -0,0 +1 @@
+from .get_job_view import GetJobView
@@ -7,12 +7,18 @@ from drf_spectacular.utils import (
     OpenApiParameter,
     OpenApiExample
 )
+from asana_jobs.interactors.get_job_interactor import GetJobInteractor
+from asana_jobs.storages.storage_implementation import StorageImplementation
+from asana_jobs.presenters.get_job_presenter_implementation import (
+    GetJobPresenterImplementation
+)
+from asana_jobs.serializers import GetJobResponseSerializer
+from asana_jobs.exceptions.custom_exceptions import JobDoesNotExistException
 from asana_backend.utils.validators import validate_uuid
 from asana_backend.utils.decorators.ratelimit import ratelimit
 from asana_backend.utils.error_responses import (
     not_found_error,
     invalid_gid_error,
-    missing_field_error,
     server_error,
 )
 
@@ -37,8 +43,7 @@ class GetJobView(APIView):
                 name='opt_pretty',
                 type=str,
                 location=OpenApiParameter.QUERY,
-                description='Provides “pretty” output.
-Provides the response in a “pretty” format. In the case of JSON this means doing proper line breaking and indentation to make it readable. This will take extra time and increase the response size so it is advisable only to use this during debugging.',
+                description='Provides “pretty” output. Provides the response in a “pretty” format. In the case of JSON this means doing proper line breaking and indentation to make it readable. This will take extra time and increase the response size so it is advisable only to use this during debugging.',
                 required=False
             ),
             OpenApiParameter(
@@ -84,25 +89,22 @@ Provides the response in a “pretty” format. In the case of JSON this means d
                 status=status.HTTP_400_BAD_REQUEST
             )
         
+        interactor = GetJobInteractor(
+            storage=StorageImplementation(),
+            presenter=GetJobPresenterImplementation()
+        )
+
         try:
-            # TODO: Implement get logic
+            response = interactor.get_job(job_gid)
+        except JobDoesNotExistException:
             return Response(
-                {'data': {'message': 'Not implemented yet'}},
-                status=status.HTTP_501_NOT_IMPLEMENTED
+                not_found_error("job", job_gid),
+                status=status.HTTP_404_NOT_FOUND
             )
         except Exception as e:
-            error_response = {
-                'errors': [{
-                    'message': str(e),
-                    'help': (
-                        'For more information on API status codes and '
-                        'how to handle them, read the docs on errors: '
-                        'https://asana.github.io/developer-docs/#errors'
-                    ),
-                    'phrase': '6 sad squid snuggle softly'
-                }]
-            }
             return Response(
-                error_response,
+                server_error(str(e)),
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+        return Response(response, status=status.HTTP_200_OK)
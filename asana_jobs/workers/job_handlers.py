@@ -0,0 +1,67 @@
+"""
+What each job type does. A handler receives the job's params and returns
+the fields to set on the job when it succeeds. It runs inside the
+transaction that marks the job succeeded, so a failed job leaves nothing
+half-copied behind.
+"""
+from typing import Any, Dict
+from asana_projects.storages.storage_implementation import (
+    StorageImplementation as ProjectStorageImplementation
+)
+from asana_tasks.storages.storage_implementation import (
+    StorageImplementation as TaskStorageImplementation
+)
+
+TASK_INCLUDE_PREFIX = 'task_'
+
+
+def duplicate_project(params: Dict[str, Any]) -> Dict[str, Any]:
+    include = params.get('include', [])
+    project_storage = ProjectStorageImplementation()
+    project = project_storage.duplicate_project(
+        project_gid=params['project_gid'],
+        name=params['name'],
+        include=include,
+        team_gid=params.get('team_gid')
+    )
+    # The copied tasks go into the copied sections, in the same order
+    section_map = project_storage.duplicate_sections(
+        project_gid=params['project_gid'],
+        new_project_gid=str(project.gid)
+    )
+    # duplicate_project's task_* options are duplicate_task's options
+    TaskStorageImplementation().duplicate_project_tasks(
+        project_gid=params['project_gid'],
+        new_project_gid=str(project.gid),
+        section_map=section_map,
+        include=[
+            option[len(TASK_INCLUDE_PREFIX):]
+            for option in include
+            if option.startswith(TASK_INCLUDE_PREFIX)
+        ]
+    )
+    return {'new_project': project}
+
+
+def duplicate_task(params: Dict[str, Any]) -> Dict[str, Any]:
+    task = TaskStorageImplementation().duplicate_task(
+        task_gid=params['task_gid'],
+        name=params['name'],
+        include=params.get('include', [])
+    )
+    return {'new_task': task}
+
+
+def rebalance_task_ranks(params: Dict[str, Any]) -> Dict[str, Any]:
+    TaskStorageImplementation().rebalance_task_ranks(
+        project_gid=params['project_gid'],
+        section_gid=params.get('section_gid')
+    )
+    return {}
+
+
+JOB_HANDLERS = {
+    'duplicate_project': duplicate_project,
+    'duplicate_task': duplicate_task,
+    'rebalance_task_ranks': rebalance_task_ranks,
+}
@@ -0,0 +1,90 @@
+"""
+Job queue backed by the Job table.
+
+``enqueue_job`` stores a not_started job. Once the enqueuing transaction
+commits, the in-process worker pool (``ASANA_JOBS['RUN_IN_PROCESS']``)
+drains the queue on background threads. With the in-process pool switched
+off, jobs wait for ``python manage.py run_job_workers``; any number of those
+processes can share the queue.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+from django.conf import settings
+from django.db import connections, transaction
+from asana_jobs.models.job import Job
+from asana_jobs.storages.storage_implementation import StorageImplementation
+from asana_jobs.constants.constants import (
+    DEFAULT_WORKERS,
+    DEFAULT_POLL_INTERVAL_SECONDS,
+    DEFAULT_STALE_AFTER_SECONDS,
+)
+from asana_jobs.workers.job_worker import JobWorker
+
+_worker_pool: Optional['JobWorkerPool'] = None
+_worker_pool_lock = threading.Lock()
+
+
+def get_job_settings() -> Dict[str, Any]:
+    return {
+        'RUN_IN_PROCESS': True,
+        'WORKERS': DEFAULT_WORKERS,
+        'POLL_INTERVAL_SECONDS': DEFAULT_POLL_INTERVAL_SECONDS,
+        'STALE_AFTER_SECONDS': DEFAULT_STALE_AFTER_SECONDS,
+        **getattr(settings, 'ASANA_JOBS', {}),
+    }
+
+
+class JobWorkerPool:
+    """Threads in the web process that drain the queue when woken."""
+
+    def __init__(self, workers: int, stale_after_seconds: float):
+        self.stale_after_seconds = stale_after_seconds
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix='asana-job-worker'
+        )
+
+    def wake(self) -> None:
+        self._executor.submit(self._drain)
+
+    def _drain(self) -> None:
+        try:
+            JobWorker(
+                storage=StorageImplementation(),
+                stale_after_seconds=self.stale_after_seconds
+            ).run_pending()
+        finally:
+            connections.close_all()
+
+
+def get_worker_pool() -> JobWorkerPool:
+    global _worker_pool
+    with _worker_pool_lock:
+        if _worker_pool is None:
+            job_settings = get_job_settings()
+            _worker_pool = JobWorkerPool(
+                workers=job_settings['WORKERS'],
+                stale_after_seconds=job_settings['STALE_AFTER_SECONDS']
+            )
+        return _worker_pool
+
+
+def enqueue_job(
+    resource_subtype: str,
+    params: Dict[str, Any],
+    unique: bool = False
+) -> Job:
+    """
+    Queue a job. With ``unique`` a job identical to one still waiting in
+    the queue is not queued again; the waiting one is returned instead.
+    """
+    storage = StorageImplementation()
+    if unique:
+        job = storage.get_pending_job(resource_subtype, params)
+        if job is not None:
+            return job
+    job = storage.create_job(resource_subtype, params)
+    if get_job_settings()['RUN_IN_PROCESS']:
+        transaction.on_commit(lambda: get_worker_pool().wake())
+    return job
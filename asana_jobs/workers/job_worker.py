@@ -0,0 +1,72 @@
+import logging
+import threading
+from datetime import timedelta
+from typing import Callable, Dict, Optional
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+from asana_jobs.models.job import Job
+from asana_jobs.interactors.storage_interfaces.storage_interface import (
+    StorageInterface
+)
+from asana_jobs.exceptions.custom_exceptions import UnknownJobTypeException
+from asana_jobs.constants.constants import (
+    DEFAULT_POLL_INTERVAL_SECONDS,
+    DEFAULT_STALE_AFTER_SECONDS,
+)
+from asana_jobs.constants.exception_messages import UNKNOWN_JOB_TYPE
+from asana_jobs.workers.job_handlers import JOB_HANDLERS
+
+logger = logging.getLogger(__name__)
+
+
+class JobWorker:
+    """Claims queued jobs from the database and runs their handlers."""
+
+    def __init__(
+        self,
+        storage: StorageInterface,
+        handlers: Optional[Dict[str, Callable]] = None,
+        stale_after_seconds: float = DEFAULT_STALE_AFTER_SECONDS
+    ):
+        self.storage = storage
+        self.handlers = JOB_HANDLERS if handlers is None else handlers
+        self.stale_after = timedelta(seconds=stale_after_seconds)
+
+    def run_job(self, job: Job) -> None:
+        try:
+            handler = self.handlers.get(job.resource_subtype)
+            if handler is None:
+                raise UnknownJobTypeException(
+                    UNKNOWN_JOB_TYPE.format(resource_subtype=job.resource_subtype)
+                )
+            with transaction.atomic():
+                results = handler(job.params)
+                self.storage.mark_job_succeeded(job.gid, **results)
+        except Exception as e:
+            logger.exception("Job %s failed", job.gid)
+            self.storage.mark_job_failed(job.gid, str(e))
+
+    def run_pending(self) -> int:
+        """Run queued jobs until there are none left; return how many ran."""
+        count = 0
+        while True:
+            job = self.storage.claim_next_job(
+                stale_before=timezone.now() - self.stale_after
+            )
+            if job is None:
+                return count
+            self.run_job(job)
+            count += 1
+
+    def run_forever(
+        self,
+        stop_event: threading.Event,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS
+    ) -> None:
+        while not stop_event.is_set():
+            try:
+                ran = self.run_pending()
+            finally:
+                close_old_connections()
+            if not ran:
+                stop_event.wait(poll_interval)
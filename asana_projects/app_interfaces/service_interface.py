@@ -0,0 +1,24 @@
+from typing import Dict, Iterable
+from asana_projects.constants.constants import TASK_COUNT_FIELDS
+from asana_projects.storages.storage_implementation import StorageImplementation
+
+
+class ServiceInterface:
+    """What other apps may use from asana_projects."""
+
+    @staticmethod
+    def get_task_counts(project_gids: Iterable[str]) -> Dict[str, Dict[str, int]]:
+        """
+        Task counts of many projects (e.g. a dashboard page) with a single
+        query. Projects without a counter row have no tasks and get zeros.
+        """
+        project_gids = list(project_gids)
+        rows = StorageImplementation().get_task_counts(project_gids)
+        counts = {}
+        for gid in project_gids:
+            row = rows.get(str(gid))
+            counts[str(gid)] = {
+                field: getattr(row, field) if row else 0
+                for field in TASK_COUNT_FIELDS
+            }
+        return counts
@@ -1,5 +1,14 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class AsanaProjectsConfig(AppConfig):
     name = 'asana_projects'
+
+    def ready(self):
+        from asana_projects.task_counts.schema import ensure_task_count_triggers
+        post_migrate.connect(
+            ensure_task_count_triggers,
+            sender=self,
+            dispatch_uid='asana_projects_ensure_task_count_triggers'
+        )
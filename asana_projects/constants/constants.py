@@ -2,3 +2,21 @@ DEFAULT_OFFSET = 0
 DEFAULT_LIMIT = 50
 MAX_LIMIT = 100
 
+
+# Task counts (GET /projects/{project_gid}/task_counts)
+TASK_COUNT_FIELDS = (
+    'num_tasks',
+    'num_incomplete_tasks',
+    'num_completed_tasks',
+    'num_milestones',
+    'num_incomplete_milestones',
+    'num_completed_milestones',
+)
+# Stored columns; the incomplete counts are derived from them
+STORED_TASK_COUNT_FIELDS = (
+    'num_tasks',
+    'num_completed_tasks',
+    'num_milestones',
+    'num_completed_milestones',
+)
+RECONCILE_BATCH_SIZE = 500
@@ -0,0 +1,46 @@
+from typing import Dict, Any, List, Optional
+from asana_projects.interactors.storage_interfaces.storage_interface import (
+    StorageInterface
+)
+from asana_projects.interactors.presenter_interfaces.presenter_interface import (
+    PresenterInterface
+)
+from asana_projects.exceptions.custom_exceptions import (
+    ProjectDoesNotExistException
+)
+from asana_jobs.app_interfaces.service_interface import ServiceInterface
+
+
+class DuplicateProjectInteractor:
+    def __init__(
+        self,
+        storage: StorageInterface,
+        presenter: PresenterInterface,
+        jobs_service: ServiceInterface
+    ):
+        self.storage = storage
+        self.presenter = presenter
+        self.jobs_service = jobs_service
+
+    def duplicate_project(
+        self,
+        project_gid: str,
+        name: str,
+        include: Optional[List[str]] = None,
+        team_gid: Optional[str] = None
+    ) -> Dict[str, Any]:
+        project = self.storage.get_project(project_gid)
+        if not project:
+            raise ProjectDoesNotExistException()
+
+        job_dict = self.jobs_service.enqueue_job(
+            'duplicate_project',
+            {
+                'project_gid': str(project.gid),
+                'name': name,
+                'include': include or [],
+                'team_gid': team_gid,
+            }
+        )
+
+        return self.presenter.get_job_response(job_dict)
@@ -1,10 +1,11 @@
-from typing import Dict, Any
+from typing import Dict, Any, Union
 from asana_projects.interactors.storage_interfaces.storage_interface import (
     StorageInterface
 )
 from asana_projects.interactors.presenter_interfaces.presenter_interface import (
     PresenterInterface
 )
+from asana_backend.utils.pagination import build_next_page
 
 
 class GetProjectTasksInteractor:
@@ -19,9 +20,29 @@ class GetProjectTasksInteractor:
     def get_project_tasks(
         self,
         project_gid: str,
-        offset: int,
-        limit: int
+        offset: Union[int, str],
+        limit: int,
+        request=None
     ) -> Dict[str, Any]:
         tasks = self.storage.get_project_tasks(project_gid, offset, limit)
-        return self.presenter.get_projects_response(tasks)
+
+        # Format tasks matching TaskCompact schema
+        tasks_list = [
+            {
+                'gid': str(task.gid),
+                'resource_type': 'task',
+                'name': task.name,
+                'resource_subtype': task.resource_subtype,
+                'completed': task.completed,
+            }
+            for task in tasks
+        ]
+
+        response = self.presenter.get_projects_response(tasks_list)
+
+        next_page = build_next_page(request, tasks.next_offset)
+        if next_page:
+            response['next_page'] = next_page
+
+        return response
 
@@ -1,4 +1,4 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 from asana_projects.interactors.storage_interfaces.storage_interface import (
     StorageInterface
 )
@@ -9,6 +9,7 @@ from asana_projects.constants.constants import (
     DEFAULT_OFFSET,
     DEFAULT_LIMIT,
 )
+from asana_backend.utils.pagination import build_next_page
 
 
 class GetProjectsInteractor:
@@ -26,29 +27,46 @@ class GetProjectsInteractor:
         team: Optional[str] = None,
         archived: Optional[bool] = None,
         opt_fields: Optional[str] = None,
-        offset: int = DEFAULT_OFFSET,
-        limit: int = DEFAULT_LIMIT
+        offset: Union[int, str] = DEFAULT_OFFSET,
+        limit: int = DEFAULT_LIMIT,
+        request=None,
+        stream: bool = False
     ) -> Dict[str, Any]:
         projects = self.storage.get_projects(
             workspace=workspace,
             team=team,
             archived=archived,
             offset=offset,
-            limit=limit
+            limit=limit,
+            stream=stream
         )
         
         # Handle opt_fields (field selection) - for now we return all fields
         # In a full implementation, we would filter the response based on opt_fields
 
         # Format projects matching ProjectCompact schema (for list view)
-        projects_list = [
+        projects_list = (
             {
                 'gid': str(project.gid),
                 'resource_type': 'project',
                 'name': project.name,
             }
             for project in projects
-        ]
+        )
+        if stream:
+            # Rows are serialized while the response is written; the next
+            # page is known once they have all been read
+            response = self.presenter.get_projects_response(projects_list)
+            response['next_page'] = lambda: build_next_page(
+                request, projects.next_offset
+            )
+            return response
+
+        response = self.presenter.get_projects_response(list(projects_list))
+
+        next_page = build_next_page(request, projects.next_offset)
+        if next_page:
+            response['next_page'] = next_page
 
-        return self.presenter.get_projects_response(projects_list)
+        return response
 
@@ -0,0 +1,50 @@
+from typing import Dict, Any, Optional
+from asana_projects.interactors.storage_interfaces.storage_interface import (
+    StorageInterface
+)
+from asana_projects.interactors.presenter_interfaces.presenter_interface import (
+    PresenterInterface
+)
+from asana_projects.exceptions.custom_exceptions import (
+    ProjectDoesNotExistException
+)
+from asana_projects.constants.constants import TASK_COUNT_FIELDS
+from asana_backend.utils.field_projection import parse_opt_fields
+
+
+class GetTaskCountsForProjectInteractor:
+    def __init__(
+        self,
+        storage: StorageInterface,
+        presenter: PresenterInterface
+    ):
+        self.storage = storage
+        self.presenter = presenter
+
+    def get_task_counts_for_project(
+        self,
+        project_gid: str,
+        opt_fields: Optional[str] = None
+    ) -> Dict[str, Any]:
+        task_counts = self.storage.get_task_counts([project_gid])
+        task_count = next(iter(task_counts.values()), None)
+
+        if task_count is None:
+            # No counter row: either the project never had a task or it
+            # does not exist
+            if not self.storage.get_project(project_gid):
+                raise ProjectDoesNotExistException()
+            counts = dict.fromkeys(TASK_COUNT_FIELDS, 0)
+        else:
+            counts = {
+                field: getattr(task_count, field) for field in TASK_COUNT_FIELDS
+            }
+
+        requested = parse_opt_fields(opt_fields)
+        if requested:
+            counts = {
+                field: value for field, value in counts.items()
+                if field in requested
+            }
+
+        return self.presenter.get_task_counts_response(counts)
@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Dict, Any, Union
 from asana_projects.interactors.storage_interfaces.storage_interface import (
     StorageInterface
 )
@@ -9,6 +9,7 @@ from asana_projects.constants.constants import (
     DEFAULT_OFFSET,
     DEFAULT_LIMIT,
 )
+from asana_backend.utils.pagination import build_next_page
 
 
 class GetWorkspaceProjectsInteractor:
@@ -23,8 +24,9 @@ class GetWorkspaceProjectsInteractor:
     def get_workspace_projects(
         self,
         workspace_gid: str,
-        offset: int = DEFAULT_OFFSET,
-        limit: int = DEFAULT_LIMIT
+        offset: Union[int, str] = DEFAULT_OFFSET,
+        limit: int = DEFAULT_LIMIT,
+        request=None
     ) -> Dict[str, Any]:
         projects = self.storage.get_workspace_projects(
             workspace_gid=workspace_gid,
@@ -47,12 +49,18 @@ class GetWorkspaceProjectsInteractor:
                 'public': project.public,
                 'archived': project.archived,
                 'color': project.color,
-                'due_date': project.due_date.isoformat() if project.due_date else None,
+                'due_on': project.due_on.isoformat() if project.due_on else None,
                 'created_at': project.created_at.isoformat(),
-                'updated_at': project.updated_at.isoformat(),
+                'modified_at': project.modified_at.isoformat(),
             }
             for project in projects
         ]
 
-        return self.presenter.get_projects_response(projects_list)
+        response = self.presenter.get_projects_response(projects_list)
+
+        next_page = build_next_page(request, projects.next_offset)
+        if next_page:
+            response['next_page'] = next_page
+
+        return response
 
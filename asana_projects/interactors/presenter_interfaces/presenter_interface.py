@@ -17,3 +17,16 @@ class PresenterInterface(ABC):
     ) -> Dict[str, Any]:
         pass
 
+    @abstractmethod
+    def get_job_response(
+        self,
+        job_dict: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    def get_task_counts_response(
+        self,
+        task_counts_dict: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        pass
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Union
 from asana_projects.models.project import Project
+from asana_projects.models.project_task_count import ProjectTaskCount
 
 
 class StorageInterface(ABC):
@@ -14,8 +15,9 @@ class StorageInterface(ABC):
         workspace: Optional[str] = None,
         team: Optional[str] = None,
         archived: Optional[bool] = None,
-        offset: int = 0,
-        limit: int = 50
+        offset: Union[int, str] = 0,
+        limit: int = 50,
+        stream: bool = False
     ) -> List[Project]:
         pass
 
@@ -23,7 +25,7 @@ class StorageInterface(ABC):
     def get_workspace_projects(
         self,
         workspace_gid: str,
-        offset: int = 0,
+        offset: Union[int, str] = 0,
         limit: int = 50
     ) -> List[Project]:
         pass
@@ -41,6 +43,39 @@ class StorageInterface(ABC):
         pass
 
     @abstractmethod
-    def get_project_tasks(self, project_gid: str, offset: int, limit: int) -> List:
+    def duplicate_project(
+        self,
+        project_gid: str,
+        name: str,
+        include: List[str],
+        team_gid: Optional[str] = None
+    ) -> Project:
+        pass
+
+    @abstractmethod
+    def duplicate_sections(
+        self,
+        project_gid: str,
+        new_project_gid: str
+    ) -> Dict[Any, Any]:
+        pass
+
+    @abstractmethod
+    def get_project_tasks(
+        self,
+        project_gid: str,
+        offset: Union[int, str],
+        limit: int
+    ) -> List:
+        pass
+
+    @abstractmethod
+    def get_task_counts(
+        self,
+        project_gids: Iterable[str]
+    ) -> Dict[str, ProjectTaskCount]:
         pass
 
+    @abstractmethod
+    def reconcile_task_counts(self, project_gids: Iterable[str]) -> List[str]:
+        pass
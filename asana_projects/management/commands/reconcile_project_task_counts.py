@@ -0,0 +1,50 @@
+from django.core.management.base import BaseCommand
+from asana_projects.models.project import Project
+from asana_projects.storages.storage_implementation import StorageImplementation
+from asana_projects.constants.constants import RECONCILE_BATCH_SIZE
+
+
+class Command(BaseCommand):
+    help = (
+        "Recount the materialized task counts of every project (or of the "
+        "given projects) and repair the ones that drifted. Meant to run "
+        "periodically, e.g. nightly from cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'project_gids',
+            nargs='*',
+            help='Only reconcile these projects.'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=RECONCILE_BATCH_SIZE,
+            help='Projects recounted per transaction.'
+        )
+
+    def handle(self, *args, **options):
+        storage = StorageImplementation()
+        project_gids = options['project_gids'] or list(
+            Project.objects.order_by('gid').values_list('gid', flat=True)
+        )
+        batch_size = options['batch_size']
+
+        checked, corrected = 0, []
+        batch = []
+        for gid in project_gids:
+            batch.append(gid)
+            if len(batch) == batch_size:
+                corrected += storage.reconcile_task_counts(batch)
+                checked += len(batch)
+                batch = []
+        if batch:
+            corrected += storage.reconcile_task_counts(batch)
+            checked += len(batch)
+
+        for gid in corrected:
+            self.stdout.write(f"Corrected task counts of project {gid}")
+        self.stdout.write(
+            f"Checked {checked} projects, corrected {len(corrected)}."
+        )
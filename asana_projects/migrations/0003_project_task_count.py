@@ -0,0 +1,41 @@
+# Generated by Django 6.0 on 2026-10-17 04:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+from asana_projects.task_counts.schema import (
+    install_task_count_triggers,
+    uninstall_task_count_triggers,
+)
+
+
+def install(apps, schema_editor):
+    install_task_count_triggers(schema_editor.connection)
+
+
+def uninstall(apps, schema_editor):
+    uninstall_task_count_triggers(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('asana_projects', '0002_projectfollower_projectmember_and_more'),
+        ('asana_tasks', '0003_task_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectTaskCount',
+            fields=[
+                ('project', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='task_count', serialize=False, to='asana_projects.project')),
+                ('num_tasks', models.IntegerField(default=0)),
+                ('num_completed_tasks', models.IntegerField(default=0)),
+                ('num_milestones', models.IntegerField(default=0)),
+                ('num_completed_milestones', models.IntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'asana_projects_project_task_count',
+            },
+        ),
+        migrations.RunPython(install, uninstall),
+    ]
@@ -1,4 +1,4 @@
 from .project import Project
+from .project_task_count import ProjectTaskCount
 
-__all__ = ['Project']
-
+__all__ = ['Project', 'ProjectTaskCount']
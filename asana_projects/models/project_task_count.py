@@ -0,0 +1,36 @@
+from django.db import models
+
+
+class ProjectTaskCount(models.Model):
+    """
+    Materialized task counts of a project.
+
+    Rows are written by database triggers on asana_tasks_taskproject and
+    asana_tasks_task (see asana_projects.task_counts.schema), so they change
+    in the same transaction as the task rows they count. Never update them
+    from application code; run ``reconcile_project_task_counts`` instead.
+    """
+    project = models.OneToOneField(
+        'asana_projects.Project',
+        primary_key=True,
+        related_name='task_count',
+        on_delete=models.CASCADE
+    )
+    num_tasks = models.IntegerField(default=0)
+    num_completed_tasks = models.IntegerField(default=0)
+    num_milestones = models.IntegerField(default=0)
+    num_completed_milestones = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = 'asana_projects_project_task_count'
+
+    @property
+    def num_incomplete_tasks(self) -> int:
+        return self.num_tasks - self.num_completed_tasks
+
+    @property
+    def num_incomplete_milestones(self) -> int:
+        return self.num_milestones - self.num_completed_milestones
+
+    def __str__(self):
+        return f"{self.project_id}: {self.num_tasks} tasks"
@@ -21,3 +21,18 @@ class GetProjectPresenterImplementation(PresenterInterface):
             'data': projects_list
         }
 
+    def get_job_response(
+        self,
+        job_dict: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        return {
+            'data': job_dict
+        }
+
+    def get_task_counts_response(
+        self,
+        task_counts_dict: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        return {
+            'data': task_counts_dict
+        }
@@ -38,3 +38,16 @@ class ProjectUpdateSerializer(serializers.ModelSerializer):
                   'due_date', 'start_on']
         extra_kwargs = {field: {'required': False} for field in fields}
 
+
+class TaskCountSerializer(serializers.Serializer):
+    """TaskCount schema matching API spec"""
+    num_tasks = serializers.IntegerField(required=False)
+    num_incomplete_tasks = serializers.IntegerField(required=False)
+    num_completed_tasks = serializers.IntegerField(required=False)
+    num_milestones = serializers.IntegerField(required=False)
+    num_incomplete_milestones = serializers.IntegerField(required=False)
+    num_completed_milestones = serializers.IntegerField(required=False)
+
+
+class GetTaskCountsForProjectResponseSerializer(serializers.Serializer):
+    data = TaskCountSerializer()
@@ -1,17 +1,25 @@
-from typing import List, Optional
-from asana_projects.models.project import Project
+import uuid
+from typing import Any, Dict, Iterable, List, Optional, Union
+from django.db import transaction
+from django.db.models import Count, Q
+from asana_projects.models.project import Project, ProjectMember
+from asana_projects.models.project_task_count import ProjectTaskCount
+from asana_projects.constants.constants import STORED_TASK_COUNT_FIELDS
 from asana_workspaces.models.workspace import Workspace
 from asana_teams.models.team import Team
+from asana_sections.models.section import Section
 from asana_tasks.models.task_project import TaskProject
 from asana_projects.interactors.storage_interfaces.storage_interface import (
     StorageInterface
 )
+from asana_backend.utils.identity_map import load
+from asana_backend.utils.pagination import Page, paginate_queryset
 
 
 class StorageImplementation(StorageInterface):
     def get_project(self, project_gid: str) -> Optional[Project]:
         try:
-            return Project.objects.get(gid=project_gid)
+            return load(Project, project_gid)
         except Project.DoesNotExist:
             return None
 
@@ -20,8 +28,9 @@ class StorageImplementation(StorageInterface):
         workspace: Optional[str] = None,
         team: Optional[str] = None,
         archived: Optional[bool] = None,
-        offset: int = 0,
-        limit: int = 50
+        offset: Union[int, str] = 0,
+        limit: int = 50,
+        stream: bool = False
     ) -> List[Project]:
         queryset = Project.objects.all()
 
@@ -32,22 +41,23 @@ class StorageImplementation(StorageInterface):
         if archived is not None:
             queryset = queryset.filter(archived=archived)
 
-        return list(queryset[offset:offset + limit])
+        return paginate_queryset(
+            queryset, offset, limit, ordering=('gid',), stream=stream
+        )
 
     def get_workspace_projects(
         self,
         workspace_gid: str,
-        offset: int = 0,
+        offset: Union[int, str] = 0,
         limit: int = 50
     ) -> List[Project]:
-        return list(
-            Project.objects.filter(
-                workspace__gid=workspace_gid
-            )[offset:offset + limit]
-        )
+        queryset = Project.objects.filter(
+            workspace__gid=workspace_gid
+        ).select_related('workspace', 'team')
+        return paginate_queryset(queryset, offset, limit, ordering=('gid',))
 
     def create_project(self, name: str, workspace_gid: str, **kwargs) -> Project:
-        workspace = Workspace.objects.get(gid=workspace_gid)
+        workspace = load(Workspace, workspace_gid)
         
         project_data = {
             'name': name,
@@ -56,7 +66,7 @@ class StorageImplementation(StorageInterface):
         
         # Handle team_gid
         if 'team_gid' in kwargs and kwargs['team_gid']:
-            team = Team.objects.get(gid=kwargs.pop('team_gid'))
+            team = load(Team, kwargs.pop('team_gid'))
             project_data['team'] = team
         
         # Add other fields
@@ -66,9 +76,8 @@ class StorageImplementation(StorageInterface):
         return project
 
     def update_project(self, project_gid: str, **update_data) -> Optional[Project]:
-        try:
-            project = Project.objects.get(gid=project_gid)
-        except Project.DoesNotExist:
+        project = self.get_project(project_gid)
+        if not project:
             return None
         
         for field, value in update_data.items():
@@ -79,18 +88,157 @@ class StorageImplementation(StorageInterface):
         return project
 
     def delete_project(self, project_gid: str) -> bool:
-        try:
-            project = Project.objects.get(gid=project_gid)
-            project.delete()
-            return True
-        except Project.DoesNotExist:
+        project = self.get_project(project_gid)
+        if not project:
             return False
+        project.delete()
+        return True
 
-    def get_project_tasks(self, project_gid: str, offset: int, limit: int) -> List:
-        try:
-            project = Project.objects.get(gid=project_gid)
-            task_projects = TaskProject.objects.filter(project=project).select_related('task')[offset:offset + limit]
-            return [tp.task for tp in task_projects]
-        except Project.DoesNotExist:
-            return []
+    @transaction.atomic
+    def duplicate_project(
+        self,
+        project_gid: str,
+        name: str,
+        include: List[str],
+        team_gid: Optional[str] = None
+    ) -> Project:
+        original = load(Project, project_gid)
+        project = Project.objects.create(
+            name=name,
+            workspace_id=original.workspace_id,
+            team=load(Team, team_gid) if team_gid else original.team,
+            owner_id=original.owner_id,
+            color=original.color,
+            icon=original.icon,
+            default_view=original.default_view,
+            public=original.public,
+            notes=original.notes if 'notes' in include else None,
+            html_notes=original.html_notes if 'notes' in include else None,
+            created_by_id=original.created_by_id
+        )
+
+        if 'members' in include:
+            ProjectMember.objects.bulk_create([
+                ProjectMember(
+                    project=project,
+                    user_id=user_id,
+                    access_level=access_level
+                )
+                for user_id, access_level in ProjectMember.objects.filter(
+                    project=original
+                ).values_list('user_id', 'access_level')
+            ])
+
+        return project
+
+    @transaction.atomic
+    def duplicate_sections(
+        self,
+        project_gid: str,
+        new_project_gid: str
+    ) -> Dict[Any, Any]:
+        """
+        Copy the sections of a project into ``new_project_gid``, in their
+        order. Returns the copies' pks keyed by original pk, to move task
+        links into the copied sections.
+        """
+        originals = list(Section.objects.filter(project_id=project_gid))
+        copies = [
+            Section(name=section.name, project_id=new_project_gid)
+            for section in originals
+        ]
+        Section.objects.bulk_create(copies)
+        # Sections are ordered by created_at, which bulk_create sets to now
+        # on every copy
+        for original, copy in zip(originals, copies):
+            copy.created_at = original.created_at
+        Section.objects.bulk_update(copies, ['created_at'])
+        return {
+            original.pk: copy.pk
+            for original, copy in zip(originals, copies)
+        }
+
+    def get_project_tasks(
+        self,
+        project_gid: str,
+        offset: Union[int, str],
+        limit: int
+    ) -> List:
+        project = self.get_project(project_gid)
+        if not project:
+            return Page()
+        # Page over the link rows in board order, section by section, so
+        # the seek runs on the (project, section, rank) index
+        task_projects = paginate_queryset(
+            TaskProject.objects.filter(project=project).select_related('task'),
+            offset,
+            limit,
+            ordering=('section_id', 'rank', 'gid')
+        )
+        return Page(
+            [tp.task for tp in task_projects],
+            next_offset=task_projects.next_offset
+        )
+
+    def get_task_counts(
+        self,
+        project_gids: Iterable[str]
+    ) -> Dict[str, ProjectTaskCount]:
+        """
+        Counter rows for ``project_gids`` keyed by gid, read with one query.
+        Projects that never had a task have no row.
+        """
+        return {
+            str(row.project_id): row
+            for row in ProjectTaskCount.objects.filter(project_id__in=list(project_gids))
+        }
+
+    def reconcile_task_counts(self, project_gids: Iterable[str]) -> List[str]:
+        """
+        Recount ``project_gids`` from the link table and fix the counter
+        rows that drifted. Returns the gids that were corrected.
+        """
+        project_gids = [uuid.UUID(str(gid)) for gid in project_gids]
+        with transaction.atomic():
+            # Lock the counters first so trigger updates from concurrent
+            # writers wait and are visible to the recount below
+            stored = {
+                row.project_id: row
+                for row in ProjectTaskCount.objects.select_for_update().filter(
+                    project_id__in=project_gids
+                )
+            }
+            completed = Q(task__completed=True)
+            milestone = Q(task__resource_subtype='milestone')
+            counted = {
+                row['project_id']: row
+                for row in TaskProject.objects.filter(
+                    project_id__in=project_gids
+                ).values('project_id').annotate(
+                    num_tasks=Count('pk'),
+                    num_completed_tasks=Count('pk', filter=completed),
+                    num_milestones=Count('pk', filter=milestone),
+                    num_completed_milestones=Count('pk', filter=completed & milestone),
+                )
+            }
+
+            to_create, to_update = [], []
+            for project_id in set(stored) | set(counted):
+                expected = counted.get(project_id, {})
+                row = stored.get(project_id)
+                if row is None:
+                    to_create.append(ProjectTaskCount(project_id=project_id, **{
+                        field: expected[field] for field in STORED_TASK_COUNT_FIELDS
+                    }))
+                    continue
+                changed = False
+                for field in STORED_TASK_COUNT_FIELDS:
+                    if getattr(row, field) != expected.get(field, 0):
+                        setattr(row, field, expected.get(field, 0))
+                        changed = True
+                if changed:
+                    to_update.append(row)
 
+            ProjectTaskCount.objects.bulk_create(to_create, ignore_conflicts=True)
+            ProjectTaskCount.objects.bulk_update(to_update, STORED_TASK_COUNT_FIELDS)
+        return [str(row.project_id) for row in to_create + to_update]
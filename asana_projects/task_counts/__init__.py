@@ -0,0 +1,11 @@
+from .schema import (
+    install_task_count_triggers,
+    uninstall_task_count_triggers,
+    ensure_task_count_triggers,
+)
+
+__all__ = [
+    'install_task_count_triggers',
+    'uninstall_task_count_triggers',
+    'ensure_task_count_triggers',
+]
@@ -0,0 +1,234 @@
+"""
+Triggers that maintain asana_projects_project_task_count.
+
+Adding or removing a TaskProject row, and changing a linked task's
+``completed`` or ``resource_subtype``, adjusts the counts of the affected
+projects inside the same statement, so the counts commit or roll back with
+the change that caused them and bulk_create / QuerySet.update paths are
+covered too. Installed by migration 0003_project_task_count; as with the
+task search index, a SQLite table rebuild drops the triggers, so
+``ensure_task_count_triggers`` reinstalls them (and recounts) after a
+``migrate`` that lost them. Triggers that are in place are left alone, as
+live processes are counting through them; drifted counts are repaired by
+the ``reconcile_project_task_counts`` command.
+"""
+from django.db import transaction
+from django.db.migrations.recorder import MigrationRecorder
+
+MIGRATION = ('asana_projects', '0003_project_task_count')
+
+COUNTS = 'asana_projects_project_task_count'
+COLUMNS = 'project_id, num_tasks, num_completed_tasks, num_milestones, num_completed_milestones'
+
+RECOUNT = [
+    f'DELETE FROM {COUNTS}',
+    f"""
+    INSERT INTO {COUNTS} ({COLUMNS})
+    SELECT
+        link.project_id,
+        COUNT(*),
+        SUM(CASE WHEN task.completed THEN 1 ELSE 0 END),
+        SUM(CASE WHEN task.resource_subtype = 'milestone' THEN 1 ELSE 0 END),
+        SUM(CASE WHEN task.completed AND task.resource_subtype = 'milestone' THEN 1 ELSE 0 END)
+    FROM asana_tasks_taskproject link
+    JOIN asana_tasks_task task ON task.gid = link.task_id
+    GROUP BY link.project_id
+    """,
+]
+
+
+def _sqlite_link_delta(sign: str, row: str) -> str:
+    task = f'(SELECT {{}} FROM asana_tasks_task WHERE gid = {row}.task_id)'
+    return f"""
+        UPDATE {COUNTS} SET
+            num_tasks = num_tasks {sign} 1,
+            num_completed_tasks = num_completed_tasks {sign} {task.format('completed')},
+            num_milestones = num_milestones {sign} {task.format("resource_subtype = 'milestone'")},
+            num_completed_milestones = num_completed_milestones {sign} {task.format("completed AND resource_subtype = 'milestone'")}
+        WHERE project_id = {row}.project_id;
+    """
+
+
+SQLITE_ENSURE_ROW = (
+    f'INSERT OR IGNORE INTO {COUNTS} ({COLUMNS}) VALUES (new.project_id, 0, 0, 0, 0);'
+)
+
+SQLITE_INSTALL = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS asana_project_task_count_link_insert
+    AFTER INSERT ON asana_tasks_taskproject
+    BEGIN
+        {SQLITE_ENSURE_ROW}
+        {_sqlite_link_delta('+', 'new')}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS asana_project_task_count_link_delete
+    AFTER DELETE ON asana_tasks_taskproject
+    BEGIN
+        {_sqlite_link_delta('-', 'old')}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS asana_project_task_count_link_update
+    AFTER UPDATE OF task_id, project_id ON asana_tasks_taskproject
+    BEGIN
+        {_sqlite_link_delta('-', 'old')}
+        {SQLITE_ENSURE_ROW}
+        {_sqlite_link_delta('+', 'new')}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS asana_project_task_count_task_update
+    AFTER UPDATE OF completed, resource_subtype ON asana_tasks_task
+    WHEN old.completed IS NOT new.completed
+        OR old.resource_subtype IS NOT new.resource_subtype
+    BEGIN
+        UPDATE {COUNTS} SET
+            num_completed_tasks = num_completed_tasks
+                + new.completed - old.completed,
+            num_milestones = num_milestones
+                + (new.resource_subtype = 'milestone')
+                - (old.resource_subtype = 'milestone'),
+            num_completed_milestones = num_completed_milestones
+                + (new.completed AND new.resource_subtype = 'milestone')
+                - (old.completed AND old.resource_subtype = 'milestone')
+        WHERE project_id IN (
+            SELECT project_id FROM asana_tasks_taskproject WHERE task_id = new.gid
+        );
+    END
+    """,
+]
+SQLITE_TRIGGERS = (
+    'asana_project_task_count_link_insert',
+    'asana_project_task_count_link_delete',
+    'asana_project_task_count_link_update',
+    'asana_project_task_count_task_update',
+)
+SQLITE_UNINSTALL = [
+    f'DROP TRIGGER IF EXISTS {trigger}' for trigger in SQLITE_TRIGGERS
+]
+
+
+def _postgres_link_delta(sign: str, row: str) -> str:
+    return f"""
+        UPDATE {COUNTS} SET
+            num_tasks = num_tasks {sign} 1,
+            num_completed_tasks = num_completed_tasks {sign} task.completed::int,
+            num_milestones = num_milestones {sign} (task.resource_subtype = 'milestone')::int,
+            num_completed_milestones = num_completed_milestones
+                {sign} (task.completed AND task.resource_subtype = 'milestone')::int
+        FROM asana_tasks_task task
+        WHERE task.gid = {row}.task_id AND {COUNTS}.project_id = {row}.project_id;
+    """
+
+
+POSTGRES_INSTALL = [
+    f"""
+    CREATE OR REPLACE FUNCTION asana_project_task_count_link() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('DELETE', 'UPDATE') THEN
+            {_postgres_link_delta('-', 'OLD')}
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            INSERT INTO {COUNTS} ({COLUMNS}) VALUES (NEW.project_id, 0, 0, 0, 0)
+            ON CONFLICT (project_id) DO NOTHING;
+            {_postgres_link_delta('+', 'NEW')}
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    f"""
+    CREATE OR REPLACE FUNCTION asana_project_task_count_task() RETURNS trigger AS $$
+    BEGIN
+        UPDATE {COUNTS} SET
+            num_completed_tasks = num_completed_tasks
+                + NEW.completed::int - OLD.completed::int,
+            num_milestones = num_milestones
+                + (NEW.resource_subtype = 'milestone')::int
+                - (OLD.resource_subtype = 'milestone')::int,
+            num_completed_milestones = num_completed_milestones
+                + (NEW.completed AND NEW.resource_subtype = 'milestone')::int
+                - (OLD.completed AND OLD.resource_subtype = 'milestone')::int
+        WHERE project_id IN (
+            SELECT project_id FROM asana_tasks_taskproject WHERE task_id = NEW.gid
+        );
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    'DROP TRIGGER IF EXISTS asana_project_task_count_link ON asana_tasks_taskproject',
+    """
+    CREATE TRIGGER asana_project_task_count_link
+    AFTER INSERT OR DELETE OR UPDATE OF task_id, project_id ON asana_tasks_taskproject
+    FOR EACH ROW EXECUTE FUNCTION asana_project_task_count_link()
+    """,
+    'DROP TRIGGER IF EXISTS asana_project_task_count_task ON asana_tasks_task',
+    """
+    CREATE TRIGGER asana_project_task_count_task
+    AFTER UPDATE OF completed, resource_subtype ON asana_tasks_task
+    FOR EACH ROW
+    WHEN (OLD.completed IS DISTINCT FROM NEW.completed
+          OR OLD.resource_subtype IS DISTINCT FROM NEW.resource_subtype)
+    EXECUTE FUNCTION asana_project_task_count_task()
+    """,
+]
+POSTGRES_TRIGGERS = (
+    'asana_project_task_count_link',
+    'asana_project_task_count_task',
+)
+POSTGRES_UNINSTALL = [
+    'DROP TRIGGER IF EXISTS asana_project_task_count_link ON asana_tasks_taskproject',
+    'DROP TRIGGER IF EXISTS asana_project_task_count_task ON asana_tasks_task',
+    'DROP FUNCTION IF EXISTS asana_project_task_count_link()',
+    'DROP FUNCTION IF EXISTS asana_project_task_count_task()',
+]
+
+
+def _triggers_installed(connection, triggers) -> bool:
+    placeholders = ', '.join(['%s'] * len(triggers))
+    query = {
+        'sqlite': "SELECT count(*) FROM sqlite_master WHERE type = 'trigger' ",
+        'postgresql': 'SELECT count(*) FROM pg_trigger WHERE NOT tgisinternal ',
+    }[connection.vendor]
+    column = 'name' if connection.vendor == 'sqlite' else 'tgname'
+    with connection.cursor() as cursor:
+        cursor.execute(f'{query} AND {column} IN ({placeholders})', triggers)
+        return cursor.fetchone()[0] == len(triggers)
+
+
+def install_task_count_triggers(connection) -> None:
+    """Create missing triggers and recount every project from scratch."""
+    if connection.vendor == 'sqlite':
+        statements, triggers = SQLITE_INSTALL, SQLITE_TRIGGERS
+    elif connection.vendor == 'postgresql':
+        statements, triggers = POSTGRES_INSTALL, POSTGRES_TRIGGERS
+    else:
+        return
+    if _triggers_installed(connection, triggers):
+        return
+    # One transaction: readers keep seeing the old counts until the new
+    # ones commit, and writes wait for the triggers instead of slipping in
+    # between them and the recount
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        for statement in [*statements, *RECOUNT]:
+            cursor.execute(statement)
+
+
+def uninstall_task_count_triggers(connection) -> None:
+    statements = {
+        'sqlite': SQLITE_UNINSTALL,
+        'postgresql': POSTGRES_UNINSTALL,
+    }.get(connection.vendor, [])
+    with connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+
+
+def ensure_task_count_triggers(sender, using, **kwargs) -> None:
+    """post_migrate receiver: reinstall the triggers if a table rebuild lost them."""
+    from django.db import connections
+    connection = connections[using]
+    if MIGRATION in MigrationRecorder(connection).applied_migrations():
+        install_task_count_triggers(connection)
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import path
 from asana_projects.views.get_project.get_project_view import GetProjectView
 from asana_projects.views.get_projects.get_projects_view import GetProjectsView
@@ -6,12 +7,13 @@ from asana_projects.views.create_project.create_project_view import CreateProjec
 from asana_projects.views.update_project.update_project_view import UpdateProjectView
 from asana_projects.views.delete_project.delete_project_view import DeleteProjectView
 from asana_projects.views.duplicate_project.duplicate_project_view import DuplicateProjectView
-from asana_projects.views.get_project_tasks.get_project_tasks_view import GetProjectTasksView
+from asana_projects.views.get_project_tasks import GetProjectTasksView, GetProjectTasksAsyncView
 from asana_projects.views.get_team_projects.get_team_projects_view import GetTeamProjectsView
 from asana_projects.views.add_project_members.add_project_members_view import AddProjectMembersView
 from asana_projects.views.remove_project_members.remove_project_members_view import RemoveProjectMembersView
 from asana_projects.views.add_project_followers.add_project_followers_view import AddProjectFollowersView
 from asana_projects.views.remove_project_followers.remove_project_followers_view import RemoveProjectFollowersView
+from asana_projects.views.get_task_counts_for_project_view import GetTaskCountsForProjectView
 from rest_framework.views import APIView
 from rest_framework.response import Response
 
@@ -43,6 +45,12 @@ class ProjectDetailView(APIView):
 
 app_name = 'asana_projects'
 
+# ASGI deployments serve this read with an async view
+if getattr(settings, 'ASANA_ASYNC_VIEWS', False):
+    project_tasks_view = GetProjectTasksAsyncView
+else:
+    project_tasks_view = GetProjectTasksView
+
 urlpatterns = [
     # GET & POST /projects/ - List and Create projects
     path('projects/', ProjectsListView.as_view(), name='projects_list'),
@@ -54,7 +62,10 @@ urlpatterns = [
     path('projects/<str:project_gid>/duplicate/', DuplicateProjectView.as_view(), name='duplicate_project'),
     
     # GET /projects/{project_gid}/tasks/ - Get tasks for a project
-    path('projects/<str:project_gid>/tasks/', GetProjectTasksView.as_view(), name='get_project_tasks'),
+    path('projects/<str:project_gid>/tasks/', project_tasks_view.as_view(), name='get_project_tasks'),
+    
+    # GET /projects/{project_gid}/task_counts - Get task counts for a project
+    path('projects/<str:project_gid>/task_counts', GetTaskCountsForProjectView.as_view(), name='get_task_counts_for_project'),
     
     # POST /projects/{project_gid}/addMembers/ - Add members to a project
     path('projects/<str:project_gid>/addMembers/', AddProjectMembersView.as_view(), name='add_project_members'),
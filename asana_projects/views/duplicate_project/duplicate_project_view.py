@@ -2,8 +2,17 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse, OpenApiExample
-import uuid
-from asana_projects.models.project import Project
+from asana_projects.interactors.duplicate_project_interactor import (
+    DuplicateProjectInteractor
+)
+from asana_projects.storages.storage_implementation import StorageImplementation
+from asana_projects.presenters.get_project_presenter_implementation import (
+    GetProjectPresenterImplementation
+)
+from asana_projects.exceptions.custom_exceptions import (
+    ProjectDoesNotExistException
+)
+from asana_jobs.app_interfaces.service_interface import ServiceInterface
 from asana_backend.utils.validators import validate_uuid
 from asana_backend.utils.decorators.ratelimit import ratelimit
 from asana_backend.utils.error_responses import (
@@ -44,6 +53,7 @@ class DuplicateProjectView(APIView):
                                 'items': {'type': 'string'},
                                 'description': 'Elements to duplicate (members, notes, task_notes, etc.)'
                             },
+                            'team': {'type': 'string', 'description': 'Team for the new project. Defaults to the original project\'s team.'},
                         },
                         'required': ['name']
                     }
@@ -61,12 +71,10 @@ class DuplicateProjectView(APIView):
                                 "gid": "job-12345",
                                 "resource_type": "job",
                                 "resource_subtype": "duplicate_project",
-                                "status": "in_progress",
-                                "new_project": {
-                                    "gid": "new-project-gid",
-                                    "resource_type": "project",
-                                    "name": "Duplicated Project"
-                                }
+                                "status": "not_started",
+                                "new_project": None,
+                                "new_task": None,
+                                "new_project_template": None
                             }
                         }
                     )
@@ -120,15 +128,6 @@ class DuplicateProjectView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Check if project exists
-        try:
-            original_project = Project.objects.get(gid=project_gid)
-        except Project.DoesNotExist:
-            return Response(
-                not_found_error("project", project_gid),
-                status=status.HTTP_404_NOT_FOUND
-            )
-        
         # Get request data
         data = request.data.get('data', request.data)
         
@@ -140,21 +139,39 @@ class DuplicateProjectView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Get include options
+        # Get include options (list or comma-separated string)
         include = data.get('include', [])
+        if isinstance(include, str):
+            include = [option.strip() for option in include.split(',') if option.strip()]
         
-        # Create duplicated project (synchronously for simplicity)
+        team_gid = data.get('team')
+        if team_gid:
+            try:
+                validate_uuid(team_gid)
+            except Exception:
+                return Response(
+                    invalid_gid_error("team"),
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+        
+        interactor = DuplicateProjectInteractor(
+            storage=StorageImplementation(),
+            presenter=GetProjectPresenterImplementation(),
+            jobs_service=ServiceInterface()
+        )
+        
+        # The copy itself runs as a job; the response tracks its progress
         try:
-            new_project = Project.objects.create(
+            response = interactor.duplicate_project(
+                project_gid=project_gid,
                 name=name,
-                workspace=original_project.workspace,
-                team=original_project.team,
-                notes=original_project.notes if 'notes' in include or 'task_notes' in include else '',
-                html_notes=original_project.html_notes if 'notes' in include else '',
-                color=original_project.color,
-                default_view=original_project.default_view,
-                public=original_project.public,
-                archived=False,
+                include=include,
+                team_gid=team_gid
+            )
+        except ProjectDoesNotExistException:
+            return Response(
+                not_found_error("project", project_gid),
+                status=status.HTTP_404_NOT_FOUND
             )
         except Exception as e:
             return Response(
@@ -162,19 +179,4 @@ class DuplicateProjectView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
         
-        # Return job response (in a real implementation, this would be async)
-        job_gid = str(uuid.uuid4())
-        
-        response_data = {
-            'gid': job_gid,
-            'resource_type': 'job',
-            'resource_subtype': 'duplicate_project',
-            'status': 'succeeded',  # Synchronous, so already done
-            'new_project': {
-                'gid': str(new_project.gid),
-                'resource_type': 'project',
-                'name': new_project.name
-            }
-        }
-        
-        return Response({'data': response_data}, status=status.HTTP_201_CREATED)
+        return Response(response, status=status.HTTP_201_CREATED)
@@ -15,6 +15,7 @@ from asana_projects.exceptions.custom_exceptions import (
 )
 from asana_backend.utils.validators import validate_uuid
 from asana_backend.utils.decorators.ratelimit import ratelimit
+from asana_backend.utils.object_cache import CachedObject
 
 
 class GetProjectView(APIView):
@@ -36,12 +37,19 @@ class GetProjectView(APIView):
             presenter=presenter
         )
 
+        cached_project = CachedObject('project', project_gid)
         try:
-            response = interactor.get_project(project_gid)
-            return Response(response, status=status.HTTP_200_OK)
+            response = cached_project.get_or_build(
+                lambda: interactor.get_project(project_gid)
+            )
         except ProjectDoesNotExistException as e:
             return Response(
                 {'errors': [{'message': str(e)}]},
                 status=status.HTTP_404_NOT_FOUND
             )
 
+        validators = cached_project.validators()
+        return validators.check(request) or validators.apply(
+            Response(response, status=status.HTTP_200_OK)
+        )
+
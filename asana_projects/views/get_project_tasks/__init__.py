@@ -1 +1,2 @@
 from .get_project_tasks_view import GetProjectTasksView
+from .get_project_tasks_async_view import GetProjectTasksAsyncView
@@ -0,0 +1,96 @@
+import asyncio
+from django.core.exceptions import ValidationError
+from rest_framework import status
+from asana_projects.models.project import Project
+from asana_projects.interactors.get_project_tasks_interactor import (
+    GetProjectTasksInteractor
+)
+from asana_projects.storages.storage_implementation import (
+    StorageImplementation
+)
+from asana_projects.presenters.get_projects_presenter_implementation import (
+    GetProjectsPresenterImplementation
+)
+from asana_backend.utils.validators import (
+    validate_uuid,
+    validate_pagination_params
+)
+from asana_backend.utils.decorators.ratelimit import ratelimit
+from asana_backend.utils.error_responses import (
+    not_found_error,
+    invalid_gid_error,
+    invalid_field_error
+)
+from asana_backend.utils.async_views import AsyncAPIView, run_in_thread
+
+
+class GetProjectTasksAsyncView(AsyncAPIView):
+    """
+    GetProjectTasksView for ASGI workers: the project's existence is
+    checked while its page of tasks is read.
+    """
+    @ratelimit(key='ip', rate='5/s', method='GET')
+    async def get(self, request, project_gid: str):
+        # Validate project GID format
+        try:
+            validate_uuid(project_gid)
+        except Exception:
+            return self.render(
+                request,
+                invalid_gid_error("project_gid"),
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # Get pagination params
+        try:
+            limit = int(request.GET.get('limit', 50))
+            if limit < 1 or limit > 100:
+                return self.render(
+                    request,
+                    invalid_field_error("limit", "Value must be between 1 and 100"),
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+        except ValueError:
+            return self.render(
+                request,
+                invalid_field_error("limit", "Must be a valid integer"),
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # offset is either an offset token from next_page or a legacy
+        # integer offset
+        try:
+            offset, _ = validate_pagination_params(
+                offset=request.GET.get('offset'),
+                limit=limit
+            )
+        except ValidationError:
+            return self.render(
+                request,
+                invalid_field_error("offset", "Must be a valid offset token"),
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        interactor = GetProjectTasksInteractor(
+            storage=StorageImplementation(),
+            presenter=GetProjectsPresenterImplementation()
+        )
+        # The page of a missing project is empty and thrown away
+        project_exists, response = await asyncio.gather(
+            run_in_thread(Project.objects.filter(gid=project_gid).exists),
+            run_in_thread(
+                interactor.get_project_tasks,
+                project_gid=project_gid,
+                offset=offset,
+                limit=limit,
+                request=request
+            )
+        )
+        if not project_exists:
+            return self.render(
+                request,
+                not_found_error("project", project_gid),
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        return self.render(request, response, status=status.HTTP_200_OK)
@@ -1,10 +1,23 @@
+from django.core.exceptions import ValidationError
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse, OpenApiExample
 from asana_projects.models.project import Project
 from asana_tasks.models.task import Task
-from asana_backend.utils.validators import validate_uuid
+from asana_projects.interactors.get_project_tasks_interactor import (
+    GetProjectTasksInteractor
+)
+from asana_projects.storages.storage_implementation import (
+    StorageImplementation
+)
+from asana_projects.presenters.get_projects_presenter_implementation import (
+    GetProjectsPresenterImplementation
+)
+from asana_backend.utils.validators import (
+    validate_uuid,
+    validate_pagination_params
+)
 from asana_backend.utils.decorators.ratelimit import ratelimit
 from asana_backend.utils.error_responses import (
     not_found_error, 
@@ -102,9 +115,7 @@ class GetProjectTasksView(APIView):
             )
         
         # Check if project exists
-        try:
-            project = Project.objects.get(gid=project_gid)
-        except Project.DoesNotExist:
+        if not Project.objects.filter(gid=project_gid).exists():
             return Response(
                 not_found_error("project", project_gid),
                 status=status.HTTP_404_NOT_FOUND
@@ -124,33 +135,28 @@ class GetProjectTasksView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
+        # offset is either an offset token from next_page or a legacy
+        # integer offset
         try:
-            offset = int(request.query_params.get('offset', 0))
-            if offset < 0:
-                return Response(
-                    invalid_field_error("offset", "Must be >= 0"),
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-        except ValueError:
+            offset, _ = validate_pagination_params(
+                offset=request.query_params.get('offset'),
+                limit=limit
+            )
+        except ValidationError:
             return Response(
-                invalid_field_error("offset", "Must be a valid integer"),
+                invalid_field_error("offset", "Must be a valid offset token"),
                 status=status.HTTP_400_BAD_REQUEST
             )
-        
-        # Get tasks for this project (using TaskProject relation)
-        from asana_tasks.models.task_project import TaskProject
-        task_projects = TaskProject.objects.filter(project=project).select_related('task')
-        tasks = [tp.task for tp in task_projects[offset:offset + limit]]
-        
-        tasks_list = [
-            {
-                'gid': str(task.gid),
-                'resource_type': 'task',
-                'name': task.name,
-                'resource_subtype': task.resource_subtype,
-                'completed': task.completed,
-            }
-            for task in tasks
-        ]
-        
-        return Response({'data': tasks_list}, status=status.HTTP_200_OK)
+
+        interactor = GetProjectTasksInteractor(
+            storage=StorageImplementation(),
+            presenter=GetProjectsPresenterImplementation()
+        )
+        response = interactor.get_project_tasks(
+            project_gid=project_gid,
+            offset=offset,
+            limit=limit,
+            request=request
+        )
+
+        return Response(response, status=status.HTTP_200_OK)
@@ -16,6 +16,10 @@ from asana_projects.constants.constants import (
     MAX_LIMIT,
 )
 from asana_backend.utils.validators import validate_pagination_params
+from asana_backend.utils.streaming import (
+    get_max_limit,
+    StreamingListResponse
+)
 from asana_backend.utils.decorators.ratelimit import ratelimit
 
 
@@ -24,21 +28,12 @@ class GetProjectsView(APIView):
     def get(self, request):
         # Validate and normalize pagination params
         try:
-            # Handle offset - can be int or string token
-            offset_param = request.query_params.get('offset', '0')
-            try:
-                offset = int(offset_param)
-            except ValueError:
-                # If it's a token, treat as 0 for now
-                offset = 0
-            
-            limit_param = request.query_params.get('limit')
-            limit = int(limit_param) if limit_param else DEFAULT_LIMIT
-            
+            # offset is either an offset token from next_page or a
+            # legacy integer offset
             offset, limit = validate_pagination_params(
-                offset=offset,
-                limit=limit,
-                max_limit=MAX_LIMIT
+                offset=request.query_params.get('offset'),
+                limit=request.query_params.get('limit'),
+                max_limit=get_max_limit(request, MAX_LIMIT)
             )
         except Exception as e:
             return Response(
@@ -46,6 +41,10 @@ class GetProjectsView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        # Pages above MAX_LIMIT are only open to bulk clients and are
+        # written out as they are read
+        stream = limit > MAX_LIMIT
+
         # Optional filters (matching API spec parameter names)
         workspace = request.query_params.get('workspace')
         team = request.query_params.get('team')
@@ -69,7 +68,11 @@ class GetProjectsView(APIView):
             archived=archived,
             opt_fields=opt_fields,
             offset=offset,
-            limit=limit
+            limit=limit,
+            request=request,
+            stream=stream
         )
+        if stream:
+            return StreamingListResponse(response)
         return Response(response, status=status.HTTP_200_OK)
 
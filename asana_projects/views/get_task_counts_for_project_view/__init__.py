@@ -0,0 +1 @@
+from .get_task_counts_for_project_view import GetTaskCountsForProjectView
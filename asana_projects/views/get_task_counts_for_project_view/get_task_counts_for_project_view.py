@@ -15,6 +15,19 @@ from asana_backend.utils.error_responses import (
     missing_field_error,
     server_error,
 )
+from asana_projects.serializers import GetTaskCountsForProjectResponseSerializer
+from asana_projects.interactors.get_task_counts_for_project_interactor import (
+    GetTaskCountsForProjectInteractor
+)
+from asana_projects.storages.storage_implementation import (
+    StorageImplementation
+)
+from asana_projects.presenters.get_project_presenter_implementation import (
+    GetProjectPresenterImplementation
+)
+from asana_projects.exceptions.custom_exceptions import (
+    ProjectDoesNotExistException
+)
 
 
 class GetTaskCountsForProjectView(APIView):
@@ -37,8 +50,7 @@ class GetTaskCountsForProjectView(APIView):
                 name='opt_pretty',
                 type=str,
                 location=OpenApiParameter.QUERY,
-                description='Provides “pretty” output.
-Provides the response in a “pretty” format. In the case of JSON this means doing proper line breaking and indentation to make it readable. This will take extra time and increase the response size so it is advisable only to use this during debugging.',
+                description='Provides “pretty” output. Provides the response in a “pretty” format. In the case of JSON this means doing proper line breaking and indentation to make it readable. This will take extra time and increase the response size so it is advisable only to use this during debugging.',
                 required=False
             ),
             OpenApiParameter(
@@ -71,7 +83,7 @@ Provides the response in a “pretty” format. In the case of JSON this means d
             ),
         },
         summary="Get task count of a project",
-        description="",
+        description="Returns the task counts of the project, read from counters the database keeps up to date as tasks are added, removed, completed or turned into milestones.",
         tags=["Projects"]
     )
     def get(self, request, project_gid: str):
@@ -84,25 +96,23 @@ Provides the response in a “pretty” format. In the case of JSON this means d
                 status=status.HTTP_400_BAD_REQUEST
             )
         
+        interactor = GetTaskCountsForProjectInteractor(
+            storage=StorageImplementation(),
+            presenter=GetProjectPresenterImplementation()
+        )
         try:
-            # TODO: Implement get logic
+            response = interactor.get_task_counts_for_project(
+                project_gid,
+                opt_fields=request.query_params.get('opt_fields')
+            )
+        except ProjectDoesNotExistException:
             return Response(
-                {'data': {'message': 'Not implemented yet'}},
-                status=status.HTTP_501_NOT_IMPLEMENTED
+                not_found_error("project", project_gid),
+                status=status.HTTP_404_NOT_FOUND
             )
         except Exception as e:
-            error_response = {
-                'errors': [{
-                    'message': str(e),
-                    'help': (
-                        'For more information on API status codes and '
-                        'how to handle them, read the docs on errors: '
-                        'https://asana.github.io/developer-docs/#errors'
-                    ),
-                    'phrase': '6 sad squid snuggle softly'
-                }]
-            }
             return Response(
-                error_response,
+                server_error(str(e)),
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+        return Response(response, status=status.HTTP_200_OK)
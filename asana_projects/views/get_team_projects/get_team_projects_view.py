@@ -1,10 +1,15 @@
+from django.core.exceptions import ValidationError
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse, OpenApiExample
 from asana_projects.models.project import Project
 from asana_teams.models.team import Team
-from asana_backend.utils.validators import validate_uuid
+from asana_backend.utils.validators import (
+    validate_uuid,
+    validate_pagination_params
+)
+from asana_backend.utils.pagination import paginate_queryset, build_next_page
 from asana_backend.utils.decorators.ratelimit import ratelimit
 from asana_backend.utils.error_responses import (
     not_found_error, 
@@ -124,16 +129,16 @@ class GetTeamProjectsView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
+        # offset is either an offset token from next_page or a legacy
+        # integer offset
         try:
-            offset = int(request.query_params.get('offset', 0))
-            if offset < 0:
-                return Response(
-                    invalid_field_error("offset", "Must be >= 0"),
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-        except ValueError:
+            offset, _ = validate_pagination_params(
+                offset=request.query_params.get('offset'),
+                limit=limit
+            )
+        except ValidationError:
             return Response(
-                invalid_field_error("offset", "Must be a valid integer"),
+                invalid_field_error("offset", "Must be a valid offset token"),
                 status=status.HTTP_400_BAD_REQUEST
             )
         
@@ -147,7 +152,7 @@ class GetTeamProjectsView(APIView):
             queryset = queryset.filter(archived=archived_bool)
         
         # Apply pagination
-        projects = queryset[offset:offset + limit]
+        projects = paginate_queryset(queryset, offset, limit, ordering=('gid',))
         
         projects_list = [
             {
@@ -160,4 +165,9 @@ class GetTeamProjectsView(APIView):
             for project in projects
         ]
         
-        return Response({'data': projects_list}, status=status.HTTP_200_OK)
+        response = {'data': projects_list}
+        next_page = build_next_page(request, projects.next_offset)
+        if next_page:
+            response['next_page'] = next_page
+
+        return Response(response, status=status.HTTP_200_OK)
@@ -0,0 +1,32 @@
+# Generated by Django 6.0 on 2026-10-17 06:35
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('asana_projects', '0003_project_task_count'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Section',
+            fields=[
+                ('gid', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=255)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sections', to='asana_projects.project')),
+            ],
+            options={
+                'db_table': 'asana_sections_section',
+                'ordering': ['created_at'],
+                'indexes': [models.Index(fields=['project'], name='asana_secti_project_bfd4fa_idx')],
+            },
+        ),
+    ]
@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Dict, Any, Union
 from asana_stories.interactors.storage_interfaces.storage_interface import (
     StorageInterface
 )
@@ -9,6 +9,7 @@ from asana_stories.constants.constants import (
     DEFAULT_OFFSET,
     DEFAULT_LIMIT,
 )
+from asana_backend.utils.pagination import build_next_page
 
 
 class GetTaskStoriesInteractor:
@@ -23,34 +24,50 @@ class GetTaskStoriesInteractor:
     def get_task_stories(
         self,
         task_gid: str,
-        offset: int = DEFAULT_OFFSET,
-        limit: int = DEFAULT_LIMIT
+        offset: Union[int, str] = DEFAULT_OFFSET,
+        limit: int = DEFAULT_LIMIT,
+        request=None,
+        stream: bool = False
     ) -> Dict[str, Any]:
         stories = self.storage.get_task_stories(
             task_gid=task_gid,
             offset=offset,
-            limit=limit
+            limit=limit,
+            stream=stream
         )
 
-        stories_list = [
+        stories_list = (
             {
-                'gid': str(story.gid),
+                'gid': story.gid,
                 'task': {
-                    'gid': str(story.task.gid),
+                    'gid': story.task_id,
                     'name': story.task.name
                 },
                 'text': story.text,
                 'html_text': story.html_text,
                 'type': story.type,
                 'is_pinned': story.is_pinned,
-                'created_at': story.created_at.isoformat(),
+                'created_at': story.created_at,
                 'created_by': {
-                    'gid': str(story.created_by.gid),
+                    'gid': story.created_by_id,
                     'name': story.created_by.name
                 } if story.created_by else None,
             }
             for story in stories
-        ]
+        )
+        if stream:
+            # Rows are serialized while the response is written; the next
+            # page is known once they have all been read
+            response = self.presenter.get_stories_response(stories_list)
+            response['next_page'] = lambda: build_next_page(
+                request, stories.next_offset
+            )
+            return response
+
+        response = self.presenter.get_stories_response(list(stories_list))
 
-        return self.presenter.get_stories_response(stories_list)
+        next_page = build_next_page(request, stories.next_offset)
+        if next_page:
+            response['next_page'] = next_page
 
+        return response
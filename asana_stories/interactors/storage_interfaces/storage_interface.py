@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Union
 from asana_stories.models.story import Story
 
 
@@ -12,8 +12,9 @@ class StorageInterface(ABC):
     def get_task_stories(
         self,
         task_gid: str,
-        offset: int = 0,
-        limit: int = 50
+        offset: Union[int, str] = 0,
+        limit: int = 50,
+        stream: bool = False
     ) -> List[Story]:
         pass
 
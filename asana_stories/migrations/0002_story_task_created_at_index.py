@@ -0,0 +1,23 @@
+# Generated by Django 6.0 on 2026-10-17 03:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('asana_stories', '0001_initial'),
+        ('asana_tasks', '0006_task_filter_indexes'),
+        ('asana_users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='story',
+            name='asana_stori_task_id_adc6d1_idx',
+        ),
+        migrations.AddIndex(
+            model_name='story',
+            index=models.Index(fields=['task', 'created_at', 'gid'], name='asana_stori_task_id_d5dba5_idx'),
+        ),
+    ]
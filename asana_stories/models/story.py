@@ -39,7 +39,8 @@ class Story(models.Model):
     class Meta:
         db_table = 'asana_stories_story'
         indexes = [
-            models.Index(fields=['task']),
+            # A task's stories, newest first, paged without a sort step
+            models.Index(fields=['task', 'created_at', 'gid']),
             models.Index(fields=['created_by']),
             models.Index(fields=['created_at']),
             models.Index(fields=['type']),
@@ -1,8 +1,9 @@
-from typing import List, Optional
+from typing import List, Optional, Union
 from asana_stories.models.story import Story
 from asana_stories.interactors.storage_interfaces.storage_interface import (
     StorageInterface
 )
+from asana_backend.utils.pagination import paginate_queryset
 
 
 class StorageImplementation(StorageInterface):
@@ -15,12 +16,18 @@ class StorageImplementation(StorageInterface):
     def get_task_stories(
         self,
         task_gid: str,
-        offset: int = 0,
-        limit: int = 50
+        offset: Union[int, str] = 0,
+        limit: int = 50,
+        stream: bool = False
     ) -> List[Story]:
-        return list(
-            Story.objects.filter(
-                task__gid=task_gid
-            ).order_by('-created_at')[offset:offset + limit]
+        # Newest first; gid breaks ties between rows created together
+        return paginate_queryset(
+            Story.objects.filter(task__gid=task_gid).select_related(
+                'task', 'created_by'
+            ),
+            offset,
+            limit,
+            ordering=('-created_at', '-gid'),
+            stream=stream
         )
 
@@ -1,18 +1,26 @@
+from django.conf import settings
 from django.urls import path
 from asana_stories.views.get_story.get_story_view import (
     GetStoryView
 )
-from asana_stories.views.get_task_stories.get_task_stories_view import (
-    GetTaskStoriesView
+from asana_stories.views.get_task_stories import (
+    GetTaskStoriesView,
+    GetTaskStoriesAsyncView
 )
 
 app_name = 'asana_stories'
 
+# ASGI deployments serve this read with an async view
+if getattr(settings, 'ASANA_ASYNC_VIEWS', False):
+    task_stories_view = GetTaskStoriesAsyncView
+else:
+    task_stories_view = GetTaskStoriesView
+
 urlpatterns = [
     path('stories/<str:story_gid>/', GetStoryView.as_view(), name='get_story'),
     path(
         'tasks/<str:task_gid>/stories/',
-        GetTaskStoriesView.as_view(),
+        task_stories_view.as_view(),
         name='get_task_stories'
     ),
 ]
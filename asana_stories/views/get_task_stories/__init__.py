@@ -1,4 +1,4 @@
 from .get_task_stories_view import GetTaskStoriesView
+from .get_task_stories_async_view import GetTaskStoriesAsyncView
 
-__all__ = ['GetTaskStoriesView']
-
+__all__ = ['GetTaskStoriesView', 'GetTaskStoriesAsyncView']
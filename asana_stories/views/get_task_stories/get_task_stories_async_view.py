@@ -0,0 +1,77 @@
+from django.core.exceptions import ValidationError
+from rest_framework import status
+from asana_stories.interactors.get_task_stories_interactor import (
+    GetTaskStoriesInteractor
+)
+from asana_stories.storages.storage_implementation import (
+    StorageImplementation
+)
+from asana_stories.presenters.get_task_stories_presenter_implementation import (
+    GetTaskStoriesPresenterImplementation
+)
+from asana_stories.constants.constants import MAX_LIMIT
+from asana_backend.utils.validators import (
+    validate_uuid,
+    validate_pagination_params
+)
+from asana_backend.utils.streaming import (
+    get_max_limit,
+    StreamingListResponse
+)
+from asana_backend.utils.decorators.ratelimit import ratelimit
+from asana_backend.utils.async_views import AsyncAPIView, run_in_thread
+
+
+class GetTaskStoriesAsyncView(AsyncAPIView):
+    """
+    GetTaskStoriesView for ASGI workers: the worker serves other requests
+    while the page is read.
+    """
+    @ratelimit(key='ip', rate='5/s', method='GET')
+    async def get(self, request, task_gid: str):
+        # Validate UUID format
+        try:
+            validate_uuid(task_gid)
+        except Exception:
+            return self.render(
+                request,
+                {'errors': [{'message': 'Invalid task GID format'}]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # Validate and normalize pagination params
+        try:
+            offset, limit = validate_pagination_params(
+                offset=request.GET.get('offset'),
+                limit=request.GET.get('limit'),
+                max_limit=get_max_limit(request, MAX_LIMIT)
+            )
+        except ValidationError as e:
+            return self.render(
+                request,
+                {'errors': [{'message': e.messages[0]}]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # Pages above MAX_LIMIT are only open to bulk clients and are
+        # written out as they are read
+        stream = limit > MAX_LIMIT
+
+        storage = StorageImplementation()
+        presenter = GetTaskStoriesPresenterImplementation()
+        interactor = GetTaskStoriesInteractor(
+            storage=storage,
+            presenter=presenter
+        )
+
+        response = await run_in_thread(
+            interactor.get_task_stories,
+            task_gid=task_gid,
+            offset=offset,
+            limit=limit,
+            request=request,
+            stream=stream
+        )
+        if stream:
+            return StreamingListResponse(response, asynchronous=True)
+        return self.render(request, response, status=status.HTTP_200_OK)
@@ -1,3 +1,4 @@
+from django.core.exceptions import ValidationError
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -19,6 +20,10 @@ from asana_backend.utils.validators import (
     validate_uuid,
     validate_pagination_params
 )
+from asana_backend.utils.streaming import (
+    get_max_limit,
+    StreamingListResponse
+)
 from asana_backend.utils.decorators.ratelimit import ratelimit
 
 
@@ -35,11 +40,21 @@ class GetTaskStoriesView(APIView):
             )
 
         # Validate and normalize pagination params
-        offset, limit = validate_pagination_params(
-            offset=request.query_params.get('offset'),
-            limit=request.query_params.get('limit'),
-            max_limit=MAX_LIMIT
-        )
+        try:
+            offset, limit = validate_pagination_params(
+                offset=request.query_params.get('offset'),
+                limit=request.query_params.get('limit'),
+                max_limit=get_max_limit(request, MAX_LIMIT)
+            )
+        except ValidationError as e:
+            return Response(
+                {'errors': [{'message': e.messages[0]}]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # Pages above MAX_LIMIT are only open to bulk clients and are
+        # written out as they are read
+        stream = limit > MAX_LIMIT
 
         storage = StorageImplementation()
         presenter = GetTaskStoriesPresenterImplementation()
@@ -51,7 +66,11 @@ class GetTaskStoriesView(APIView):
         response = interactor.get_task_stories(
             task_gid=task_gid,
             offset=offset,
-            limit=limit
+            limit=limit,
+            request=request,
+            stream=stream
         )
+        if stream:
+            return StreamingListResponse(response)
         return Response(response, status=status.HTTP_200_OK)
 
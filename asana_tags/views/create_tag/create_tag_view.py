@@ -97,9 +97,6 @@ class CreateTagView(APIView):
         tags=["Tags"]
     )
     def post(self, request):
-        import json
-        
-        opt_pretty = request.query_params.get('opt_pretty', 'false').lower() == 'true'
         
         serializer = TagCreateRequestSerializer(data=request.data)
         if not serializer.is_valid():
@@ -122,13 +119,6 @@ class CreateTagView(APIView):
         try:
             response = interactor.create_tag(**serializer.validated_data)
             
-            if opt_pretty:
-                response_data = json.dumps(response, indent=2, ensure_ascii=False)
-                return Response(
-                    json.loads(response_data),
-                    status=status.HTTP_201_CREATED
-                )
-            
             return Response(response, status=status.HTTP_201_CREATED)
         except (WorkspaceDoesNotExistException, TagAlreadyExistsException) as e:
             error_response = {
@@ -93,9 +93,6 @@ class CreateTagInWorkspaceView(APIView):
         tags=["Tags"]
     )
     def post(self, request, workspace_gid: str):
-        import json
-        
-        opt_pretty = request.query_params.get('opt_pretty', 'false').lower() == 'true'
         
         try:
             validate_uuid(workspace_gid)
@@ -134,13 +131,6 @@ class CreateTagInWorkspaceView(APIView):
             
             response = interactor.create_tag(**validated_data)
             
-            if opt_pretty:
-                response_data = json.dumps(response, indent=2, ensure_ascii=False)
-                return Response(
-                    json.loads(response_data),
-                    status=status.HTTP_201_CREATED
-                )
-            
             return Response(response, status=status.HTTP_201_CREATED)
         except (WorkspaceDoesNotExistException, TagAlreadyExistsException) as e:
             error_response = {
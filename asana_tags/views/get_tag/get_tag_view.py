@@ -80,9 +80,6 @@ class GetTagView(APIView):
         tags=["Tags"]
     )
     def get(self, request, tag_gid: str):
-        import json
-        
-        opt_pretty = request.query_params.get('opt_pretty', 'false').lower() == 'true'
         
         try:
             validate_uuid(tag_gid)
@@ -106,13 +103,6 @@ class GetTagView(APIView):
         try:
             response = interactor.get_tag(tag_gid)
             
-            if opt_pretty:
-                response_data = json.dumps(response, indent=2, ensure_ascii=False)
-                return Response(
-                    json.loads(response_data),
-                    status=status.HTTP_200_OK
-                )
-            
             return Response(response, status=status.HTTP_200_OK)
         except TagDoesNotExistException as e:
             error_response = {
@@ -178,9 +168,6 @@ class GetTagView(APIView):
         tags=["Tags"]
     )
     def put(self, request, tag_gid: str):
-        import json
-        
-        opt_pretty = request.query_params.get('opt_pretty', 'false').lower() == 'true'
         
         try:
             validate_uuid(tag_gid)
@@ -218,13 +205,6 @@ class GetTagView(APIView):
                 **serializer.validated_data
             )
             
-            if opt_pretty:
-                response_data = json.dumps(response, indent=2, ensure_ascii=False)
-                return Response(
-                    json.loads(response_data),
-                    status=status.HTTP_200_OK
-                )
-            
             return Response(response, status=status.HTTP_200_OK)
         except TagDoesNotExistException as e:
             error_response = {
@@ -105,9 +105,6 @@ class GetTaskTagsView(APIView):
         tags=["Tags"]
     )
     def get(self, request, task_gid: str):
-        import json
-        
-        opt_pretty = request.query_params.get('opt_pretty', 'false').lower() == 'true'
         
         try:
             validate_uuid(task_gid)
@@ -170,13 +167,6 @@ class GetTaskTagsView(APIView):
             
             response = presenter.get_tags_response(tags_list)
             
-            if opt_pretty:
-                response_data = json.dumps(response, indent=2, ensure_ascii=False)
-                return Response(
-                    json.loads(response_data),
-                    status=status.HTTP_200_OK
-                )
-            
             return Response(response, status=status.HTTP_200_OK)
         except TaskDoesNotExistException as e:
             error_response = {
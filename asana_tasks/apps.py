@@ -1,5 +1,25 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class AsanaTasksConfig(AppConfig):
     name = 'asana_tasks'
+
+    def ready(self):
+        from asana_tasks.search.schema import ensure_search_index
+        from asana_tasks.hierarchy.schema import ensure_closure_triggers
+        from asana_backend.utils.object_cache import (
+            connect_signals as connect_object_cache_signals
+        )
+        post_migrate.connect(
+            ensure_search_index,
+            sender=self,
+            dispatch_uid='asana_tasks_ensure_search_index'
+        )
+        post_migrate.connect(
+            ensure_closure_triggers,
+            sender=self,
+            dispatch_uid='asana_tasks_ensure_closure_triggers'
+        )
+        # Drop cached task/project/user/workspace responses on writes
+        connect_object_cache_signals()
@@ -2,3 +2,36 @@ DEFAULT_OFFSET = 0
 DEFAULT_LIMIT = 50
 MAX_LIMIT = 100
 
+
+# Task fields copied by duplicate_task for each `include` option
+DUPLICATE_TASK_FIELDS = {
+    'assignee': ('assignee_id',),
+    'dates': ('due_on', 'due_at', 'start_on', 'start_at'),
+    'due_on': ('due_on',),
+    'due_at': ('due_at',),
+    'start_on': ('start_on',),
+    'start_at': ('start_at',),
+    'notes': ('notes', 'html_notes'),
+}
+
+# Rows per INSERT / IN (...) when copying task trees
+DUPLICATE_BATCH_SIZE = 500
+
+# Full-text task search (see asana_tasks.search)
+TASK_SEARCH_FTS_TABLE = 'asana_tasks_task_fts'
+TASK_SEARCH_MAX_TERMS = 16
+# Shortest last term that is matched by prefix
+TASK_SEARCH_MIN_PREFIX_LENGTH = 2
+# Relative weight of a term found in the name vs. in the notes (SQLite bm25)
+TASK_SEARCH_NAME_WEIGHT = 10.0
+TASK_SEARCH_NOTES_WEIGHT = 1.0
+SEARCH_DEFAULT_LIMIT = 100
+
+# Dependency graph (see asana_tasks.dependencies)
+# Days a task without both start_on and due_on counts for on a critical path
+DEFAULT_TASK_DURATION_DAYS = 1
+
+# Task order within a project section (see asana_tasks.ordering)
+TASK_RANK_MAX_LENGTH = 255
+# A move that produces a rank longer than this queues a rebalance job
+TASK_RANK_REBALANCE_LENGTH = 12
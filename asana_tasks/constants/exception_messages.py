@@ -1,3 +1,5 @@
 TASK_DOES_NOT_EXIST = "Task does not exist"
 INVALID_TASK_GID = "Invalid task GID"
 
+DEPENDENCY_CYCLE = "Dependency would create a cycle"
+PROJECT_DOES_NOT_EXIST = "Project does not exist"
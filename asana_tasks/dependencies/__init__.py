@@ -0,0 +1,13 @@
+from .graph import DependencyGraph
+from .edges import (
+    load_upstream_edges,
+    load_downstream_edges,
+    load_project_edges,
+)
+
+__all__ = [
+    'DependencyGraph',
+    'load_upstream_edges',
+    'load_downstream_edges',
+    'load_project_edges',
+]
@@ -0,0 +1,61 @@
+"""
+Single-query loaders for dependency edges.
+
+Transitive walks use a recursive CTE (SQLite and PostgreSQL both have
+``WITH RECURSIVE``); ``UNION`` rather than ``UNION ALL`` keeps the walk
+finite even over a cycle left by data written before cycles were rejected.
+"""
+from typing import Any, List, Tuple
+from django.db import connection
+from django.db.models import Q
+from asana_tasks.models.task import Task
+from asana_tasks.models.task_project import TaskProject
+from asana_tasks.models.task_dependency import TaskDependency
+
+Edge = Tuple[Any, Any]
+
+_WALK = """
+    WITH RECURSIVE reached(gid) AS (
+        SELECT {near} FROM asana_tasks_taskdependency WHERE {far} = %s
+        UNION
+        SELECT dependency.{near}
+        FROM asana_tasks_taskdependency dependency
+        JOIN reached ON dependency.{far} = reached.gid
+    )
+    SELECT predecessor_id, successor_id
+    FROM asana_tasks_taskdependency
+    WHERE {far} = %s OR {far} IN (SELECT gid FROM reached)
+"""
+UPSTREAM_EDGES = _WALK.format(near='predecessor_id', far='successor_id')
+DOWNSTREAM_EDGES = _WALK.format(near='successor_id', far='predecessor_id')
+
+
+def _walk(sql: str, task_pk: Any) -> List[Edge]:
+    to_python = Task._meta.pk.to_python
+    value = Task._meta.pk.get_db_prep_value(to_python(task_pk), connection)
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [value, value])
+        return [
+            (to_python(predecessor), to_python(successor))
+            for predecessor, successor in cursor.fetchall()
+        ]
+
+
+def load_upstream_edges(task_pk: Any) -> List[Edge]:
+    """Every edge on a path into ``task_pk``."""
+    return _walk(UPSTREAM_EDGES, task_pk)
+
+
+def load_downstream_edges(task_pk: Any) -> List[Edge]:
+    """Every edge on a path out of ``task_pk``."""
+    return _walk(DOWNSTREAM_EDGES, task_pk)
+
+
+def load_project_edges(project_pk: Any) -> List[Edge]:
+    """Every edge with at least one end in the project."""
+    project_tasks = TaskProject.objects.filter(project_id=project_pk).values('task_id')
+    return list(
+        TaskDependency.objects.filter(
+            Q(predecessor_id__in=project_tasks) | Q(successor_id__in=project_tasks)
+        ).values_list('predecessor_id', 'successor_id')
+    )
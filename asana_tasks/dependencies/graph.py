@@ -0,0 +1,143 @@
+"""
+In-memory task dependency graph.
+
+Built from (predecessor, successor) pairs loaded in one query, it answers
+transitive upstream / downstream, topological order, cycle and critical
+path questions without going back to the database.
+"""
+import heapq
+from collections import defaultdict
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+from asana_tasks.exceptions.custom_exceptions import DependencyCycleException
+
+Node = Hashable
+
+
+class DependencyGraph:
+    """Adjacency sets of a dependency graph: predecessor -> successor."""
+
+    def __init__(self, edges: Iterable[Tuple[Node, Node]] = ()):
+        self.successors: Dict[Node, Set[Node]] = defaultdict(set)
+        self.predecessors: Dict[Node, Set[Node]] = defaultdict(set)
+        self.nodes: Set[Node] = set()
+        for predecessor, successor in edges:
+            self.add_edge(predecessor, successor)
+
+    def add_edge(self, predecessor: Node, successor: Node) -> None:
+        self.successors[predecessor].add(successor)
+        self.predecessors[successor].add(predecessor)
+        self.nodes.update((predecessor, successor))
+
+    def add_node(self, node: Node) -> None:
+        self.nodes.add(node)
+
+    def upstream(self, node: Node) -> Set[Node]:
+        """Every node ``node`` transitively depends on."""
+        return self._reach(node, self.predecessors)
+
+    def downstream(self, node: Node) -> Set[Node]:
+        """Every node that transitively depends on ``node``."""
+        return self._reach(node, self.successors)
+
+    def find_cycle(
+        self,
+        predecessors: Iterable[Node],
+        successors: Iterable[Node]
+    ) -> Optional[List[Node]]:
+        """
+        The cycle that adding an edge from each of ``predecessors`` to each
+        of ``successors`` would close, as a path from successor back to
+        predecessor, or None if the edges are safe.
+        """
+        predecessors = set(predecessors)
+        for successor in successors:
+            if successor in predecessors:
+                return [successor]
+            path = self._path(successor, predecessors)
+            if path:
+                return path
+        return None
+
+    def topological_order(self, nodes: Optional[Iterable[Node]] = None) -> List[Node]:
+        """
+        ``nodes`` (default: all) ordered so every node comes after its
+        predecessors; ties are broken by node value so the order is stable.
+        Raises DependencyCycleException if they contain a cycle.
+        """
+        nodes = self.nodes if nodes is None else set(nodes)
+        remaining = {
+            node: len(self.predecessors[node] & nodes) for node in nodes
+        }
+        ready = [node for node, count in remaining.items() if count == 0]
+        heapq.heapify(ready)
+        order = []
+        while ready:
+            node = heapq.heappop(ready)
+            order.append(node)
+            for successor in self.successors[node]:
+                if successor in remaining:
+                    remaining[successor] -= 1
+                    if remaining[successor] == 0:
+                        heapq.heappush(ready, successor)
+        if len(order) < len(nodes):
+            raise DependencyCycleException(
+                cycle=sorted(node for node, count in remaining.items() if count)
+            )
+        return order
+
+    def critical_path(
+        self,
+        duration: Callable[[Node], int]
+    ) -> Tuple[List[Node], int]:
+        """
+        The chain of dependent nodes with the largest total ``duration``
+        and that total. Each node's earliest finish is its duration plus the
+        latest finish among its predecessors.
+        """
+        finish: Dict[Node, int] = {}
+        via: Dict[Node, Optional[Node]] = {}
+        for node in self.topological_order():
+            before = max(
+                self.predecessors[node],
+                key=lambda predecessor: (finish[predecessor], predecessor),
+                default=None
+            )
+            finish[node] = duration(node) + (finish[before] if before is not None else 0)
+            via[node] = before
+        if not finish:
+            return [], 0
+
+        end = max(finish, key=lambda node: (finish[node], node))
+        path = [end]
+        while via[path[-1]] is not None:
+            path.append(via[path[-1]])
+        return path[::-1], finish[end]
+
+    def _reach(self, start: Node, adjacency: Dict[Node, Set[Node]]) -> Set[Node]:
+        seen: Set[Node] = set()
+        stack = [start]
+        while stack:
+            for neighbour in adjacency[stack.pop()]:
+                if neighbour not in seen:
+                    seen.add(neighbour)
+                    stack.append(neighbour)
+        seen.discard(start)
+        return seen
+
+    def _path(self, start: Node, targets: Set[Node]) -> Optional[List[Node]]:
+        """A successor path from ``start`` to any of ``targets``."""
+        parents: Dict[Node, Node] = {start: start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for successor in self.successors[node]:
+                if successor in parents:
+                    continue
+                parents[successor] = node
+                if successor in targets:
+                    path = [successor]
+                    while path[-1] != start:
+                        path.append(parents[path[-1]])
+                    return path[::-1]
+                stack.append(successor)
+        return None
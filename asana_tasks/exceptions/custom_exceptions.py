@@ -1,6 +1,8 @@
 from asana_tasks.constants.exception_messages import (
     TASK_DOES_NOT_EXIST,
     INVALID_TASK_GID,
+    DEPENDENCY_CYCLE,
+    PROJECT_DOES_NOT_EXIST,
 )
 
 
@@ -15,3 +17,16 @@ class InvalidTaskGidException(Exception):
         self.message = message
         super().__init__(self.message)
 
+
+
+class DependencyCycleException(Exception):
+    def __init__(self, message=DEPENDENCY_CYCLE, cycle=None):
+        self.message = message
+        self.cycle = cycle or []
+        super().__init__(self.message)
+
+
+class ProjectDoesNotExistException(Exception):
+    def __init__(self, message=PROJECT_DOES_NOT_EXIST):
+        self.message = message
+        super().__init__(self.message)
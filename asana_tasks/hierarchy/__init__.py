@@ -0,0 +1,11 @@
+from .schema import (
+    install_closure_triggers,
+    uninstall_closure_triggers,
+    ensure_closure_triggers,
+)
+
+__all__ = [
+    'install_closure_triggers',
+    'uninstall_closure_triggers',
+    'ensure_closure_triggers',
+]
@@ -0,0 +1,216 @@
+"""
+Triggers that maintain the task hierarchy closure table.
+
+Creating a task under a parent adds a row from the parent and from each of
+its ancestors; reparenting a task detaches its whole subtree from the old
+ancestors and attaches it under the new ones, all inside the statement that
+changed ``parent_id``. A guard trigger rejects a parent that is the task
+itself or one of its descendants, so a cycle cannot be committed even by
+code that skips the storage check. Installed by migration
+0004_task_closure; reinstalled (with a rebuild from ``parent_id``) after
+a ``migrate`` if a SQLite table rebuild dropped the triggers. Triggers
+that are in place are left alone, so the cycle guard and the closure are
+never missing while the app serves.
+"""
+from django.db import transaction
+from django.db.migrations.recorder import MigrationRecorder
+
+MIGRATION = ('asana_tasks', '0004_task_closure')
+
+CLOSURE = 'asana_tasks_task_closure'
+CYCLE_MESSAGE = 'task hierarchy cycle'
+
+REBUILD = [
+    f'DELETE FROM {CLOSURE}',
+    f"""
+    WITH RECURSIVE chain(ancestor_id, descendant_id, depth) AS (
+        SELECT parent_id, gid, 1 FROM asana_tasks_task WHERE parent_id IS NOT NULL
+        UNION ALL
+        SELECT task.parent_id, chain.descendant_id, chain.depth + 1
+        FROM chain JOIN asana_tasks_task task ON task.gid = chain.ancestor_id
+        WHERE task.parent_id IS NOT NULL
+    )
+    INSERT INTO {CLOSURE} (ancestor_id, descendant_id, depth)
+    SELECT ancestor_id, descendant_id, depth FROM chain
+    """,
+]
+
+
+def _detach(row: str) -> str:
+    # Rows from the task's old ancestors to the task and its descendants
+    return f"""
+        DELETE FROM {CLOSURE}
+        WHERE descendant_id IN (
+            SELECT descendant_id FROM {CLOSURE} WHERE ancestor_id = {row}.gid
+            UNION ALL SELECT {row}.gid
+        )
+        AND ancestor_id IN (
+            SELECT ancestor_id FROM {CLOSURE} WHERE descendant_id = {row}.gid
+        );
+    """
+
+
+def _attach(row: str) -> str:
+    # The new parent and its ancestors over the task and its descendants
+    return f"""
+        INSERT INTO {CLOSURE} (ancestor_id, descendant_id, depth)
+        SELECT above.ancestor_id, below.descendant_id, above.depth + below.depth + 1
+        FROM (
+            SELECT {row}.parent_id AS ancestor_id, 0 AS depth
+            UNION ALL
+            SELECT ancestor_id, depth FROM {CLOSURE} WHERE descendant_id = {row}.parent_id
+        ) AS above, (
+            SELECT {row}.gid AS descendant_id, 0 AS depth
+            UNION ALL
+            SELECT descendant_id, depth FROM {CLOSURE} WHERE ancestor_id = {row}.gid
+        ) AS below
+        WHERE {row}.parent_id IS NOT NULL;
+    """
+
+
+def _creates_cycle(row: str) -> str:
+    return f"""
+        {row}.parent_id = {row}.gid OR EXISTS (
+            SELECT 1 FROM {CLOSURE}
+            WHERE ancestor_id = {row}.gid AND descendant_id = {row}.parent_id
+        )
+    """
+
+
+SQLITE_INSTALL = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS asana_tasks_task_closure_guard
+    BEFORE UPDATE OF parent_id ON asana_tasks_task
+    WHEN new.parent_id IS NOT NULL AND ({_creates_cycle('new')})
+    BEGIN
+        SELECT RAISE(ABORT, '{CYCLE_MESSAGE}');
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS asana_tasks_task_closure_insert
+    AFTER INSERT ON asana_tasks_task
+    WHEN new.parent_id IS NOT NULL
+    BEGIN
+        {_attach('new')}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS asana_tasks_task_closure_update
+    AFTER UPDATE OF parent_id ON asana_tasks_task
+    WHEN old.parent_id IS NOT new.parent_id
+    BEGIN
+        {_detach('new')}
+        {_attach('new')}
+    END
+    """,
+]
+SQLITE_TRIGGERS = (
+    'asana_tasks_task_closure_guard',
+    'asana_tasks_task_closure_insert',
+    'asana_tasks_task_closure_update',
+)
+SQLITE_UNINSTALL = [
+    f'DROP TRIGGER IF EXISTS {trigger}' for trigger in SQLITE_TRIGGERS
+]
+
+POSTGRES_INSTALL = [
+    f"""
+    CREATE OR REPLACE FUNCTION asana_tasks_task_closure_guard() RETURNS trigger AS $$
+    BEGIN
+        IF {_creates_cycle('NEW')} THEN
+            RAISE EXCEPTION '{CYCLE_MESSAGE}' USING ERRCODE = 'check_violation';
+        END IF;
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    f"""
+    CREATE OR REPLACE FUNCTION asana_tasks_task_closure() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'UPDATE' THEN
+            {_detach('NEW')}
+        END IF;
+        {_attach('NEW')}
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    'DROP TRIGGER IF EXISTS asana_tasks_task_closure_guard ON asana_tasks_task',
+    """
+    CREATE TRIGGER asana_tasks_task_closure_guard
+    BEFORE INSERT OR UPDATE OF parent_id ON asana_tasks_task
+    FOR EACH ROW WHEN (NEW.parent_id IS NOT NULL)
+    EXECUTE FUNCTION asana_tasks_task_closure_guard()
+    """,
+    'DROP TRIGGER IF EXISTS asana_tasks_task_closure_insert ON asana_tasks_task',
+    """
+    CREATE TRIGGER asana_tasks_task_closure_insert
+    AFTER INSERT ON asana_tasks_task
+    FOR EACH ROW WHEN (NEW.parent_id IS NOT NULL)
+    EXECUTE FUNCTION asana_tasks_task_closure()
+    """,
+    'DROP TRIGGER IF EXISTS asana_tasks_task_closure_update ON asana_tasks_task',
+    """
+    CREATE TRIGGER asana_tasks_task_closure_update
+    AFTER UPDATE OF parent_id ON asana_tasks_task
+    FOR EACH ROW WHEN (OLD.parent_id IS DISTINCT FROM NEW.parent_id)
+    EXECUTE FUNCTION asana_tasks_task_closure()
+    """,
+]
+# Same names as on SQLite, created per table
+POSTGRES_TRIGGERS = SQLITE_TRIGGERS
+POSTGRES_UNINSTALL = [
+    'DROP TRIGGER IF EXISTS asana_tasks_task_closure_guard ON asana_tasks_task',
+    'DROP TRIGGER IF EXISTS asana_tasks_task_closure_insert ON asana_tasks_task',
+    'DROP TRIGGER IF EXISTS asana_tasks_task_closure_update ON asana_tasks_task',
+    'DROP FUNCTION IF EXISTS asana_tasks_task_closure_guard()',
+    'DROP FUNCTION IF EXISTS asana_tasks_task_closure()',
+]
+
+
+def _triggers_installed(connection, triggers) -> bool:
+    placeholders = ', '.join(['%s'] * len(triggers))
+    query = {
+        'sqlite': "SELECT count(*) FROM sqlite_master WHERE type = 'trigger' ",
+        'postgresql': 'SELECT count(*) FROM pg_trigger WHERE NOT tgisinternal ',
+    }[connection.vendor]
+    column = 'name' if connection.vendor == 'sqlite' else 'tgname'
+    with connection.cursor() as cursor:
+        cursor.execute(f'{query} AND {column} IN ({placeholders})', triggers)
+        return cursor.fetchone()[0] == len(triggers)
+
+
+def install_closure_triggers(connection) -> None:
+    """Create missing triggers and rebuild the closure from ``parent_id``."""
+    if connection.vendor == 'sqlite':
+        statements, triggers = SQLITE_INSTALL, SQLITE_TRIGGERS
+    elif connection.vendor == 'postgresql':
+        statements, triggers = POSTGRES_INSTALL, POSTGRES_TRIGGERS
+    else:
+        return
+    if _triggers_installed(connection, triggers):
+        return
+    # One transaction: readers keep seeing the old closure until the
+    # rebuilt one commits, and reparenting waits for the guard instead of
+    # running without it
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        for statement in [*statements, *REBUILD]:
+            cursor.execute(statement)
+
+
+def uninstall_closure_triggers(connection) -> None:
+    statements = {
+        'sqlite': SQLITE_UNINSTALL,
+        'postgresql': POSTGRES_UNINSTALL,
+    }.get(connection.vendor, [])
+    with connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+
+
+def ensure_closure_triggers(sender, using, **kwargs) -> None:
+    """post_migrate receiver: reinstall the triggers if a table rebuild lost them."""
+    from django.db import connections
+    connection = connections[using]
+    if MIGRATION in MigrationRecorder(connection).applied_migrations():
+        install_closure_triggers(connection)
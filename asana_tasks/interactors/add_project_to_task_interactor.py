@@ -1,32 +1,60 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from asana_tasks.interactors.storage_interfaces.storage_interface import (
     StorageInterface
 )
 from asana_tasks.interactors.presenter_interfaces.presenter_interface import (
     PresenterInterface
 )
+from asana_tasks.constants.constants import TASK_RANK_REBALANCE_LENGTH
+from asana_jobs.app_interfaces.service_interface import ServiceInterface
 
 
 class AddProjectToTaskInteractor:
     def __init__(
         self,
         storage: StorageInterface,
-        presenter: PresenterInterface
+        presenter: PresenterInterface,
+        jobs_service: ServiceInterface
     ):
         self.storage = storage
         self.presenter = presenter
+        self.jobs_service = jobs_service
 
     def add_project_to_task(
         self,
         task_gid: str,
-        project_gid: str
+        project_gid: str,
+        section_gid: Optional[str] = None,
+        insert_before: Optional[str] = None,
+        insert_after: Optional[str] = None
     ) -> Dict[str, Any]:
-        task = self.storage.add_project_to_task(task_gid, project_gid)
+        task_project = self.storage.add_project_to_task(
+            task_gid,
+            project_gid,
+            section_gid=section_gid,
+            insert_before=insert_before,
+            insert_after=insert_after
+        )
 
+        # Moves to the same spot keep halving the gap there; respace the
+        # section in the background before the ranks grow unwieldy
+        if len(task_project.rank) > TASK_RANK_REBALANCE_LENGTH:
+            self.jobs_service.enqueue_job(
+                'rebalance_task_ranks',
+                {
+                    'project_gid': str(task_project.project_id),
+                    'section_gid': (
+                        str(task_project.section_id)
+                        if task_project.section_id else None
+                    ),
+                },
+                unique=True
+            )
+
+        task = task_project.task
         task_dict = {
             'gid': str(task.gid),
             'name': task.name,
         }
 
         return self.presenter.get_task_response(task_dict)
-
@@ -6,16 +6,19 @@ from asana_tasks.interactors.presenter_interfaces.presenter_interface import (
     PresenterInterface
 )
 from asana_tasks.exceptions.custom_exceptions import TaskDoesNotExistException
+from asana_jobs.app_interfaces.service_interface import ServiceInterface
 
 
 class DuplicateTaskInteractor:
     def __init__(
         self,
         storage: StorageInterface,
-        presenter: PresenterInterface
+        presenter: PresenterInterface,
+        jobs_service: ServiceInterface
     ):
         self.storage = storage
         self.presenter = presenter
+        self.jobs_service = jobs_service
 
     def duplicate_task(
         self,
@@ -31,39 +34,14 @@ class DuplicateTaskInteractor:
         if not name:
             name = f"{original_task.name} (Copy)"
 
-        # Create duplicated task
-        new_task = self.storage.duplicate_task(
-            task_gid=task_gid,
-            name=name,
-            include=include or []
+        # Subtask trees can be large, so the copy runs as a job
+        job_dict = self.jobs_service.enqueue_job(
+            'duplicate_task',
+            {
+                'task_gid': str(original_task.gid),
+                'name': name,
+                'include': include or [],
+            }
         )
 
-        # Format response
-        task_dict = {
-            'gid': str(new_task.gid),
-            'resource_type': 'task',
-            'name': new_task.name,
-            'workspace': {
-                'gid': str(new_task.workspace.gid),
-                'resource_type': 'workspace',
-                'name': new_task.workspace.name
-            },
-            'assignee': {
-                'gid': str(new_task.assignee.gid),
-                'resource_type': 'user',
-                'name': new_task.assignee.name
-            } if new_task.assignee and 'assignee' in (include or []) else None,
-            'completed': new_task.completed,
-            'completed_at': new_task.completed_at.isoformat() if new_task.completed_at else None,
-            'due_on': str(new_task.due_on) if new_task.due_on else None,
-            'due_at': new_task.due_at.isoformat() if new_task.due_at else None,
-            'start_on': str(new_task.start_on) if new_task.start_on else None,
-            'start_at': new_task.start_at.isoformat() if new_task.start_at else None,
-            'notes': new_task.notes if 'notes' in (include or []) else None,
-            'html_notes': new_task.html_notes if 'notes' in (include or []) else None,
-            'created_at': new_task.created_at.isoformat(),
-            'updated_at': new_task.updated_at.isoformat(),
-        }
-
-        return self.presenter.get_task_response(task_dict)
-
+        return self.presenter.get_job_response(job_dict)
@@ -1,4 +1,4 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 from asana_tasks.interactors.storage_interfaces.storage_interface import (
     StorageInterface
 )
@@ -9,6 +9,12 @@ from asana_tasks.constants.constants import (
     DEFAULT_OFFSET,
     DEFAULT_LIMIT,
 )
+from asana_tasks.utils.task_projection import (
+    TASK_PROJECTION_SPEC,
+    TASK_COMPACT_FIELDS,
+)
+from asana_backend.utils.field_projection import FieldProjection
+from asana_backend.utils.pagination import build_next_page
 
 
 class GetTasksInteractor:
@@ -29,9 +35,16 @@ class GetTasksInteractor:
         completed_since: Optional[str] = None,
         modified_since: Optional[str] = None,
         opt_fields: Optional[str] = None,
-        offset: int = DEFAULT_OFFSET,
-        limit: int = DEFAULT_LIMIT
+        offset: Union[int, str] = DEFAULT_OFFSET,
+        limit: int = DEFAULT_LIMIT,
+        request=None,
+        stream: bool = False
     ) -> Dict[str, Any]:
+        projection = FieldProjection(
+            TASK_PROJECTION_SPEC,
+            opt_fields=opt_fields,
+            default=TASK_COMPACT_FIELDS
+        )
         tasks = self.storage.get_tasks(
             workspace=workspace,
             assignee=assignee,
@@ -40,22 +53,58 @@ class GetTasksInteractor:
             completed_since=completed_since,
             modified_since=modified_since,
             offset=offset,
-            limit=limit
+            limit=limit,
+            projection=projection,
+            stream=stream
         )
-        
-        # Handle opt_fields (field selection) - for now we return all fields
-        # In a full implementation, we would filter the response based on opt_fields
-
-        # Format tasks matching TaskCompact schema
-        tasks_list = []
-        for task in tasks:
-            task_dict = {
-                'gid': str(task.gid),
-                'resource_type': 'task',
-                'name': task.name,
-                'resource_subtype': 'default_task',
-            }
-            tasks_list.append(task_dict)
-
-        return self.presenter.get_tasks_response(tasks_list)
 
+        # Format tasks matching TaskCompact schema, extended by opt_fields
+        tasks_list = (projection.serialize(task) for task in tasks)
+        if stream:
+            # Rows are serialized while the response is written; the next
+            # page is known once they have all been read
+            response = self.presenter.get_tasks_response(tasks_list)
+            response['next_page'] = lambda: build_next_page(
+                request, tasks.next_offset
+            )
+            return response
+
+        response = self.presenter.get_tasks_response(list(tasks_list))
+
+        next_page = build_next_page(request, tasks.next_offset)
+        if next_page:
+            response['next_page'] = next_page
+
+        return response
+
+    def get_tasks_version(
+        self,
+        workspace: Optional[str] = None,
+        assignee: Optional[str] = None,
+        project: Optional[str] = None,
+        section: Optional[str] = None,
+        completed_since: Optional[str] = None,
+        modified_since: Optional[str] = None,
+        opt_fields: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        A summary of the tasks ``get_tasks`` lists that changes whenever
+        its response does, or None when it cannot be told cheaply: for
+        section lists, which change with board moves, and for opt_fields
+        showing related objects or num_subtasks, which change without the
+        tasks being saved.
+        """
+        projection = FieldProjection(
+            TASK_PROJECTION_SPEC,
+            opt_fields=opt_fields,
+            default=TASK_COMPACT_FIELDS
+        )
+        if section or projection.relations or 'num_subtasks' in projection.fields:
+            return None
+        return self.storage.get_tasks_version(
+            workspace=workspace,
+            assignee=assignee,
+            project=project,
+            completed_since=completed_since,
+            modified_since=modified_since
+        )
@@ -21,3 +21,9 @@ class PresenterInterface(ABC):
     def get_delete_response(self) -> Dict[str, Any]:
         pass
 
+    @abstractmethod
+    def get_job_response(
+        self,
+        job_dict: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        pass
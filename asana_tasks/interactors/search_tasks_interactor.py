@@ -0,0 +1,67 @@
+from datetime import date
+from typing import Dict, Any, Optional, Union
+from asana_tasks.interactors.storage_interfaces.storage_interface import (
+    StorageInterface
+)
+from asana_tasks.interactors.presenter_interfaces.presenter_interface import (
+    PresenterInterface
+)
+from asana_tasks.constants.constants import (
+    DEFAULT_OFFSET,
+    SEARCH_DEFAULT_LIMIT,
+)
+from asana_backend.utils.pagination import build_next_page
+
+
+class SearchTasksInteractor:
+    def __init__(
+        self,
+        storage: StorageInterface,
+        presenter: PresenterInterface
+    ):
+        self.storage = storage
+        self.presenter = presenter
+
+    def search_tasks(
+        self,
+        workspace_gid: str,
+        text: Optional[str] = None,
+        resource_subtype: Optional[str] = None,
+        completed: Optional[bool] = None,
+        is_subtask: Optional[bool] = None,
+        due_on_before: Optional[date] = None,
+        due_on_after: Optional[date] = None,
+        offset: Union[int, str] = DEFAULT_OFFSET,
+        limit: int = SEARCH_DEFAULT_LIMIT,
+        request=None
+    ) -> Dict[str, Any]:
+        tasks = self.storage.search_tasks(
+            workspace_gid=workspace_gid,
+            text=text,
+            resource_subtype=resource_subtype,
+            completed=completed,
+            is_subtask=is_subtask,
+            due_on_before=due_on_before,
+            due_on_after=due_on_after,
+            offset=offset,
+            limit=limit
+        )
+
+        tasks_list = [
+            {
+                'gid': str(task.gid),
+                'resource_type': 'task',
+                'name': task.name,
+                'resource_subtype': task.resource_subtype,
+                'completed': task.completed,
+            }
+            for task in tasks
+        ]
+
+        response = self.presenter.get_tasks_response(tasks_list)
+
+        next_page = build_next_page(request, tasks.next_offset)
+        if next_page:
+            response['next_page'] = next_page
+
+        return response
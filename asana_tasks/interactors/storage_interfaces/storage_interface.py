@@ -1,11 +1,27 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from datetime import date
+from typing import List, Optional, Dict, Any, Union
 from asana_tasks.models.task import Task
+from asana_tasks.models.task_project import TaskProject
+from asana_backend.utils.field_projection import FieldProjection
+from asana_tasks.dependencies.graph import DependencyGraph
 
 
 class StorageInterface(ABC):
     @abstractmethod
-    def get_task(self, task_gid: str) -> Optional[Task]:
+    def get_task(
+        self,
+        task_gid: str,
+        projection: Optional[FieldProjection] = None
+    ) -> Optional[Task]:
+        pass
+
+    @abstractmethod
+    async def aget_task(
+        self,
+        task_gid: str,
+        projection: Optional[FieldProjection] = None
+    ) -> Optional[Task]:
         pass
 
     @abstractmethod
@@ -17,7 +33,35 @@ class StorageInterface(ABC):
         section: Optional[str] = None,
         completed_since: Optional[str] = None,
         modified_since: Optional[str] = None,
-        offset: int = 0,
+        offset: Union[int, str] = 0,
+        limit: int = 50,
+        projection: Optional[FieldProjection] = None,
+        stream: bool = False
+    ) -> List[Task]:
+        pass
+
+    @abstractmethod
+    def get_tasks_version(
+        self,
+        workspace: Optional[str] = None,
+        assignee: Optional[str] = None,
+        project: Optional[str] = None,
+        completed_since: Optional[str] = None,
+        modified_since: Optional[str] = None
+    ) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    def search_tasks(
+        self,
+        workspace_gid: str,
+        text: Optional[str] = None,
+        resource_subtype: Optional[str] = None,
+        completed: Optional[bool] = None,
+        is_subtask: Optional[bool] = None,
+        due_on_before: Optional[date] = None,
+        due_on_after: Optional[date] = None,
+        offset: Union[int, str] = 0,
         limit: int = 50
     ) -> List[Task]:
         pass
@@ -41,7 +85,22 @@ class StorageInterface(ABC):
         pass
 
     @abstractmethod
-    def add_project_to_task(self, task_gid: str, project_gid: str) -> Task:
+    def add_project_to_task(
+        self,
+        task_gid: str,
+        project_gid: str,
+        section_gid: Optional[str] = None,
+        insert_before: Optional[str] = None,
+        insert_after: Optional[str] = None
+    ) -> TaskProject:
+        pass
+
+    @abstractmethod
+    def rebalance_task_ranks(
+        self,
+        project_gid: str,
+        section_gid: Optional[str] = None
+    ) -> int:
         pass
 
     @abstractmethod
@@ -73,6 +132,16 @@ class StorageInterface(ABC):
     ) -> Task:
         pass
 
+    @abstractmethod
+    def duplicate_project_tasks(
+        self,
+        project_gid: str,
+        new_project_gid: str,
+        include: List[str],
+        section_map: Optional[Dict[Any, Any]] = None
+    ) -> Dict[Any, Task]:
+        pass
+
     @abstractmethod
     def get_task_dependencies(self, task_gid: str) -> List[Task]:
         pass
@@ -97,3 +166,34 @@ class StorageInterface(ABC):
     def remove_task_dependents(self, task_gid: str, dependent_gids: List[str]) -> Task:
         pass
 
+    @abstractmethod
+    def is_subtask_of(self, task_gid: str, ancestor_gid: str) -> bool:
+        pass
+
+    @abstractmethod
+    def get_subtree(self, task_gid: str) -> List[Task]:
+        pass
+
+    @abstractmethod
+    def get_subtask_counts(self, task_gids: List[str]) -> Dict[str, Dict[str, int]]:
+        pass
+
+    @abstractmethod
+    def set_task_parent(self, task_gid: str, parent_gid: Optional[str]) -> Task:
+        pass
+
+    @abstractmethod
+    def get_tasks_by_gids(self, task_gids: List[Any]) -> List[Task]:
+        pass
+
+    @abstractmethod
+    def get_upstream_dependency_graph(self, task_gid: str) -> DependencyGraph:
+        pass
+
+    @abstractmethod
+    def get_downstream_dependency_graph(self, task_gid: str) -> DependencyGraph:
+        pass
+
+    @abstractmethod
+    def get_project_dependency_graph(self, project_gid: str) -> DependencyGraph:
+        pass
@@ -0,0 +1,112 @@
+from typing import Any, Dict, List
+from asana_tasks.models.task import Task
+from asana_tasks.interactors.storage_interfaces.storage_interface import (
+    StorageInterface
+)
+from asana_tasks.interactors.presenter_interfaces.presenter_interface import (
+    PresenterInterface
+)
+from asana_tasks.exceptions.custom_exceptions import TaskDoesNotExistException
+from asana_tasks.constants.constants import DEFAULT_TASK_DURATION_DAYS
+
+
+def task_duration_days(task: Task) -> int:
+    """Calendar days from start_on to due_on inclusive; completed tasks take none."""
+    if task.completed:
+        return 0
+    if task.start_on and task.due_on and task.due_on >= task.start_on:
+        return (task.due_on - task.start_on).days + 1
+    return DEFAULT_TASK_DURATION_DAYS
+
+
+class TaskDependencyGraphInteractor:
+    def __init__(
+        self,
+        storage: StorageInterface,
+        presenter: PresenterInterface
+    ):
+        self.storage = storage
+        self.presenter = presenter
+
+    def get_upstream(self, task_gid: str) -> Dict[str, Any]:
+        """
+        Every task the task transitively depends on, ordered so each comes
+        after the tasks it depends on, with its direct dependents among them.
+        """
+        if not self.storage.get_task(task_gid):
+            raise TaskDoesNotExistException()
+        graph = self.storage.get_upstream_dependency_graph(task_gid)
+        root = Task._meta.pk.to_python(task_gid)
+        order = graph.topological_order(graph.upstream(root))
+        within = set(order) | {root}
+
+        return self.presenter.get_tasks_response([
+            dict(
+                self._compact(task),
+                dependents=self._links(graph.successors[task.pk] & within)
+            )
+            for task in self.storage.get_tasks_by_gids(order)
+        ])
+
+    def get_downstream(self, task_gid: str) -> Dict[str, Any]:
+        """
+        Every task that transitively depends on the task, ordered so each
+        comes after the tasks it depends on, with its direct dependencies
+        among them.
+        """
+        if not self.storage.get_task(task_gid):
+            raise TaskDoesNotExistException()
+        graph = self.storage.get_downstream_dependency_graph(task_gid)
+        root = Task._meta.pk.to_python(task_gid)
+        order = graph.topological_order(graph.downstream(root))
+        within = set(order) | {root}
+
+        return self.presenter.get_tasks_response([
+            dict(
+                self._compact(task),
+                dependencies=self._links(graph.predecessors[task.pk] & within)
+            )
+            for task in self.storage.get_tasks_by_gids(order)
+        ])
+
+    def get_critical_path(self, project_gid: str) -> Dict[str, Any]:
+        """
+        The chain of dependent tasks touching the project with the most
+        remaining calendar days, and that number of days.
+        """
+        graph = self.storage.get_project_dependency_graph(project_gid)
+        tasks = {
+            task.pk: task
+            for task in self.storage.get_tasks_by_gids(sorted(graph.nodes))
+        }
+        path, duration = graph.critical_path(
+            lambda pk: task_duration_days(tasks[pk])
+        )
+
+        return self.presenter.get_task_response({
+            'duration_days': duration,
+            'tasks': [
+                dict(
+                    self._compact(tasks[pk]),
+                    duration_days=task_duration_days(tasks[pk])
+                )
+                for pk in path
+            ],
+        })
+
+    def _compact(self, task: Task) -> Dict[str, Any]:
+        return {
+            'gid': str(task.gid),
+            'resource_type': 'task',
+            'name': task.name,
+            'resource_subtype': task.resource_subtype,
+            'completed': task.completed,
+            'start_on': task.start_on.isoformat() if task.start_on else None,
+            'due_on': task.due_on.isoformat() if task.due_on else None,
+        }
+
+    def _links(self, pks) -> List[Dict[str, str]]:
+        return [
+            {'gid': str(pk), 'resource_type': 'task'}
+            for pk in sorted(pks)
+        ]
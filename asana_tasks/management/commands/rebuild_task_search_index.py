@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from django.db import connection
+from asana_tasks.search import get_search_backend
+from asana_tasks.search.schema import install_search_index
+
+
+class Command(BaseCommand):
+    help = (
+        "Reinstall missing parts of the task search index and rebuild it "
+        "from the task table (needed on SQLite after VACUUM)."
+    )
+
+    def handle(self, *args, **options):
+        install_search_index(connection)
+        get_search_backend(connection).rebuild()
+        self.stdout.write("Task search index rebuilt.")
@@ -0,0 +1,26 @@
+# Generated by Django 6.0 on 2026-10-17 03:40
+
+from django.db import migrations
+from asana_tasks.search.schema import (
+    install_search_index,
+    uninstall_search_index,
+)
+
+
+def install(apps, schema_editor):
+    install_search_index(schema_editor.connection)
+
+
+def uninstall(apps, schema_editor):
+    uninstall_search_index(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('asana_tasks', '0002_task_num_subtasks_task_parent_task_resource_subtype'),
+    ]
+
+    operations = [
+        migrations.RunPython(install, uninstall),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 6.0 on 2026-10-17 05:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+from asana_tasks.hierarchy.schema import (
+    install_closure_triggers,
+    uninstall_closure_triggers,
+)
+
+
+def install(apps, schema_editor):
+    install_closure_triggers(schema_editor.connection)
+
+
+def uninstall(apps, schema_editor):
+    uninstall_closure_triggers(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('asana_tasks', '0003_task_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskClosure',
+            fields=[
+                ('pk', models.CompositePrimaryKey('ancestor', 'descendant', blank=True, editable=False, primary_key=True, serialize=False)),
+                ('depth', models.PositiveIntegerField()),
+                ('ancestor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='descendant_links', to='asana_tasks.task')),
+                ('descendant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ancestor_links', to='asana_tasks.task')),
+            ],
+            options={
+                'db_table': 'asana_tasks_task_closure',
+                'indexes': [models.Index(fields=['descendant', 'depth'], name='asana_tasks_descend_5efcd0_idx')],
+            },
+        ),
+        migrations.RunPython(install, uninstall),
+    ]
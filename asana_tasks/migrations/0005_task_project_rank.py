@@ -0,0 +1,67 @@
+# Generated by Django 6.0 on 2026-10-17 06:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+from asana_tasks.ordering import spaced_ranks
+from asana_projects.task_counts import (
+    install_task_count_triggers,
+    uninstall_task_count_triggers,
+)
+
+
+def drop_link_triggers(apps, schema_editor):
+    # SQLite adds the rank column by rebuilding the link table, which the
+    # task count triggers on and around it do not survive
+    if schema_editor.connection.vendor == 'sqlite':
+        uninstall_task_count_triggers(schema_editor.connection)
+
+
+def restore_link_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        install_task_count_triggers(schema_editor.connection)
+
+
+def rank_existing_links(apps, schema_editor):
+    # Keep the order projects listed their tasks in before: creation order
+    TaskProject = apps.get_model('asana_tasks', 'TaskProject')
+    project_ids = TaskProject.objects.values_list(
+        'project_id', flat=True
+    ).distinct()
+    for project_id in project_ids:
+        links = list(
+            TaskProject.objects.filter(project_id=project_id).order_by(
+                'created_at', 'gid'
+            ).only('gid')
+        )
+        for link, rank in zip(links, spaced_ranks(len(links))):
+            link.rank = rank
+        TaskProject.objects.bulk_update(links, ['rank'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('asana_projects', '0003_project_task_count'),
+        ('asana_sections', '0001_initial'),
+        ('asana_tasks', '0004_task_closure'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_link_triggers, restore_link_triggers),
+        migrations.AddField(
+            model_name='taskproject',
+            name='rank',
+            field=models.CharField(blank=True, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='taskproject',
+            name='section',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='task_projects', to='asana_sections.section'),
+        ),
+        migrations.RunPython(rank_existing_links, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='taskproject',
+            index=models.Index(fields=['project', 'section', 'rank'], name='asana_tasks_project_446696_idx'),
+        ),
+        migrations.RunPython(restore_link_triggers, drop_link_triggers),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 6.0 on 2026-10-17 03:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('asana_projects', '0003_project_task_count'),
+        ('asana_sections', '0001_initial'),
+        ('asana_tasks', '0005_task_project_rank'),
+        ('asana_users', '0001_initial'),
+        ('asana_workspaces', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='task',
+            name='asana_tasks_workspa_ce1f91_idx',
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['workspace', 'assignee', 'completed'], name='asana_tasks_workspa_ccfa10_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['workspace', 'updated_at'], name='asana_tasks_workspa_d4bd83_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='taskproject',
+            index=models.Index(fields=['project', 'task'], name='asana_tasks_project_62066d_idx'),
+        ),
+    ]
@@ -3,6 +3,7 @@ from .task_project import TaskProject
 from .task_tag import TaskTag
 from .task_dependency import TaskDependency
 from .task_follower import TaskFollower
+from .task_closure import TaskClosure
 
 __all__ = [
     'Task',
@@ -10,5 +11,6 @@ __all__ = [
     'TaskTag',
     'TaskDependency',
     'TaskFollower',
+    'TaskClosure',
 ]
 
@@ -79,7 +79,11 @@ class Task(models.Model):
     class Meta:
         db_table = 'asana_tasks_task'
         indexes = [
-            models.Index(fields=['workspace']),
+            # GET /tasks filters: a workspace's tasks for an assignee
+            # (completed_since narrows on completed), and modified_since.
+            # They also cover lookups by workspace alone.
+            models.Index(fields=['workspace', 'assignee', 'completed']),
+            models.Index(fields=['workspace', 'updated_at']),
             models.Index(fields=['assignee']),
             models.Index(fields=['completed']),
             models.Index(fields=['due_on']),
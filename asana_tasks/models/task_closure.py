@@ -0,0 +1,33 @@
+from django.db import models
+
+
+class TaskClosure(models.Model):
+    """
+    One row per (ancestor, descendant) pair of the subtask hierarchy, with
+    ``depth`` 1 for a direct subtask. Tasks have no row for themselves.
+
+    Rows are written by database triggers on asana_tasks_task (see
+    asana_tasks.hierarchy.schema) whenever a task is created with a parent
+    or its parent changes, so application code only ever reads them.
+    """
+    pk = models.CompositePrimaryKey('ancestor', 'descendant')
+    ancestor = models.ForeignKey(
+        'asana_tasks.Task',
+        related_name='descendant_links',
+        on_delete=models.CASCADE
+    )
+    descendant = models.ForeignKey(
+        'asana_tasks.Task',
+        related_name='ancestor_links',
+        on_delete=models.CASCADE
+    )
+    depth = models.PositiveIntegerField()
+
+    class Meta:
+        db_table = 'asana_tasks_task_closure'
+        indexes = [
+            models.Index(fields=['descendant', 'depth']),
+        ]
+
+    def __str__(self):
+        return f"{self.ancestor_id} > {self.descendant_id} ({self.depth})"
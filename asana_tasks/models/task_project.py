@@ -1,6 +1,8 @@
 import uuid
 from django.db import models
 from django.core.exceptions import ValidationError
+from asana_tasks.constants.constants import TASK_RANK_MAX_LENGTH
+from asana_tasks.ordering import rank_between
 
 
 class TaskProject(models.Model):
@@ -20,11 +22,28 @@ class TaskProject(models.Model):
         'asana_projects.Project',
         on_delete=models.CASCADE
     )
+    # Tasks outside any section are listed before the project's sections
+    section = models.ForeignKey(
+        'asana_sections.Section',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='task_projects'
+    )
+    # Position within (project, section), see asana_tasks.ordering
+    rank = models.CharField(max_length=TASK_RANK_MAX_LENGTH, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         db_table = 'asana_tasks_taskproject'
         unique_together = [['task', 'project']]
+        indexes = [
+            # Board columns and project lists page in rank order off this
+            models.Index(fields=['project', 'section', 'rank']),
+            # A project's task ids straight from the index, for the
+            # project filter on task lists
+            models.Index(fields=['project', 'task']),
+        ]
 
     def clean(self):
         """Validate task-project relationship."""
@@ -34,9 +53,20 @@ class TaskProject(models.Model):
                 raise ValidationError(
                     'Task and Project must belong to the same workspace'
                 )
+        if self.section_id and self.section.project_id != self.project_id:
+            raise ValidationError('Section must belong to the project')
 
     def save(self, *args, **kwargs):
         """Override save to run validations."""
+        if not self.rank:
+            # New links go to the end of their section
+            last = TaskProject.objects.filter(
+                project_id=self.project_id,
+                section_id=self.section_id
+            ).exclude(pk=self.pk).order_by('-rank').values_list(
+                'rank', flat=True
+            ).first()
+            self.rank = rank_between(last, None)
         self.full_clean()
         super().save(*args, **kwargs)
 
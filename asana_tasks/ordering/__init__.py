@@ -0,0 +1,6 @@
+from .ranks import rank_between, spaced_ranks
+
+__all__ = [
+    'rank_between',
+    'spaced_ranks',
+]
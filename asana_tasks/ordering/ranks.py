@@ -0,0 +1,94 @@
+"""
+Gap-based ranks for ordering tasks within a project section.
+
+A rank is a string of base-36 digits compared as a fraction (plain string
+comparison, so the database orders by it with an ordinary index). There is
+always room for another rank between two ranks, so placing a task before or
+after another one writes only that task's row. Ranks never end in '0': a
+rank ending in the smallest digit would leave nothing between itself and
+the same rank without the trailing zero.
+
+Appending and prepending step the leading RANK_WIDTH digits by RANK_STEP so
+ranks stay short for the common case; repeated inserts at the same spot
+halve the gap and lengthen the rank by about one digit every five moves,
+which ``spaced_ranks`` undoes when a section is rebalanced.
+"""
+from typing import List, Optional
+
+RANK_DIGITS = '0123456789abcdefghijklmnopqrstuvwxyz'
+RANK_BASE = len(RANK_DIGITS)
+# Leading digits that appends, prepends and rebalancing work with
+RANK_WIDTH = 6
+RANK_STEP = RANK_BASE ** 3
+
+_DIGIT_VALUES = {digit: value for value, digit in enumerate(RANK_DIGITS)}
+
+
+def _to_int(rank: str, width: int = RANK_WIDTH) -> int:
+    value = 0
+    for digit in rank[:width].ljust(width, RANK_DIGITS[0]):
+        value = value * RANK_BASE + _DIGIT_VALUES[digit]
+    return value
+
+
+def _from_int(value: int, width: int = RANK_WIDTH) -> str:
+    digits = []
+    for _ in range(width):
+        value, remainder = divmod(value, RANK_BASE)
+        digits.append(RANK_DIGITS[remainder])
+    return ''.join(reversed(digits)).rstrip(RANK_DIGITS[0])
+
+
+def _midpoint(before: str, after: Optional[str]) -> str:
+    """The shortest-ish rank strictly between ``before`` and ``after``."""
+    digits = []
+    position = 0
+    while True:
+        low = _DIGIT_VALUES[before[position]] if position < len(before) else 0
+        if after is not None and position < len(after):
+            high = _DIGIT_VALUES[after[position]]
+        else:
+            high = RANK_BASE
+        if high - low > 1:
+            digits.append(RANK_DIGITS[(low + high) // 2])
+            return ''.join(digits)
+        digits.append(RANK_DIGITS[low])
+        if high > low:
+            # The prefix is now below ``after``; only ``before`` bounds the rest
+            after = None
+        position += 1
+
+
+def rank_between(before: Optional[str], after: Optional[str]) -> str:
+    """
+    A rank that sorts after ``before`` and before ``after``; None stands
+    for the start or the end of the section. Raises ValueError when
+    ``before`` does not sort before ``after`` (e.g. two rows share a rank),
+    in which case the section needs rebalancing first.
+    """
+    if before is not None and after is not None and before >= after:
+        raise ValueError(f"No rank between {before!r} and {after!r}")
+    space = RANK_BASE ** RANK_WIDTH
+    if before is None and after is None:
+        return _from_int(space // 2)
+    if after is None:
+        value = _to_int(before) + RANK_STEP
+        if value < space:
+            return _from_int(value)
+    elif before is None:
+        value = _to_int(after) - RANK_STEP
+        if value > 0:
+            return _from_int(value)
+    return _midpoint(before or '', after)
+
+
+def spaced_ranks(count: int) -> List[str]:
+    """
+    ``count`` ascending ranks spread evenly over the rank space, leaving a
+    gap of at least RANK_STEP between neighbours.
+    """
+    width = RANK_WIDTH
+    while RANK_BASE ** width // (count + 1) < RANK_STEP:
+        width += 1
+    step = RANK_BASE ** width // (count + 1)
+    return [_from_int(step * (index + 1), width) for index in range(count)]
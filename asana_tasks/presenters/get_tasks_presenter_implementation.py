@@ -26,3 +26,10 @@ class GetTasksPresenterImplementation(PresenterInterface):
             'data': {}
         }
 
+    def get_job_response(
+        self,
+        job_dict: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        return {
+            'data': job_dict
+        }
@@ -0,0 +1,17 @@
+from .backends import (
+    TaskSearchBackend,
+    SqliteFtsSearchBackend,
+    PostgresSearchBackend,
+    ContainsSearchBackend,
+    get_search_backend,
+    parse_search_terms,
+)
+
+__all__ = [
+    'TaskSearchBackend',
+    'SqliteFtsSearchBackend',
+    'PostgresSearchBackend',
+    'ContainsSearchBackend',
+    'get_search_backend',
+    'parse_search_terms',
+]
@@ -0,0 +1,133 @@
+"""
+Full-text search over task names and notes.
+
+Each backend narrows a Task queryset to the rows matching a text query and
+orders them by relevance, so callers can combine search with any other
+task filters. Every term of the query must match; the last one also
+matches by prefix, as for search-as-you-type ("bug fi" finds "Bug fix").
+A match in the name ranks above a match in the notes.
+
+The search index is maintained by the database itself (see migration
+0003_task_search_index), so task saves, deletes, bulk_create and
+QuerySet.update all keep it current:
+
+* SQLite: an FTS5 external-content table over asana_tasks_task, updated by
+  triggers. It is keyed by the task table's rowid, which ``VACUUM`` may
+  renumber; run ``manage.py rebuild_task_search_index`` after vacuuming.
+* PostgreSQL: a generated ``search_vector`` tsvector column with a GIN
+  index.
+* Other databases fall back to icontains scans.
+"""
+import re
+from abc import ABC, abstractmethod
+from typing import List, Tuple
+from django.db import connection as default_connection
+from django.db.models import Q, QuerySet
+from asana_tasks.search.schema import SQLITE_REBUILD
+from asana_tasks.constants.constants import (
+    TASK_SEARCH_FTS_TABLE,
+    TASK_SEARCH_MAX_TERMS,
+    TASK_SEARCH_MIN_PREFIX_LENGTH,
+    TASK_SEARCH_NAME_WEIGHT,
+    TASK_SEARCH_NOTES_WEIGHT,
+)
+
+# Alias the relevance score is selected under; lower sorts first
+RANK_ALIAS = 'search_rank'
+
+
+def parse_search_terms(text: str) -> List[str]:
+    """Split search text into lower-cased word terms."""
+    return re.findall(r'\w+', text.lower())[:TASK_SEARCH_MAX_TERMS]
+
+
+def _prefix_terms(terms: List[str]) -> List[Tuple[str, bool]]:
+    """
+    Pair each term with whether it matches by prefix: only the last one,
+    the word still being typed, and only once it is long enough not to
+    match nearly everything.
+    """
+    return [
+        (term, index == len(terms) - 1 and len(term) >= TASK_SEARCH_MIN_PREFIX_LENGTH)
+        for index, term in enumerate(terms)
+    ]
+
+
+class TaskSearchBackend(ABC):
+    @abstractmethod
+    def search(self, queryset: QuerySet, terms: List[str]) -> QuerySet:
+        """
+        Restrict ``queryset`` to tasks matching all ``terms`` and order it
+        best match first.
+        """
+        pass
+
+    def rebuild(self) -> None:
+        """Rebuild the search index from the task table."""
+
+
+class SqliteFtsSearchBackend(TaskSearchBackend):
+    def search(self, queryset: QuerySet, terms: List[str]) -> QuerySet:
+        table = queryset.model._meta.db_table
+        # "term"* is a prefix query; terms are \w+ so need no escaping
+        match = ' '.join(
+            f'"{term}"*' if prefix else f'"{term}"'
+            for term, prefix in _prefix_terms(terms)
+        )
+        return queryset.extra(
+            tables=[TASK_SEARCH_FTS_TABLE],
+            where=[
+                f'{TASK_SEARCH_FTS_TABLE} MATCH %s',
+                f'{TASK_SEARCH_FTS_TABLE}.rowid = {table}.rowid',
+            ],
+            params=[match],
+            select={
+                RANK_ALIAS: (
+                    f'bm25({TASK_SEARCH_FTS_TABLE}, '
+                    f'{TASK_SEARCH_NAME_WEIGHT}, {TASK_SEARCH_NOTES_WEIGHT})'
+                )
+            },
+            order_by=[RANK_ALIAS, 'gid'],
+        )
+
+    def rebuild(self) -> None:
+        with default_connection.cursor() as cursor:
+            cursor.execute(SQLITE_REBUILD)
+
+
+class PostgresSearchBackend(TaskSearchBackend):
+    def search(self, queryset: QuerySet, terms: List[str]) -> QuerySet:
+        table = queryset.model._meta.db_table
+        query = ' & '.join(
+            f'{term}:*' if prefix else term
+            for term, prefix in _prefix_terms(terms)
+        )
+        return queryset.extra(
+            where=[f"{table}.search_vector @@ to_tsquery('simple', %s)"],
+            params=[query],
+            select={
+                # Negated so that, as with bm25, lower is better
+                RANK_ALIAS: (
+                    f"-ts_rank({table}.search_vector, to_tsquery('simple', %s))"
+                )
+            },
+            select_params=[query],
+            order_by=[RANK_ALIAS, 'gid'],
+        )
+
+
+class ContainsSearchBackend(TaskSearchBackend):
+    def search(self, queryset: QuerySet, terms: List[str]) -> QuerySet:
+        for term in terms:
+            queryset = queryset.filter(
+                Q(name__icontains=term) | Q(notes__icontains=term)
+            )
+        return queryset.order_by('gid')
+
+
+def get_search_backend(connection=default_connection) -> TaskSearchBackend:
+    if connection.vendor == 'sqlite':
+        return SqliteFtsSearchBackend()
+    if connection.vendor == 'postgresql':
+        return PostgresSearchBackend()
+    return ContainsSearchBackend()
@@ -0,0 +1,120 @@
+"""
+DDL for the database-maintained task search index.
+
+Installed by migration 0003_task_search_index. On SQLite, Django alters a
+table by rebuilding it, which drops its triggers and renumbers its rowids,
+so ``ensure_search_index`` also runs after every ``migrate`` to reinstall
+anything missing and rebuild the index.
+"""
+from django.db.migrations.recorder import MigrationRecorder
+
+MIGRATION = ('asana_tasks', '0003_task_search_index')
+
+SQLITE_INSTALL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS asana_tasks_task_fts USING fts5(
+        name, notes,
+        content='asana_tasks_task',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3 4'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS asana_tasks_task_fts_insert
+    AFTER INSERT ON asana_tasks_task
+    BEGIN
+        INSERT INTO asana_tasks_task_fts(rowid, name, notes)
+        VALUES (new.rowid, new.name, new.notes);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS asana_tasks_task_fts_delete
+    AFTER DELETE ON asana_tasks_task
+    BEGIN
+        INSERT INTO asana_tasks_task_fts(asana_tasks_task_fts, rowid, name, notes)
+        VALUES ('delete', old.rowid, old.name, old.notes);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS asana_tasks_task_fts_update
+    AFTER UPDATE OF name, notes ON asana_tasks_task
+    BEGIN
+        INSERT INTO asana_tasks_task_fts(asana_tasks_task_fts, rowid, name, notes)
+        VALUES ('delete', old.rowid, old.name, old.notes);
+        INSERT INTO asana_tasks_task_fts(rowid, name, notes)
+        VALUES (new.rowid, new.name, new.notes);
+    END
+    """,
+]
+SQLITE_REBUILD = (
+    "INSERT INTO asana_tasks_task_fts(asana_tasks_task_fts) VALUES ('rebuild')"
+)
+SQLITE_TRIGGERS = (
+    'asana_tasks_task_fts_insert',
+    'asana_tasks_task_fts_delete',
+    'asana_tasks_task_fts_update',
+)
+SQLITE_UNINSTALL = [
+    *(f'DROP TRIGGER IF EXISTS {trigger}' for trigger in SQLITE_TRIGGERS),
+    'DROP TABLE IF EXISTS asana_tasks_task_fts',
+]
+
+POSTGRES_INSTALL = [
+    """
+    ALTER TABLE asana_tasks_task ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(name, '')), 'A')
+        || setweight(to_tsvector('simple', coalesce(notes, '')), 'B')
+    ) STORED
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS asana_tasks_task_search_vector_idx
+    ON asana_tasks_task USING GIN (search_vector)
+    """,
+]
+POSTGRES_UNINSTALL = [
+    'DROP INDEX IF EXISTS asana_tasks_task_search_vector_idx',
+    'ALTER TABLE asana_tasks_task DROP COLUMN IF EXISTS search_vector',
+]
+
+
+def _sqlite_triggers_installed(connection) -> bool:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT count(*) FROM sqlite_master WHERE type = 'trigger' AND name IN (%s, %s, %s)",
+            SQLITE_TRIGGERS
+        )
+        return cursor.fetchone()[0] == len(SQLITE_TRIGGERS)
+
+
+def install_search_index(connection) -> None:
+    """Create whatever part of the search index is missing."""
+    if connection.vendor == 'sqlite':
+        if _sqlite_triggers_installed(connection):
+            return
+        with connection.cursor() as cursor:
+            for statement in SQLITE_INSTALL:
+                cursor.execute(statement)
+            cursor.execute(SQLITE_REBUILD)
+    elif connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            for statement in POSTGRES_INSTALL:
+                cursor.execute(statement)
+
+
+def uninstall_search_index(connection) -> None:
+    statements = {
+        'sqlite': SQLITE_UNINSTALL,
+        'postgresql': POSTGRES_UNINSTALL,
+    }.get(connection.vendor, [])
+    with connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+
+
+def ensure_search_index(sender, using, **kwargs) -> None:
+    """post_migrate receiver: reinstall the index if a table rebuild lost it."""
+    from django.db import connections
+    connection = connections[using]
+    if MIGRATION in MigrationRecorder(connection).applied_migrations():
+        install_search_index(connection)
@@ -63,6 +63,20 @@ class TaskUpdateSerializer(serializers.ModelSerializer):
 
 class TaskProjectSerializer(serializers.Serializer):
     project_gid = serializers.UUIDField(required=True)
+    section = serializers.UUIDField(required=False, allow_null=True)
+    insert_before = serializers.UUIDField(required=False, allow_null=True)
+    insert_after = serializers.UUIDField(required=False, allow_null=True)
+
+    def validate(self, attrs):
+        positions = [
+            field for field in ('section', 'insert_before', 'insert_after')
+            if attrs.get(field)
+        ]
+        if len(positions) > 1:
+            raise serializers.ValidationError(
+                'Only one of section, insert_before or insert_after may be given'
+            )
+        return attrs
 
 
 class TaskTagSerializer(serializers.Serializer):
@@ -172,3 +186,36 @@ class ErrorResponseSerializer(serializers.Serializer):
     """Standard error response"""
     errors = ErrorMessageSerializer(many=True)
 
+
+
+class DependencyGraphTaskSerializer(serializers.Serializer):
+    """A task in a transitive dependency listing"""
+    gid = serializers.CharField()
+    resource_type = serializers.CharField(default='task')
+    name = serializers.CharField()
+    resource_subtype = serializers.CharField(required=False, allow_null=True)
+    completed = serializers.BooleanField()
+    start_on = serializers.DateField(allow_null=True, required=False)
+    due_on = serializers.DateField(allow_null=True, required=False)
+    dependencies = TaskCompactSerializer(many=True, required=False)
+    dependents = TaskCompactSerializer(many=True, required=False)
+
+
+class DependencyGraphResponseSerializer(serializers.Serializer):
+    """Response for a transitive dependency listing"""
+    data = DependencyGraphTaskSerializer(many=True)
+
+
+class CriticalPathTaskSerializer(DependencyGraphTaskSerializer):
+    """A task on a critical path"""
+    duration_days = serializers.IntegerField()
+
+
+class CriticalPathSerializer(serializers.Serializer):
+    duration_days = serializers.IntegerField()
+    tasks = CriticalPathTaskSerializer(many=True)
+
+
+class CriticalPathResponseSerializer(serializers.Serializer):
+    """Response for a project's critical path"""
+    data = CriticalPathSerializer()
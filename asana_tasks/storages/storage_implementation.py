@@ -1,30 +1,97 @@
-from typing import List, Optional
+import asyncio
+from collections import Counter, defaultdict
+from datetime import date
+from typing import Any, Dict, List, Optional, Union
 from django.db import transaction
-from django.db.models import Q
+from django.core.exceptions import ValidationError
+from django.db.models import Count, F, Max, Q, Subquery, prefetch_related_objects
 from asana_tasks.models.task import Task
 from asana_tasks.models.task_project import TaskProject
 from asana_tasks.models.task_tag import TaskTag
 from asana_tasks.models.task_follower import TaskFollower
 from asana_tasks.models.task_dependency import TaskDependency
+from asana_tasks.models.task_closure import TaskClosure
 from asana_workspaces.models.workspace import Workspace
 from asana_users.models.user import User
 from asana_projects.models.project import Project
 from asana_tags.models.tag import Tag
+from asana_sections.models.section import Section
 from asana_tasks.interactors.storage_interfaces.storage_interface import (
     StorageInterface
 )
 from asana_tasks.exceptions.custom_exceptions import (
-    TaskDoesNotExistException
+    TaskDoesNotExistException,
+    DependencyCycleException,
+    ProjectDoesNotExistException,
+)
+from asana_tasks.constants.constants import (
+    DUPLICATE_TASK_FIELDS,
+    DUPLICATE_BATCH_SIZE,
+    TASK_RANK_MAX_LENGTH,
+)
+from asana_backend.utils.field_projection import FieldProjection
+from asana_backend.utils.pagination import (
+    Page,
+    paginate_queryset,
+    paginate_by_position,
+)
+from asana_tasks.search import get_search_backend, parse_search_terms
+from asana_tasks.dependencies import (
+    DependencyGraph,
+    load_upstream_edges,
+    load_downstream_edges,
+    load_project_edges,
+)
+from asana_tasks.ordering import rank_between, spaced_ranks
+from asana_backend.utils.identity_map import load, load_many
+from asana_backend.utils.async_views import run_in_thread
+from asana_backend.utils.object_cache import invalidate
+from asana_events.journal import record_many
+from asana_typeahead.app_interfaces.service_interface import (
+    ServiceInterface as TypeaheadServiceInterface
 )
 
 
 class StorageImplementation(StorageInterface):
-    def get_task(self, task_gid: str) -> Optional[Task]:
+    def get_task(
+        self,
+        task_gid: str,
+        projection: Optional[FieldProjection] = None
+    ) -> Optional[Task]:
+        queryset = Task.objects.all()
+        if projection:
+            queryset = projection.apply(queryset)
+        try:
+            return queryset.get(gid=task_gid)
+        except Task.DoesNotExist:
+            return None
+
+    async def aget_task(
+        self,
+        task_gid: str,
+        projection: Optional[FieldProjection] = None
+    ) -> Optional[Task]:
+        queryset = Task.objects.all()
+        prefetches = []
+        if projection:
+            queryset = projection.apply(queryset).prefetch_related(None)
+            prefetches = projection.prefetch_related
         try:
-            return Task.objects.get(gid=task_gid)
+            task = await run_in_thread(queryset.get, gid=task_gid)
         except Task.DoesNotExist:
             return None
 
+        # The to-many relations (projects, tags, followers...) do not
+        # depend on each other: load them at the same time, each on its
+        # own connection. Prefetching only creates the cache when it is
+        # missing, so create it up front for the loads to share.
+        task._prefetched_objects_cache = {}
+        await asyncio.gather(*(
+            run_in_thread(prefetch_related_objects, [task], prefetch)
+            for prefetch in prefetches
+        ))
+        return task
+
     def get_tasks(
         self,
         workspace: Optional[str] = None,
@@ -33,12 +100,67 @@ class StorageImplementation(StorageInterface):
         section: Optional[str] = None,
         completed_since: Optional[str] = None,
         modified_since: Optional[str] = None,
-        offset: int = 0,
-        limit: int = 50
+        offset: Union[int, str] = 0,
+        limit: int = 50,
+        projection: Optional[FieldProjection] = None,
+        stream: bool = False
     ) -> List[Task]:
-        from django.utils import timezone
+        queryset = self._filter_tasks(
+            workspace=workspace,
+            assignee=assignee,
+            project=project,
+            completed_since=completed_since,
+            modified_since=modified_since
+        )
+
+        if projection:
+            queryset = projection.apply(queryset)
+
+        if section:
+            return self._get_section_tasks(section, queryset, offset, limit)
+        return paginate_queryset(
+            queryset, offset, limit, ordering=('gid',), stream=stream
+        )
+
+    def get_tasks_version(
+        self,
+        workspace: Optional[str] = None,
+        assignee: Optional[str] = None,
+        project: Optional[str] = None,
+        completed_since: Optional[str] = None,
+        modified_since: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        The number of tasks ``get_tasks`` lists for these filters and their
+        latest change, with one aggregate query. A task joining the list
+        has been saved, or added to the project, since the latest change,
+        and one leaving it lowers the count unless another joins.
+        """
+        queryset = self._filter_tasks(
+            workspace=workspace,
+            assignee=assignee,
+            project=project,
+            completed_since=completed_since,
+            modified_since=modified_since
+        )
+        aggregates = {
+            'count': Count('pk', distinct=True),
+            'modified_at': Max('updated_at'),
+        }
+        if project:
+            aggregates['added_at'] = Max('taskproject__created_at')
+        return queryset.order_by().aggregate(**aggregates)
+
+    def _filter_tasks(
+        self,
+        workspace: Optional[str] = None,
+        assignee: Optional[str] = None,
+        project: Optional[str] = None,
+        completed_since: Optional[str] = None,
+        modified_since: Optional[str] = None
+    ):
         from datetime import datetime
-        
+
         queryset = Task.objects.all()
 
         if workspace:
@@ -54,11 +176,6 @@ class StorageImplementation(StorageInterface):
         if project:
             queryset = queryset.filter(taskproject__project__gid=project).distinct()
         
-        if section:
-            # Section filtering would require Section model (not implemented yet)
-            # For now, we'll skip this filter
-            pass
-        
         if completed_since:
             try:
                 completed_since_dt = datetime.fromisoformat(completed_since.replace('Z', '+00:00'))
@@ -77,7 +194,73 @@ class StorageImplementation(StorageInterface):
             except (ValueError, AttributeError):
                 pass  # Invalid date format, ignore filter
 
-        return list(queryset[offset:offset + limit])
+        return queryset
+
+    def _get_section_tasks(
+        self,
+        section_gid: str,
+        queryset,
+        offset: Union[int, str],
+        limit: int
+    ) -> Page:
+        """
+        The tasks of ``queryset`` in the section, in board order. The links
+        are paged by rank with one scan of the (project, section, rank)
+        index, then their tasks are loaded with one more query.
+        """
+        links = paginate_queryset(
+            TaskProject.objects.filter(
+                project_id=Subquery(
+                    Section.objects.filter(gid=section_gid).values('project_id')
+                ),
+                section_id=section_gid,
+                task__in=queryset.values('pk')
+            ).only('gid', 'rank', 'task_id'),
+            offset,
+            limit,
+            ordering=('rank', 'gid')
+        )
+        tasks = queryset.in_bulk([link.task_id for link in links])
+        return Page(
+            [tasks[link.task_id] for link in links],
+            next_offset=links.next_offset
+        )
+
+    def search_tasks(
+        self,
+        workspace_gid: str,
+        text: Optional[str] = None,
+        resource_subtype: Optional[str] = None,
+        completed: Optional[bool] = None,
+        is_subtask: Optional[bool] = None,
+        due_on_before: Optional[date] = None,
+        due_on_after: Optional[date] = None,
+        offset: Union[int, str] = 0,
+        limit: int = 50
+    ) -> List[Task]:
+        queryset = Task.objects.filter(workspace_id=workspace_gid)
+        if resource_subtype:
+            queryset = queryset.filter(resource_subtype=resource_subtype)
+        if completed is not None:
+            queryset = queryset.filter(completed=completed)
+        if is_subtask is not None:
+            queryset = queryset.filter(parent__isnull=not is_subtask)
+        if due_on_before:
+            queryset = queryset.filter(due_on__lt=due_on_before)
+        if due_on_after:
+            queryset = queryset.filter(due_on__gt=due_on_after)
+
+        if text is None:
+            return paginate_queryset(queryset, offset, limit, ordering=('gid',))
+
+        terms = parse_search_terms(text)
+        if not terms:
+            return Page([])
+        return paginate_by_position(
+            get_search_backend().search(queryset, terms),
+            offset,
+            limit
+        )
 
     def create_task(
         self,
@@ -86,7 +269,7 @@ class StorageImplementation(StorageInterface):
         assignee_gid: Optional[str] = None,
         **kwargs
     ) -> Task:
-        workspace = Workspace.objects.get(gid=workspace_gid)
+        workspace = load(Workspace, workspace_gid)
         
         task_data = {
             'name': name,
@@ -95,7 +278,7 @@ class StorageImplementation(StorageInterface):
         }
         
         if assignee_gid:
-            assignee = User.objects.get(gid=assignee_gid)
+            assignee = load(User, assignee_gid)
             task_data['assignee'] = assignee
         
         task = Task.objects.create(**task_data)
@@ -109,7 +292,7 @@ class StorageImplementation(StorageInterface):
         if 'assignee_gid' in update_data:
             assignee_gid = update_data.pop('assignee_gid')
             if assignee_gid:
-                task.assignee = User.objects.get(gid=assignee_gid)
+                task.assignee = load(User, assignee_gid)
             else:
                 task.assignee = None
         
@@ -128,44 +311,90 @@ class StorageImplementation(StorageInterface):
         return True
 
     @transaction.atomic
-    def add_project_to_task(self, task_gid: str, project_gid: str) -> Task:
-        task = Task.objects.get(gid=task_gid)
-        project = Project.objects.get(gid=project_gid)
-        TaskProject.objects.get_or_create(task=task, project=project)
-        return task
+    def add_project_to_task(
+        self,
+        task_gid: str,
+        project_gid: str,
+        section_gid: Optional[str] = None,
+        insert_before: Optional[str] = None,
+        insert_after: Optional[str] = None
+    ) -> TaskProject:
+        """
+        Add the task to the project, or move it within the project, and
+        return its link. The task goes right before ``insert_before`` or
+        after ``insert_after`` (in that task's section), else to the end of
+        ``section_gid`` or of the tasks outside any section. A task already
+        in the project stays put unless a position is given. Either way
+        only the task's own link row is written.
+        """
+        task = load(Task, task_gid)
+        project = load(Project, project_gid)
+        link = TaskProject.objects.filter(task=task, project=project).first()
+        if link is None:
+            link = TaskProject(task=task, project=project)
+        elif not (section_gid or insert_before or insert_after):
+            return link
+
+        anchor = None
+        if insert_before or insert_after:
+            anchor = self._get_anchor_link(
+                project,
+                insert_before or insert_after,
+                field='insert_before' if insert_before else 'insert_after'
+            )
+            if anchor.task_id == task.pk:
+                raise ValidationError(
+                    'insert_before: A task cannot be placed next to itself'
+                    if insert_before else
+                    'insert_after: A task cannot be placed next to itself'
+                )
+            link.section_id = anchor.section_id
+        else:
+            link.section = load(Section, section_gid) if section_gid else None
+        link.rank = self._rank_for(link, anchor, before=bool(insert_before))
+        link.save()
+        return link
 
     @transaction.atomic
     def remove_project_from_task(self, task_gid: str, project_gid: str) -> Task:
-        task = Task.objects.get(gid=task_gid)
-        project = Project.objects.get(gid=project_gid)
+        task = load(Task, task_gid)
+        project = load(Project, project_gid)
         TaskProject.objects.filter(task=task, project=project).delete()
         return task
 
     @transaction.atomic
     def add_tag_to_task(self, task_gid: str, tag_gid: str) -> Task:
-        task = Task.objects.get(gid=task_gid)
+        task = load(Task, task_gid)
         tag = Tag.objects.get(gid=tag_gid)
         TaskTag.objects.get_or_create(task=task, tag=tag)
         return task
 
     @transaction.atomic
     def remove_tag_from_task(self, task_gid: str, tag_gid: str) -> Task:
-        task = Task.objects.get(gid=task_gid)
+        task = load(Task, task_gid)
         tag = Tag.objects.get(gid=tag_gid)
         TaskTag.objects.filter(task=task, tag=tag).delete()
         return task
 
     @transaction.atomic
     def add_followers_to_task(self, task_gid: str, follower_gids: List[str]) -> Task:
-        task = Task.objects.get(gid=task_gid)
-        for follower_gid in follower_gids:
-            user = User.objects.get(gid=follower_gid)
-            TaskFollower.objects.get_or_create(task=task, user=user)
+        task = load(Task, task_gid)
+        users = load_many(User, follower_gids)
+        # Existing followers are skipped by the (task, user) unique constraint
+        TaskFollower.objects.bulk_create(
+            [
+                TaskFollower(task=task, user_id=user_id)
+                for user_id in {user.pk for user in users}
+            ],
+            ignore_conflicts=True
+        )
+        # bulk_create skips the signals that drop the cached task
+        invalidate([('task', task.pk)])
         return task
 
     @transaction.atomic
     def remove_followers_from_task(self, task_gid: str, follower_gids: List[str]) -> Task:
-        task = Task.objects.get(gid=task_gid)
+        task = load(Task, task_gid)
         TaskFollower.objects.filter(
             task=task,
             user__gid__in=follower_gids
@@ -179,70 +408,312 @@ class StorageImplementation(StorageInterface):
         name: str,
         include: List[str]
     ) -> Task:
-        original_task = Task.objects.get(gid=task_gid)
-        
-        # Create new task with copied fields
-        new_task = Task.objects.create(
-            name=name,
-            workspace=original_task.workspace,
-            assignee=original_task.assignee if 'assignee' in include else None,
-            assignee_status=original_task.assignee_status,
-            completed=False,  # New task is not completed
-            due_on=original_task.due_on if 'due_on' in include else None,
-            due_at=original_task.due_at if 'due_at' in include else None,
-            start_on=original_task.start_on if 'start_on' in include else None,
-            start_at=original_task.start_at if 'start_at' in include else None,
-            notes=original_task.notes if 'notes' in include else None,
-            html_notes=original_task.html_notes if 'notes' in include else None,
-            created_by=original_task.created_by
+        original_task = load(Task, task_gid)
+        copies = self.duplicate_tasks(
+            [original_task],
+            include,
+            names={original_task.pk: name}
         )
-        
-        # Copy relationships if included
-        if 'projects' in include:
-            for task_project in TaskProject.objects.filter(task=original_task):
-                TaskProject.objects.create(task=new_task, project=task_project.project)
-        
-        if 'tags' in include:
-            for task_tag in TaskTag.objects.filter(task=original_task):
-                TaskTag.objects.create(task=new_task, tag=task_tag.tag)
-        
-        if 'followers' in include:
-            for task_follower in TaskFollower.objects.filter(task=original_task):
-                TaskFollower.objects.create(task=new_task, user=task_follower.user)
-        
-        # Note: subtasks and dependencies are typically not duplicated by default
-        # but can be added if needed
-        
-        return new_task
+        return copies[original_task.pk]
+
+    @transaction.atomic
+    def duplicate_project_tasks(
+        self,
+        project_gid: str,
+        new_project_gid: str,
+        include: List[str],
+        section_map: Optional[Dict[Any, Any]] = None
+    ) -> Dict[Any, Task]:
+        """
+        Copy every task of a project into ``new_project_gid``, into the
+        sections ``section_map`` maps theirs to.
+        """
+        project = load(Project, project_gid)
+        new_project = load(Project, new_project_gid)
+        tasks = list(
+            Task.objects.filter(taskproject__project=project).order_by('created_at')
+        )
+        return self.duplicate_tasks(
+            tasks,
+            include,
+            project_map={project.pk: new_project.pk},
+            section_map=section_map
+        )
+
+    @transaction.atomic
+    def duplicate_tasks(
+        self,
+        tasks: List[Task],
+        include: List[str],
+        names: Optional[Dict[Any, str]] = None,
+        project_map: Optional[Dict[Any, Any]] = None,
+        section_map: Optional[Dict[Any, Any]] = None
+    ) -> Dict[Any, Task]:
+        """
+        Copy ``tasks`` and, with 'subtasks' in ``include``, their whole
+        subtask trees. Each relation is copied with one read and one bulk
+        insert per DUPLICATE_BATCH_SIZE tasks, so the query count grows
+        neither with the number of tasks nor with the depth of the trees.
+        Links to projects in ``project_map`` are moved to the mapped
+        project, and into the section ``section_map`` maps theirs to, keeping
+        their rank; dependencies between copied tasks are remapped onto the
+        copies. Returns the copies keyed by original pk.
+        """
+        names = names or {}
+        originals = {task.pk: task for task in tasks}
+        if 'subtasks' in include:
+            # The closure table yields whole subtrees, however deep, with
+            # one query per chunk of roots
+            for chunk in _chunked(list(originals)):
+                for subtask in Task.objects.filter(
+                    ancestor_links__ancestor_id__in=chunk
+                ).distinct():
+                    originals.setdefault(subtask.pk, subtask)
+
+        copies = {
+            pk: self._copy_task_fields(
+                original,
+                include,
+                name=names.get(pk, original.name)
+            )
+            for pk, original in originals.items()
+        }
+        for pk, original in originals.items():
+            if original.parent_id in copies:
+                copies[pk].parent_id = copies[original.parent_id].pk
+            elif 'parent' in include:
+                copies[pk].parent_id = original.parent_id
+        # Parents are inserted before their subtasks: the closure trigger
+        # of a subtask reads the rows of its parent
+        Task.objects.bulk_create(
+            _parents_first(list(copies.values())),
+            batch_size=DUPLICATE_BATCH_SIZE
+        )
+        # Copies added under their original's parent; bulk_create skips
+        # the saves that would have counted them and invalidated the parent
+        added_subtasks = Counter(
+            original.parent_id
+            for original in originals.values()
+            if 'parent' in include
+            and original.parent_id is not None
+            and original.parent_id not in copies
+        )
+        parents_by_count = defaultdict(list)
+        for parent_id, count in added_subtasks.items():
+            parents_by_count[count].append(parent_id)
+        for count, parent_ids in parents_by_count.items():
+            Task.objects.filter(pk__in=parent_ids).update(
+                num_subtasks=F('num_subtasks') + count
+            )
+        invalidate([('task', parent_id) for parent_id in added_subtasks])
+
+        project_map = project_map or {}
+        section_map = section_map or {}
+        task_projects, task_tags, task_followers, dependencies = [], [], [], []
+        for chunk in _chunked(list(copies)):
+            if project_map or 'projects' in include:
+                for task_id, project_id, section_id, rank in TaskProject.objects.filter(
+                    task_id__in=chunk
+                ).values_list('task_id', 'project_id', 'section_id', 'rank'):
+                    if project_id in project_map:
+                        project_id = project_map[project_id]
+                        # Links into sections that were not copied fall
+                        # back to the project's tasks outside any section
+                        section_id = section_map.get(section_id)
+                    elif 'projects' not in include:
+                        continue
+                    # Copies take their original's place; rows sharing a
+                    # rank are ordered by gid
+                    task_projects.append(TaskProject(
+                        task=copies[task_id],
+                        project_id=project_id,
+                        section_id=section_id,
+                        rank=rank
+                    ))
+            if 'tags' in include:
+                task_tags.extend(
+                    TaskTag(task=copies[task_id], tag_id=tag_id)
+                    for task_id, tag_id in TaskTag.objects.filter(
+                        task_id__in=chunk
+                    ).values_list('task_id', 'tag_id')
+                )
+            if 'followers' in include:
+                task_followers.extend(
+                    TaskFollower(task=copies[task_id], user_id=user_id)
+                    for task_id, user_id in TaskFollower.objects.filter(
+                        task_id__in=chunk
+                    ).values_list('task_id', 'user_id')
+                )
+            if 'dependencies' in include:
+                for successor_id, predecessor_id in TaskDependency.objects.filter(
+                    successor_id__in=chunk
+                ).values_list('successor_id', 'predecessor_id'):
+                    if predecessor_id in copies:
+                        predecessor_id = copies[predecessor_id].pk
+                    dependencies.append(TaskDependency(
+                        successor=copies[successor_id],
+                        predecessor_id=predecessor_id
+                    ))
+
+        # The copies live in the originals' workspace, so links that were
+        # valid for the originals stay valid for the copies
+        TaskProject.objects.bulk_create(
+            task_projects, batch_size=DUPLICATE_BATCH_SIZE, ignore_conflicts=True
+        )
+        TaskTag.objects.bulk_create(task_tags, batch_size=DUPLICATE_BATCH_SIZE)
+        TaskFollower.objects.bulk_create(
+            task_followers, batch_size=DUPLICATE_BATCH_SIZE
+        )
+        TaskDependency.objects.bulk_create(
+            dependencies, batch_size=DUPLICATE_BATCH_SIZE
+        )
+        # bulk_create skips the signals that feed the event journal
+        record_many(copies.values(), 'added')
+        TypeaheadServiceInterface.index_objects(copies.values())
+        record_many(task_projects + task_tags, 'added')
+
+        return copies
+
+    def is_subtask_of(self, task_gid: str, ancestor_gid: str) -> bool:
+        """Whether ``task_gid`` is anywhere below ``ancestor_gid``."""
+        return TaskClosure.objects.filter(
+            ancestor_id=ancestor_gid,
+            descendant_id=task_gid
+        ).exists()
+
+    def get_subtree(self, task_gid: str) -> List[Task]:
+        """Every task below ``task_gid``, shallowest first, in one query."""
+        return list(
+            Task.objects.filter(ancestor_links__ancestor_id=task_gid)
+            .order_by('ancestor_links__depth', 'created_at')
+        )
+
+    def get_subtask_counts(self, task_gids: List[str]) -> Dict[str, Dict[str, int]]:
+        """
+        Direct (``num_subtasks``) and recursive (``num_descendants``)
+        subtask counts of ``task_gids`` from one index scan of the closure.
+        Tasks without subtasks are left out.
+        """
+        return {
+            str(row['ancestor_id']): {
+                'num_subtasks': row['num_subtasks'],
+                'num_descendants': row['num_descendants'],
+            }
+            for row in TaskClosure.objects.filter(
+                ancestor_id__in=task_gids
+            ).values('ancestor_id').annotate(
+                num_subtasks=Count('descendant', filter=Q(depth=1)),
+                num_descendants=Count('descendant'),
+            )
+        }
+
+    @transaction.atomic
+    def set_task_parent(self, task_gid: str, parent_gid: Optional[str]) -> Task:
+        """
+        Move a task, with its subtasks, under ``parent_gid`` (or to the top
+        level when None). Both rows are locked in pk order so two moves
+        that would form a cycle together are serialised and the second one
+        sees the first in the closure.
+        """
+        locked = {
+            task.pk: task
+            for task in Task.objects.select_for_update().filter(
+                gid__in=[gid for gid in (task_gid, parent_gid) if gid]
+            ).order_by('gid')
+        }
+        task = locked.get(Task._meta.pk.to_python(task_gid))
+        parent = locked.get(Task._meta.pk.to_python(parent_gid)) if parent_gid else None
+        if task is None or (parent_gid and parent is None):
+            raise TaskDoesNotExistException()
+
+        if parent is not None:
+            if parent.pk == task.pk:
+                raise ValidationError(
+                    'parent: Cannot set a task as its own parent'
+                )
+            if parent.workspace_id != task.workspace_id:
+                raise ValidationError(
+                    'parent: Parent task must be in the same workspace'
+                )
+            if self.is_subtask_of(parent.pk, task.pk):
+                raise ValidationError(
+                    'parent: Cannot create circular reference in task hierarchy'
+                )
+
+        old_parent_id = task.parent_id
+        new_parent_id = parent.pk if parent else None
+        if old_parent_id == new_parent_id:
+            return task
+
+        task.parent = parent
+        task.save(update_fields=['parent', 'updated_at'])
+        if old_parent_id:
+            Task.objects.filter(pk=old_parent_id).update(
+                num_subtasks=F('num_subtasks') - 1
+            )
+        if new_parent_id:
+            Task.objects.filter(pk=new_parent_id).update(
+                num_subtasks=F('num_subtasks') + 1
+            )
+        invalidate([('task', old_parent_id), ('task', new_parent_id)])
+        return task
+
+    def get_tasks_by_gids(self, task_gids: List[Any]) -> List[Task]:
+        """``task_gids`` as tasks, in the same order, with one query."""
+        return load_many(Task, task_gids)
+
+    def get_upstream_dependency_graph(self, task_gid: str) -> DependencyGraph:
+        """Every dependency edge leading into the task, however indirect."""
+        graph = DependencyGraph(load_upstream_edges(task_gid))
+        graph.add_node(Task._meta.pk.to_python(task_gid))
+        return graph
+
+    def get_downstream_dependency_graph(self, task_gid: str) -> DependencyGraph:
+        """Every dependency edge leading out of the task, however indirect."""
+        graph = DependencyGraph(load_downstream_edges(task_gid))
+        graph.add_node(Task._meta.pk.to_python(task_gid))
+        return graph
+
+    def get_project_dependency_graph(self, project_gid: str) -> DependencyGraph:
+        """The dependency edges touching the project's tasks."""
+        try:
+            project = load(Project, project_gid)
+        except Project.DoesNotExist:
+            raise ProjectDoesNotExistException()
+        return DependencyGraph(load_project_edges(project.pk))
 
     def get_task_dependencies(self, task_gid: str) -> List[Task]:
         """Get tasks that this task depends on (predecessors)."""
-        task = Task.objects.get(gid=task_gid)
+        task = load(Task, task_gid)
         dependencies = TaskDependency.objects.filter(successor=task).select_related('predecessor')
         return [dep.predecessor for dep in dependencies]
 
     @transaction.atomic
     def set_task_dependencies(self, task_gid: str, dependency_gids: List[str]) -> Task:
         """Set dependencies for a task (tasks that must complete before this task)."""
-        task = Task.objects.get(gid=task_gid)
-        
-        # Remove existing dependencies
-        TaskDependency.objects.filter(successor=task).delete()
-        
-        # Add new dependencies
-        for dep_gid in dependency_gids:
-            dependency_task = Task.objects.get(gid=dep_gid)
-            TaskDependency.objects.create(
-                predecessor=dependency_task,
-                successor=task
-            )
+        task = load(Task, task_gid)
+        dependency_tasks = load_many(Task, dependency_gids)
+        self._validate_dependency_tasks(task, dependency_tasks)
+        self._lock_dependency_graph(task.workspace_id)
+        self._reject_cycles(
+            DependencyGraph(load_downstream_edges(task.pk)),
+            predecessors=[dependency.pk for dependency in dependency_tasks],
+            successors=[task.pk]
+        )
+
+        self._replace_dependencies(
+            TaskDependency.objects.filter(successor=task),
+            linked_field='predecessor_id',
+            desired_ids={dependency.pk for dependency in dependency_tasks},
+            build=lambda pk: TaskDependency(predecessor_id=pk, successor=task)
+        )
         
         return task
 
     @transaction.atomic
     def remove_task_dependencies(self, task_gid: str, dependency_gids: List[str]) -> Task:
         """Remove specific dependencies from a task."""
-        task = Task.objects.get(gid=task_gid)
+        task = load(Task, task_gid)
         TaskDependency.objects.filter(
             successor=task,
             predecessor__gid__in=dependency_gids
@@ -251,35 +722,224 @@ class StorageImplementation(StorageInterface):
 
     def get_task_dependents(self, task_gid: str) -> List[Task]:
         """Get tasks that depend on this task (successors)."""
-        task = Task.objects.get(gid=task_gid)
+        task = load(Task, task_gid)
         dependents = TaskDependency.objects.filter(predecessor=task).select_related('successor')
         return [dep.successor for dep in dependents]
 
     @transaction.atomic
     def set_task_dependents(self, task_gid: str, dependent_gids: List[str]) -> Task:
         """Set dependents for a task (tasks that depend on this task)."""
-        task = Task.objects.get(gid=task_gid)
-        
-        # Remove existing dependents
-        TaskDependency.objects.filter(predecessor=task).delete()
-        
-        # Add new dependents
-        for dep_gid in dependent_gids:
-            dependent_task = Task.objects.get(gid=dep_gid)
-            TaskDependency.objects.create(
-                predecessor=task,
-                successor=dependent_task
-            )
+        task = load(Task, task_gid)
+        dependent_tasks = load_many(Task, dependent_gids)
+        self._validate_dependency_tasks(task, dependent_tasks)
+        self._lock_dependency_graph(task.workspace_id)
+        self._reject_cycles(
+            DependencyGraph(load_upstream_edges(task.pk)),
+            predecessors=[task.pk],
+            successors=[dependent.pk for dependent in dependent_tasks]
+        )
+
+        self._replace_dependencies(
+            TaskDependency.objects.filter(predecessor=task),
+            linked_field='successor_id',
+            desired_ids={dependent.pk for dependent in dependent_tasks},
+            build=lambda pk: TaskDependency(predecessor=task, successor_id=pk)
+        )
         
         return task
 
     @transaction.atomic
     def remove_task_dependents(self, task_gid: str, dependent_gids: List[str]) -> Task:
         """Remove specific dependents from a task."""
-        task = Task.objects.get(gid=task_gid)
+        task = load(Task, task_gid)
         TaskDependency.objects.filter(
             predecessor=task,
             successor__gid__in=dependent_gids
         ).delete()
         return task
 
+    def _validate_dependency_tasks(
+        self,
+        task: Task,
+        linked_tasks: List[Task]
+    ) -> None:
+        """
+        TaskDependency.clean() for a whole set of links at once: bulk_create
+        does not call save(), so the checks run here instead.
+        """
+        for linked_task in linked_tasks:
+            if linked_task.pk == task.pk:
+                raise ValidationError('A task cannot depend on itself.')
+            if linked_task.workspace_id != task.workspace_id:
+                raise ValidationError(
+                    'Both tasks must belong to the same workspace'
+                )
+
+    @transaction.atomic
+    def rebalance_task_ranks(
+        self,
+        project_gid: str,
+        section_gid: Optional[str] = None
+    ) -> int:
+        """
+        Respace the ranks of a project section (or of the project's tasks
+        outside any section) evenly, keeping their order. Returns how many
+        links were rewritten.
+        """
+        links = list(
+            TaskProject.objects.select_for_update()
+            .filter(project_id=project_gid, section_id=section_gid)
+            .order_by('rank', 'gid')
+            .only('gid', 'rank')
+        )
+        for link, rank in zip(links, spaced_ranks(len(links))):
+            link.rank = rank
+        TaskProject.objects.bulk_update(
+            links, ['rank'], batch_size=DUPLICATE_BATCH_SIZE
+        )
+        return len(links)
+
+    def _get_anchor_link(
+        self,
+        project: Project,
+        task_gid: str,
+        field: str
+    ) -> TaskProject:
+        # Locked so two moves next to the same task cannot pick one rank
+        anchor = TaskProject.objects.select_for_update().filter(
+            project=project,
+            task_id=task_gid
+        ).first()
+        if anchor is None:
+            raise ValidationError(f'{field}: Task is not in the project')
+        return anchor
+
+    def _rank_for(
+        self,
+        link: TaskProject,
+        anchor: Optional[TaskProject],
+        before: bool
+    ) -> str:
+        """
+        A rank placing ``link`` before or after ``anchor``, or at the end of
+        its section without one. Reads one neighbour through the
+        (project, section, rank) index; only when the gap has run out is
+        the section rebalanced on the spot.
+        """
+        siblings = TaskProject.objects.filter(
+            project_id=link.project_id,
+            section_id=link.section_id
+        ).exclude(pk=link.pk)
+        while True:
+            if anchor is None:
+                bounds = (
+                    siblings.order_by('-rank').values_list('rank', flat=True).first(),
+                    None
+                )
+            elif before:
+                bounds = (
+                    siblings.filter(rank__lt=anchor.rank).order_by('-rank')
+                    .values_list('rank', flat=True).first(),
+                    anchor.rank
+                )
+            else:
+                bounds = (
+                    anchor.rank,
+                    siblings.filter(rank__gt=anchor.rank).order_by('rank')
+                    .values_list('rank', flat=True).first()
+                )
+            rank = rank_between(*bounds)
+            if len(rank) <= TASK_RANK_MAX_LENGTH:
+                return rank
+            self.rebalance_task_ranks(link.project_id, link.section_id)
+            if anchor is not None:
+                anchor.refresh_from_db(fields=['rank'])
+
+    def _lock_dependency_graph(self, workspace_id: Any) -> None:
+        """
+        Serialise dependency writes within a workspace. Two writers each
+        checking the graph before the other commits could otherwise close
+        a cycle between them; the workspace row lock makes the second one
+        wait and then see the first one's edges.
+        """
+        list(
+            Workspace.objects.select_for_update()
+            .filter(pk=workspace_id)
+            .values_list('pk', flat=True)
+        )
+
+    def _reject_cycles(
+        self,
+        graph: DependencyGraph,
+        predecessors: List[Any],
+        successors: List[Any]
+    ) -> None:
+        cycle = graph.find_cycle(predecessors, successors)
+        if cycle:
+            # The new edge closes the path back to where it started
+            cycle = [str(pk) for pk in cycle + cycle[:1]]
+            raise DependencyCycleException(
+                f"Dependency would create a cycle: {' -> '.join(cycle)}",
+                cycle=cycle
+            )
+
+    def _replace_dependencies(
+        self,
+        existing_links,
+        linked_field: str,
+        desired_ids: set,
+        build
+    ) -> None:
+        """
+        Make ``existing_links`` point at exactly ``desired_ids``: delete the
+        links that are no longer wanted and bulk insert the missing ones.
+        Links that stay keep their rows.
+        """
+        existing_ids = set(existing_links.values_list(linked_field, flat=True))
+
+        stale_ids = existing_ids - desired_ids
+        if stale_ids:
+            existing_links.filter(**{f'{linked_field}__in': stale_ids}).delete()
+
+        new_ids = desired_ids - existing_ids
+        if new_ids:
+            TaskDependency.objects.bulk_create(
+                [build(pk) for pk in new_ids],
+                ignore_conflicts=True
+            )
+
+    def _copy_task_fields(
+        self,
+        original: Task,
+        include: List[str],
+        name: str
+    ) -> Task:
+        copy = Task(
+            name=name,
+            resource_subtype=original.resource_subtype,
+            workspace_id=original.workspace_id,
+            assignee_status=original.assignee_status,
+            num_subtasks=original.num_subtasks if 'subtasks' in include else 0,
+            created_by_id=original.created_by_id
+        )
+        for option in include:
+            for field in DUPLICATE_TASK_FIELDS.get(option, ()):
+                setattr(copy, field, getattr(original, field))
+        return copy
+
+
+def _chunked(items: List[Any], size: int = DUPLICATE_BATCH_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _parents_first(tasks: List[Task]) -> List[Task]:
+    """Order ``tasks`` so each one follows its parent when that is listed too."""
+    pending = {task.pk: task for task in tasks}
+    ordered = []
+    while pending:
+        ready = [task for task in pending.values() if task.parent_id not in pending]
+        for task in ready:
+            del pending[task.pk]
+        ordered.extend(ready)
+    return ordered
@@ -1,6 +1,7 @@
+from django.conf import settings
 from django.urls import path
-from asana_tasks.views.get_task.get_task_view import GetTaskView
-from asana_tasks.views.get_tasks.get_tasks_view import GetTasksView
+from asana_tasks.views.get_task import GetTaskView, GetTaskAsyncView
+from asana_tasks.views.get_tasks import GetTasksView, GetTasksAsyncView
 from asana_tasks.views.create_task.create_task_view import CreateTaskView
 from asana_tasks.views.update_task.update_task_view import UpdateTaskView
 from asana_tasks.views.delete_task.delete_task_view import DeleteTaskView
@@ -21,13 +22,23 @@ from asana_tasks.views.remove_task_dependencies.remove_task_dependencies_view im
 from asana_tasks.views.get_task_dependents.get_task_dependents_view import GetTaskDependentsView
 from asana_tasks.views.set_task_dependents.set_task_dependents_view import SetTaskDependentsView
 from asana_tasks.views.remove_task_dependents.remove_task_dependents_view import RemoveTaskDependentsView
+from asana_tasks.views.get_task_upstream.get_task_upstream_view import GetTaskUpstreamView
+from asana_tasks.views.get_task_downstream.get_task_downstream_view import GetTaskDownstreamView
+from asana_tasks.views.get_project_critical_path.get_project_critical_path_view import GetProjectCriticalPathView
+from asana_tasks.views.get_tasks_for_section_view.get_tasks_for_section_view import GetTasksForSectionView
 
 app_name = 'asana_tasks'
 
+# ASGI deployments serve these reads with async views
+if getattr(settings, 'ASANA_ASYNC_VIEWS', False):
+    tasks_view, task_detail_view = GetTasksAsyncView, GetTaskAsyncView
+else:
+    tasks_view, task_detail_view = GetTasksView, GetTaskView
+
 urlpatterns = [
     # Basic CRUD operations
-    path('tasks/', GetTasksView.as_view(), name='tasks'),
-    path('tasks/<str:task_gid>/', GetTaskView.as_view(), name='task_detail'),
+    path('tasks/', tasks_view.as_view(), name='tasks'),
+    path('tasks/<str:task_gid>/', task_detail_view.as_view(), name='task_detail'),
     
     # Subtasks (from /tasks/{task_gid}/subtasks in api_spec.txt)
     path('tasks/<str:task_gid>/subtasks/', GetSubtasksView.as_view(), name='get_subtasks'),
@@ -57,6 +68,14 @@ urlpatterns = [
     path('tasks/<str:task_gid>/dependents/', SetTaskDependentsView.as_view(), name='set_task_dependents'),
     path('tasks/<str:task_gid>/dependents/remove/', RemoveTaskDependentsView.as_view(), name='remove_task_dependents'),
     
+    # Transitive dependency graph
+    path('tasks/<str:task_gid>/dependencies/upstream/', GetTaskUpstreamView.as_view(), name='get_task_upstream'),
+    path('tasks/<str:task_gid>/dependents/downstream/', GetTaskDownstreamView.as_view(), name='get_task_downstream'),
+    path('projects/<str:project_gid>/critical_path/', GetProjectCriticalPathView.as_view(), name='get_project_critical_path'),
+    
+    # Section board column, in rank order
+    path('sections/<str:section_gid>/tasks/', GetTasksForSectionView.as_view(), name='get_tasks_for_section'),
+    
     # Search tasks (from /workspaces/{workspace_gid}/tasks/search in api_spec.txt)
     path('workspaces/<str:workspace_gid>/tasks/search/', SearchTasksView.as_view(), name='search_tasks'),
 ]
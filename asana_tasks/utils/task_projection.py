@@ -0,0 +1,103 @@
+"""
+opt_fields projection spec for tasks.
+"""
+from asana_backend.utils.field_projection import (
+    ProjectionSpec,
+    RelatedResource,
+    RelatedResourceList,
+)
+from asana_tasks.models.task_project import TaskProject
+from asana_tasks.models.task_tag import TaskTag
+from asana_tasks.models.task_follower import TaskFollower
+
+
+USER_FIELDS = {'name': 'name', 'email': 'email'}
+
+TASK_PROJECTION_SPEC = ProjectionSpec(
+    resource_type='task',
+    fields={
+        'name': 'name',
+        'resource_subtype': 'resource_subtype',
+        'assignee_status': 'assignee_status',
+        'completed': 'completed',
+        'completed_at': 'completed_at',
+        'due_on': 'due_on',
+        'due_at': 'due_at',
+        'start_on': 'start_on',
+        'start_at': 'start_at',
+        'notes': 'notes',
+        'html_notes': 'html_notes',
+        'num_hearts': 'num_hearts',
+        'num_likes': 'num_likes',
+        'num_subtasks': 'num_subtasks',
+        'created_at': 'created_at',
+        'modified_at': 'updated_at',
+    },
+    relations=[
+        RelatedResource('workspace', 'workspace', {'name': 'name'}),
+        RelatedResource('assignee', 'user', USER_FIELDS),
+        RelatedResource('created_by', 'user', USER_FIELDS),
+        RelatedResource(
+            'parent',
+            'task',
+            {'name': 'name', 'resource_subtype': 'resource_subtype'}
+        ),
+        RelatedResourceList(
+            'projects',
+            'project',
+            {'name': 'name'},
+            link_accessor='taskproject_set',
+            link_model=TaskProject,
+            root_field='task',
+            target_field='project'
+        ),
+        RelatedResourceList(
+            'tags',
+            'tag',
+            {'name': 'name', 'color': 'color'},
+            link_accessor='tasktag_set',
+            link_model=TaskTag,
+            root_field='task',
+            target_field='tag'
+        ),
+        RelatedResourceList(
+            'followers',
+            'user',
+            USER_FIELDS,
+            link_accessor='taskfollower_set',
+            link_model=TaskFollower,
+            root_field='task',
+            target_field='user'
+        ),
+    ],
+    compact=('resource_type', 'name', 'resource_subtype')
+)
+
+# TaskCompact schema returned by list endpoints
+TASK_COMPACT_FIELDS = ('resource_type', 'name', 'resource_subtype')
+
+# TaskResponse schema returned by GET /tasks/{task_gid}
+TASK_FULL_FIELDS = (
+    'resource_type',
+    'name',
+    'resource_subtype',
+    'workspace',
+    'assignee',
+    'assignee_status',
+    'completed',
+    'completed_at',
+    'due_on',
+    'due_at',
+    'start_on',
+    'start_at',
+    'notes',
+    'html_notes',
+    'num_hearts',
+    'num_likes',
+    'created_at',
+    'modified_at',
+    'created_by',
+    'projects',
+    'tags',
+    'followers',
+)
@@ -12,6 +12,7 @@ from asana_tasks.presenters.get_task_presenter_implementation import (
     GetTaskPresenterImplementation
 )
 from asana_tasks.serializers import TaskProjectSerializer
+from asana_jobs.app_interfaces.service_interface import ServiceInterface
 from asana_backend.utils.validators import validate_uuid
 from asana_backend.utils.decorators.ratelimit import ratelimit
 
@@ -47,7 +48,13 @@ class AddProjectToTaskView(APIView):
             404: OpenApiResponse(description="Task or Project not found")
         },
         summary="Add project to task",
-        description="Associates a task with a project. A task can belong to multiple projects.",
+        description=(
+            "Associates a task with a project. A task can belong to multiple "
+            "projects. The task is placed right before insert_before or after "
+            "insert_after, or at the end of section; at most one of the three "
+            "may be given. Calling this for a task already in the project "
+            "moves it."
+        ),
         tags=["Tasks - Relationships"]
     )
     @ratelimit(key='ip', rate='5/s', method='POST')
@@ -71,13 +78,18 @@ class AddProjectToTaskView(APIView):
         presenter = GetTaskPresenterImplementation()
         interactor = AddProjectToTaskInteractor(
             storage=storage,
-            presenter=presenter
+            presenter=presenter,
+            jobs_service=ServiceInterface()
         )
 
         try:
+            data = serializer.validated_data
             response = interactor.add_project_to_task(
                 task_gid,
-                str(serializer.validated_data['project_gid'])
+                str(data['project_gid']),
+                section_gid=_optional_gid(data.get('section')),
+                insert_before=_optional_gid(data.get('insert_before')),
+                insert_after=_optional_gid(data.get('insert_after'))
             )
             return Response(response, status=status.HTTP_200_OK)
         except Exception as e:
@@ -85,3 +97,7 @@ class AddProjectToTaskView(APIView):
                 {'errors': [{'message': str(e)}]},
                 status=status.HTTP_400_BAD_REQUEST
             )
+
+
+def _optional_gid(value):
+    return str(value) if value else None
@@ -2,6 +2,8 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse, OpenApiExample
+from django.db import transaction
+from django.db.models import F
 from asana_tasks.models.task import Task
 from asana_backend.utils.validators import validate_uuid
 from asana_backend.utils.decorators.ratelimit import ratelimit
@@ -144,17 +146,19 @@ class CreateSubtaskView(APIView):
         
         # Create subtask
         try:
-            subtask = Task.objects.create(
-                name=name,
-                workspace=parent_task.workspace,
-                parent=parent_task,
-                notes=data.get('notes', ''),
-                resource_subtype=data.get('resource_subtype', 'default_task'),
-            )
-            
-            # Update parent's num_subtasks
-            parent_task.num_subtasks = Task.objects.filter(parent=parent_task).count()
-            parent_task.save()
+            with transaction.atomic():
+                subtask = Task.objects.create(
+                    name=name,
+                    workspace=parent_task.workspace,
+                    parent=parent_task,
+                    notes=data.get('notes', ''),
+                    resource_subtype=data.get('resource_subtype', 'default_task'),
+                )
+                
+                # Update parent's num_subtasks
+                Task.objects.filter(pk=parent_task.pk).update(
+                    num_subtasks=F('num_subtasks') + 1
+                )
             
         except Exception as e:
             return Response(
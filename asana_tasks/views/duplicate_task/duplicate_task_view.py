@@ -6,9 +6,11 @@ from asana_tasks.storages.storage_implementation import StorageImplementation
 from asana_tasks.presenters.get_task_presenter_implementation import GetTaskPresenterImplementation
 from asana_tasks.interactors.duplicate_task_interactor import DuplicateTaskInteractor
 from asana_tasks.exceptions.custom_exceptions import TaskDoesNotExistException
+from asana_jobs.app_interfaces.service_interface import ServiceInterface
 from asana_backend.utils.validators import validate_uuid
 from asana_backend.utils.decorators.ratelimit import ratelimit
-from asana_tasks.serializers import TaskSingleResponseSerializer, ErrorResponseSerializer
+from asana_tasks.serializers import ErrorResponseSerializer
+from asana_jobs.serializers import GetJobResponseSerializer
 from asana_backend.utils.error_messages import invalid_gid_error, not_found_error
 
 
@@ -44,8 +46,8 @@ class DuplicateTaskView(APIView):
         },
         responses={
             201: OpenApiResponse(
-                response=TaskSingleResponseSerializer,
-                description="Task duplicated successfully."
+                response=GetJobResponseSerializer,
+                description="Job created to handle duplication."
             ),
             400: OpenApiResponse(
                 response=ErrorResponseSerializer,
@@ -57,7 +59,7 @@ class DuplicateTaskView(APIView):
             ),
         },
         summary="Duplicate a task",
-        description="Creates a copy of an existing task with a new name.",
+        description="Creates and returns a job that will asynchronously handle the duplication.",
         tags=["Tasks"]
     )
     def post(self, request, task_gid: str):
@@ -73,13 +75,16 @@ class DuplicateTaskView(APIView):
         presenter = GetTaskPresenterImplementation()
         interactor = DuplicateTaskInteractor(
             storage=storage,
-            presenter=presenter
+            presenter=presenter,
+            jobs_service=ServiceInterface()
         )
 
         # Get request data
         data = request.data.get('data', request.data)
         name = data.get('name')
         include = data.get('include', [])
+        if isinstance(include, str):
+            include = [option.strip() for option in include.split(',') if option.strip()]
 
         try:
             response = interactor.duplicate_task(
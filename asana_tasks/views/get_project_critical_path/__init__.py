@@ -0,0 +1 @@
+from .get_project_critical_path_view import GetProjectCriticalPathView
@@ -0,0 +1,84 @@
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
+from asana_tasks.interactors.task_dependency_graph_interactor import (
+    TaskDependencyGraphInteractor
+)
+from asana_tasks.storages.storage_implementation import StorageImplementation
+from asana_tasks.presenters.get_tasks_presenter_implementation import GetTasksPresenterImplementation
+from asana_tasks.exceptions.custom_exceptions import (
+    ProjectDoesNotExistException,
+    DependencyCycleException,
+)
+from asana_backend.utils.validators import validate_uuid
+from asana_backend.utils.decorators.ratelimit import ratelimit
+from asana_tasks.serializers import CriticalPathResponseSerializer, ErrorResponseSerializer
+from asana_backend.utils.error_messages import (
+    invalid_gid_error,
+    not_found_error,
+    conflict_error,
+)
+
+
+class GetProjectCriticalPathView(APIView):
+    @ratelimit(key='ip', rate='5/s', method='GET')
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name='project_gid',
+                type=str,
+                location=OpenApiParameter.PATH,
+                description='Globally unique identifier for the project.',
+                required=True
+            ),
+        ],
+        responses={
+            200: OpenApiResponse(
+                response=CriticalPathResponseSerializer,
+                description="The critical path of the project."
+            ),
+            400: OpenApiResponse(
+                response=ErrorResponseSerializer,
+                description="Bad Request - Invalid project GID format."
+            ),
+            404: OpenApiResponse(
+                response=ErrorResponseSerializer,
+                description="Not Found - Project does not exist."
+            ),
+            409: OpenApiResponse(
+                response=ErrorResponseSerializer,
+                description="Conflict - The dependencies contain a cycle."
+            ),
+        },
+        summary="Get the critical path of a project",
+        description="Returns the chain of dependent tasks touching the project with the most remaining calendar days. A task counts for the days from start_on to due_on inclusive, one day without both dates, and none once completed.",
+        tags=["Tasks"]
+    )
+    def get(self, request, project_gid: str):
+        try:
+            validate_uuid(project_gid)
+        except Exception:
+            return Response(
+                invalid_gid_error("project_gid"),
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        interactor = TaskDependencyGraphInteractor(
+            storage=StorageImplementation(),
+            presenter=GetTasksPresenterImplementation()
+        )
+
+        try:
+            response = interactor.get_critical_path(project_gid)
+            return Response(response, status=status.HTTP_200_OK)
+        except ProjectDoesNotExistException:
+            return Response(
+                not_found_error("project", project_gid),
+                status=status.HTTP_404_NOT_FOUND
+            )
+        except DependencyCycleException as e:
+            return Response(
+                conflict_error(str(e)),
+                status=status.HTTP_409_CONFLICT
+            )
@@ -1,4 +1,4 @@
 from .get_task_view import GetTaskView
+from .get_task_async_view import GetTaskAsyncView
 
-__all__ = ['GetTaskView']
-
+__all__ = ['GetTaskView', 'GetTaskAsyncView']
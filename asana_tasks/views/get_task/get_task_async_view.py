@@ -0,0 +1,61 @@
+from rest_framework import status
+from asana_tasks.interactors.get_task_interactor import (
+    GetTaskInteractor
+)
+from asana_tasks.storages.storage_implementation import (
+    StorageImplementation
+)
+from asana_tasks.presenters.get_task_presenter_implementation import (
+    GetTaskPresenterImplementation
+)
+from asana_tasks.exceptions.custom_exceptions import (
+    TaskDoesNotExistException
+)
+from asana_backend.utils.validators import validate_uuid
+from asana_backend.utils.decorators.ratelimit import ratelimit
+from asana_backend.utils.async_views import AsyncAPIView, run_in_thread
+from asana_backend.utils.object_cache import CachedObject
+
+
+class GetTaskAsyncView(AsyncAPIView):
+    """
+    GetTaskView for ASGI workers: the task's projects, tags and followers
+    are loaded concurrently.
+    """
+    @ratelimit(key='ip', rate='5/s', method='GET')
+    async def get(self, request, task_gid: str):
+        try:
+            validate_uuid(task_gid)
+        except Exception:
+            return self.render(
+                request,
+                {'errors': [{'message': 'Invalid task GID format'}]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        storage = StorageImplementation()
+        presenter = GetTaskPresenterImplementation()
+        interactor = GetTaskInteractor(
+            storage=storage,
+            presenter=presenter
+        )
+
+        opt_fields = request.GET.get('opt_fields')
+
+        cached_task = CachedObject('task', task_gid, opt_fields)
+        try:
+            response = await run_in_thread(cached_task.get)
+            if response is None:
+                response = await interactor.aget_task(task_gid, opt_fields=opt_fields)
+                await run_in_thread(cached_task.set, response)
+        except TaskDoesNotExistException as e:
+            return self.render(
+                request,
+                {'errors': [{'message': str(e)}]},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        validators = cached_task.validators()
+        return validators.check(request) or validators.apply(
+            self.render(request, response, status=status.HTTP_200_OK)
+        )
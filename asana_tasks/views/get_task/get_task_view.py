@@ -16,6 +16,7 @@ from asana_tasks.exceptions.custom_exceptions import (
 )
 from asana_backend.utils.validators import validate_uuid
 from asana_backend.utils.decorators.ratelimit import ratelimit
+from asana_backend.utils.object_cache import CachedObject
 
 
 class GetTaskView(APIView):
@@ -33,6 +34,13 @@ class GetTaskView(APIView):
                         value='123e4567-e89b-12d3-a456-426614174000'
                     )
                 ]
+            ),
+            OpenApiParameter(
+                name='opt_fields',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='Comma-separated list of properties to include. Supports dotted paths into nested resources, e.g. assignee.name,projects.name.',
+                required=False
             )
         ],
         responses={
@@ -114,11 +122,20 @@ class GetTaskView(APIView):
             presenter=presenter
         )
 
+        opt_fields = request.query_params.get('opt_fields')
+
+        cached_task = CachedObject('task', task_gid, opt_fields)
         try:
-            response = interactor.get_task(task_gid)
-            return Response(response, status=status.HTTP_200_OK)
+            response = cached_task.get_or_build(
+                lambda: interactor.get_task(task_gid, opt_fields=opt_fields)
+            )
         except TaskDoesNotExistException as e:
             return Response(
                 {'errors': [{'message': str(e)}]},
                 status=status.HTTP_404_NOT_FOUND
             )
+
+        validators = cached_task.validators()
+        return validators.check(request) or validators.apply(
+            Response(response, status=status.HTTP_200_OK)
+        )
@@ -0,0 +1 @@
+from .get_task_downstream_view import GetTaskDownstreamView
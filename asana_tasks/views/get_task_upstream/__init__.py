@@ -0,0 +1 @@
+from .get_task_upstream_view import GetTaskUpstreamView
@@ -0,0 +1,84 @@
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
+from asana_tasks.interactors.task_dependency_graph_interactor import (
+    TaskDependencyGraphInteractor
+)
+from asana_tasks.storages.storage_implementation import StorageImplementation
+from asana_tasks.presenters.get_tasks_presenter_implementation import GetTasksPresenterImplementation
+from asana_tasks.exceptions.custom_exceptions import (
+    TaskDoesNotExistException,
+    DependencyCycleException,
+)
+from asana_backend.utils.validators import validate_uuid
+from asana_backend.utils.decorators.ratelimit import ratelimit
+from asana_tasks.serializers import DependencyGraphResponseSerializer, ErrorResponseSerializer
+from asana_backend.utils.error_messages import (
+    invalid_gid_error,
+    not_found_error,
+    conflict_error,
+)
+
+
+class GetTaskUpstreamView(APIView):
+    @ratelimit(key='ip', rate='5/s', method='GET')
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name='task_gid',
+                type=str,
+                location=OpenApiParameter.PATH,
+                description='Globally unique identifier for the task.',
+                required=True
+            ),
+        ],
+        responses={
+            200: OpenApiResponse(
+                response=DependencyGraphResponseSerializer,
+                description="Tasks this task transitively depends on."
+            ),
+            400: OpenApiResponse(
+                response=ErrorResponseSerializer,
+                description="Bad Request - Invalid task GID format."
+            ),
+            404: OpenApiResponse(
+                response=ErrorResponseSerializer,
+                description="Not Found - Task does not exist."
+            ),
+            409: OpenApiResponse(
+                response=ErrorResponseSerializer,
+                description="Conflict - The dependencies contain a cycle."
+            ),
+        },
+        summary="Get upstream dependencies of a task",
+        description="Returns every task this task depends on, directly or through other tasks, ordered so each task comes after the tasks it depends on. Each task lists its direct dependents among the returned tasks and this one.",
+        tags=["Tasks"]
+    )
+    def get(self, request, task_gid: str):
+        try:
+            validate_uuid(task_gid)
+        except Exception:
+            return Response(
+                invalid_gid_error("task_gid"),
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        interactor = TaskDependencyGraphInteractor(
+            storage=StorageImplementation(),
+            presenter=GetTasksPresenterImplementation()
+        )
+
+        try:
+            response = interactor.get_upstream(task_gid)
+            return Response(response, status=status.HTTP_200_OK)
+        except TaskDoesNotExistException:
+            return Response(
+                not_found_error("task", task_gid),
+                status=status.HTTP_404_NOT_FOUND
+            )
+        except DependencyCycleException as e:
+            return Response(
+                conflict_error(str(e)),
+                status=status.HTTP_409_CONFLICT
+            )
@@ -1,4 +1,4 @@
 from .get_tasks_view import GetTasksView
+from .get_tasks_async_view import GetTasksAsyncView
 
-__all__ = ['GetTasksView']
-
+__all__ = ['GetTasksView', 'GetTasksAsyncView']
@@ -0,0 +1,90 @@
+from rest_framework import status
+from asana_tasks.interactors.get_tasks_interactor import (
+    GetTasksInteractor
+)
+from asana_tasks.storages.storage_implementation import (
+    StorageImplementation
+)
+from asana_tasks.presenters.get_tasks_presenter_implementation import (
+    GetTasksPresenterImplementation
+)
+from asana_tasks.constants.constants import MAX_LIMIT
+from asana_backend.utils.validators import validate_pagination_params
+from asana_backend.utils.streaming import (
+    get_max_limit,
+    StreamingListResponse
+)
+from asana_backend.utils.decorators.ratelimit import ratelimit
+from asana_backend.utils.conditional import Validators, list_validators
+from asana_backend.utils.async_views import AsyncAPIView, run_in_thread
+from .get_tasks_view import GetTasksView
+
+
+class GetTasksAsyncView(AsyncAPIView):
+    """
+    GetTasksView for ASGI workers: the worker serves other requests while
+    the page is read. Creating tasks (POST) goes to GetTasksView.
+    """
+    sync_view = GetTasksView
+
+    @ratelimit(key='ip', rate='5/s', method='GET')
+    async def get(self, request):
+        try:
+            # offset is either an offset token from next_page or a
+            # legacy integer offset
+            offset, limit = validate_pagination_params(
+                offset=request.GET.get('offset'),
+                limit=request.GET.get('limit'),
+                max_limit=get_max_limit(request, MAX_LIMIT)
+            )
+        except Exception as e:
+            return self.render(
+                request,
+                {'errors': [{'message': str(e)}]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # Pages above MAX_LIMIT are only open to bulk clients and are
+        # written out as they are read
+        stream = limit > MAX_LIMIT
+
+        storage = StorageImplementation()
+        presenter = GetTasksPresenterImplementation()
+        interactor = GetTasksInteractor(
+            storage=storage,
+            presenter=presenter
+        )
+
+        filters = {
+            'workspace': request.GET.get('workspace'),
+            'assignee': request.GET.get('assignee'),
+            'project': request.GET.get('project'),
+            'section': request.GET.get('section'),
+            'completed_since': request.GET.get('completed_since'),
+            'modified_since': request.GET.get('modified_since'),
+            'opt_fields': request.GET.get('opt_fields'),
+        }
+        version = await run_in_thread(interactor.get_tasks_version, **filters)
+        validators = (
+            list_validators(request, *version.values())
+            if version is not None else Validators()
+        )
+        not_modified = validators.check(request)
+        if not_modified is not None:
+            return not_modified
+
+        response = await run_in_thread(
+            interactor.get_tasks,
+            **filters,
+            offset=offset,
+            limit=limit,
+            request=request,
+            stream=stream
+        )
+        if stream:
+            return validators.apply(
+                StreamingListResponse(response, asynchronous=True)
+            )
+        return validators.apply(
+            self.render(request, response, status=status.HTTP_200_OK)
+        )
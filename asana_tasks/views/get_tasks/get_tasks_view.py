@@ -34,7 +34,12 @@ from asana_tasks.constants.constants import (
     MAX_LIMIT,
 )
 from asana_backend.utils.validators import validate_pagination_params
+from asana_backend.utils.streaming import (
+    get_max_limit,
+    StreamingListResponse
+)
 from asana_backend.utils.decorators.ratelimit import ratelimit
+from asana_backend.utils.conditional import Validators, list_validators
 
 
 class GetTasksView(APIView):
@@ -44,7 +49,7 @@ class GetTasksView(APIView):
                 name='limit',
                 type=int,
                 location=OpenApiParameter.QUERY,
-                description='Results per page. The number of objects to return per page. The value must be between 1 and 100.',
+                description='Results per page. The number of objects to return per page. The value must be between 1 and 100; trusted bulk clients may ask for more.',
                 required=False
             ),
             OpenApiParameter(
@@ -115,21 +120,12 @@ class GetTasksView(APIView):
     @ratelimit(key='ip', rate='5/s', method='GET')
     def get(self, request):
         try:
-            # Handle offset - can be int or string token
-            offset_param = request.query_params.get('offset', '0')
-            try:
-                offset = int(offset_param)
-            except ValueError:
-                # If it's a token, treat as 0 for now (token-based pagination not fully implemented)
-                offset = 0
-            
-            limit_param = request.query_params.get('limit')
-            limit = int(limit_param) if limit_param else DEFAULT_LIMIT
-            
+            # offset is either an offset token from next_page or a
+            # legacy integer offset
             offset, limit = validate_pagination_params(
-                offset=offset,
-                limit=limit,
-                max_limit=MAX_LIMIT
+                offset=request.query_params.get('offset'),
+                limit=request.query_params.get('limit'),
+                max_limit=get_max_limit(request, MAX_LIMIT)
             )
         except Exception as e:
             return Response(
@@ -137,6 +133,10 @@ class GetTasksView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        # Pages above MAX_LIMIT are only open to bulk clients and are
+        # written out as they are read
+        stream = limit > MAX_LIMIT
+
         # Extract parameters matching API spec names
         workspace = request.query_params.get('workspace')
         assignee = request.query_params.get('assignee')
@@ -153,6 +153,25 @@ class GetTasksView(APIView):
             presenter=presenter
         )
 
+        # Polling clients holding the current page get a 304 after one
+        # aggregate query
+        version = interactor.get_tasks_version(
+            workspace=workspace,
+            assignee=assignee,
+            project=project,
+            section=section,
+            completed_since=completed_since,
+            modified_since=modified_since,
+            opt_fields=opt_fields
+        )
+        validators = (
+            list_validators(request, *version.values())
+            if version is not None else Validators()
+        )
+        not_modified = validators.check(request)
+        if not_modified is not None:
+            return not_modified
+
         response = interactor.get_tasks(
             workspace=workspace,
             assignee=assignee,
@@ -162,9 +181,13 @@ class GetTasksView(APIView):
             modified_since=modified_since,
             opt_fields=opt_fields,
             offset=offset,
-            limit=limit
+            limit=limit,
+            request=request,
+            stream=stream
         )
-        return Response(response, status=status.HTTP_200_OK)
+        if stream:
+            return validators.apply(StreamingListResponse(response))
+        return validators.apply(Response(response, status=status.HTTP_200_OK))
     
     @extend_schema(
         request=TaskCreateRequestSerializer,
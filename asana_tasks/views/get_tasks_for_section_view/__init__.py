@@ -0,0 +1,3 @@
+from .get_tasks_for_section_view import GetTasksForSectionView
+
+__all__ = ['GetTasksForSectionView']
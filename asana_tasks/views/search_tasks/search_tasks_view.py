@@ -2,10 +2,16 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse, OpenApiExample
-from django.db.models import Q
-from asana_tasks.models.task import Task
+from datetime import datetime
+from django.core.exceptions import ValidationError
 from asana_workspaces.models.workspace import Workspace
-from asana_backend.utils.validators import validate_uuid
+from asana_tasks.interactors.search_tasks_interactor import SearchTasksInteractor
+from asana_tasks.storages.storage_implementation import StorageImplementation
+from asana_tasks.presenters.get_tasks_presenter_implementation import (
+    GetTasksPresenterImplementation
+)
+from asana_tasks.constants.constants import MAX_LIMIT, SEARCH_DEFAULT_LIMIT
+from asana_backend.utils.validators import validate_uuid, validate_pagination_params
 from asana_backend.utils.decorators.ratelimit import ratelimit
 from asana_backend.utils.error_responses import (
     not_found_error, 
@@ -34,7 +40,9 @@ class SearchTasksView(APIView):
                 name='text',
                 type=str,
                 location=OpenApiParameter.QUERY,
-                description='Full-text search on task name and description',
+                description='Full-text search on task name and description. '
+                            'Every word must match, by prefix; results are '
+                            'ordered by relevance.',
                 required=False
             ),
             OpenApiParameter(
@@ -72,6 +80,20 @@ class SearchTasksView(APIView):
                 description='Due date after (ISO 8601 date)',
                 required=False
             ),
+            OpenApiParameter(
+                name='limit',
+                type=int,
+                location=OpenApiParameter.QUERY,
+                description='Results per page, between 1 and 100 (default 100)',
+                required=False
+            ),
+            OpenApiParameter(
+                name='offset',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='Offset token from a previous page\'s next_page',
+                required=False
+            ),
         ],
         responses={
             200: OpenApiResponse(
@@ -148,16 +170,18 @@ class SearchTasksView(APIView):
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        # Build query
-        queryset = Task.objects.filter(workspace=workspace)
-        
-        # Text search (full-text on name and notes)
-        text = request.query_params.get('text')
-        if text:
-            queryset = queryset.filter(
-                Q(name__icontains=text) | Q(notes__icontains=text)
+        try:
+            offset, limit = validate_pagination_params(
+                offset=request.query_params.get('offset'),
+                limit=request.query_params.get('limit', SEARCH_DEFAULT_LIMIT),
+                max_limit=MAX_LIMIT
             )
-        
+        except ValidationError as e:
+            return Response(
+                {'errors': [{'message': e.messages[0]}]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
         # Resource subtype filter
         resource_subtype = request.query_params.get('resource_subtype')
         if resource_subtype:
@@ -170,60 +194,44 @@ class SearchTasksView(APIView):
                     ),
                     status=status.HTTP_400_BAD_REQUEST
                 )
-            queryset = queryset.filter(resource_subtype=resource_subtype)
-        
-        # Completed filter
+
+        # Completed / subtask filters
         completed = request.query_params.get('completed')
         if completed is not None:
-            completed_bool = completed.lower() == 'true'
-            queryset = queryset.filter(completed=completed_bool)
-        
-        # Subtask filter
+            completed = completed.lower() == 'true'
         is_subtask = request.query_params.get('is_subtask')
         if is_subtask is not None:
-            is_subtask_bool = is_subtask.lower() == 'true'
-            if is_subtask_bool:
-                queryset = queryset.filter(parent__isnull=False)
-            else:
-                queryset = queryset.filter(parent__isnull=True)
-        
+            is_subtask = is_subtask.lower() == 'true'
+
         # Due date filters
-        due_on_before = request.query_params.get('due_on.before')
-        if due_on_before:
-            try:
-                from datetime import datetime
-                date_obj = datetime.strptime(due_on_before, '%Y-%m-%d').date()
-                queryset = queryset.filter(due_on__lt=date_obj)
-            except ValueError:
-                return Response(
-                    invalid_field_error("due_on.before", "Invalid date format. Use YYYY-MM-DD"),
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-        
-        due_on_after = request.query_params.get('due_on.after')
-        if due_on_after:
+        due_dates = {}
+        for param in ('due_on.before', 'due_on.after'):
+            value = request.query_params.get(param)
+            if not value:
+                continue
             try:
-                from datetime import datetime
-                date_obj = datetime.strptime(due_on_after, '%Y-%m-%d').date()
-                queryset = queryset.filter(due_on__gt=date_obj)
+                due_dates[param] = datetime.strptime(value, '%Y-%m-%d').date()
             except ValueError:
                 return Response(
-                    invalid_field_error("due_on.after", "Invalid date format. Use YYYY-MM-DD"),
+                    invalid_field_error(param, "Invalid date format. Use YYYY-MM-DD"),
                     status=status.HTTP_400_BAD_REQUEST
                 )
-        
-        # Limit results
-        queryset = queryset[:100]
-        
-        tasks_list = [
-            {
-                'gid': str(task.gid),
-                'resource_type': 'task',
-                'name': task.name,
-                'resource_subtype': task.resource_subtype,
-                'completed': task.completed,
-            }
-            for task in queryset
-        ]
-        
-        return Response({'data': tasks_list}, status=status.HTTP_200_OK)
+
+        interactor = SearchTasksInteractor(
+            storage=StorageImplementation(),
+            presenter=GetTasksPresenterImplementation()
+        )
+        response = interactor.search_tasks(
+            workspace_gid=str(workspace.gid),
+            text=request.query_params.get('text'),
+            resource_subtype=resource_subtype,
+            completed=completed,
+            is_subtask=is_subtask,
+            due_on_before=due_dates.get('due_on.before'),
+            due_on_after=due_dates.get('due_on.after'),
+            offset=offset,
+            limit=limit,
+            request=request
+        )
+
+        return Response(response, status=status.HTTP_200_OK)
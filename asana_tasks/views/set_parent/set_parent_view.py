@@ -2,7 +2,9 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse, OpenApiExample
+from django.core.exceptions import ValidationError
 from asana_tasks.models.task import Task
+from asana_tasks.storages.storage_implementation import StorageImplementation
 from asana_backend.utils.validators import validate_uuid
 from asana_backend.utils.decorators.ratelimit import ratelimit
 from asana_backend.utils.error_responses import (
@@ -127,9 +129,7 @@ class SetParentView(APIView):
             )
         
         # Check if task exists
-        try:
-            task = Task.objects.get(gid=task_gid)
-        except Task.DoesNotExist:
+        if not Task.objects.filter(gid=task_gid).exists():
             return Response(
                 not_found_error("task", task_gid),
                 status=status.HTTP_404_NOT_FOUND
@@ -146,13 +146,10 @@ class SetParentView(APIView):
             )
         
         parent_gid = data.get('parent')
-        old_parent = task.parent
+        if parent_gid == 'null':
+            parent_gid = None
         
-        # If parent is null, remove parent
-        if parent_gid is None or parent_gid == 'null':
-            task.parent = None
-            task.save()
-        else:
+        if parent_gid is not None:
             # Validate parent GID format
             try:
                 validate_uuid(parent_gid)
@@ -163,48 +160,20 @@ class SetParentView(APIView):
                 )
             
             # Check if parent task exists
-            try:
-                new_parent = Task.objects.get(gid=parent_gid)
-            except Task.DoesNotExist:
+            if not Task.objects.filter(gid=parent_gid).exists():
                 return Response(
                     not_found_error("parent", parent_gid),
                     status=status.HTTP_404_NOT_FOUND
                 )
-            
-            # Prevent circular reference - task can't be its own parent
-            if str(new_parent.gid) == str(task.gid):
-                return Response(
-                    bad_request_error("parent: Cannot set a task as its own parent"),
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-            
-            # Check for indirect circular reference (A -> B -> C -> A)
-            current = new_parent
-            while current.parent:
-                if str(current.parent.gid) == str(task.gid):
-                    return Response(
-                        bad_request_error("parent: Cannot create circular reference in task hierarchy"),
-                        status=status.HTTP_400_BAD_REQUEST
-                    )
-                current = current.parent
-            
-            # Verify same workspace
-            if new_parent.workspace.gid != task.workspace.gid:
-                return Response(
-                    bad_request_error("parent: Parent task must be in the same workspace"),
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-            
-            task.parent = new_parent
-            task.save()
         
-        # Update num_subtasks for old and new parents
-        if old_parent:
-            old_parent.num_subtasks = Task.objects.filter(parent=old_parent).count()
-            old_parent.save()
-        if task.parent:
-            task.parent.num_subtasks = Task.objects.filter(parent=task.parent).count()
-            task.parent.save()
+        # Cycle and workspace checks run against the hierarchy closure
+        try:
+            task = StorageImplementation().set_task_parent(task_gid, parent_gid)
+        except ValidationError as e:
+            return Response(
+                bad_request_error(e.messages[0]),
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
         response_data = {
             'gid': str(task.gid),
@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Dict, Any, Union
 from asana_teams.interactors.storage_interfaces.storage_interface import (
     StorageInterface
 )
@@ -9,6 +9,7 @@ from asana_teams.constants.constants import (
     DEFAULT_OFFSET,
     DEFAULT_LIMIT,
 )
+from asana_backend.utils.pagination import build_next_page
 
 
 class GetWorkspaceTeamsInteractor:
@@ -23,8 +24,9 @@ class GetWorkspaceTeamsInteractor:
     def get_workspace_teams(
         self,
         workspace_gid: str,
-        offset: int = DEFAULT_OFFSET,
-        limit: int = DEFAULT_LIMIT
+        offset: Union[int, str] = DEFAULT_OFFSET,
+        limit: int = DEFAULT_LIMIT,
+        request=None
     ) -> Dict[str, Any]:
         teams = self.storage.get_workspace_teams(
             workspace_gid=workspace_gid,
@@ -47,5 +49,10 @@ class GetWorkspaceTeamsInteractor:
             for team in teams
         ]
 
-        return self.presenter.get_teams_response(teams_list)
+        response = self.presenter.get_teams_response(teams_list)
 
+        next_page = build_next_page(request, teams.next_offset)
+        if next_page:
+            response['next_page'] = next_page
+
+        return response
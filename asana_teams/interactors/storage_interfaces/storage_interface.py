@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Union
 from asana_teams.models.team import Team
 
 
@@ -12,7 +12,7 @@ class StorageInterface(ABC):
     def get_teams(
         self,
         workspace_gid: Optional[str] = None,
-        offset: int = 0,
+        offset: Union[int, str] = 0,
         limit: int = 50
     ) -> List[Team]:
         pass
@@ -21,7 +21,7 @@ class StorageInterface(ABC):
     def get_workspace_teams(
         self,
         workspace_gid: str,
-        offset: int = 0,
+        offset: Union[int, str] = 0,
         limit: int = 50
     ) -> List[Team]:
         pass
@@ -66,7 +66,7 @@ class StorageInterface(ABC):
     def get_teams_for_user(
         self,
         user_gid: str,
-        offset: int = 0,
+        offset: Union[int, str] = 0,
         limit: int = 50
     ) -> List[Team]:
         pass
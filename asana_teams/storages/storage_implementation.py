@@ -1,21 +1,23 @@
-from typing import List, Optional
+from typing import List, Optional, Union
 from asana_teams.models.team import Team
 from asana_teams.interactors.storage_interfaces.storage_interface import (
     StorageInterface
 )
+from asana_backend.utils.identity_map import load
+from asana_backend.utils.pagination import Page, paginate_queryset
 
 
 class StorageImplementation(StorageInterface):
     def get_team(self, team_gid: str) -> Optional[Team]:
         try:
-            return Team.objects.get(gid=team_gid)
+            return load(Team, team_gid)
         except Team.DoesNotExist:
             return None
 
     def get_teams(
         self,
         workspace_gid: Optional[str] = None,
-        offset: int = 0,
+        offset: Union[int, str] = 0,
         limit: int = 50
     ) -> List[Team]:
         queryset = Team.objects.all()
@@ -23,18 +25,19 @@ class StorageImplementation(StorageInterface):
         if workspace_gid:
             queryset = queryset.filter(workspace__gid=workspace_gid)
 
-        return list(queryset[offset:offset + limit])
+        return paginate_queryset(queryset, offset, limit, ordering=('gid',))
 
     def get_workspace_teams(
         self,
         workspace_gid: str,
-        offset: int = 0,
+        offset: Union[int, str] = 0,
         limit: int = 50
     ) -> List[Team]:
-        return list(
-            Team.objects.filter(
-                workspace__gid=workspace_gid
-            )[offset:offset + limit]
+        return paginate_queryset(
+            Team.objects.filter(workspace__gid=workspace_gid),
+            offset,
+            limit,
+            ordering=('gid',)
         )
     
     def create_team(
@@ -50,7 +53,7 @@ class StorageImplementation(StorageInterface):
         )
         
         try:
-            workspace = Workspace.objects.get(gid=workspace_gid)
+            workspace = load(Workspace, workspace_gid)
         except Workspace.DoesNotExist:
             raise WorkspaceDoesNotExistException()
         
@@ -98,7 +101,7 @@ class StorageImplementation(StorageInterface):
             return None
         
         try:
-            user = User.objects.get(gid=user_gid)
+            user = load(User, user_gid)
         except User.DoesNotExist:
             return None
         
@@ -120,7 +123,7 @@ class StorageImplementation(StorageInterface):
         from asana_users.models.user import User
         
         try:
-            user = User.objects.get(gid=user_gid)
+            user = load(User, user_gid)
         except User.DoesNotExist:
             return False
         
@@ -137,14 +140,22 @@ class StorageImplementation(StorageInterface):
     def get_teams_for_user(
         self,
         user_gid: str,
-        offset: int = 0,
+        offset: Union[int, str] = 0,
         limit: int = 50
     ) -> List[Team]:
         from asana_teams.models.team_membership import TeamMembership
         
-        memberships = TeamMembership.objects.filter(
-            user__gid=user_gid
-        ).select_related('team')[offset:offset + limit]
-        
-        return [membership.team for membership in memberships]
+        memberships = paginate_queryset(
+            TeamMembership.objects.filter(
+                user__gid=user_gid
+            ).select_related('team'),
+            offset,
+            limit,
+            ordering=('gid',)
+        )
+
+        return Page(
+            [membership.team for membership in memberships],
+            next_offset=memberships.next_offset
+        )
 
@@ -107,9 +107,6 @@ class AddUserToTeamView(APIView):
         tags=["Teams"]
     )
     def post(self, request, team_gid: str):
-        import json
-        
-        opt_pretty = request.query_params.get('opt_pretty', 'false').lower() == 'true'
         
         try:
             validate_uuid(team_gid)
@@ -147,13 +144,6 @@ class AddUserToTeamView(APIView):
                 user=serializer.validated_data['user']
             )
             
-            if opt_pretty:
-                response_data = json.dumps(response, indent=2, ensure_ascii=False)
-                return Response(
-                    json.loads(response_data),
-                    status=status.HTTP_200_OK
-                )
-            
             return Response(response, status=status.HTTP_200_OK)
         except (TeamDoesNotExistException, UserDoesNotExistException) as e:
             error_response = {
@@ -101,9 +101,6 @@ class CreateTeamView(APIView):
         tags=["Teams"]
     )
     def post(self, request):
-        import json
-        
-        opt_pretty = request.query_params.get('opt_pretty', 'false').lower() == 'true'
         
         serializer = TeamCreateRequestSerializer(data=request.data)
         if not serializer.is_valid():
@@ -126,13 +123,6 @@ class CreateTeamView(APIView):
         try:
             response = interactor.create_team(**serializer.validated_data)
             
-            if opt_pretty:
-                response_data = json.dumps(response, indent=2, ensure_ascii=False)
-                return Response(
-                    json.loads(response_data),
-                    status=status.HTTP_201_CREATED
-                )
-            
             return Response(response, status=status.HTTP_201_CREATED)
         except WorkspaceDoesNotExistException as e:
             error_response = {
@@ -98,13 +98,11 @@ class GetTeamView(APIView):
     )
     @ratelimit(key='ip', rate='5/s', method='GET')
     def get(self, request, team_gid: str):
-        import json
         from asana_teams.serializers import (
             TeamSingleResponseSerializer,
             ErrorResponseSerializer
         )
         
-        opt_pretty = request.query_params.get('opt_pretty', 'false').lower() == 'true'
         
         try:
             validate_uuid(team_gid)
@@ -128,13 +126,6 @@ class GetTeamView(APIView):
         try:
             response = interactor.get_team(team_gid)
             
-            if opt_pretty:
-                response_data = json.dumps(response, indent=2, ensure_ascii=False)
-                return Response(
-                    json.loads(response_data),
-                    status=status.HTTP_200_OK
-                )
-            
             return Response(response, status=status.HTTP_200_OK)
         except TeamDoesNotExistException as e:
             error_response = {
@@ -212,7 +203,6 @@ class GetTeamView(APIView):
         tags=["Teams"]
     )
     def put(self, request, team_gid: str):
-        import json
         from asana_teams.interactors.update_team_interactor import (
             UpdateTeamInteractor
         )
@@ -222,7 +212,6 @@ class GetTeamView(APIView):
             ErrorResponseSerializer
         )
         
-        opt_pretty = request.query_params.get('opt_pretty', 'false').lower() == 'true'
         
         try:
             validate_uuid(team_gid)
@@ -260,13 +249,6 @@ class GetTeamView(APIView):
                 **serializer.validated_data
             )
             
-            if opt_pretty:
-                response_data = json.dumps(response, indent=2, ensure_ascii=False)
-                return Response(
-                    json.loads(response_data),
-                    status=status.HTTP_200_OK
-                )
-            
             return Response(response, status=status.HTTP_200_OK)
         except TeamDoesNotExistException as e:
             error_response = {
@@ -96,6 +96,7 @@ class GetTeamsView(APIView):
 
         response = interactor.get_teams(
             offset=offset,
-            limit=limit
+            limit=limit,
+            request=request
         )
         return Response(response, status=status.HTTP_200_OK)
@@ -29,6 +29,7 @@ from asana_users.exceptions.custom_exceptions import (
     UserDoesNotExistException
 )
 from asana_backend.utils.validators import validate_uuid, validate_pagination_params
+from asana_backend.utils.pagination import build_next_page
 from asana_backend.utils.decorators.ratelimit import ratelimit
 
 
@@ -117,9 +118,6 @@ class GetTeamsForUserView(APIView):
         tags=["Teams"]
     )
     def get(self, request, user_gid: str):
-        import json
-        
-        opt_pretty = request.query_params.get('opt_pretty', 'false').lower() == 'true'
         
         try:
             validate_uuid(user_gid)
@@ -135,18 +133,9 @@ class GetTeamsForUserView(APIView):
         
         # Validate pagination
         try:
-            offset_param = request.query_params.get('offset', '0')
-            try:
-                offset = int(offset_param)
-            except ValueError:
-                offset = 0
-            
-            limit_param = request.query_params.get('limit')
-            limit = int(limit_param) if limit_param else DEFAULT_LIMIT
-            
             offset, limit = validate_pagination_params(
-                offset=offset,
-                limit=limit,
+                offset=request.query_params.get('offset'),
+                limit=request.query_params.get('limit'),
                 max_limit=MAX_LIMIT
             )
         except Exception as e:
@@ -185,13 +174,10 @@ class GetTeamsForUserView(APIView):
             ]
             
             response = presenter.get_teams_response(teams_list)
-            
-            if opt_pretty:
-                response_data = json.dumps(response, indent=2, ensure_ascii=False)
-                return Response(
-                    json.loads(response_data),
-                    status=status.HTTP_200_OK
-                )
+
+            next_page = build_next_page(request, teams.next_offset)
+            if next_page:
+                response['next_page'] = next_page
             
             return Response(response, status=status.HTTP_200_OK)
         except UserDoesNotExistException as e:
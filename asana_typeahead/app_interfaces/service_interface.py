@@ -0,0 +1,31 @@
+from typing import Iterable
+from django.db import transaction
+from django.db.models import Model
+from asana_typeahead.index.registry import get_index_registry
+from asana_typeahead.index.sources import WORKSPACE_MODELS
+
+_RESOURCE_TYPES = {model: resource_type for resource_type, model in WORKSPACE_MODELS.items()}
+
+
+class ServiceInterface:
+    """What other apps may use from asana_typeahead."""
+
+    @staticmethod
+    def index_objects(instances: Iterable[Model]) -> None:
+        """
+        Add bulk-created projects, tags, teams or tasks to the loaded
+        typeahead indexes once the transaction commits (bulk_create sends
+        no post_save).
+        """
+        rows = [
+            (_RESOURCE_TYPES[type(instance)], str(instance.workspace_id),
+             str(instance.gid), instance.name)
+            for instance in instances
+        ]
+
+        def index():
+            registry = get_index_registry()
+            for row in rows:
+                registry.put(*row)
+
+        transaction.on_commit(index)
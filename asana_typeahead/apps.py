@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class AsanaTypeaheadConfig(AppConfig):
+    name = 'asana_typeahead'
+
+    def ready(self):
+        # Keep loaded typeahead indexes in step with model saves/deletes
+        from asana_typeahead import signals  # noqa: F401
@@ -0,0 +1,2 @@
+from .constants import *
+from .exception_messages import *
@@ -0,0 +1,14 @@
+TYPEAHEAD_RESOURCE_TYPES = ('user', 'project', 'tag', 'team', 'task')
+DEFAULT_COUNT = 20
+MAX_COUNT = 100
+
+# Workspace/resource type indexes kept in memory per process (LRU)
+MAX_CACHED_INDEXES = 64
+# Indexes are rebuilt after this long, to pick up changes made by other
+# processes (changes in this process are applied as they commit)
+INDEX_MAX_AGE_SECONDS = 300
+# Most index entries looked at per query before giving up on finding
+# `count` results that match every query word
+MAX_CANDIDATES = 5000
+# Compact an index once this share of its entries are deleted
+COMPACT_DEAD_RATIO = 0.5
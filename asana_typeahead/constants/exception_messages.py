@@ -0,0 +1,5 @@
+INVALID_RESOURCE_TYPE = (
+    "resource_type: Must be one of: user, project, tag, team, task"
+)
+INVALID_COUNT = "count: Must be an integer between 1 and 100"
+WORKSPACE_DOES_NOT_EXIST = "workspace: Unknown object"
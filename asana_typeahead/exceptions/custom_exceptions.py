@@ -0,0 +1,9 @@
+from asana_typeahead.constants.exception_messages import (
+    WORKSPACE_DOES_NOT_EXIST,
+)
+
+
+class WorkspaceDoesNotExistException(Exception):
+    def __init__(self, message=WORKSPACE_DOES_NOT_EXIST):
+        self.message = message
+        super().__init__(self.message)
@@ -0,0 +1,144 @@
+"""
+Word-prefix index over the names of one resource type in one workspace.
+
+Names are split into lower-cased words. ``_words`` is the sorted vocabulary
+and ``_postings`` maps each word to the ids of the entries containing it, so
+the words starting with a prefix are one ``bisect`` away and a lookup reads
+only the entries it returns. Deleting or renaming marks the old entry dead;
+dead entries are skipped and dropped when the index is compacted.
+"""
+import bisect
+import heapq
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from asana_typeahead.constants.constants import COMPACT_DEAD_RATIO
+
+WORD_RE = re.compile(r'\w+')
+
+
+def split_words(text: str) -> List[str]:
+    return WORD_RE.findall(text.lower())
+
+
+class PrefixIndex:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._words: List[str] = []
+        self._postings: Dict[str, List[int]] = {}
+        # Entry id -> (gid, name); None once deleted
+        self._entries: List[Optional[Tuple[str, str]]] = []
+        self._entry_ids: Dict[str, int] = {}
+        self._dead = 0
+
+    def __len__(self) -> int:
+        return len(self._entry_ids)
+
+    def __contains__(self, gid: str) -> bool:
+        return gid in self._entry_ids
+
+    def load(self, rows: Iterable[Tuple[str, str]]) -> None:
+        """Bulk-add (gid, name) rows to an empty index."""
+        with self._lock:
+            for gid, name in rows:
+                self._add(str(gid), name, keep_sorted=False)
+            self._words = sorted(self._postings)
+
+    def put(self, gid: str, name: str) -> None:
+        with self._lock:
+            current = self._entry_ids.get(gid)
+            if current is not None and self._entries[current][1] == name:
+                return
+            self._discard(gid)
+            self._add(gid, name, keep_sorted=True)
+            self._maybe_compact()
+
+    def discard(self, gid: str) -> None:
+        with self._lock:
+            self._discard(gid)
+            self._maybe_compact()
+
+    def search(
+        self,
+        query: str,
+        count: int,
+        max_candidates: int
+    ) -> List[Tuple[str, str]]:
+        """
+        Up to ``count`` (gid, name) entries having a word starting with each
+        word of ``query``; every entry when the query has no words. Names
+        that start with the query come first, then shorter names. Up to
+        ``max_candidates`` entries are examined and ranked, so the best
+        matches are found wherever their words sort in the vocabulary.
+        """
+        # Seek on the longest word, the most selective one; check the rest
+        others = split_words(query)
+        lead = others.pop(
+            max(range(len(others)), key=lambda index: len(others[index]))
+        ) if others else ''
+        query_lower = query.strip().lower()
+
+        matches = []
+        seen: Set[int] = set()
+        examined = 0
+        with self._lock:
+            position = bisect.bisect_left(self._words, lead)
+            while position < len(self._words) and examined < max_candidates:
+                word = self._words[position]
+                if not word.startswith(lead):
+                    break
+                for entry_id in self._postings[word]:
+                    if entry_id in seen:
+                        continue
+                    seen.add(entry_id)
+                    entry = self._entries[entry_id]
+                    if entry is None:
+                        continue
+                    examined += 1
+                    if not others or _has_word_prefixes(entry[1], others):
+                        matches.append(entry)
+                    if examined >= max_candidates:
+                        break
+                position += 1
+
+        return heapq.nsmallest(count, matches, key=lambda entry: (
+            not entry[1].lower().startswith(query_lower),
+            len(entry[1]),
+            entry[1].lower(),
+        ))
+
+    def _add(self, gid: str, name: str, keep_sorted: bool) -> None:
+        entry_id = len(self._entries)
+        self._entries.append((gid, name))
+        self._entry_ids[gid] = entry_id
+        for word in set(split_words(name)):
+            postings = self._postings.get(word)
+            if postings is None:
+                postings = self._postings[word] = []
+                if keep_sorted:
+                    bisect.insort(self._words, word)
+            postings.append(entry_id)
+
+    def _discard(self, gid: str) -> None:
+        entry_id = self._entry_ids.pop(gid, None)
+        if entry_id is not None:
+            self._entries[entry_id] = None
+            self._dead += 1
+
+    def _maybe_compact(self) -> None:
+        if self._dead <= len(self._entries) * COMPACT_DEAD_RATIO:
+            return
+        live = [entry for entry in self._entries if entry is not None]
+        self._words, self._postings, self._entries = [], {}, []
+        self._entry_ids, self._dead = {}, 0
+        for gid, name in live:
+            self._add(gid, name, keep_sorted=False)
+        self._words = sorted(self._postings)
+
+
+def _has_word_prefixes(name: str, prefixes: List[str]) -> bool:
+    words = split_words(name)
+    return all(
+        any(word.startswith(prefix) for word in words)
+        for prefix in prefixes
+    )
@@ -0,0 +1,150 @@
+"""
+Per-process cache of typeahead indexes, one per (workspace, resource type).
+
+Indexes are built on first use and the least recently used ones are
+dropped beyond MAX_CACHED_INDEXES. Saves and deletes in this process are
+applied to the loaded indexes as they commit (see asana_typeahead.signals),
+including while an index is still loading; indexes older than
+INDEX_MAX_AGE_SECONDS are rebuilt so changes made by other processes show
+up too.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Set, Tuple
+from asana_typeahead.constants.constants import (
+    MAX_CACHED_INDEXES,
+    INDEX_MAX_AGE_SECONDS,
+)
+from asana_typeahead.index.prefix_index import PrefixIndex
+from asana_typeahead.index.sources import load_names
+
+
+class _Entry:
+    def __init__(self):
+        self.index = PrefixIndex()
+        self.built_at = time.monotonic()
+        self.ready = threading.Event()
+        # Gids changed while loading; their (older) loaded rows are skipped
+        self.touched: Optional[Set[str]] = set()
+
+
+class TypeaheadIndexRegistry:
+    def __init__(
+        self,
+        max_indexes: int = MAX_CACHED_INDEXES,
+        max_age_seconds: float = INDEX_MAX_AGE_SECONDS
+    ):
+        self.max_indexes = max_indexes
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[Tuple[str, str], _Entry]' = OrderedDict()
+
+    def get_index(self, workspace_gid: str, resource_type: str) -> PrefixIndex:
+        key = (workspace_gid, resource_type)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry.built_at > self.max_age_seconds:
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                builder = False
+            else:
+                entry = self._entries[key] = _Entry()
+                builder = True
+                while len(self._entries) > self.max_indexes:
+                    self._entries.popitem(last=False)
+
+        if builder:
+            try:
+                rows = [
+                    (str(gid), name)
+                    for gid, name in load_names(resource_type, workspace_gid)
+                ]
+                entry.index.load(
+                    (gid, name) for gid, name in rows if gid not in entry.touched
+                )
+            except BaseException:
+                with self._lock:
+                    if self._entries.get(key) is entry:
+                        del self._entries[key]
+                raise
+            finally:
+                entry.touched = None
+                entry.ready.set()
+        else:
+            entry.ready.wait()
+        return entry.index
+
+    def put(self, resource_type: str, workspace_gid: str, gid: str, name: str) -> None:
+        """Index (or rename) ``gid`` in the workspace's index, if loaded."""
+        entry = self._get_loaded(workspace_gid, resource_type)
+        if entry is not None:
+            if entry.touched is not None:
+                entry.touched.add(gid)
+            entry.index.put(gid, name)
+
+    def place(self, resource_type: str, workspace_gid: str, gid: str, name: str) -> None:
+        """
+        Index ``gid`` in its workspace's index and drop it from the others,
+        for objects that belong to exactly one workspace.
+        """
+        for entry_workspace_gid, entry in self._loaded(resource_type):
+            if entry_workspace_gid == workspace_gid:
+                self.put(resource_type, workspace_gid, gid, name)
+            elif gid in entry.index:
+                entry.index.discard(gid)
+
+    def rename(self, resource_type: str, gid: str, name: str) -> None:
+        """Rename ``gid`` in every loaded index of the type that has it."""
+        for _, entry in self._loaded(resource_type):
+            if gid in entry.index:
+                entry.index.put(gid, name)
+
+    def discard(
+        self,
+        resource_type: str,
+        gid: str,
+        workspace_gid: Optional[str] = None
+    ) -> None:
+        """
+        Remove ``gid`` from the workspace's index, or from every loaded index
+        of the type when no workspace is given.
+        """
+        if workspace_gid is not None:
+            entry = self._get_loaded(workspace_gid, resource_type)
+            entries = [entry] if entry is not None else []
+        else:
+            entries = [entry for _, entry in self._loaded(resource_type)]
+        for entry in entries:
+            if entry.touched is not None:
+                entry.touched.add(gid)
+            entry.index.discard(gid)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _get_loaded(self, workspace_gid: str, resource_type: str) -> Optional[_Entry]:
+        with self._lock:
+            return self._entries.get((workspace_gid, resource_type))
+
+    def _loaded(self, resource_type: str):
+        with self._lock:
+            return [
+                (workspace_gid, entry)
+                for (workspace_gid, entry_type), entry in self._entries.items()
+                if entry_type == resource_type
+            ]
+
+
+_registry: Optional[TypeaheadIndexRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_index_registry() -> TypeaheadIndexRegistry:
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = TypeaheadIndexRegistry()
+        return _registry
@@ -0,0 +1,31 @@
+"""
+Where each typeahead resource type's names come from.
+"""
+from typing import Iterable, Tuple
+from asana_users.models.user import User
+from asana_projects.models.project import Project
+from asana_tags.models.tag import Tag
+from asana_teams.models.team import Team
+from asana_tasks.models.task import Task
+
+
+def load_names(resource_type: str, workspace_gid: str) -> Iterable[Tuple[str, str]]:
+    """(gid, name) of every ``resource_type`` object in the workspace."""
+    if resource_type == 'user':
+        queryset = User.objects.filter(
+            userworkspacemembership__workspace_id=workspace_gid
+        )
+    else:
+        queryset = WORKSPACE_MODELS[resource_type].objects.filter(
+            workspace_id=workspace_gid
+        )
+    return queryset.values_list('gid', 'name').iterator(chunk_size=10000)
+
+
+# Resource types whose rows carry their workspace
+WORKSPACE_MODELS = {
+    'project': Project,
+    'tag': Tag,
+    'team': Team,
+    'task': Task,
+}
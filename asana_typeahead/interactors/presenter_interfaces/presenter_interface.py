@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List
+
+
+class PresenterInterface(ABC):
+    @abstractmethod
+    def get_typeahead_response(
+        self,
+        results: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        pass
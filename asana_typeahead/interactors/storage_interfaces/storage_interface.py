@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from typing import List, Tuple
+
+
+class StorageInterface(ABC):
+    @abstractmethod
+    def workspace_exists(self, workspace_gid: str) -> bool:
+        pass
+
+    @abstractmethod
+    def typeahead(
+        self,
+        workspace_gid: str,
+        resource_type: str,
+        query: str,
+        count: int
+    ) -> List[Tuple[str, str]]:
+        pass
@@ -0,0 +1,41 @@
+from typing import Any, Dict
+from asana_typeahead.interactors.storage_interfaces.storage_interface import (
+    StorageInterface
+)
+from asana_typeahead.interactors.presenter_interfaces.presenter_interface import (
+    PresenterInterface
+)
+from asana_typeahead.exceptions.custom_exceptions import (
+    WorkspaceDoesNotExistException
+)
+
+
+class TypeaheadInteractor:
+    def __init__(
+        self,
+        storage: StorageInterface,
+        presenter: PresenterInterface
+    ):
+        self.storage = storage
+        self.presenter = presenter
+
+    def typeahead(
+        self,
+        workspace_gid: str,
+        resource_type: str,
+        query: str,
+        count: int
+    ) -> Dict[str, Any]:
+        if not self.storage.workspace_exists(workspace_gid):
+            raise WorkspaceDoesNotExistException()
+
+        results = [
+            {'gid': gid, 'resource_type': resource_type, 'name': name}
+            for gid, name in self.storage.typeahead(
+                workspace_gid,
+                resource_type,
+                query,
+                count
+            )
+        ]
+        return self.presenter.get_typeahead_response(results)
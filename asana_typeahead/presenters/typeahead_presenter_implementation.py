@@ -0,0 +1,14 @@
+from typing import Any, Dict, List
+from asana_typeahead.interactors.presenter_interfaces.presenter_interface import (
+    PresenterInterface
+)
+
+
+class TypeaheadPresenterImplementation(PresenterInterface):
+    def get_typeahead_response(
+        self,
+        results: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        return {
+            'data': results
+        }
@@ -3,3 +3,14 @@ Serializers for typeahead API endpoints.
 """
 from rest_framework import serializers
 
+
+class TypeaheadResultSerializer(serializers.Serializer):
+    """Compact record of the matched object"""
+    gid = serializers.CharField(read_only=True)
+    resource_type = serializers.CharField(read_only=True)
+    name = serializers.CharField(read_only=True)
+
+
+class TypeaheadForWorkspaceResponseSerializer(serializers.Serializer):
+    """Response wrapper for GET /workspaces/{workspace_gid}/typeahead"""
+    data = TypeaheadResultSerializer(many=True)
@@ -0,0 +1,83 @@
+"""
+Applies committed saves and deletes of typeahead-able objects to the
+loaded typeahead indexes.
+"""
+from functools import partial
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from asana_users.models.user import User
+from asana_users.models.user_workspace_membership import UserWorkspaceMembership
+from asana_typeahead.index.registry import get_index_registry
+from asana_typeahead.index.sources import WORKSPACE_MODELS
+
+
+def _on_commit(fn, *args):
+    transaction.on_commit(partial(fn, *args))
+
+
+def index_workspace_object_save(sender, instance, resource_type, **kwargs):
+    _on_commit(
+        get_index_registry().place,
+        resource_type,
+        str(instance.workspace_id),
+        str(instance.gid),
+        instance.name
+    )
+
+
+def index_workspace_object_delete(sender, instance, resource_type, **kwargs):
+    _on_commit(get_index_registry().discard, resource_type, str(instance.gid))
+
+
+def index_user_save(sender, instance, **kwargs):
+    _on_commit(get_index_registry().rename, 'user', str(instance.gid), instance.name)
+
+
+def index_user_delete(sender, instance, **kwargs):
+    _on_commit(get_index_registry().discard, 'user', str(instance.gid))
+
+
+def index_membership_save(sender, instance, **kwargs):
+    _on_commit(
+        get_index_registry().put,
+        'user',
+        str(instance.workspace_id),
+        str(instance.user_id),
+        instance.user.name
+    )
+
+
+def index_membership_delete(sender, instance, **kwargs):
+    _on_commit(
+        get_index_registry().discard,
+        'user',
+        str(instance.user_id),
+        str(instance.workspace_id)
+    )
+
+
+for resource_type, model in WORKSPACE_MODELS.items():
+    post_save.connect(
+        partial(index_workspace_object_save, resource_type=resource_type),
+        sender=model,
+        weak=False,
+        dispatch_uid=f'typeahead_save:{resource_type}'
+    )
+    post_delete.connect(
+        partial(index_workspace_object_delete, resource_type=resource_type),
+        sender=model,
+        weak=False,
+        dispatch_uid=f'typeahead_delete:{resource_type}'
+    )
+post_save.connect(index_user_save, sender=User, dispatch_uid='typeahead_save:user')
+post_delete.connect(index_user_delete, sender=User, dispatch_uid='typeahead_delete:user')
+post_save.connect(
+    index_membership_save,
+    sender=UserWorkspaceMembership,
+    dispatch_uid='typeahead_save:membership'
+)
+post_delete.connect(
+    index_membership_delete,
+    sender=UserWorkspaceMembership,
+    dispatch_uid='typeahead_delete:membership'
+)
@@ -0,0 +1,22 @@
+from typing import List, Tuple
+from asana_workspaces.models.workspace import Workspace
+from asana_typeahead.interactors.storage_interfaces.storage_interface import (
+    StorageInterface
+)
+from asana_typeahead.constants.constants import MAX_CANDIDATES
+from asana_typeahead.index.registry import get_index_registry
+
+
+class StorageImplementation(StorageInterface):
+    def workspace_exists(self, workspace_gid: str) -> bool:
+        return Workspace.objects.filter(gid=workspace_gid).exists()
+
+    def typeahead(
+        self,
+        workspace_gid: str,
+        resource_type: str,
+        query: str,
+        count: int
+    ) -> List[Tuple[str, str]]:
+        index = get_index_registry().get_index(workspace_gid, resource_type)
+        return index.search(query, count, MAX_CANDIDATES)
@@ -0,0 +1,14 @@
+from django.urls import path
+from asana_typeahead.views.typeahead_for_workspace_view.typeahead_for_workspace_view import (
+    TypeaheadForWorkspaceView
+)
+
+app_name = 'asana_typeahead'
+
+urlpatterns = [
+    path(
+        'workspaces/<str:workspace_gid>/typeahead',
+        TypeaheadForWorkspaceView.as_view(),
+        name='typeahead_for_workspace'
+    ),  # GET
+]
@@ -0,0 +1 @@
+from .typeahead_for_workspace_view import TypeaheadForWorkspaceView
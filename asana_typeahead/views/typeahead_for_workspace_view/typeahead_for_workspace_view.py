@@ -10,11 +10,30 @@ from drf_spectacular.utils import (
 from asana_backend.utils.validators import validate_uuid
 from asana_backend.utils.decorators.ratelimit import ratelimit
 from asana_backend.utils.error_responses import (
+    create_error_response,
     not_found_error,
     invalid_gid_error,
     missing_field_error,
     server_error,
 )
+from asana_typeahead.serializers import TypeaheadForWorkspaceResponseSerializer
+from asana_typeahead.interactors.typeahead_interactor import TypeaheadInteractor
+from asana_typeahead.storages.storage_implementation import StorageImplementation
+from asana_typeahead.presenters.typeahead_presenter_implementation import (
+    TypeaheadPresenterImplementation
+)
+from asana_typeahead.exceptions.custom_exceptions import (
+    WorkspaceDoesNotExistException
+)
+from asana_typeahead.constants.constants import (
+    TYPEAHEAD_RESOURCE_TYPES,
+    DEFAULT_COUNT,
+    MAX_COUNT,
+)
+from asana_typeahead.constants.exception_messages import (
+    INVALID_RESOURCE_TYPE,
+    INVALID_COUNT,
+)
 
 
 class TypeaheadForWorkspaceView(APIView):
@@ -37,7 +56,7 @@ class TypeaheadForWorkspaceView(APIView):
                 name='resource_type',
                 type=str,
                 location=OpenApiParameter.QUERY,
-                description='The type of values the typeahead should return. You can choose from one of the following: `custom_field`, `goal`, `project`, `project_template`, `portfolio`, `tag`, `task`, `team`, and `user`. Note that unlike in the names of endpoints, the types listed here are in singular form (e.g. `task`). Using multiple types is not yet supported.',
+                description='The type of values the typeahead should return. You can choose from one of the following: `project`, `tag`, `task`, `team`, and `user`. Note that unlike in the names of endpoints, the types listed here are in singular form (e.g. `task`). Using multiple types is not yet supported.',
                 required=True
             ),
             OpenApiParameter(
@@ -65,8 +84,7 @@ class TypeaheadForWorkspaceView(APIView):
                 name='opt_pretty',
                 type=str,
                 location=OpenApiParameter.QUERY,
-                description='Provides “pretty” output.
-Provides the response in a “pretty” format. In the case of JSON this means doing proper line breaking and indentation to make it readable. This will take extra time and increase the response size so it is advisable only to use this during debugging.',
+                description='Provides “pretty” output. Provides the response in a “pretty” format. In the case of JSON this means doing proper line breaking and indentation to make it readable. This will take extra time and increase the response size so it is advisable only to use this during debugging.',
                 required=False
             ),
             OpenApiParameter(
@@ -99,7 +117,7 @@ Provides the response in a “pretty” format. In the case of JSON this means d
             ),
         },
         summary="Get objects via typeahead",
-        description="",
+        description="Returns the objects of one type in the workspace that have a word starting with each word of the query, from an in-memory prefix index.",
         tags=["Typeahead"]
     )
     def get(self, request, workspace_gid: str):
@@ -112,25 +130,50 @@ Provides the response in a “pretty” format. In the case of JSON this means d
                 status=status.HTTP_400_BAD_REQUEST
             )
         
+        resource_type = (
+            request.query_params.get('resource_type')
+            or request.query_params.get('type')
+        )
+        if not resource_type:
+            return Response(
+                missing_field_error("resource_type"),
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if resource_type not in TYPEAHEAD_RESOURCE_TYPES:
+            return Response(
+                create_error_response(INVALID_RESOURCE_TYPE),
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            count = int(request.query_params.get('count', DEFAULT_COUNT))
+        except ValueError:
+            count = 0
+        if not 1 <= count <= MAX_COUNT:
+            return Response(
+                create_error_response(INVALID_COUNT),
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        interactor = TypeaheadInteractor(
+            storage=StorageImplementation(),
+            presenter=TypeaheadPresenterImplementation()
+        )
         try:
-            # TODO: Implement get logic
+            response = interactor.typeahead(
+                workspace_gid=workspace_gid,
+                resource_type=resource_type,
+                query=request.query_params.get('query', ''),
+                count=count
+            )
+        except WorkspaceDoesNotExistException:
             return Response(
-                {'data': {'message': 'Not implemented yet'}},
-                status=status.HTTP_501_NOT_IMPLEMENTED
+                not_found_error("workspace", workspace_gid),
+                status=status.HTTP_404_NOT_FOUND
             )
         except Exception as e:
-            error_response = {
-                'errors': [{
-                    'message': str(e),
-                    'help': (
-                        'For more information on API status codes and '
-                        'how to handle them, read the docs on errors: '
-                        'https://asana.github.io/developer-docs/#errors'
-                    ),
-                    'phrase': '6 sad squid snuggle softly'
-                }]
-            }
             return Response(
-                error_response,
+                server_error(str(e)),
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+        return Response(response, status=status.HTTP_200_OK)
@@ -1,7 +1,7 @@
 """
 Interactor for retrieving user workspaces.
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Union
 from asana_users.interactors.storage_interfaces.storage_interface import (
     StorageInterface
 )
@@ -12,6 +12,7 @@ from asana_users.constants.constants import (
     DEFAULT_OFFSET,
     DEFAULT_LIMIT,
 )
+from asana_backend.utils.pagination import build_next_page
 from asana_users.exceptions.custom_exceptions import (
     UserDoesNotExistException
 )
@@ -29,8 +30,9 @@ class GetUserWorkspacesInteractor:
     def get_user_workspaces(
         self,
         user_gid: str,
-        offset: int = DEFAULT_OFFSET,
-        limit: int = DEFAULT_LIMIT
+        offset: Union[int, str] = DEFAULT_OFFSET,
+        limit: int = DEFAULT_LIMIT,
+        request=None
     ) -> Dict[str, Any]:
         workspaces = self.storage.get_user_workspaces(
             user_gid=user_gid,
@@ -49,7 +51,12 @@ class GetUserWorkspacesInteractor:
             for workspace in workspaces
         ]
 
-        return self.presenter.get_user_workspaces_response(
+        response = self.presenter.get_user_workspaces_response(
             workspaces_list
         )
 
+        next_page = build_next_page(request, workspaces.next_offset)
+        if next_page:
+            response['next_page'] = next_page
+
+        return response
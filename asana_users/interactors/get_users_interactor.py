@@ -1,7 +1,7 @@
 """
 Interactor for retrieving multiple users.
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 from asana_users.interactors.storage_interfaces.storage_interface import (
     StorageInterface
 )
@@ -12,6 +12,7 @@ from asana_users.constants.constants import (
     DEFAULT_OFFSET,
     DEFAULT_LIMIT,
 )
+from asana_backend.utils.pagination import build_next_page
 
 
 class GetUsersInteractor:
@@ -28,27 +29,43 @@ class GetUsersInteractor:
         workspace: Optional[str] = None,
         team: Optional[str] = None,
         opt_fields: Optional[str] = None,
-        offset: int = DEFAULT_OFFSET,
-        limit: int = DEFAULT_LIMIT
+        offset: Union[int, str] = DEFAULT_OFFSET,
+        limit: int = DEFAULT_LIMIT,
+        request=None,
+        stream: bool = False
     ) -> Dict[str, Any]:
         users = self.storage.get_users(
             workspace=workspace,
             team=team,
             offset=offset,
-            limit=limit
+            limit=limit,
+            stream=stream
         )
         
         # Handle opt_fields (field selection) - for now we return all fields
 
         # Format users matching UserCompact schema (for list view)
-        users_list = [
+        users_list = (
             {
                 'gid': str(user.gid),
                 'resource_type': 'user',
                 'name': user.name,
             }
             for user in users
-        ]
+        )
+        if stream:
+            # Rows are serialized while the response is written; the next
+            # page is known once they have all been read
+            response = self.presenter.get_users_response(users_list)
+            response['next_page'] = lambda: build_next_page(
+                request, users.next_offset
+            )
+            return response
+
+        response = self.presenter.get_users_response(list(users_list))
 
-        return self.presenter.get_users_response(users_list)
+        next_page = build_next_page(request, users.next_offset)
+        if next_page:
+            response['next_page'] = next_page
 
+        return response
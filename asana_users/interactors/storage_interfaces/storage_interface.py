@@ -2,7 +2,7 @@
 Storage interface for user operations.
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Union
 from asana_users.models.user import User
 
 
@@ -25,8 +25,9 @@ class StorageInterface(ABC):
         self,
         workspace: Optional[str] = None,
         team: Optional[str] = None,
-        offset: int = 0,
-        limit: int = 50
+        offset: Union[int, str] = 0,
+        limit: int = 50,
+        stream: bool = False
     ) -> List[User]:
         pass
 
@@ -48,7 +49,7 @@ class StorageInterface(ABC):
     def get_user_workspaces(
         self,
         user_gid: str,
-        offset: int = 0,
+        offset: Union[int, str] = 0,
         limit: int = 50
     ) -> List:
         pass
@@ -1,7 +1,7 @@
 """
 Storage implementation for user operations.
 """
-from typing import List, Optional
+from typing import List, Optional, Union
 from asana_users.models.user import User
 from asana_users.models.user_workspace_membership import (
     UserWorkspaceMembership
@@ -9,6 +9,8 @@ from asana_users.models.user_workspace_membership import (
 from asana_users.interactors.storage_interfaces.storage_interface import (
     StorageInterface
 )
+from asana_backend.utils.identity_map import load
+from asana_backend.utils.pagination import Page, paginate_queryset
 from asana_users.exceptions.custom_exceptions import (
     UserDoesNotExistException
 )
@@ -30,7 +32,7 @@ class StorageImplementation(StorageInterface):
 
     def get_user(self, user_gid: str) -> Optional[User]:
         try:
-            return User.objects.get(gid=user_gid)
+            return load(User, user_gid)
         except User.DoesNotExist:
             return None
 
@@ -38,8 +40,9 @@ class StorageImplementation(StorageInterface):
         self,
         workspace: Optional[str] = None,
         team: Optional[str] = None,
-        offset: int = 0,
-        limit: int = 50
+        offset: Union[int, str] = 0,
+        limit: int = 50,
+        stream: bool = False
     ) -> List[User]:
         from asana_teams.models.team_membership import TeamMembership
         
@@ -67,7 +70,9 @@ class StorageImplementation(StorageInterface):
                 # If team filtering fails, just return all users
                 pass
         
-        return list(queryset[offset:offset + limit])
+        return paginate_queryset(
+            queryset, offset, limit, ordering=('gid',), stream=stream
+        )
 
     def update_user(
         self,
@@ -101,19 +106,24 @@ class StorageImplementation(StorageInterface):
     def get_user_workspaces(
         self,
         user_gid: str,
-        offset: int = 0,
+        offset: Union[int, str] = 0,
         limit: int = 50
     ) -> List:
         user = self.get_user(user_gid)
         if not user:
             raise UserDoesNotExistException()
 
-        memberships = UserWorkspaceMembership.objects.filter(
-            user=user
-        )[offset:offset + limit]
+        memberships = paginate_queryset(
+            UserWorkspaceMembership.objects.filter(
+                user=user
+            ).select_related('workspace'),
+            offset,
+            limit,
+            ordering=('gid',)
+        )
 
-        return [
-            membership.workspace
-            for membership in memberships
-        ]
+        return Page(
+            [membership.workspace for membership in memberships],
+            next_offset=memberships.next_offset
+        )
 
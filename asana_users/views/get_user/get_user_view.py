@@ -21,6 +21,7 @@ from asana_users.serializers import (
 )
 from asana_backend.utils.validators import validate_uuid
 from asana_backend.utils.decorators.ratelimit import ratelimit
+from asana_backend.utils.object_cache import CachedObject
 
 
 class GetUserView(APIView):
@@ -64,15 +65,22 @@ class GetUserView(APIView):
         presenter = GetUserPresenterImplementation()
         interactor = GetUserInteractor(storage=storage, presenter=presenter)
 
+        cached_user = CachedObject('user', user_gid)
         try:
-            response = interactor.get_user(user_gid)
-            return Response(response, status=status.HTTP_200_OK)
+            response = cached_user.get_or_build(
+                lambda: interactor.get_user(user_gid)
+            )
         except UserDoesNotExistException as e:
             return Response(
                 {'errors': [{'message': str(e)}]},
                 status=status.HTTP_404_NOT_FOUND
             )
 
+        validators = cached_user.validators()
+        return validators.check(request) or validators.apply(
+            Response(response, status=status.HTTP_200_OK)
+        )
+
     @ratelimit(key='ip', rate='5/m', method='PUT')
     @extend_schema(
         parameters=[
@@ -1,6 +1,7 @@
 """
 API view for retrieving user workspaces.
 """
+from django.core.exceptions import ValidationError
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -41,11 +42,17 @@ class GetUserWorkspacesView(APIView):
             )
 
         # Validate and normalize pagination params
-        offset, limit = validate_pagination_params(
-            offset=request.query_params.get('offset'),
-            limit=request.query_params.get('limit'),
-            max_limit=MAX_LIMIT
-        )
+        try:
+            offset, limit = validate_pagination_params(
+                offset=request.query_params.get('offset'),
+                limit=request.query_params.get('limit'),
+                max_limit=MAX_LIMIT
+            )
+        except ValidationError as e:
+            return Response(
+                {'errors': [{'message': e.messages[0]}]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
 
         storage = StorageImplementation()
         presenter = GetUserPresenterImplementation()
@@ -58,7 +65,8 @@ class GetUserWorkspacesView(APIView):
             response = interactor.get_user_workspaces(
                 user_gid=user_gid,
                 offset=offset,
-                limit=limit
+                limit=limit,
+                request=request
             )
             return Response(response, status=status.HTTP_200_OK)
         except UserDoesNotExistException as e:
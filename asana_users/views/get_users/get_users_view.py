@@ -23,6 +23,10 @@ from asana_users.serializers import (
     ErrorResponseSerializer
 )
 from asana_backend.utils.validators import validate_pagination_params
+from asana_backend.utils.streaming import (
+    get_max_limit,
+    StreamingListResponse
+)
 from asana_backend.utils.decorators.ratelimit import ratelimit
 
 
@@ -48,7 +52,7 @@ class GetUsersView(APIView):
                 name='limit',
                 type=int,
                 location=OpenApiParameter.QUERY,
-                description=f'Results per page. The number of objects to return per page. The value must be between 1 and {MAX_LIMIT}.',
+                description=f'Results per page. The number of objects to return per page. The value must be between 1 and {MAX_LIMIT}; trusted bulk clients may ask for more.',
                 required=False
             ),
             OpenApiParameter(
@@ -81,21 +85,12 @@ class GetUsersView(APIView):
     )
     def get(self, request):
         try:
-            # Handle offset - can be int or string token
-            offset_param = request.query_params.get('offset', '0')
-            try:
-                offset = int(offset_param)
-            except ValueError:
-                # If it's a token, treat as 0 for now
-                offset = 0
-            
-            limit_param = request.query_params.get('limit')
-            limit = int(limit_param) if limit_param else DEFAULT_LIMIT
-            
+            # offset is either an offset token from next_page or a
+            # legacy integer offset
             offset, limit = validate_pagination_params(
-                offset=offset,
-                limit=limit,
-                max_limit=MAX_LIMIT
+                offset=request.query_params.get('offset'),
+                limit=request.query_params.get('limit'),
+                max_limit=get_max_limit(request, MAX_LIMIT)
             )
         except Exception as e:
             return Response(
@@ -103,6 +98,10 @@ class GetUsersView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        # Pages above MAX_LIMIT are only open to bulk clients and are
+        # written out as they are read
+        stream = limit > MAX_LIMIT
+
         # Extract parameters matching API spec names
         workspace = request.query_params.get('workspace')
         team = request.query_params.get('team')
@@ -117,8 +116,12 @@ class GetUsersView(APIView):
             team=team,
             opt_fields=opt_fields,
             offset=offset,
-            limit=limit
+            limit=limit,
+            request=request,
+            stream=stream
         )
+        if stream:
+            return StreamingListResponse(response)
         return Response(response, status=status.HTTP_200_OK)
 
     @ratelimit(key='ip', rate='5/m', method='POST')
@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class AsanaWebhooksConfig(AppConfig):
     name = 'asana_webhooks'
+
+    def ready(self):
+        # Keep the subscription index in step with Webhook saves/deletes
+        from asana_webhooks import signals  # noqa: F401
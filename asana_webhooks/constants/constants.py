@@ -2,3 +2,27 @@ DEFAULT_OFFSET = 0
 DEFAULT_LIMIT = 50
 MAX_LIMIT = 100
 
+
+# Delivery engine defaults (see `manage.py run_webhook_deliveries`)
+DELIVERY_WORKERS = 16
+DELIVERY_POLL_INTERVAL_SECONDS = 1.0
+# Journal entries read per delivery round
+FEED_BATCH_SIZE = 1000
+# Each round re-reads webhooks saved this long before the last one it saw,
+# in case a save committed late or another host's clock is behind
+INDEX_SYNC_OVERLAP_SECONDS = 60
+# Reload every active webhook this often, to drop webhooks deleted by
+# other processes from the subscription index
+INDEX_RECONCILE_SECONDS = 300
+# Events coalesced into one POST
+MAX_EVENTS_PER_DELIVERY = 100
+DELIVERY_TIMEOUT_SECONDS = 10
+# Attempts (the first delivery included) before a payload is dead-lettered
+MAX_DELIVERY_ATTEMPTS = 8
+# Retry n waits min(BASE * 2 ** (n - 1), MAX) seconds
+RETRY_BACKOFF_BASE_SECONDS = 2
+RETRY_BACKOFF_MAX_SECONDS = 60 * 60
+# Characters of a failed response body kept in last_failure_content
+FAILURE_CONTENT_MAX_LENGTH = 500
+
+SIGNATURE_HEADER = 'X-Hook-Signature'
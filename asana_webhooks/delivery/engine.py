@@ -0,0 +1,259 @@
+"""
+Webhook delivery engine.
+
+Each round reads the next slice of the event journal (the change feed),
+routes it to the active webhooks, coalesces each webhook's events into
+batched, signed POSTs and sends them from a bounded thread pool. Database
+reads and writes stay on the calling thread; pool threads only do HTTP.
+
+A webhook's cursor (``last_event_sequence``) moves past events once they
+are delivered. Journal entries become visible in sequence order (see
+``asana_events.journal``), so a cursor never passes an entry whose
+transaction has yet to commit. A failed POST is retried with exponential backoff; after
+MAX_DELIVERY_ATTEMPTS the payload is moved to the dead-letter table and the
+webhook carries on with later events.
+
+A round that finds no new journal entries costs three small queries: the
+webhooks saved since the last round, which keep the subscription index
+current, the lowest cursor of the due webhooks and the journal read. The
+due webhooks are only loaded when there are events to route.
+"""
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+import requests
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+from asana_events.app_interfaces.service_interface import (
+    ServiceInterface as EventsServiceInterface
+)
+from asana_events.models.event import Event
+from asana_webhooks.models.webhook import Webhook
+from asana_webhooks.interactors.storage_interfaces.storage_interface import (
+    StorageInterface
+)
+from asana_webhooks.constants.constants import (
+    DELIVERY_WORKERS,
+    DELIVERY_POLL_INTERVAL_SECONDS,
+    FEED_BATCH_SIZE,
+    INDEX_SYNC_OVERLAP_SECONDS,
+    INDEX_RECONCILE_SECONDS,
+    MAX_EVENTS_PER_DELIVERY,
+    MAX_DELIVERY_ATTEMPTS,
+    RETRY_BACKOFF_BASE_SECONDS,
+    RETRY_BACKOFF_MAX_SECONDS,
+    FAILURE_CONTENT_MAX_LENGTH,
+    SIGNATURE_HEADER,
+)
+from asana_webhooks.delivery.http_client import WebhookHttpClient
+from asana_webhooks.delivery.metrics import DeliveryMetrics
+from asana_webhooks.delivery.routing import route_events
+from asana_webhooks.delivery.subscription_index import (
+    SubscriptionIndex,
+    get_subscription_index,
+)
+from asana_webhooks.delivery.signing import sign_payload
+
+
+@dataclass
+class DeliveryResult:
+    """Outcome of sending one webhook its events for this round."""
+    # Sequence of the last event that was delivered, if any
+    delivered_through: Optional[int] = None
+    # Set when a POST failed; later events were not attempted
+    failed_payload: Optional[Dict[str, Any]] = None
+    failed_first_sequence: Optional[int] = None
+    failed_last_sequence: Optional[int] = None
+    status_code: Optional[int] = None
+    error: str = ''
+
+
+def retry_backoff(retry_count: int) -> timedelta:
+    return timedelta(seconds=min(
+        RETRY_BACKOFF_BASE_SECONDS * 2 ** (retry_count - 1),
+        RETRY_BACKOFF_MAX_SECONDS
+    ))
+
+
+class WebhookDeliveryEngine:
+    def __init__(
+        self,
+        storage: StorageInterface,
+        workers: int = DELIVERY_WORKERS,
+        client: Optional[WebhookHttpClient] = None,
+        metrics: Optional[DeliveryMetrics] = None,
+        index: Optional[SubscriptionIndex] = None
+    ):
+        self.storage = storage
+        # An empty index is falsy
+        self.index = index if index is not None else get_subscription_index()
+        self.client = client or WebhookHttpClient(pool_size=workers)
+        self.metrics = metrics or DeliveryMetrics()
+        # Latest updated_at of the webhooks synced into the index, and when
+        # the index was last reconciled with every active webhook
+        self._synced_through: Optional[datetime] = None
+        self._reconciled_at: Optional[float] = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix='webhook-delivery'
+        )
+
+    def run_once(self) -> int:
+        """Run one delivery round; return how many journal entries it read."""
+        self._sync_index()
+        due_at = timezone.now()
+        cursor = self.storage.get_due_cursor(due_at)
+        if cursor is None:
+            return 0
+        events = EventsServiceInterface.get_events_after(cursor, FEED_BATCH_SIZE)
+        if not events:
+            return 0
+        head = events[-1].sequence
+        webhooks = self.storage.get_due_webhooks(due_at)
+
+        routed = route_events(webhooks, events, self.index, self.storage)
+        futures = {
+            webhook: self._executor.submit(self._deliver, webhook, webhook_events)
+            for webhook, webhook_events in routed.items()
+        }
+        results = {webhook: future.result() for webhook, future in futures.items()}
+
+        now = timezone.now()
+        # Webhooks with nothing in this slice just skip past it, unless they
+        # were created after the index was synced and could not be matched
+        self.storage.advance_webhooks(
+            [
+                str(webhook.gid) for webhook in webhooks
+                if webhook not in routed and str(webhook.gid) in self.index
+            ],
+            head
+        )
+        self.storage.advance_webhooks(
+            [
+                str(webhook.gid) for webhook, result in results.items()
+                if result.failed_payload is None
+            ],
+            head,
+            succeeded_at=now
+        )
+        for webhook, result in results.items():
+            if result.failed_payload is not None:
+                self._handle_failure(webhook, result, now)
+
+        return len(events)
+
+    def run_forever(
+        self,
+        stop_event: threading.Event,
+        poll_interval: float = DELIVERY_POLL_INTERVAL_SECONDS
+    ) -> None:
+        while not stop_event.is_set():
+            if not self.run_once():
+                stop_event.wait(poll_interval)
+
+    def _sync_index(self) -> None:
+        """
+        Index the webhooks saved since the last round, and every
+        INDEX_RECONCILE_SECONDS all active ones, which also drops those
+        deleted by other processes.
+        """
+        now = time.monotonic()
+        if (
+            self._reconciled_at is None
+            or now - self._reconciled_at >= INDEX_RECONCILE_SECONDS
+        ):
+            started = timezone.now()
+            webhooks = self.storage.get_active_webhooks()
+            self.index.sync(webhooks, complete=True)
+            self._reconciled_at = now
+            self._synced_through = max(
+                [webhook.updated_at for webhook in webhooks] + [started]
+            )
+            return
+        webhooks = self.storage.get_webhooks_changed_since(
+            self._synced_through - timedelta(seconds=INDEX_SYNC_OVERLAP_SECONDS)
+        )
+        self.index.sync(webhooks)
+        if webhooks:
+            self._synced_through = max(
+                self._synced_through,
+                max(webhook.updated_at for webhook in webhooks)
+            )
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        self.client.close()
+
+    def _deliver(self, webhook: Webhook, events: List[Event]) -> DeliveryResult:
+        result = DeliveryResult()
+        for start in range(0, len(events), MAX_EVENTS_PER_DELIVERY):
+            batch = events[start:start + MAX_EVENTS_PER_DELIVERY]
+            payload = {
+                'events': [EventsServiceInterface.format_event(event) for event in batch]
+            }
+            body = json.dumps(payload, cls=DjangoJSONEncoder).encode()
+            headers = {
+                'Content-Type': 'application/json',
+                SIGNATURE_HEADER: sign_payload(webhook.secret, body),
+            }
+
+            started = time.monotonic()
+            try:
+                status_code, content = self.client.post(webhook.target, body, headers)
+            except requests.RequestException as e:
+                status_code, content = None, str(e)
+            succeeded = status_code is not None and 200 <= status_code < 300
+            self.metrics.record_attempt(time.monotonic() - started, succeeded, len(batch))
+
+            if not succeeded:
+                result.failed_payload = payload
+                result.failed_first_sequence = batch[0].sequence
+                result.failed_last_sequence = batch[-1].sequence
+                result.status_code = status_code
+                result.error = content[:FAILURE_CONTENT_MAX_LENGTH]
+                return result
+            result.delivered_through = batch[-1].sequence
+        return result
+
+    def _handle_failure(self, webhook: Webhook, result: DeliveryResult, now) -> None:
+        attempts = webhook.delivery_retry_count + 1
+        failure_content = (
+            f"{result.status_code}: {result.error}"
+            if result.status_code is not None else result.error
+        )
+        last_event_sequence = result.delivered_through or webhook.last_event_sequence
+
+        if attempts >= MAX_DELIVERY_ATTEMPTS:
+            self.storage.create_dead_letter(
+                webhook_gid=str(webhook.gid),
+                payload=result.failed_payload,
+                first_event_sequence=result.failed_first_sequence,
+                last_event_sequence=result.failed_last_sequence,
+                attempts=attempts,
+                last_status_code=result.status_code,
+                last_error=result.error
+            )
+            self.metrics.record_dead_letter()
+            # Give up on this payload and carry on after it
+            self.storage.record_delivery_failure(
+                webhook_gid=str(webhook.gid),
+                last_event_sequence=result.failed_last_sequence,
+                retry_count=0,
+                next_attempt_after=None,
+                failure_content=failure_content,
+                failed_at=now
+            )
+            return
+
+        self.storage.record_delivery_failure(
+            webhook_gid=str(webhook.gid),
+            last_event_sequence=last_event_sequence,
+            retry_count=attempts,
+            next_attempt_after=now + retry_backoff(attempts),
+            failure_content=failure_content,
+            failed_at=now
+        )
@@ -0,0 +1,33 @@
+from typing import Dict, Tuple
+import requests
+from requests.adapters import HTTPAdapter
+from asana_webhooks.constants.constants import DELIVERY_TIMEOUT_SECONDS
+
+
+class WebhookHttpClient:
+    """
+    POSTs webhook payloads over a shared requests.Session. The session keeps
+    up to ``pool_size`` connections per target host alive between
+    deliveries, so busy targets are not re-dialed for every POST.
+    """
+
+    def __init__(self, pool_size: int, timeout: float = DELIVERY_TIMEOUT_SECONDS):
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def post(self, url: str, body: bytes, headers: Dict[str, str]) -> Tuple[int, str]:
+        """Return (status code, response text). Network errors raise."""
+        response = self.session.post(
+            url,
+            data=body,
+            headers=headers,
+            timeout=self.timeout,
+            allow_redirects=False
+        )
+        return response.status_code, response.text
+
+    def close(self) -> None:
+        self.session.close()
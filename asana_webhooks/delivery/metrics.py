@@ -0,0 +1,59 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Dict
+
+# Latency samples kept for percentiles
+LATENCY_WINDOW = 10000
+
+
+class DeliveryMetrics:
+    """Thread-safe delivery counters and latency percentiles."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._started_at = time.monotonic()
+        self._latencies = deque(maxlen=LATENCY_WINDOW)
+        self.attempts = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.dead_lettered = 0
+        self.events_delivered = 0
+
+    def record_attempt(self, latency: float, succeeded: bool, events: int) -> None:
+        with self._lock:
+            self.attempts += 1
+            self._latencies.append(latency)
+            if succeeded:
+                self.succeeded += 1
+                self.events_delivered += events
+            else:
+                self.failed += 1
+
+    def record_dead_letter(self) -> None:
+        with self._lock:
+            self.dead_lettered += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            elapsed = max(time.monotonic() - self._started_at, 1e-9)
+            latencies = sorted(self._latencies)
+            return {
+                'attempts': self.attempts,
+                'succeeded': self.succeeded,
+                'failed': self.failed,
+                'dead_lettered': self.dead_lettered,
+                'events_delivered': self.events_delivered,
+                'deliveries_per_second': self.succeeded / elapsed,
+                'events_per_second': self.events_delivered / elapsed,
+                'latency_p50_ms': _percentile(latencies, 0.50) * 1000,
+                'latency_p95_ms': _percentile(latencies, 0.95) * 1000,
+                'latency_p99_ms': _percentile(latencies, 0.99) * 1000,
+            }
+
+
+def _percentile(sorted_values, fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(int(len(sorted_values) * fraction), len(sorted_values) - 1)
+    return sorted_values[index]
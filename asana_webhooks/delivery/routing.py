@@ -0,0 +1,38 @@
+from collections import defaultdict
+from typing import Dict, List
+from asana_events.models.event import Event
+from asana_webhooks.models.webhook import Webhook
+from asana_webhooks.interactors.storage_interfaces.storage_interface import (
+    StorageInterface
+)
+from asana_webhooks.delivery.subscription_index import (
+    SubscriptionIndex,
+    ancestor_gids_for,
+)
+
+
+def route_events(
+    webhooks: List[Webhook],
+    events: List[Event],
+    index: SubscriptionIndex,
+    storage: StorageInterface
+) -> Dict[Webhook, List[Event]]:
+    """
+    Match journal entries to the given webhooks through the subscription
+    index. A webhook on a resource gets events on that resource and on
+    everything under it (a project's tasks and their stories, a workspace's
+    everything). Events at or before a webhook's cursor were already handled.
+    """
+    webhooks_by_gid = {str(webhook.gid): webhook for webhook in webhooks}
+    task_projects = ancestor_gids_for(events, storage)
+
+    routed = defaultdict(list)
+    for event in events:
+        ancestor_gids = task_projects.get(event.resource_gid, [])
+        if event.parent_type == 'task':
+            ancestor_gids = ancestor_gids + task_projects.get(event.parent_gid, [])
+        for webhook_gid in index.match(event, ancestor_gids):
+            webhook = webhooks_by_gid.get(webhook_gid)
+            if webhook is not None and event.sequence > (webhook.last_event_sequence or 0):
+                routed[webhook].append(event)
+    return routed
@@ -0,0 +1,7 @@
+import hashlib
+import hmac
+
+
+def sign_payload(secret: str, body: bytes) -> str:
+    """X-Hook-Signature: hex HMAC-SHA256 of the request body keyed by the secret."""
+    return hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
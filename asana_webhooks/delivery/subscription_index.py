@@ -0,0 +1,162 @@
+"""
+In-memory webhook subscription index.
+
+Webhooks are indexed by the gid of the resource they watch. An event is
+matched by looking up its resource gid and each of its ancestors' gids
+(task -> parent task / project -> workspace) and applying the filters of
+the webhooks found there, so matching costs one dict lookup per ancestor
+plus the hooks that are actually subscribed, however many webhooks exist.
+
+The process-wide index (``get_subscription_index``) follows Webhook saves
+and deletes through signals; ``sync`` catches up with webhooks saved or
+deleted by other processes.
+"""
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from asana_events.models.event import Event
+from asana_webhooks.models.webhook import Webhook
+from asana_webhooks.interactors.storage_interfaces.storage_interface import (
+    StorageInterface
+)
+
+
+@dataclass(frozen=True)
+class Subscription:
+    webhook_gid: str
+    resource_gid: str
+    filters: Tuple[Tuple[Tuple[str, str], ...], ...] = ()
+
+    @classmethod
+    def from_webhook(cls, webhook: Webhook) -> 'Subscription':
+        return cls(
+            webhook_gid=str(webhook.gid),
+            resource_gid=webhook.resource_gid,
+            filters=tuple(
+                tuple(sorted(webhook_filter.items()))
+                for webhook_filter in webhook.filters or ()
+            )
+        )
+
+    def accepts(self, event: Event) -> bool:
+        if not self.filters:
+            return True
+        return any(
+            all(getattr(event, key) == value for key, value in webhook_filter)
+            for webhook_filter in self.filters
+        )
+
+
+class SubscriptionIndex:
+    def __init__(self):
+        self._lock = threading.Lock()
+        # resource gid -> webhook gid -> subscription
+        self._by_resource: Dict[str, Dict[str, Subscription]] = {}
+        self._by_webhook: Dict[str, Subscription] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_webhook)
+
+    def __contains__(self, webhook_gid: str) -> bool:
+        return webhook_gid in self._by_webhook
+
+    def add(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._add(subscription)
+
+    def discard(self, webhook_gid: str) -> None:
+        with self._lock:
+            self._discard(webhook_gid)
+
+    def update_webhook(self, webhook: Webhook) -> None:
+        if webhook.active:
+            self.add(Subscription.from_webhook(webhook))
+        else:
+            self.discard(str(webhook.gid))
+
+    def match(self, event: Event, ancestor_gids: Iterable[str] = ()) -> Set[str]:
+        """
+        Gids of the webhooks subscribed to ``event``: those watching the
+        resource itself, its parent, its workspace or any of
+        ``ancestor_gids``, whose filters accept the event.
+        """
+        gids = {event.resource_gid, event.parent_gid, event.workspace_gid}
+        gids.update(ancestor_gids)
+        matched = set()
+        with self._lock:
+            for gid in gids:
+                for subscription in self._by_resource.get(gid, {}).values():
+                    if subscription.accepts(event):
+                        matched.add(subscription.webhook_gid)
+        return matched
+
+    def sync(self, webhooks: Iterable[Webhook], complete: bool = False) -> None:
+        """
+        Bring the index up to date with ``webhooks``: active ones missing
+        or out of date are indexed, inactive ones dropped. The delivery
+        engine calls this with the rows changed since its last sync, which
+        picks up webhooks edited by other processes. With ``complete``,
+        ``webhooks`` are every active webhook and any other indexed one
+        (deleted elsewhere) is dropped as well.
+        """
+        with self._lock:
+            synced = set()
+            for webhook in webhooks:
+                webhook_gid = str(webhook.gid)
+                synced.add(webhook_gid)
+                if not webhook.active:
+                    self._discard(webhook_gid)
+                    continue
+                subscription = Subscription.from_webhook(webhook)
+                if self._by_webhook.get(webhook_gid) != subscription:
+                    self._add(subscription)
+            if complete:
+                for webhook_gid in set(self._by_webhook) - synced:
+                    self._discard(webhook_gid)
+
+    def _add(self, subscription: Subscription) -> None:
+        self._discard(subscription.webhook_gid)
+        self._by_webhook[subscription.webhook_gid] = subscription
+        self._by_resource.setdefault(
+            subscription.resource_gid, {}
+        )[subscription.webhook_gid] = subscription
+
+    def _discard(self, webhook_gid: str) -> None:
+        subscription = self._by_webhook.pop(webhook_gid, None)
+        if subscription is None:
+            return
+        subscriptions = self._by_resource.get(subscription.resource_gid)
+        subscriptions.pop(webhook_gid, None)
+        if not subscriptions:
+            del self._by_resource[subscription.resource_gid]
+
+
+_subscription_index: Optional[SubscriptionIndex] = None
+_subscription_index_lock = threading.Lock()
+
+
+def get_subscription_index() -> SubscriptionIndex:
+    global _subscription_index
+    with _subscription_index_lock:
+        if _subscription_index is None:
+            _subscription_index = SubscriptionIndex()
+        return _subscription_index
+
+
+def ancestor_gids_for(
+    events: List[Event],
+    storage: StorageInterface
+) -> Dict[str, List[str]]:
+    """
+    Project gids of the tasks the events are about (a task's own events and
+    those of its stories and attachments), loaded with one query.
+    """
+    task_gids = set()
+    for event in events:
+        if event.resource_type == 'task':
+            task_gids.add(event.resource_gid)
+        if event.parent_type == 'task':
+            task_gids.add(event.parent_gid)
+    if not task_gids:
+        return {}
+    return storage.get_task_project_gids(task_gids)
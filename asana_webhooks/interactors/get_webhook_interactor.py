@@ -33,6 +33,15 @@ class GetWebhookInteractor:
             'active': webhook.active,
             'created_at': webhook.created_at.isoformat(),
             'updated_at': webhook.updated_at.isoformat(),
+            'last_success_at': (
+                webhook.last_success_at.isoformat()
+                if webhook.last_success_at else None
+            ),
+            'last_failure_at': (
+                webhook.last_failure_at.isoformat()
+                if webhook.last_failure_at else None
+            ),
+            'last_failure_content': webhook.last_failure_content,
         }
 
         return self.presenter.get_webhook_response(webhook_dict)
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
 from asana_webhooks.models.webhook import Webhook
 
 
@@ -17,3 +18,56 @@ class StorageInterface(ABC):
     ) -> List[Webhook]:
         pass
 
+    @abstractmethod
+    def get_due_webhooks(self, now: datetime) -> List[Webhook]:
+        pass
+
+    @abstractmethod
+    def get_due_cursor(self, now: datetime) -> Optional[int]:
+        pass
+
+    @abstractmethod
+    def get_active_webhooks(self) -> List[Webhook]:
+        pass
+
+    @abstractmethod
+    def get_webhooks_changed_since(self, since: datetime) -> List[Webhook]:
+        pass
+
+    @abstractmethod
+    def get_task_project_gids(self, task_gids: Iterable[str]) -> Dict[str, List[str]]:
+        pass
+
+    @abstractmethod
+    def advance_webhooks(
+        self,
+        webhook_gids: List[str],
+        last_event_sequence: int,
+        succeeded_at: Optional[datetime] = None
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def record_delivery_failure(
+        self,
+        webhook_gid: str,
+        last_event_sequence: int,
+        retry_count: int,
+        next_attempt_after: Optional[datetime],
+        failure_content: str,
+        failed_at: datetime
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def create_dead_letter(
+        self,
+        webhook_gid: str,
+        payload: Dict[str, Any],
+        first_event_sequence: int,
+        last_event_sequence: int,
+        attempts: int,
+        last_status_code: Optional[int],
+        last_error: str
+    ) -> None:
+        pass
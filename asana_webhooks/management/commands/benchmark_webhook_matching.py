@@ -0,0 +1,96 @@
+import random
+import time
+import uuid
+from django.core.management.base import BaseCommand
+from asana_events.models.event import Event
+from asana_webhooks.delivery.subscription_index import Subscription, SubscriptionIndex
+
+
+class Command(BaseCommand):
+    help = (
+        "Time matching events against an in-memory subscription index of "
+        "synthetic webhooks, next to a scan of every webhook per event."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--webhooks', type=int, default=100000)
+        parser.add_argument('--events', type=int, default=10000)
+        parser.add_argument('--workspaces', type=int, default=10)
+        parser.add_argument('--projects', type=int, default=5000)
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+
+        def gids(count):
+            return [str(uuid.UUID(int=rng.getrandbits(128))) for _ in range(count)]
+
+        workspaces = gids(options['workspaces'])
+        projects = gids(options['projects'])
+        tasks = gids(options['webhooks'])
+        project_workspace = {project: rng.choice(workspaces) for project in projects}
+        task_project = {task: rng.choice(projects) for task in tasks}
+
+        # Mostly task webhooks, some on projects, a few on workspaces
+        subscriptions = []
+        for i in range(options['webhooks']):
+            roll = rng.random()
+            if roll < 0.001:
+                resource_gid = rng.choice(workspaces)
+            elif roll < 0.2:
+                resource_gid = rng.choice(projects)
+            else:
+                resource_gid = rng.choice(tasks)
+            filters = (
+                ((('action', 'changed'),),) if rng.random() < 0.5 else ()
+            )
+            subscriptions.append(Subscription(
+                webhook_gid=f'hook-{i}',
+                resource_gid=resource_gid,
+                filters=filters
+            ))
+
+        started = time.perf_counter()
+        index = SubscriptionIndex()
+        for subscription in subscriptions:
+            index.add(subscription)
+        build_seconds = time.perf_counter() - started
+
+        events = []
+        for _ in range(options['events']):
+            task = rng.choice(tasks)
+            project = task_project[task]
+            events.append((
+                Event(
+                    resource_gid=task,
+                    resource_type='task',
+                    action=rng.choice(['changed', 'added']),
+                    workspace_gid=project_workspace[project]
+                ),
+                [project]
+            ))
+
+        started = time.perf_counter()
+        matched = sum(len(index.match(event, ancestors)) for event, ancestors in events)
+        index_seconds = time.perf_counter() - started
+
+        scanned_events = events[:max(1, len(events) // 100)]
+        started = time.perf_counter()
+        for event, ancestors in scanned_events:
+            gids_of_event = {event.resource_gid, event.workspace_gid, *ancestors}
+            [
+                subscription for subscription in subscriptions
+                if subscription.resource_gid in gids_of_event
+                and subscription.accepts(event)
+            ]
+        scan_seconds = time.perf_counter() - started
+
+        per_event_index = index_seconds / len(events) * 1e6
+        per_event_scan = scan_seconds / len(scanned_events) * 1e6
+        self.stdout.write(
+            f"{len(index)} webhooks indexed in {build_seconds:.2f}s\n"
+            f"index: {per_event_index:.1f} us/event "
+            f"({matched / len(events):.1f} hooks matched per event)\n"
+            f"scan:  {per_event_scan:.1f} us/event "
+            f"({per_event_scan / per_event_index:.0f}x slower)"
+        )
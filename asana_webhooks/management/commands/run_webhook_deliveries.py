@@ -0,0 +1,67 @@
+import logging
+import threading
+from django.core.management.base import BaseCommand
+from asana_webhooks.constants.constants import (
+    DELIVERY_WORKERS,
+    DELIVERY_POLL_INTERVAL_SECONDS,
+)
+from asana_webhooks.delivery.engine import WebhookDeliveryEngine
+from asana_webhooks.storages.storage_implementation import StorageImplementation
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Deliver journal events to webhook targets until interrupted."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=DELIVERY_WORKERS,
+            help=f"Concurrent deliveries (default: {DELIVERY_WORKERS})."
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help="Run delivery rounds until caught up, then exit."
+        )
+        parser.add_argument(
+            '--stats-interval',
+            type=float,
+            default=60.0,
+            help="Seconds between delivery metrics log lines (0 disables)."
+        )
+
+    def handle(self, *args, **options):
+        engine = WebhookDeliveryEngine(
+            storage=StorageImplementation(),
+            workers=options['workers']
+        )
+        try:
+            if options['once']:
+                while engine.run_once():
+                    pass
+                self.stdout.write(str(engine.metrics.snapshot()))
+                return
+
+            stop_event = threading.Event()
+            stats_interval = options['stats_interval']
+            if stats_interval > 0:
+                threading.Thread(
+                    target=self._log_stats,
+                    args=(engine, stop_event, stats_interval),
+                    name='webhook-delivery-stats',
+                    daemon=True
+                ).start()
+            self.stdout.write(f"Delivering webhooks with {options['workers']} worker(s).")
+            try:
+                engine.run_forever(stop_event, DELIVERY_POLL_INTERVAL_SECONDS)
+            except KeyboardInterrupt:
+                stop_event.set()
+        finally:
+            engine.close()
+
+    def _log_stats(self, engine, stop_event, interval):
+        while not stop_event.wait(interval):
+            logger.info("Webhook delivery metrics: %s", engine.metrics.snapshot())
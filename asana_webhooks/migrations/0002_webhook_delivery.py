@@ -0,0 +1,90 @@
+# Generated by Django 6.0 on 2026-10-17 02:48
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+def start_existing_webhooks_at_head(apps, schema_editor):
+    # Webhooks created before delivery existed start from the current
+    # journal head instead of replaying it from the beginning
+    Event = apps.get_model('asana_events', 'Event')
+    Webhook = apps.get_model('asana_webhooks', 'Webhook')
+    head = Event.objects.aggregate(head=models.Max('sequence'))['head'] or 0
+    Webhook.objects.filter(last_event_sequence__isnull=True).update(
+        last_event_sequence=head
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('asana_events', '0001_initial'),
+        ('asana_webhooks', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WebhookDeadLetter',
+            fields=[
+                ('gid', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('payload', models.JSONField()),
+                ('first_event_sequence', models.BigIntegerField()),
+                ('last_event_sequence', models.BigIntegerField()),
+                ('attempts', models.IntegerField()),
+                ('last_status_code', models.IntegerField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'asana_webhooks_webhook_dead_letter',
+            },
+        ),
+        migrations.AddField(
+            model_name='webhook',
+            name='delivery_retry_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='webhook',
+            name='last_event_sequence',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='webhook',
+            name='last_failure_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='webhook',
+            name='last_failure_content',
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='webhook',
+            name='last_success_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='webhook',
+            name='next_attempt_after',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='webhook',
+            index=models.Index(fields=['active', 'next_attempt_after'], name='asana_webho_active_6a83a3_idx'),
+        ),
+        migrations.AddField(
+            model_name='webhookdeadletter',
+            name='webhook',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='dead_letters', to='asana_webhooks.webhook'),
+        ),
+        migrations.AddIndex(
+            model_name='webhookdeadletter',
+            index=models.Index(fields=['webhook', 'created_at'], name='asana_webho_webhook_fa59e5_idx'),
+        ),
+        migrations.RunPython(
+            start_existing_webhooks_at_head,
+            migrations.RunPython.noop
+        ),
+    ]
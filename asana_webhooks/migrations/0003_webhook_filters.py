@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-17 03:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('asana_webhooks', '0002_webhook_delivery'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='webhook',
+            name='filters',
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.0 on 2026-10-17 04:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('asana_webhooks', '0003_webhook_filters'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='webhook',
+            index=models.Index(fields=['updated_at'], name='asana_webho_updated_45cd7a_idx'),
+        ),
+    ]
@@ -1,4 +1,4 @@
 from .webhook import Webhook
+from .webhook_dead_letter import WebhookDeadLetter
 
-__all__ = ['Webhook']
-
+__all__ = ['Webhook', 'WebhookDeadLetter']
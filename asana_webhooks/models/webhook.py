@@ -14,6 +14,7 @@ class Webhook(models.Model):
         'story',
         'attachment',
     ]
+    FILTER_KEYS = ('resource_type', 'resource_subtype', 'action')
     """
     Webhook model for event notifications.
     """
@@ -27,19 +28,45 @@ class Webhook(models.Model):
     target = models.URLField()
     active = models.BooleanField(default=True)
     secret = models.CharField(max_length=255)
+    # Asana WebhookFilter objects; an event is delivered when it matches any
+    # of them ({} or no filters matches everything). Supported keys are in
+    # FILTER_KEYS.
+    filters = models.JSONField(default=list, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Delivery state. last_event_sequence is the last event journal entry
+    # this webhook has been sent (or skipped past).
+    last_event_sequence = models.BigIntegerField(null=True, blank=True)
+    delivery_retry_count = models.IntegerField(default=0)
+    next_attempt_after = models.DateTimeField(null=True, blank=True)
+    last_success_at = models.DateTimeField(null=True, blank=True)
+    last_failure_at = models.DateTimeField(null=True, blank=True)
+    last_failure_content = models.TextField(null=True, blank=True)
+
     class Meta:
         db_table = 'asana_webhooks_webhook'
         indexes = [
             models.Index(fields=['resource']),
             models.Index(fields=['resource_gid']),
             models.Index(fields=['active']),
+            models.Index(fields=['active', 'next_attempt_after']),
+            # Delivery engines poll for webhooks changed since their last look
+            models.Index(fields=['updated_at']),
         ]
 
     def clean(self):
         """Validate webhook data."""
+        if not isinstance(self.filters, list) or not all(
+            isinstance(webhook_filter, dict)
+            and set(webhook_filter) <= set(self.FILTER_KEYS)
+            for webhook_filter in self.filters
+        ):
+            raise ValidationError({
+                'filters': 'Filters must be a list of objects with keys: '
+                           f'{", ".join(self.FILTER_KEYS)}'
+            })
+
         # Validate resource type
         if self.resource and self.resource not in self.RESOURCE_TYPES:
             raise ValidationError(
@@ -58,6 +85,12 @@ class Webhook(models.Model):
     def save(self, *args, **kwargs):
         """Override save to run validations."""
         self.full_clean()
+        if self.last_event_sequence is None:
+            # Only events from now on are delivered to a new webhook
+            from asana_events.app_interfaces.service_interface import (
+                ServiceInterface as EventsServiceInterface
+            )
+            self.last_event_sequence = EventsServiceInterface.get_latest_sequence()
         super().save(*args, **kwargs)
 
     def __str__(self):
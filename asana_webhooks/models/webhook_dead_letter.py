@@ -0,0 +1,37 @@
+import uuid
+from django.db import models
+
+
+class WebhookDeadLetter(models.Model):
+    """
+    A webhook payload that could not be delivered within the retry budget.
+    Kept so it can be inspected and replayed; the webhook itself moves on to
+    later events.
+    """
+    gid = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False
+    )
+    webhook = models.ForeignKey(
+        'asana_webhooks.Webhook',
+        on_delete=models.CASCADE,
+        related_name='dead_letters'
+    )
+    payload = models.JSONField()
+    # Event journal range the payload covers
+    first_event_sequence = models.BigIntegerField()
+    last_event_sequence = models.BigIntegerField()
+    attempts = models.IntegerField()
+    last_status_code = models.IntegerField(null=True, blank=True)
+    last_error = models.TextField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'asana_webhooks_webhook_dead_letter'
+        indexes = [
+            models.Index(fields=['webhook', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"Dead letter for webhook {self.webhook_id} ({self.first_event_sequence}-{self.last_event_sequence})"
@@ -0,0 +1,18 @@
+"""
+Keeps the process's webhook subscription index in step with Webhook saves
+and deletes.
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from asana_webhooks.models.webhook import Webhook
+from asana_webhooks.delivery.subscription_index import get_subscription_index
+
+
+@receiver(post_save, sender=Webhook, dispatch_uid='subscription_index_save')
+def index_webhook_save(sender, instance, **kwargs):
+    get_subscription_index().update_webhook(instance)
+
+
+@receiver(post_delete, sender=Webhook, dispatch_uid='subscription_index_delete')
+def index_webhook_delete(sender, instance, **kwargs):
+    get_subscription_index().discard(str(instance.gid))
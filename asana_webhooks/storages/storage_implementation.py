@@ -1,5 +1,10 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+from django.db.models import Min, Q
+from django.db.models.functions import Coalesce
+from asana_tasks.models.task_project import TaskProject
 from asana_webhooks.models.webhook import Webhook
+from asana_webhooks.models.webhook_dead_letter import WebhookDeadLetter
 from asana_webhooks.interactors.storage_interfaces.storage_interface import (
     StorageInterface
 )
@@ -25,3 +30,100 @@ class StorageImplementation(StorageInterface):
 
         return list(queryset[offset:offset + limit])
 
+    def get_due_webhooks(self, now: datetime) -> List[Webhook]:
+        """Active webhooks that are not waiting out a retry backoff."""
+        return list(
+            Webhook.objects.filter(
+                Q(next_attempt_after__isnull=True) | Q(next_attempt_after__lte=now),
+                active=True
+            )
+        )
+
+    def get_due_cursor(self, now: datetime) -> Optional[int]:
+        """
+        The lowest cursor of the due webhooks (0 for one that has read
+        nothing yet), or None when none is due.
+        """
+        return Webhook.objects.filter(
+            Q(next_attempt_after__isnull=True) | Q(next_attempt_after__lte=now),
+            active=True
+        ).aggregate(
+            cursor=Min(Coalesce('last_event_sequence', 0))
+        )['cursor']
+
+    def get_active_webhooks(self) -> List[Webhook]:
+        return list(Webhook.objects.filter(active=True))
+
+    def get_webhooks_changed_since(self, since: datetime) -> List[Webhook]:
+        """Webhooks, active or not, saved after ``since``."""
+        return list(Webhook.objects.filter(updated_at__gt=since))
+
+    def get_task_project_gids(self, task_gids: Iterable[str]) -> Dict[str, List[str]]:
+        """Project gids of each task, for matching project webhooks."""
+        task_projects = {}
+        for task_gid, project_gid in TaskProject.objects.filter(
+            task_id__in=task_gids
+        ).values_list('task_id', 'project_id'):
+            task_projects.setdefault(str(task_gid), []).append(str(project_gid))
+        return task_projects
+
+    def advance_webhooks(
+        self,
+        webhook_gids: List[str],
+        last_event_sequence: int,
+        succeeded_at: Optional[datetime] = None
+    ) -> None:
+        """
+        Move the webhooks' cursors forward to ``last_event_sequence`` with one
+        UPDATE. With ``succeeded_at`` the webhooks also had events delivered,
+        which clears their retry state.
+        """
+        fields = {'last_event_sequence': last_event_sequence}
+        if succeeded_at is not None:
+            fields.update(
+                delivery_retry_count=0,
+                next_attempt_after=None,
+                last_success_at=succeeded_at
+            )
+        Webhook.objects.filter(
+            Q(last_event_sequence__isnull=True)
+            | Q(last_event_sequence__lt=last_event_sequence),
+            gid__in=webhook_gids
+        ).update(**fields)
+
+    def record_delivery_failure(
+        self,
+        webhook_gid: str,
+        last_event_sequence: int,
+        retry_count: int,
+        next_attempt_after: Optional[datetime],
+        failure_content: str,
+        failed_at: datetime
+    ) -> None:
+        Webhook.objects.filter(gid=webhook_gid).update(
+            last_event_sequence=last_event_sequence,
+            delivery_retry_count=retry_count,
+            next_attempt_after=next_attempt_after,
+            last_failure_at=failed_at,
+            last_failure_content=failure_content
+        )
+
+    def create_dead_letter(
+        self,
+        webhook_gid: str,
+        payload: Dict[str, Any],
+        first_event_sequence: int,
+        last_event_sequence: int,
+        attempts: int,
+        last_status_code: Optional[int],
+        last_error: str
+    ) -> None:
+        WebhookDeadLetter.objects.create(
+            webhook_id=webhook_gid,
+            payload=payload,
+            first_event_sequence=first_event_sequence,
+            last_event_sequence=last_event_sequence,
+            attempts=attempts,
+            last_status_code=last_status_code,
+            last_error=last_error
+        )
@@ -44,7 +44,10 @@ class GetWebhookView(APIView):
                                 "active": True,
                                 "secret": "webhook_secret_key",
                                 "created_at": "2025-12-09T10:00:00Z",
-                                "updated_at": "2025-12-09T10:00:00Z"
+                                "updated_at": "2025-12-09T10:00:00Z",
+                                "last_success_at": "2025-12-09T10:05:00Z",
+                                "last_failure_at": None,
+                                "last_failure_content": None
                             }
                         }
                     )
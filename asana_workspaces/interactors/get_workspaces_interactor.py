@@ -1,8 +1,7 @@
 """
 Interactor for getting all workspaces.
 """
-from typing import Dict, Any, List, Optional
-import base64
+from typing import Dict, Any, List, Optional, Union
 from asana_workspaces.interactors.storage_interfaces.storage_interface import (
     StorageInterface
 )
@@ -13,6 +12,7 @@ from asana_workspaces.constants.constants import (
     DEFAULT_OFFSET,
     DEFAULT_LIMIT,
 )
+from asana_backend.utils.pagination import build_next_page
 
 
 class GetWorkspacesInteractor:
@@ -26,7 +26,7 @@ class GetWorkspacesInteractor:
 
     def get_workspaces(
         self,
-        offset: int = DEFAULT_OFFSET,
+        offset: Union[int, str] = DEFAULT_OFFSET,
         limit: int = DEFAULT_LIMIT,
         opt_fields: Optional[str] = None,
         request=None
@@ -65,39 +65,10 @@ class GetWorkspacesInteractor:
             
             workspaces_list.append(workspace_dict)
 
-        # Generate next_page if there are more results
-        next_page = None
-        total_count = self.storage.get_workspaces_count()
-        has_more = (offset + limit) < total_count
-        
-        if has_more and request:
-            # Generate offset token (base64 encoded next offset)
-            next_offset = offset + limit
-            offset_token = base64.b64encode(
-                str(next_offset).encode('utf-8')
-            ).decode('utf-8')
-            
-            # Build next_page object
-            base_path = '/api/asana_workspaces/workspaces/'
-            query_params = f'limit={limit}&offset={offset_token}'
-            if opt_fields:
-                query_params += f'&opt_fields={opt_fields}'
-            
-            next_page = {
-                'offset': offset_token,
-                'path': f'{base_path}?{query_params}',
-                'uri': f'{request.scheme}://{request.get_host()}{base_path}?{query_params}'
-            }
-            
-            # Include next_page fields in opt_fields if requested
-            if opt_fields:
-                if 'offset' in requested_fields or 'path' in requested_fields or 'uri' in requested_fields:
-                    # Already included above
-                    pass
-
         response = self.presenter.get_workspaces_response(workspaces_list)
         
-        # Add next_page to response if exists
+        # Add next_page to response if there are more results
+        next_page = build_next_page(request, workspaces.next_offset)
         if next_page:
             response['next_page'] = next_page
         
@@ -2,7 +2,7 @@
 Storage interface for workspace operations.
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Union
 from asana_workspaces.models.workspace import Workspace
 
 
@@ -22,7 +22,7 @@ class StorageInterface(ABC):
     @abstractmethod
     def get_workspaces(
         self,
-        offset: int = 0,
+        offset: Union[int, str] = 0,
         limit: int = 50
     ) -> List[Workspace]:
         pass
@@ -55,13 +55,4 @@ class StorageInterface(ABC):
         user_gid: str
     ) -> bool:
         pass
-    
-    @abstractmethod
-    def get_workspace_events(
-        self,
-        workspace_gid: str,
-        offset: int = 0,
-        limit: int = 50
-    ) -> List:
-        pass
 
@@ -1,11 +1,13 @@
 """
 Storage implementation for workspace operations.
 """
-from typing import List, Optional
+from typing import List, Optional, Union
 from asana_workspaces.models.workspace import Workspace
 from asana_workspaces.interactors.storage_interfaces.storage_interface import (
     StorageInterface
 )
+from asana_backend.utils.identity_map import load
+from asana_backend.utils.pagination import paginate_queryset
 from asana_workspaces.exceptions.custom_exceptions import (
     WorkspaceDoesNotExistException
 )
@@ -25,17 +27,20 @@ class StorageImplementation(StorageInterface):
 
     def get_workspace(self, workspace_gid: str) -> Optional[Workspace]:
         try:
-            return Workspace.objects.get(gid=workspace_gid)
+            return load(Workspace, workspace_gid)
         except Workspace.DoesNotExist:
             return None
 
     def get_workspaces(
         self,
-        offset: int = 0,
+        offset: Union[int, str] = 0,
         limit: int = 50
     ) -> List[Workspace]:
-        return list(
-            Workspace.objects.all()[offset:offset + limit]
+        return paginate_queryset(
+            Workspace.objects.all(),
+            offset,
+            limit,
+            ordering=('gid',)
         )
     
     def get_workspaces_count(self) -> int:
@@ -119,18 +124,4 @@ class StorageImplementation(StorageInterface):
             return True
         except UserWorkspaceMembership.DoesNotExist:
             return False
-    
-    def get_workspace_events(
-        self,
-        workspace_gid: str,
-        offset: int = 0,
-        limit: int = 50
-    ) -> List:
-        """
-        Get workspace events.
-        For now, returns empty list as Events model is not implemented.
-        """
-        # Events would require an Event model
-        # For now, return empty list
-        return []
 
@@ -88,9 +88,6 @@ class AddUserToWorkspaceView(APIView):
         tags=["Workspaces"]
     )
     def post(self, request, workspace_gid: str):
-        import json
-        
-        opt_pretty = request.query_params.get('opt_pretty', 'false').lower() == 'true'
         
         try:
             validate_uuid(workspace_gid)
@@ -128,13 +125,6 @@ class AddUserToWorkspaceView(APIView):
                 user=serializer.validated_data['user']
             )
             
-            if opt_pretty:
-                response_data = json.dumps(response, indent=2, ensure_ascii=False)
-                return Response(
-                    json.loads(response_data),
-                    status=status.HTTP_200_OK
-                )
-            
             return Response(response, status=status.HTTP_200_OK)
         except (WorkspaceDoesNotExistException, UserDoesNotExistException) as e:
             error_response = {
@@ -36,6 +36,7 @@ from asana_workspaces.serializers import (
 )
 from asana_backend.utils.validators import validate_uuid
 from asana_backend.utils.decorators.ratelimit import ratelimit
+from asana_backend.utils.object_cache import CachedObject
 
 
 class GetWorkspaceView(APIView):
@@ -144,8 +145,6 @@ class GetWorkspaceView(APIView):
         description="Returns the full workspace record for a single workspace."
     )
     def get(self, request, workspace_gid: str):
-        import json
-        
         # Validate UUID format
         try:
             validate_uuid(workspace_gid)
@@ -161,7 +160,6 @@ class GetWorkspaceView(APIView):
 
         # Get query parameters
         opt_fields = request.query_params.get('opt_fields')
-        opt_pretty = request.query_params.get('opt_pretty', 'false').lower() == 'true'
 
         storage = StorageImplementation()
         presenter = GetWorkspacePresenterImplementation()
@@ -170,21 +168,19 @@ class GetWorkspaceView(APIView):
             presenter=presenter
         )
 
+        cached_workspace = CachedObject('workspace', workspace_gid, opt_fields)
         try:
-            response = interactor.get_workspace(
-                workspace_gid=workspace_gid,
-                opt_fields=opt_fields
-            )
-            
-            # Handle opt_pretty for pretty JSON formatting
-            if opt_pretty:
-                response_data = json.dumps(response, indent=2, ensure_ascii=False)
-                return Response(
-                    json.loads(response_data),
-                    status=status.HTTP_200_OK
+            response = cached_workspace.get_or_build(
+                lambda: interactor.get_workspace(
+                    workspace_gid=workspace_gid,
+                    opt_fields=opt_fields
                 )
-            
-            return Response(response, status=status.HTTP_200_OK)
+            )
+
+            validators = cached_workspace.validators()
+            return validators.check(request) or validators.apply(
+                Response(response, status=status.HTTP_200_OK)
+            )
         except WorkspaceDoesNotExistException as e:
             error_response = {
                 'errors': [{
@@ -14,11 +14,15 @@ from asana_workspaces.exceptions.custom_exceptions import (
     WorkspaceDoesNotExistException
 )
 from asana_workspaces.serializers import ErrorResponseSerializer
+from asana_events.app_interfaces.service_interface import (
+    ServiceInterface as EventsServiceInterface
+)
+from asana_events.exceptions.custom_exceptions import (
+    InvalidSyncTokenException
+)
 from asana_backend.utils.validators import validate_uuid
 from asana_backend.utils.decorators.ratelimit import ratelimit
-import hashlib
-import time
-import json
+from asana_backend.utils.error_responses import create_error_response
 
 
 class GetWorkspaceEventsView(APIView):
@@ -55,7 +59,7 @@ class GetWorkspaceEventsView(APIView):
                         'Success Response',
                         value={
                             "data": [],
-                            "sync": "de4774f6915eae04714ca93bb2f5ee81",
+                            "sync": "MTIzNDU",
                             "has_more": False
                         }
                     )
@@ -79,7 +83,6 @@ class GetWorkspaceEventsView(APIView):
         tags=["Workspaces"]
     )
     def get(self, request, workspace_gid: str):
-        opt_pretty = request.query_params.get('opt_pretty', 'false').lower() == 'true'
         sync_token = request.query_params.get('sync')
         
         try:
@@ -109,35 +112,15 @@ class GetWorkspaceEventsView(APIView):
             return Response(error_response, status=status.HTTP_404_NOT_FOUND)
         
         try:
-            # Get workspace events (for now, returns empty list as Events model is not implemented)
-            events = storage.get_workspace_events(
+            response = EventsServiceInterface.get_workspace_events(
                 workspace_gid=workspace_gid,
-                offset=0,
-                limit=1000
+                sync_token=sync_token
+            )
+        except InvalidSyncTokenException as e:
+            return Response(
+                {**create_error_response(e.message), 'sync': e.sync},
+                status=status.HTTP_412_PRECONDITION_FAILED
             )
-            
-            # Generate sync token
-            sync_token_new = hashlib.md5(
-                f"{workspace_gid}_{int(time.time())}".encode()
-            ).hexdigest()
-            
-            # Format events (empty for now)
-            events_list = []
-            
-            response = {
-                'data': events_list,
-                'sync': sync_token_new,
-                'has_more': False
-            }
-            
-            if opt_pretty:
-                response_data = json.dumps(response, indent=2, ensure_ascii=False)
-                return Response(
-                    json.loads(response_data),
-                    status=status.HTTP_200_OK
-                )
-            
-            return Response(response, status=status.HTTP_200_OK)
         except Exception as e:
             error_response = {
                 'errors': [{
@@ -147,4 +130,5 @@ class GetWorkspaceEventsView(APIView):
                 }]
             }
             return Response(error_response, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
+        
+        return Response(response, status=status.HTTP_200_OK)
@@ -1,6 +1,7 @@
 """
 View for getting all workspaces and creating a new workspace.
 """
+from django.core.exceptions import ValidationError
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -145,36 +146,24 @@ class GetWorkspacesView(APIView):
         description="Returns the compact records for all workspaces visible to the authorized user."
     )
     def get(self, request):
-        import json
-        import base64
-        
         # Get query parameters
         opt_fields = request.query_params.get('opt_fields')
-        opt_pretty = request.query_params.get('opt_pretty', 'false').lower() == 'true'
         
-        # Handle offset - can be string token or integer
-        offset_param = request.query_params.get('offset')
-        if offset_param:
-            try:
-                # Try to decode if it's a base64 token
-                try:
-                    decoded = base64.b64decode(offset_param).decode('utf-8')
-                    # If it decodes successfully, treat as token
-                    offset = offset_param
-                except:
-                    # If not base64, try as integer
-                    offset = int(offset_param)
-            except ValueError:
-                error_response = {
-                    'errors': [{
-                        'message': 'offset: Invalid format',
-                        'help': 'For more information on API status codes and how to handle them, read the docs on errors: https://asana.github.io/developer-docs/#errors',
-                        'phrase': '6 sad squid snuggle softly'
-                    }]
-                }
-                return Response(error_response, status=status.HTTP_400_BAD_REQUEST)
-        else:
-            offset = 0
+        # offset is either an offset token from next_page or a legacy
+        # integer offset
+        try:
+            offset, _ = validate_pagination_params(
+                offset=request.query_params.get('offset')
+            )
+        except ValidationError:
+            error_response = {
+                'errors': [{
+                    'message': 'offset: Invalid format',
+                    'help': 'For more information on API status codes and how to handle them, read the docs on errors: https://asana.github.io/developer-docs/#errors',
+                    'phrase': '6 sad squid snuggle softly'
+                }]
+            }
+            return Response(error_response, status=status.HTTP_400_BAD_REQUEST)
         
         # Validate limit
         limit_param = request.query_params.get('limit')
@@ -203,24 +192,13 @@ class GetWorkspacesView(APIView):
         )
 
         try:
-            # Convert offset to int if it's a number (for storage)
-            offset_int = offset if isinstance(offset, int) else 0
-            
             response = interactor.get_workspaces(
-                offset=offset_int,
+                offset=offset,
                 limit=limit,
                 opt_fields=opt_fields,
                 request=request  # Pass request for generating next_page URLs
             )
             
-            # Handle opt_pretty for pretty JSON formatting
-            if opt_pretty:
-                response_data = json.dumps(response, indent=2, ensure_ascii=False)
-                return Response(
-                    json.loads(response_data),
-                    status=status.HTTP_200_OK
-                )
-            
             return Response(response, status=status.HTTP_200_OK)
         except Exception as e:
             error_response = {
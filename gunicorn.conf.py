@@ -0,0 +1,47 @@
+"""
+gunicorn settings for serving the API; start it with
+``python -m asana_backend.serve``, which picks the worker class and the
+matching WSGI/ASGI application.
+
+Environment:
+    ASANA_WORKER_CLASS   sync, gthread (default) or uvicorn
+    WEB_CONCURRENCY      worker processes (default: from the CPU count)
+    ASANA_THREADS        threads per gthread worker (default 4)
+    ASANA_BIND           listen address (default 0.0.0.0:8000)
+    ASANA_TIMEOUT        seconds before a stuck worker is restarted (30)
+    ASANA_MAX_REQUESTS   requests after which a worker is recycled (1000)
+
+Workers load the application after forking (no preload_app), so SIGHUP
+reloads code and settings: new workers start, old ones finish their
+requests within graceful_timeout and exit.
+"""
+import os
+from asana_backend.serve import (
+    DEFAULT_THREADS,
+    DEFAULT_WORKER_CLASS,
+    default_workers,
+)
+
+_worker_class = os.environ.get('ASANA_WORKER_CLASS', DEFAULT_WORKER_CLASS)
+
+bind = os.environ.get('ASANA_BIND', '0.0.0.0:8000')
+workers = int(
+    os.environ.get('WEB_CONCURRENCY') or default_workers(_worker_class)
+)
+threads = int(os.environ.get('ASANA_THREADS', DEFAULT_THREADS))
+
+timeout = int(os.environ.get('ASANA_TIMEOUT', 30))
+graceful_timeout = timeout
+keepalive = 5
+
+# Recycle workers now and then so slow leaks cannot build up; the jitter
+# keeps them from all restarting at once
+max_requests = int(os.environ.get('ASANA_MAX_REQUESTS', 1000))
+max_requests_jitter = max_requests // 10
+
+# Worker heartbeats on tmpfs; a disk-backed /tmp can stall them in containers
+if os.path.isdir('/dev/shm'):
+    worker_tmp_dir = '/dev/shm'
+
+accesslog = os.environ.get('ASANA_ACCESS_LOG') or None
+errorlog = '-'
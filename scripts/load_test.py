@@ -0,0 +1,202 @@
+"""
+Load test: throughput of the production server against runserver.
+
+    python scripts/load_test.py --compare [--concurrency 32] [--duration 10]
+    python scripts/load_test.py --url http://localhost:8000/api/1.0/tasks/?workspace=...
+
+With --compare the script starts ``manage.py runserver`` and
+``python -m asana_backend.serve`` (each worker class given with
+--worker-class) on free ports against the same database, seeds a
+workspace with tasks if it has none, runs the same closed-loop load
+against each and prints requests per second and latency percentiles.
+Rate limiting is switched off for the servers it starts.
+"""
+import argparse
+import http.client
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+def run_load(url: str, concurrency: int, duration: float) -> Dict[str, float]:
+    """
+    ``concurrency`` clients each send GET ``url`` back to back on a
+    keep-alive connection for ``duration`` seconds.
+    """
+    parts = urlsplit(url)
+    path = parts.path + (f'?{parts.query}' if parts.query else '')
+    latencies: List[float] = []
+    # [non-200 responses, dropped connections]
+    failures = [0, 0]
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+
+    def client():
+        connection = http.client.HTTPConnection(parts.hostname, parts.port, timeout=30)
+        own_latencies, own_errors, own_drops = [], 0, 0
+        while time.monotonic() < deadline:
+            started = time.monotonic()
+            try:
+                connection.request('GET', path)
+                response = connection.getresponse()
+                response.read()
+                if response.status != 200:
+                    own_errors += 1
+                if response.getheader('Connection', '').lower() == 'close':
+                    connection.close()
+            except (OSError, http.client.HTTPException):
+                # Keep-alive connections are closed when a worker is
+                # recycled; the client reconnects as a browser would
+                own_drops += 1
+                connection.close()
+                connection = http.client.HTTPConnection(parts.hostname, parts.port, timeout=30)
+                continue
+            own_latencies.append(time.monotonic() - started)
+        connection.close()
+        with lock:
+            latencies.extend(own_latencies)
+            failures[0] += own_errors
+            failures[1] += own_drops
+
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - started
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'errors': failures[0],
+        'dropped': failures[1],
+        'rps': len(latencies) / elapsed,
+        'p50_ms': 1000 * statistics.median(latencies) if latencies else 0.0,
+        'p95_ms': 1000 * latencies[int(len(latencies) * 0.95)] if latencies else 0.0,
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for(url: str, timeout: float = 30) -> None:
+    parts = urlsplit(url)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            connection = http.client.HTTPConnection(parts.hostname, parts.port, timeout=2)
+            connection.request('GET', '/api/info/')
+            connection.getresponse().read()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Server at {url} did not start")
+
+
+def _seed_workspace(settings_module: str) -> str:
+    """The gid of a workspace with tasks, creating one if needed."""
+    script = (
+        "import django; django.setup()\n"
+        "from asana_workspaces.models.workspace import Workspace\n"
+        "from asana_tasks.models.task import Task\n"
+        "workspace = Workspace.objects.filter(name='Load test').first()\n"
+        "if workspace is None:\n"
+        "    workspace = Workspace.objects.create(name='Load test')\n"
+        "    Task.objects.bulk_create(\n"
+        "        Task(name=f'Task {i}', workspace=workspace) for i in range(500))\n"
+        "print(workspace.gid)\n"
+    )
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE=settings_module)
+    return subprocess.check_output(
+        [sys.executable, '-c', script], cwd=BASE_DIR, env=env, text=True
+    ).strip().splitlines()[-1]
+
+
+def compare(
+    concurrency: int,
+    duration: float,
+    worker_classes: List[str],
+    path: Optional[str]
+) -> None:
+    settings_module = os.environ.get('DJANGO_SETTINGS_MODULE', 'asana_backend.settings.prod')
+    env = dict(
+        os.environ,
+        DJANGO_SETTINGS_MODULE=settings_module,
+        ASANA_RATELIMIT_ENABLE='false',
+        PYTHONUNBUFFERED='1',
+    )
+    if path is None:
+        path = f'/api/1.0/tasks/?workspace={_seed_workspace(settings_module)}&limit=50'
+
+    servers = [('runserver', lambda port: [
+        sys.executable, 'manage.py', 'runserver', '--noreload', f'127.0.0.1:{port}'
+    ])]
+    for worker_class in worker_classes:
+        servers.append((f'gunicorn {worker_class}', lambda port, worker_class=worker_class: [
+            sys.executable, '-m', 'asana_backend.serve',
+            '--worker-class', worker_class, '--bind', f'127.0.0.1:{port}'
+        ]))
+
+    results = []
+    for name, command in servers:
+        port = _free_port()
+        process = subprocess.Popen(
+            command(port), cwd=BASE_DIR, env=env,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        try:
+            url = f'http://127.0.0.1:{port}'
+            _wait_for(url)
+            run_load(url + path, concurrency, min(duration, 2))  # warm up
+            results.append((name, run_load(url + path, concurrency, duration)))
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
+
+    print(f"GET {path}  concurrency={concurrency}  duration={duration}s  cpus={os.cpu_count()}")
+    print(f"{'server':<20}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'errors':>8}{'dropped':>9}")
+    for name, result in results:
+        print(
+            f"{name:<20}{result['rps']:>10.1f}{result['p50_ms']:>10.1f}"
+            f"{result['p95_ms']:>10.1f}{result['errors']:>8}{result['dropped']:>9}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--url', help="Load an already running server at this URL.")
+    parser.add_argument('--compare', action='store_true', help="Start runserver and gunicorn and compare them.")
+    parser.add_argument('--path', help="Path to request with --compare (default: a page of tasks).")
+    parser.add_argument('--worker-class', action='append', dest='worker_classes', help="Worker classes to compare (default: sync and gthread).")
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--duration', type=float, default=10)
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(args.concurrency, args.duration, args.worker_classes or ['sync', 'gthread'], args.path)
+    elif args.url:
+        result = run_load(args.url, args.concurrency, args.duration)
+        print(
+            f"{result['rps']:.1f} req/s  p50 {result['p50_ms']:.1f} ms  "
+            f"p95 {result['p95_ms']:.1f} ms  {result['errors']} errors  "
+            f"{result['dropped']} dropped connections"
+        )
+    else:
+        parser.error("pass --url or --compare")
+
+
+if __name__ == '__main__':
+    main()
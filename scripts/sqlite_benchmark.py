@@ -0,0 +1,161 @@
+"""
+SQLite concurrency benchmark: lock errors and throughput with and without
+the connection tuning in settings (ASANA_SQLITE_PRAGMAS).
+
+    python scripts/sqlite_benchmark.py [--processes 8] [--duration 10] [--write-ratio 0.2]
+
+Migrates a scratch database, then for each mode runs ``--processes``
+processes, standing in for server workers, against a copy of it. Each one
+reads pages of tasks and, for ``--write-ratio`` of its operations, reads
+and then creates a task in one transaction, as the write endpoints do.
+The script prints operations per second and how many operations failed
+with "database is locked".
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+SETTINGS_MODULE = 'asana_backend.settings.prod'
+MODES = {'defaults': 'false', 'tuned': 'true'}
+
+
+def worker(duration: float, write_ratio: float, seed: int) -> None:
+    import django
+    django.setup()
+    from django.db import OperationalError, transaction
+    from asana_workspaces.models.workspace import Workspace
+    from asana_tasks.models.task import Task
+
+    workspace = Workspace.objects.get(name='Benchmark')
+    counts = {'reads': 0, 'writes': 0, 'locked': 0}
+    rng = random.Random(seed)
+    deadline = time.monotonic() + duration
+    while time.monotonic() < deadline:
+        try:
+            if rng.random() < write_ratio:
+                with transaction.atomic():
+                    count = Task.objects.filter(workspace=workspace).count()
+                    Task.objects.create(name=f'Task {count}', workspace=workspace)
+                counts['writes'] += 1
+            else:
+                list(
+                    Task.objects.filter(workspace=workspace).order_by('-created_at')[:50]
+                )
+                counts['reads'] += 1
+        except OperationalError as error:
+            if 'locked' not in str(error):
+                raise
+            counts['locked'] += 1
+    print(json.dumps(counts))
+
+
+def _env(path: Path, tuning: str) -> Dict[str, str]:
+    return dict(
+        os.environ,
+        DJANGO_SETTINGS_MODULE=SETTINGS_MODULE,
+        ASANA_DB_ENGINE='sqlite',
+        ASANA_SQLITE_PATH=str(path),
+        ASANA_SQLITE_TUNING=tuning,
+    )
+
+
+def _prepare(path: Path) -> None:
+    # Built untuned, so every mode starts from a rollback-journal file
+    env = _env(path, 'false')
+    subprocess.run(
+        [sys.executable, 'manage.py', 'migrate', '--verbosity', '0'],
+        cwd=BASE_DIR, env=env, check=True
+    )
+    script = (
+        "import django; django.setup()\n"
+        "from asana_workspaces.models.workspace import Workspace\n"
+        "from asana_tasks.models.task import Task\n"
+        "workspace = Workspace.objects.create(name='Benchmark')\n"
+        "Task.objects.bulk_create(\n"
+        "    Task(name=f'Task {i}', workspace=workspace) for i in range(1000))\n"
+    )
+    subprocess.run([sys.executable, '-c', script], cwd=BASE_DIR, env=env, check=True)
+
+
+def run_mode(
+    source: Path,
+    directory: Path,
+    mode: str,
+    processes: int,
+    duration: float,
+    write_ratio: float
+) -> Dict[str, float]:
+    path = directory / f'{mode}.sqlite3'
+    shutil.copy(source, path)
+    env = _env(path, MODES[mode])
+    workers = [
+        subprocess.Popen(
+            [sys.executable, __file__, '--worker', '--duration', str(duration),
+             '--write-ratio', str(write_ratio), '--seed', str(seed)],
+            cwd=BASE_DIR, env=env, stdout=subprocess.PIPE, text=True
+        )
+        for seed in range(processes)
+    ]
+    totals = {'reads': 0, 'writes': 0, 'locked': 0}
+    for process in workers:
+        output, _ = process.communicate()
+        if process.returncode:
+            raise RuntimeError(f"{mode} worker exited with {process.returncode}")
+        for name, value in json.loads(output.strip().splitlines()[-1]).items():
+            totals[name] += value
+    return {
+        'reads_per_s': totals['reads'] / duration,
+        'writes_per_s': totals['writes'] / duration,
+        'locked': totals['locked'],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--processes', type=int, default=8)
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--write-ratio', type=float, default=0.2)
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--seed', type=int, default=0, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        sys.path.insert(0, str(BASE_DIR))
+        worker(args.duration, args.write_ratio, args.seed)
+        return
+
+    with tempfile.TemporaryDirectory(prefix='asana-sqlite-') as directory:
+        directory = Path(directory)
+        source = directory / 'source.sqlite3'
+        _prepare(source)
+        results = [
+            (mode, run_mode(
+                source, directory, mode,
+                args.processes, args.duration, args.write_ratio
+            ))
+            for mode in MODES
+        ]
+
+    print(
+        f"processes={args.processes}  duration={args.duration}s  "
+        f"write ratio={args.write_ratio}  cpus={os.cpu_count()}"
+    )
+    print(f"{'mode':<12}{'reads/s':>10}{'writes/s':>10}{'locked':>8}")
+    for mode, result in results:
+        print(
+            f"{mode:<12}{result['reads_per_s']:>10.1f}"
+            f"{result['writes_per_s']:>10.1f}{result['locked']:>8}"
+        )
+
+
+if __name__ == '__main__':
+    main()
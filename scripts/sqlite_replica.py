@@ -0,0 +1,55 @@
+"""
+Stand-in replicator for trying read replicas locally on SQLite.
+
+    python scripts/sqlite_replica.py db.sqlite3 replica.sqlite3 [--interval 1]
+
+Copies the primary database into each replica every ``--interval``
+seconds with SQLite's online backup, so the replicas trail the primary by
+up to that long, as streaming replicas do. ``--once`` copies once and
+exits. Serve the API with the same paths in ASANA_SQLITE_REPLICA_PATHS:
+
+    ASANA_SQLITE_REPLICA_PATHS=replica.sqlite3 python manage.py runserver
+"""
+import argparse
+import sqlite3
+import time
+from pathlib import Path
+from typing import List
+
+
+def replicate(primary: Path, replicas: List[Path]) -> None:
+    source = sqlite3.connect(primary)
+    try:
+        for path in replicas:
+            # Waits, like the API's connections, while a replica is read
+            target = sqlite3.connect(path, timeout=30)
+            try:
+                source.backup(target)
+            finally:
+                target.close()
+    finally:
+        source.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('primary', type=Path)
+    parser.add_argument('replicas', type=Path, nargs='+')
+    parser.add_argument('--interval', type=float, default=1.0)
+    parser.add_argument('--once', action='store_true')
+    args = parser.parse_args()
+
+    if not args.primary.exists():
+        parser.error(f"{args.primary} does not exist; run migrate first")
+    while True:
+        replicate(args.primary, args.replicas)
+        if args.once:
+            return
+        time.sleep(args.interval)
+
+
+if __name__ == '__main__':
+    try:
+        main()
+    except KeyboardInterrupt:
+        pass
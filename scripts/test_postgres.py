@@ -0,0 +1,119 @@
+"""
+Run the test suite against a throwaway PostgreSQL server, without Docker.
+
+    python scripts/test_postgres.py [manage.py test arguments]
+    python scripts/test_postgres.py tests.test_keyset_pagination
+
+The script starts a temporary cluster with the PostgreSQL binaries on this
+machine (``initdb`` and ``pg_ctl`` on PATH, in ``pg_config --bindir``, or
+in ASANA_PG_BINDIR), listening only on a Unix socket in a temporary
+directory. It runs ``manage.py test`` with ASANA_DB_ENGINE=postgres against
+it and removes the cluster afterwards. Without PostgreSQL or psycopg it
+says so and runs the tests on SQLite instead, unless --require-postgres
+is given.
+"""
+import argparse
+import importlib.util
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import List, Optional
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+PORT = '5432'
+
+
+def find_bindir() -> Optional[Path]:
+    """The directory with initdb and pg_ctl, if there is one."""
+    candidates = []
+    if os.environ.get('ASANA_PG_BINDIR'):
+        candidates.append(Path(os.environ['ASANA_PG_BINDIR']))
+    initdb = shutil.which('initdb')
+    if initdb:
+        candidates.append(Path(initdb).parent)
+    pg_config = shutil.which('pg_config')
+    if pg_config:
+        bindir = subprocess.run(
+            [pg_config, '--bindir'], capture_output=True, text=True
+        ).stdout.strip()
+        if bindir:
+            candidates.append(Path(bindir))
+    for candidate in candidates:
+        if (candidate / 'initdb').exists() and (candidate / 'pg_ctl').exists():
+            return candidate
+    return None
+
+
+def run_tests(test_args: List[str], env: dict) -> int:
+    return subprocess.call(
+        [sys.executable, 'manage.py', 'test', *test_args],
+        cwd=BASE_DIR,
+        env=env
+    )
+
+
+def run_on_postgres(bindir: Path, test_args: List[str]) -> int:
+    with tempfile.TemporaryDirectory(prefix='asana-pg-') as directory:
+        data = Path(directory) / 'data'
+        subprocess.run(
+            [bindir / 'initdb', '-D', data, '-U', 'asana', '-A', 'trust',
+             '-E', 'UTF8', '--no-sync'],
+            check=True,
+            stdout=subprocess.DEVNULL
+        )
+        # No TCP listener; fsync off as nothing here needs to survive a crash
+        options = f"-c listen_addresses='' -k {directory} -p {PORT} -c fsync=off"
+        subprocess.run(
+            [bindir / 'pg_ctl', '-D', data, '-o', options, '-w',
+             '-l', Path(directory) / 'server.log', 'start'],
+            check=True,
+            stdout=subprocess.DEVNULL
+        )
+        try:
+            env = dict(
+                os.environ,
+                ASANA_DB_ENGINE='postgres',
+                ASANA_DB_HOST=directory,
+                ASANA_DB_PORT=PORT,
+                ASANA_DB_USER='asana',
+                ASANA_DB_PASSWORD='',
+                ASANA_DB_NAME='postgres',
+            )
+            return run_tests(test_args, env)
+        finally:
+            subprocess.run(
+                [bindir / 'pg_ctl', '-D', data, '-m', 'fast', 'stop'],
+                stdout=subprocess.DEVNULL
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument(
+        '--require-postgres',
+        action='store_true',
+        help="Fail instead of falling back to SQLite."
+    )
+    args, test_args = parser.parse_known_args()
+
+    bindir = find_bindir()
+    missing = None
+    if bindir is None:
+        missing = "PostgreSQL binaries (initdb, pg_ctl) not found"
+    elif importlib.util.find_spec('psycopg') is None:
+        missing = "psycopg is not installed"
+
+    if missing is None:
+        sys.exit(run_on_postgres(bindir, test_args))
+    if args.require_postgres:
+        sys.exit(f"{missing}; set ASANA_PG_BINDIR or install PostgreSQL")
+    print(f"{missing}; running the tests on SQLite", file=sys.stderr)
+    env = dict(os.environ, ASANA_DB_ENGINE='sqlite')
+    sys.exit(run_tests(test_args, env))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,211 @@
+"""
+Async (ASGI) read view tests.
+
+Run tests: python manage.py test tests.test_async_views
+"""
+
+import json
+import threading
+from unittest import mock
+from asgiref.sync import sync_to_async
+from django.db.models import prefetch_related_objects
+from django.test import AsyncRequestFactory, TransactionTestCase, override_settings
+from rest_framework.test import APIClient
+from rest_framework import status
+from asana_workspaces.models.workspace import Workspace
+from asana_users.models.user import User
+from asana_projects.models.project import Project
+from asana_tags.models.tag import Tag
+from asana_tasks.models.task import Task
+from asana_tasks.models.task_project import TaskProject
+from asana_tasks.models.task_tag import TaskTag
+from asana_tasks.models.task_follower import TaskFollower
+from asana_stories.models.story import Story
+from asana_tasks.views.get_task import GetTaskAsyncView
+from asana_tasks.views.get_tasks import GetTasksAsyncView
+from asana_projects.views.get_project_tasks import GetProjectTasksAsyncView
+from asana_stories.views.get_task_stories import GetTaskStoriesAsyncView
+
+BULK_TOKEN = 'bulk-export-token'
+MEMORY_STORE = {
+    'STORE': 'asana_backend.utils.rate_limiting.memory_store.MemoryStore',
+    'OPTIONS': {},
+    'LEASE_FRACTION': 0.05,
+}
+
+
+# The relations are read on worker threads with connections of their own,
+# which only see committed rows
+@override_settings(RATELIMIT_ENABLE=False)
+class AsyncReadViewsTest(TransactionTestCase):
+    """
+    GetTaskAsyncView, GetTasksAsyncView, GetProjectTasksAsyncView and
+    GetTaskStoriesAsyncView
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.factory = AsyncRequestFactory()
+        self.workspace = Workspace.objects.create(name="Async Workspace")
+        self.user = User.objects.create(name="Ada", email="ada@example.com")
+        self.project = Project.objects.create(name="Launch", workspace=self.workspace)
+        self.tag = Tag.objects.create(name="urgent", workspace=self.workspace)
+        self.task = Task.objects.create(
+            name="Write spec",
+            workspace=self.workspace,
+            assignee=self.user
+        )
+        for i in range(3):
+            task = Task.objects.create(name=f"Task {i}", workspace=self.workspace)
+            TaskProject.objects.create(task=task, project=self.project)
+        TaskProject.objects.create(task=self.task, project=self.project)
+        TaskTag.objects.create(task=self.task, tag=self.tag)
+        TaskFollower.objects.create(task=self.task, user=self.user)
+        for i in range(3):
+            Story.objects.create(task=self.task, text=f"Comment {i}", created_by=self.user)
+
+    def tearDown(self):
+        # The task count triggers need a link's task while the link is
+        # deleted, which flush's table order does not guarantee
+        TaskProject.objects.all().delete()
+
+    async def _get(self, view_class, path, data=None, **kwargs):
+        request = self.factory.get(path, data or {})
+        return await view_class.as_view()(request, **kwargs)
+
+    async def test_get_task_matches_sync_view(self):
+        """
+        Test Case: the async task read returns what GetTaskView returns,
+        with or without opt_fields.
+        """
+        path = f'/api/1.0/tasks/{self.task.gid}/'
+        for params in ({}, {'opt_fields': 'name,assignee.name,tags.name'}):
+            response = await self._get(GetTaskAsyncView, path, params, task_gid=str(self.task.gid))
+            expected = await self._sync_get(path, params)
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(json.loads(response.content), expected)
+
+    async def test_task_relations_are_loaded_concurrently(self):
+        """
+        Test Case: projects, tags and followers are prefetched at the same
+        time; each load waits for the other two to start.
+        """
+        barrier = threading.Barrier(3, timeout=5)
+
+        def prefetch(*args):
+            barrier.wait()
+            prefetch_related_objects(*args)
+
+        with mock.patch(
+            'asana_tasks.storages.storage_implementation.prefetch_related_objects',
+            prefetch
+        ):
+            response = await self._get(
+                GetTaskAsyncView,
+                f'/api/1.0/tasks/{self.task.gid}/',
+                task_gid=str(self.task.gid)
+            )
+
+        data = json.loads(response.content)['data']
+        self.assertEqual(data['projects'][0]['name'], 'Launch')
+        self.assertEqual(data['tags'][0]['name'], 'urgent')
+        self.assertEqual(data['followers'][0]['name'], 'Ada')
+
+    async def test_get_task_errors(self):
+        """
+        Test Case: a malformed gid is a 400 and an unknown one a 404.
+        """
+        bad = await self._get(GetTaskAsyncView, '/api/1.0/tasks/nope/', task_gid='nope')
+        missing_gid = '123e4567-e89b-12d3-a456-426614174000'
+        missing = await self._get(
+            GetTaskAsyncView, f'/api/1.0/tasks/{missing_gid}/', task_gid=missing_gid
+        )
+
+        self.assertEqual(bad.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(missing.status_code, status.HTTP_404_NOT_FOUND)
+
+    async def test_lists_match_sync_views(self):
+        """
+        Test Case: task, project task and story pages, including their
+        next_page links, are the same as the DRF views'.
+        """
+        project_gid, task_gid = str(self.project.gid), str(self.task.gid)
+        cases = [
+            (GetTasksAsyncView, '/api/1.0/tasks/',
+             {'workspace': str(self.workspace.gid), 'limit': 2}, {}),
+            (GetProjectTasksAsyncView, f'/api/1.0/projects/{project_gid}/tasks/',
+             {'limit': 3}, {'project_gid': project_gid}),
+            (GetTaskStoriesAsyncView, f'/api/1.0/tasks/{task_gid}/stories/',
+             {'limit': 2}, {'task_gid': task_gid}),
+        ]
+        for view_class, path, params, kwargs in cases:
+            response = await self._get(view_class, path, params, **kwargs)
+            body = json.loads(response.content)
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertIn('next_page', body)
+            self.assertEqual(body, await self._sync_get(path, params))
+
+    async def test_unknown_project(self):
+        """
+        Test Case: the tasks of a project that does not exist are a 404.
+        """
+        project_gid = '123e4567-e89b-12d3-a456-426614174000'
+        response = await self._get(
+            GetProjectTasksAsyncView,
+            f'/api/1.0/projects/{project_gid}/tasks/',
+            project_gid=project_gid
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @override_settings(ASANA_STREAMING={'BULK_CLIENT_TOKENS': [BULK_TOKEN], 'ITEMS_PER_WRITE': 2})
+    async def test_bulk_pages_stream_asynchronously(self):
+        """
+        Test Case: a bulk client's large page is an async streamed body.
+        """
+        request = self.factory.get(
+            '/api/1.0/tasks/',
+            {'workspace': str(self.workspace.gid), 'limit': 500},
+            headers={'X-Bulk-Client-Token': BULK_TOKEN}
+        )
+        response = await GetTasksAsyncView.as_view()(request)
+
+        self.assertTrue(response.is_async)
+        chunks = [chunk async for chunk in response.streaming_content]
+        body = json.loads(b''.join(chunks))
+        self.assertEqual(len(body['data']), 4)
+        self.assertIsNone(body['next_page'])
+
+    async def test_post_goes_to_sync_view(self):
+        """
+        Test Case: POST /tasks/ on the async view creates the task through
+        GetTasksView.
+        """
+        request = self.factory.post(
+            '/api/1.0/tasks/',
+            {'name': 'Created', 'workspace': str(self.workspace.gid)},
+            content_type='application/json'
+        )
+        response = await GetTasksAsyncView.as_view()(request)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(await Task.objects.filter(name='Created').acount(), 1)
+
+    @override_settings(RATELIMIT_ENABLE=True, ASANA_RATE_LIMITS=MEMORY_STORE)
+    async def test_rate_limit(self):
+        """
+        Test Case: @ratelimit applies to coroutine handlers too.
+        """
+        codes = []
+        for _ in range(6):
+            request = self.factory.get('/api/1.0/tasks/')
+            codes.append((await GetTasksAsyncView.as_view()(request)).status_code)
+
+        self.assertNotIn(status.HTTP_429_TOO_MANY_REQUESTS, codes[:5])
+        self.assertEqual(codes[5], status.HTTP_429_TOO_MANY_REQUESTS)
+
+    async def _sync_get(self, path, params):
+        response = await sync_to_async(self.client.get)(path, params)
+        return response.json()
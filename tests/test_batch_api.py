@@ -0,0 +1,89 @@
+"""
+Batch API tests.
+
+Run tests: python manage.py test tests.test_batch_api
+"""
+
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from rest_framework import status
+from asana_workspaces.models.workspace import Workspace
+from asana_users.models.user import User
+
+
+@override_settings(RATELIMIT_ENABLE=False)
+class BatchApiTest(TestCase):
+    """
+    POST /api/1.0/batch/
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.workspace = Workspace.objects.create(name="Batch Workspace")
+        self.user = User.objects.create(name="Ada", email="ada@example.com")
+
+    def _batch(self, actions):
+        return self.client.post(
+            '/api/1.0/batch/',
+            {'data': {'actions': actions}},
+            format='json'
+        )
+
+    def test_actions_return_their_own_status_and_body(self):
+        """
+        Test Case: each action gets its own status_code and body, in order.
+        """
+        response = self._batch([
+            {'relative_path': f'/workspaces/{self.workspace.gid}', 'method': 'get'},
+            {'relative_path': f'/users/{self.user.gid}', 'method': 'get'},
+            {'relative_path': '/no-such-endpoint', 'method': 'get'},
+        ])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.json()['data']
+        self.assertEqual(
+            [result['status_code'] for result in results],
+            [200, 200, 404]
+        )
+        self.assertEqual(results[0]['body']['data']['name'], 'Batch Workspace')
+        self.assertEqual(results[1]['body']['data']['name'], 'Ada')
+
+    def test_repeated_lookups_share_one_query(self):
+        """
+        Test Case: looking up the same workspace in several actions only
+        loads it once.
+        """
+        action = {
+            'relative_path': f'/workspaces/{self.workspace.gid}/',
+            'method': 'get',
+        }
+        with self.assertNumQueries(1):
+            response = self._batch([action, action, action])
+
+        self.assertEqual(
+            [result['status_code'] for result in response.json()['data']],
+            [200, 200, 200]
+        )
+
+    def test_options_are_passed_as_query_parameters(self):
+        """
+        Test Case: options.limit reaches the list view and next_page points
+        at the action's endpoint.
+        """
+        Workspace.objects.create(name="Second Workspace")
+        response = self._batch([
+            {'relative_path': '/workspaces', 'method': 'get', 'options': {'limit': 1}},
+        ])
+
+        body = response.json()['data'][0]['body']
+        self.assertEqual(len(body['data']), 1)
+        self.assertTrue(body['next_page']['path'].startswith('/workspaces/?limit=1'))
+
+    def test_too_many_actions(self):
+        """
+        Test Case: more than 10 actions is rejected with a 400.
+        """
+        action = {'relative_path': '/workspaces', 'method': 'get'}
+        response = self._batch([action] * 11)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,151 @@
+"""
+Set-based task relation mutation tests.
+
+Run tests: python manage.py test tests.test_bulk_task_relations
+"""
+
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from asana_workspaces.models.workspace import Workspace
+from asana_users.models.user import User
+from asana_projects.models.project import Project
+from asana_tags.models.tag import Tag
+from asana_tasks.models.task import Task
+from asana_tasks.models.task_project import TaskProject
+from asana_tasks.models.task_tag import TaskTag
+from asana_tasks.models.task_follower import TaskFollower
+from asana_tasks.models.task_dependency import TaskDependency
+from asana_tasks.storages.storage_implementation import StorageImplementation
+
+
+class BulkTaskRelationsTest(TestCase):
+    """
+    StorageImplementation follower, dependency and duplicate mutations
+    """
+
+    def setUp(self):
+        self.storage = StorageImplementation()
+        self.workspace = Workspace.objects.create(name="Bulk Workspace")
+        self.task = Task.objects.create(name="Root", workspace=self.workspace)
+
+    def _make_tasks(self, count):
+        return [
+            Task.objects.create(name=f"Task {i}", workspace=self.workspace)
+            for i in range(count)
+        ]
+
+    def _count_queries(self, fn, *args):
+        with CaptureQueriesContext(connection) as context:
+            fn(*args)
+        return len(context.captured_queries)
+
+    def test_add_followers_is_constant_queries(self):
+        """
+        Test Case: adding 5 or 55 followers costs the same number of
+        queries, and re-adding existing followers is a no-op.
+        """
+        users = [
+            User.objects.create(name=f"User {i}", email=f"user{i}@example.com")
+            for i in range(55)
+        ]
+        few = self._count_queries(
+            self.storage.add_followers_to_task,
+            str(self.task.gid),
+            [str(user.gid) for user in users[:5]]
+        )
+        many = self._count_queries(
+            self.storage.add_followers_to_task,
+            str(self.task.gid),
+            [str(user.gid) for user in users]
+        )
+
+        self.assertEqual(few, many)
+        self.assertEqual(TaskFollower.objects.filter(task=self.task).count(), 55)
+
+    def test_set_dependencies_diffs_existing_links(self):
+        """
+        Test Case: set_task_dependencies keeps links that stay, removes the
+        rest and adds new ones in a constant number of queries.
+        """
+        tasks = self._make_tasks(200)
+        self.storage.set_task_dependencies(
+            str(self.task.gid),
+            [str(task.gid) for task in tasks[:3]]
+        )
+        kept = TaskDependency.objects.get(
+            successor=self.task,
+            predecessor=tasks[1]
+        )
+
+        few = self._count_queries(
+            self.storage.set_task_dependencies,
+            str(self.task.gid),
+            [str(task.gid) for task in tasks[1:4]]
+        )
+        self.storage.set_task_dependencies(
+            str(self.task.gid),
+            [str(task.gid) for task in tasks[:3]]
+        )
+        many = self._count_queries(
+            self.storage.set_task_dependencies,
+            str(self.task.gid),
+            [str(task.gid) for task in tasks[1:]]
+        )
+
+        self.assertEqual(few, many)
+        self.assertEqual(
+            set(self.task.predecessors.values_list('predecessor_id', flat=True)),
+            {task.pk for task in tasks[1:]}
+        )
+        self.assertTrue(TaskDependency.objects.filter(gid=kept.gid).exists())
+
+    def test_set_dependents_validates_links(self):
+        """
+        Test Case: a task cannot be its own dependent, nor depend on a task
+        in another workspace.
+        """
+        other = Task.objects.create(
+            name="Elsewhere",
+            workspace=Workspace.objects.create(name="Other Workspace")
+        )
+
+        with self.assertRaises(ValidationError):
+            self.storage.set_task_dependents(
+                str(self.task.gid),
+                [str(self.task.gid)]
+            )
+        with self.assertRaises(ValidationError):
+            self.storage.set_task_dependents(str(self.task.gid), [str(other.gid)])
+        self.assertFalse(TaskDependency.objects.exists())
+
+    def test_duplicate_task_copies_relations(self):
+        """
+        Test Case: duplicate_task copies projects, tags and followers.
+        """
+        project = Project.objects.create(name="P", workspace=self.workspace)
+        tag = Tag.objects.create(name="T", workspace=self.workspace)
+        user = User.objects.create(name="U", email="u@example.com")
+        TaskProject.objects.create(task=self.task, project=project)
+        TaskTag.objects.create(task=self.task, tag=tag)
+        TaskFollower.objects.create(task=self.task, user=user)
+
+        copy = self.storage.duplicate_task(
+            str(self.task.gid),
+            "Copy",
+            ['projects', 'tags', 'followers']
+        )
+
+        self.assertEqual(
+            list(TaskProject.objects.filter(task=copy).values_list('project', flat=True)),
+            [project.pk]
+        )
+        self.assertEqual(
+            list(TaskTag.objects.filter(task=copy).values_list('tag', flat=True)),
+            [tag.pk]
+        )
+        self.assertEqual(
+            list(TaskFollower.objects.filter(task=copy).values_list('user', flat=True)),
+            [user.pk]
+        )
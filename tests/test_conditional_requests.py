@@ -0,0 +1,173 @@
+"""
+Conditional GET tests.
+
+Run tests: python manage.py test tests.test_conditional_requests
+"""
+
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework import status
+from asana_workspaces.models.workspace import Workspace
+from asana_users.models.user import User
+from asana_projects.models.project import Project
+from asana_tasks.models.task import Task
+from asana_tasks.models.task_project import TaskProject
+
+OBJECT_CACHE = {
+    'ENABLED': True,
+    'CACHE': 'objects',
+    'VERSION_CACHE': 'object_versions',
+    'TIMEOUT': 300,
+    'SETTLE_SECONDS': 0,
+}
+
+
+@override_settings(RATELIMIT_ENABLE=False, ASANA_OBJECT_CACHE=OBJECT_CACHE)
+class ConditionalRequestsTest(TestCase):
+    """
+    ETag, If-None-Match and If-Modified-Since on GET /tasks/{task_gid},
+    GET /tasks and other endpoints
+    """
+
+    def setUp(self):
+        caches['objects'].clear()
+        caches['object_versions'].clear()
+        self.client = APIClient()
+        self.workspace = Workspace.objects.create(name="Conditional Workspace")
+        self.user = User.objects.create(name="Ada", email="ada@example.com")
+        self.project = Project.objects.create(
+            name="Roadmap", workspace=self.workspace
+        )
+        self.task = Task.objects.create(
+            name="Write spec", workspace=self.workspace, assignee=self.user
+        )
+        self.other = Task.objects.create(name="Review", workspace=self.workspace)
+        TaskProject.objects.create(task=self.task, project=self.project)
+
+    def revalidate(self, path, params=None):
+        first = self.client.get(path, params or {})
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        second = self.client.get(
+            path, params or {}, HTTP_IF_NONE_MATCH=first['ETag']
+        )
+        return first, second
+
+    def test_current_task_is_not_modified(self):
+        """
+        Test Case: a task revalidated with its ETag is a 304 with no body,
+        answered without queries.
+        """
+        path = f'/api/1.0/tasks/{self.task.gid}/'
+        first = self.client.get(path)
+        with CaptureQueriesContext(connection) as context:
+            second = self.client.get(path, HTTP_IF_NONE_MATCH=first['ETag'])
+
+        self.assertIn('Last-Modified', first)
+        self.assertEqual(second.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(second.content, b'')
+        self.assertEqual(second['ETag'], first['ETag'])
+        self.assertEqual(len(context.captured_queries), 0)
+
+    def test_changed_task_is_sent(self):
+        """
+        Test Case: saving the task or an object it embeds changes its ETag.
+        """
+        path = f'/api/1.0/tasks/{self.task.gid}/'
+        etag = self.client.get(path)['ETag']
+
+        self.user.name = "Ada Lovelace"
+        self.user.save()
+        response = self.client.get(path, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['data']['assignee']['name'], "Ada Lovelace")
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_opt_fields_have_their_own_etag(self):
+        """
+        Test Case: each opt_fields selection of an object has its own ETag.
+        """
+        path = f'/api/1.0/tasks/{self.task.gid}/'
+        etag = self.client.get(path)['ETag']
+
+        response = self.client.get(
+            path, {'opt_fields': 'name'}, HTTP_IF_NONE_MATCH=etag
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_if_modified_since(self):
+        """
+        Test Case: a user revalidated with its Last-Modified is a 304.
+        """
+        path = f'/api/1.0/users/{self.user.gid}/'
+        first = self.client.get(path)
+        second = self.client.get(
+            path, HTTP_IF_MODIFIED_SINCE=first['Last-Modified']
+        )
+
+        self.assertEqual(second.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_current_task_list_is_not_modified(self):
+        """
+        Test Case: a task list revalidated with its ETag is a 304 after one
+        aggregate query.
+        """
+        path = '/api/1.0/tasks/'
+        params = {'workspace': str(self.workspace.gid)}
+        first = self.client.get(path, params)
+        with CaptureQueriesContext(connection) as context:
+            second = self.client.get(
+                path, params, HTTP_IF_NONE_MATCH=first['ETag']
+            )
+
+        self.assertEqual(second.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(len(context.captured_queries), 1)
+
+    def test_changed_task_list_is_sent(self):
+        """
+        Test Case: saving, adding or deleting a listed task changes the
+        list's ETag, as does adding a task to the listed project.
+        """
+        workspace = {'workspace': str(self.workspace.gid)}
+        project = {'project': str(self.project.gid)}
+        changes = [
+            (workspace, lambda: self.task.save()),
+            (workspace, lambda: Task.objects.create(
+                name="New", workspace=self.workspace
+            )),
+            (project, lambda: TaskProject.objects.create(
+                task=self.other, project=self.project
+            )),
+            (workspace, lambda: self.other.delete()),
+        ]
+        for params, change in changes:
+            etag = self.client.get('/api/1.0/tasks/', params)['ETag']
+            change()
+            response = self.client.get(
+                '/api/1.0/tasks/', params, HTTP_IF_NONE_MATCH=etag
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotEqual(response['ETag'], etag)
+
+    def test_other_lists_fall_back_to_body_etags(self):
+        """
+        Test Case: lists without a cheap version (here num_subtasks, which
+        changes without the task being saved) are still revalidated, by a
+        hash of their body.
+        """
+        params = {
+            'workspace': str(self.workspace.gid),
+            'opt_fields': 'name,num_subtasks',
+        }
+        first, second = self.revalidate('/api/1.0/tasks/', params)
+        Task.objects.filter(pk=self.task.pk).update(num_subtasks=3)
+        third = self.client.get(
+            '/api/1.0/tasks/', params, HTTP_IF_NONE_MATCH=first['ETag']
+        )
+
+        self.assertEqual(second.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(third.status_code, status.HTTP_200_OK)
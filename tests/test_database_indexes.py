@@ -0,0 +1,80 @@
+"""
+Composite index tests.
+
+Run tests: python manage.py test tests.test_database_indexes
+"""
+
+import uuid
+from datetime import datetime, timezone
+from unittest import skipUnless
+from django.db import connection
+from django.test import TestCase
+from asana_stories.models.story import Story
+from asana_tasks.models.task import Task
+from asana_tasks.models.task_project import TaskProject
+
+
+def _index_name(model, fields):
+    return next(
+        index.name for index in model._meta.indexes
+        if list(index.fields) == fields
+    )
+
+
+@skipUnless(connection.vendor == 'sqlite', "Reads SQLite query plans")
+class CompositeIndexTest(TestCase):
+    """
+    Task, TaskProject and Story indexes for the list filters
+    """
+
+    def plan(self, queryset) -> str:
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+            return '\n'.join(row[-1] for row in cursor.fetchall())
+
+    def test_task_list_filters(self):
+        """
+        Test Case: a workspace's tasks for an assignee, and those modified
+        since a time, are each found through their composite index.
+        """
+        gid = uuid.uuid4()
+        by_assignee = Task.objects.filter(workspace__gid=gid, assignee__gid=gid)
+        modified = Task.objects.filter(
+            workspace__gid=gid,
+            updated_at__gte=datetime(2026, 1, 1, tzinfo=timezone.utc)
+        )
+
+        self.assertIn(
+            _index_name(Task, ['workspace', 'assignee', 'completed']),
+            self.plan(by_assignee)
+        )
+        self.assertIn(
+            _index_name(Task, ['workspace', 'updated_at']),
+            self.plan(modified)
+        )
+
+    def test_project_task_ids(self):
+        """
+        Test Case: a project's task ids are read from the index alone.
+        """
+        plan = self.plan(
+            TaskProject.objects.filter(project_id=uuid.uuid4()).values('task_id')
+        )
+
+        self.assertIn('COVERING INDEX', plan)
+        self.assertIn(_index_name(TaskProject, ['project', 'task']), plan)
+
+    def test_task_stories_need_no_sort(self):
+        """
+        Test Case: a page of a task's stories, newest first, is read in
+        index order.
+        """
+        plan = self.plan(
+            Story.objects.filter(task_id=uuid.uuid4()).order_by(
+                '-created_at', '-gid'
+            )[:51]
+        )
+
+        self.assertIn(_index_name(Story, ['task', 'created_at', 'gid']), plan)
+        self.assertNotIn('TEMP B-TREE', plan)
@@ -0,0 +1,177 @@
+"""
+Task dependency graph tests.
+
+Run tests: python manage.py test tests.test_dependency_graph
+"""
+
+from datetime import date
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from rest_framework import status
+from asana_workspaces.models.workspace import Workspace
+from asana_projects.models.project import Project
+from asana_tasks.models.task import Task
+from asana_tasks.models.task_project import TaskProject
+from asana_tasks.models.task_dependency import TaskDependency
+from asana_tasks.dependencies.graph import DependencyGraph
+from asana_tasks.exceptions.custom_exceptions import DependencyCycleException
+from asana_tasks.storages.storage_implementation import StorageImplementation
+
+
+class DependencyGraphTest(TestCase):
+    """
+    asana_tasks.dependencies.graph.DependencyGraph
+    """
+
+    def setUp(self):
+        # a -> b -> d, a -> c -> d, d -> e
+        self.graph = DependencyGraph([
+            ('a', 'b'), ('a', 'c'), ('b', 'd'), ('c', 'd'), ('d', 'e'),
+        ])
+
+    def test_reachability_and_order(self):
+        """
+        Test Case: upstream/downstream are transitive and the topological
+        order puts every node after its predecessors.
+        """
+        self.assertEqual(self.graph.upstream('d'), {'a', 'b', 'c'})
+        self.assertEqual(self.graph.downstream('b'), {'d', 'e'})
+        self.assertEqual(self.graph.topological_order(), ['a', 'b', 'c', 'd', 'e'])
+        self.assertEqual(self.graph.topological_order({'e', 'b', 'd'}), ['b', 'd', 'e'])
+
+    def test_find_cycle(self):
+        """
+        Test Case: an edge back from e to a would close a path through d;
+        an edge from a to e would not.
+        """
+        self.assertIn(
+            self.graph.find_cycle(['e'], ['a']),
+            (['a', 'b', 'd', 'e'], ['a', 'c', 'd', 'e'])
+        )
+        self.assertIsNone(self.graph.find_cycle(['a'], ['e']))
+
+        self.graph.add_edge('e', 'a')
+        with self.assertRaises(DependencyCycleException):
+            self.graph.topological_order()
+
+    def test_critical_path(self):
+        """
+        Test Case: the critical path follows the longest branch.
+        """
+        durations = {'a': 1, 'b': 2, 'c': 5, 'd': 1, 'e': 1}
+
+        path, total = self.graph.critical_path(durations.get)
+
+        self.assertEqual(path, ['a', 'c', 'd', 'e'])
+        self.assertEqual(total, 8)
+
+
+@override_settings(RATELIMIT_ENABLE=False)
+class DependencyGraphApiTest(TestCase):
+    """
+    Cycle rejection on write and the upstream / downstream / critical path
+    endpoints
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.storage = StorageImplementation()
+        self.workspace = Workspace.objects.create(name="Graph Workspace")
+        self.project = Project.objects.create(name="Release", workspace=self.workspace)
+
+    def _tasks(self, count, **fields):
+        tasks = [
+            Task.objects.create(name=f"T{i}", workspace=self.workspace, **fields)
+            for i in range(count)
+        ]
+        for task in tasks:
+            TaskProject.objects.create(task=task, project=self.project)
+        return tasks
+
+    def _chain(self, tasks):
+        for predecessor, successor in zip(tasks, tasks[1:]):
+            TaskDependency.objects.create(predecessor=predecessor, successor=successor)
+
+    def test_writes_reject_cycles(self):
+        """
+        Test Case: neither setting dependencies nor dependents may close a
+        cycle, however long; unrelated links still go through.
+        """
+        tasks = self._tasks(5)
+        self._chain(tasks)
+
+        with self.assertRaises(DependencyCycleException) as context:
+            self.storage.set_task_dependencies(str(tasks[0].gid), [str(tasks[4].gid)])
+        self.assertEqual(
+            context.exception.cycle,
+            [str(task.gid) for task in tasks] + [str(tasks[0].gid)]
+        )
+        with self.assertRaises(DependencyCycleException):
+            self.storage.set_task_dependents(str(tasks[3].gid), [str(tasks[1].gid)])
+
+        self.storage.set_task_dependents(str(tasks[0].gid), [str(tasks[1].gid), str(tasks[4].gid)])
+        self.assertEqual(TaskDependency.objects.count(), 5)
+
+    def test_upstream_and_downstream(self):
+        """
+        Test Case: the transitive endpoints list every task on the chain in
+        dependency order with their direct links, in a fixed number of
+        queries.
+        """
+        tasks = self._tasks(4)
+        self._chain(tasks)
+        side = self._tasks(1)[0]
+        TaskDependency.objects.create(predecessor=side, successor=tasks[2])
+
+        with self.assertNumQueries(3):
+            response = self.client.get(f'/api/1.0/tasks/{tasks[3].gid}/dependencies/upstream/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()['data']
+        self.assertEqual(len(data), 4)
+        position = {item['gid']: i for i, item in enumerate(data)}
+        self.assertLess(position[str(tasks[0].gid)], position[str(tasks[1].gid)])
+        self.assertLess(position[str(tasks[1].gid)], position[str(tasks[2].gid)])
+        self.assertLess(position[str(side.gid)], position[str(tasks[2].gid)])
+        self.assertEqual(
+            data[position[str(tasks[2].gid)]]['dependents'],
+            [{'gid': str(tasks[3].gid), 'resource_type': 'task'}]
+        )
+
+        data = self.client.get(
+            f'/api/1.0/tasks/{tasks[0].gid}/dependents/downstream/'
+        ).json()['data']
+        self.assertEqual([item['name'] for item in data], ['T1', 'T2', 'T3'])
+
+    def test_critical_path(self):
+        """
+        Test Case: the critical path of a project is its longest chain of
+        remaining work; completed tasks count for nothing.
+        """
+        long_task, short_task, last = self._tasks(3)
+        long_task.start_on, long_task.due_on = date(2026, 1, 1), date(2026, 1, 10)
+        long_task.save()
+        done = self._tasks(1, completed=True)[0]
+        self._chain([long_task, last])
+        self._chain([done, short_task, last])
+
+        response = self.client.get(f'/api/1.0/projects/{self.project.gid}/critical_path/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()['data']
+        self.assertEqual(data['duration_days'], 11)
+        self.assertEqual(
+            [(task['name'], task['duration_days']) for task in data['tasks']],
+            [('T0', 10), ('T2', 1)]
+        )
+
+    def test_unknown_resources(self):
+        """
+        Test Case: unknown tasks and projects are 404s.
+        """
+        missing = '00000000-0000-0000-0000-000000000000'
+        for path in (
+            f'/api/1.0/tasks/{missing}/dependencies/upstream/',
+            f'/api/1.0/tasks/{missing}/dependents/downstream/',
+            f'/api/1.0/projects/{missing}/critical_path/',
+        ):
+            self.assertEqual(self.client.get(path).status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,214 @@
+"""
+Event journal and sync token tests.
+
+Run tests: python manage.py test tests.test_events
+"""
+
+import threading
+import time
+from datetime import timedelta
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+from asana_workspaces.models.workspace import Workspace
+from asana_projects.models.project import Project
+from asana_tasks.models.task import Task
+from asana_tasks.models.task_project import TaskProject
+from asana_stories.models.story import Story
+from asana_events.models.event import Event
+from asana_events.storages.storage_implementation import StorageImplementation
+from asana_events.utils.sync_tokens import encode_sync_token
+
+
+@override_settings(RATELIMIT_ENABLE=False)
+class EventsTest(TestCase):
+    """
+    GET /api/1.0/events/ and GET /api/1.0/workspaces/{gid}/events
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.workspace = Workspace.objects.create(name="Events Workspace")
+        self.project = Project.objects.create(name="Project", workspace=self.workspace)
+        self.task = Task.objects.create(name="Task", workspace=self.workspace)
+
+    def _events(self, resource_gid, sync=None):
+        params = {'resource': str(resource_gid)}
+        if sync:
+            params['sync'] = sync
+        return self.client.get('/api/1.0/events/', params)
+
+    def _workspace_events(self, sync=None):
+        return self.client.get(
+            f'/api/1.0/workspaces/{self.workspace.gid}/events',
+            {'sync': sync} if sync else {}
+        )
+
+    def test_first_request_returns_sync_token_then_deltas(self):
+        """
+        Test Case: without a sync token the response is a 412 carrying one;
+        with it only the changes made since are returned.
+        """
+        response = self._events(self.task.gid)
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        sync = response.json()['sync']
+
+        self.task.name = "Renamed"
+        self.task.save()
+        Story.objects.create(task=self.task, text="A comment")
+
+        response = self._events(self.task.gid, sync)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        body = response.json()
+        self.assertEqual(
+            [(event['resource']['resource_type'], event['action']) for event in body['data']],
+            [('task', 'changed'), ('story', 'added')]
+        )
+        self.assertEqual(body['data'][0]['resource']['name'], 'Renamed')
+        self.assertEqual(body['data'][1]['parent']['gid'], str(self.task.gid))
+        self.assertFalse(body['has_more'])
+
+        response = self._events(self.task.gid, body['sync'])
+        self.assertEqual(response.json()['data'], [])
+        self.assertEqual(response.json()['sync'], body['sync'])
+
+    def test_project_subscription_sees_tasks_added_and_removed(self):
+        """
+        Test Case: adding a task to a project and removing it show up as
+        added/removed events on the project.
+        """
+        sync = self._events(self.project.gid).json()['sync']
+
+        link = TaskProject.objects.create(task=self.task, project=self.project)
+        link.delete()
+
+        data = self._events(self.project.gid, sync).json()['data']
+        self.assertEqual([event['action'] for event in data], ['added', 'removed'])
+        self.assertEqual(data[0]['resource']['gid'], str(self.task.gid))
+        self.assertEqual(data[0]['parent']['resource_type'], 'project')
+
+    def test_workspace_events_page_with_has_more(self):
+        """
+        Test Case: workspace events include task and project changes and
+        page through in order when there are more than fit in one response.
+        """
+        sync = self._workspace_events().json()['sync']
+        for i in range(105):
+            Task.objects.create(name=f"Task {i}", workspace=self.workspace)
+        self.project.delete()
+
+        first = self._workspace_events(sync).json()
+        self.assertEqual(len(first['data']), 100)
+        self.assertTrue(first['has_more'])
+        second = self._workspace_events(first['sync']).json()
+        self.assertFalse(second['has_more'])
+        self.assertEqual(
+            (second['data'][-1]['resource']['name'], second['data'][-1]['action']),
+            ('Project', 'deleted')
+        )
+        self.assertEqual(len(first['data']) + len(second['data']), 106)
+
+    def test_poll_is_two_queries(self):
+        """
+        Test Case: a poll with a valid token reads the journal with one range
+        query plus the retention check.
+        """
+        sync = self._events(self.task.gid).json()['sync']
+        self.task.save()
+
+        with self.assertNumQueries(2):
+            response = self._events(self.task.gid, sync)
+        self.assertEqual(len(response.json()['data']), 1)
+
+    def test_pruned_token_is_rejected(self):
+        """
+        Test Case: a token pointing before events that were pruned gets a
+        412 with a fresh token; garbage tokens do too.
+        """
+        sync = self._events(self.task.gid).json()['sync']
+        self.task.save()
+        self.task.save()
+        latest = Event.objects.order_by('sequence').last()
+        Event.objects.exclude(pk=latest.pk).update(
+            created_at=timezone.now() - timedelta(days=2)
+        )
+        StorageImplementation().prune_events(timezone.now() - timedelta(days=1))
+
+        response = self._events(self.task.gid, sync)
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.assertEqual(
+            response.json()['sync'],
+            encode_sync_token(latest.sequence)
+        )
+
+        response = self._events(self.task.gid, 'not-a-token')
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+
+
+class JournalOrderTest(TransactionTestCase):
+    """
+    asana_events.journal under concurrent writers
+    """
+
+    def test_reader_never_passes_an_uncommitted_event(self):
+        """
+        Test Case: while one transaction holds a journal entry, a second
+        writer's entry does not become visible before it, so a reader
+        polling throughout sees both events.
+        """
+        workspace = Workspace.objects.create(name="Journal Workspace")
+        storage = StorageImplementation()
+        after_sequence = storage.get_latest_sequence()
+        first_wrote = threading.Event()
+        second_started = threading.Event()
+        errors = []
+
+        def first_writer():
+            try:
+                with transaction.atomic():
+                    Task.objects.create(name="First", workspace=workspace)
+                    first_wrote.set()
+                    second_started.wait(5)
+                    # Leave the second writer time to commit ahead of us
+                    time.sleep(0.3)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                first_wrote.set()
+                connection.close()
+
+        def second_writer():
+            try:
+                first_wrote.wait(5)
+                second_started.set()
+                with transaction.atomic():
+                    Task.objects.create(name="Second", workspace=workspace)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connection.close()
+
+        threads = [
+            threading.Thread(target=first_writer),
+            threading.Thread(target=second_writer),
+        ]
+        for thread in threads:
+            thread.start()
+        # Poll as a sync client would, moving past every event seen
+        seen = []
+        while any(thread.is_alive() for thread in threads):
+            for event in storage.get_events_after(after_sequence, 100):
+                seen.append(event.resource_name)
+                after_sequence = event.sequence
+            time.sleep(0.01)
+        for thread in threads:
+            thread.join()
+        seen.extend(
+            event.resource_name
+            for event in storage.get_events_after(after_sequence, 100)
+        )
+
+        self.assertEqual(errors, [])
+        self.assertEqual(seen, ["First", "Second"])
@@ -0,0 +1,82 @@
+"""
+Request-scoped identity map / loader tests.
+
+Run tests: python manage.py test tests.test_identity_map
+"""
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework import status
+from asana_backend.utils.identity_map import (
+    identity_map_scope,
+    load,
+    load_many,
+)
+from asana_workspaces.models.workspace import Workspace
+from asana_users.models.user import User
+from asana_tasks.models.task import Task
+from asana_tasks.models.task_follower import TaskFollower
+
+
+@override_settings(RATELIMIT_ENABLE=False)
+class IdentityMapTest(TestCase):
+    """
+    asana_backend.utils.identity_map and the storages wired to it
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.workspace = Workspace.objects.create(name="Loader Workspace")
+        self.users = [
+            User.objects.create(name=f"User {i}", email=f"user{i}@example.com")
+            for i in range(3)
+        ]
+        self.task = Task.objects.create(name="Task", workspace=self.workspace)
+
+    def test_load_many_uses_one_query_and_memoizes(self):
+        """
+        Test Case: load_many fetches every missing row with one IN query and
+        later lookups in the same scope hit the map.
+        """
+        gids = [str(user.gid) for user in self.users]
+        with identity_map_scope():
+            with self.assertNumQueries(1):
+                users = load_many(User, gids)
+            with self.assertNumQueries(0):
+                self.assertIs(load(User, self.users[1].gid), users[1])
+                load_many(User, reversed(gids))
+
+        self.assertEqual([user.gid for user in users], [u.gid for u in self.users])
+
+    def test_load_raises_does_not_exist(self):
+        """
+        Test Case: a missing row raises the model's DoesNotExist.
+        """
+        with self.assertRaises(Workspace.DoesNotExist):
+            load(Workspace, '00000000-0000-0000-0000-000000000000')
+
+    def test_add_followers_loads_users_in_one_query(self):
+        """
+        Test Case: POST /tasks/{task_gid}/addFollowers/ loads all followers
+        with a single query.
+        """
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(
+                f'/api/1.0/tasks/{self.task.gid}/addFollowers/',
+                {'followers': [str(user.gid) for user in self.users]},
+                format='json'
+            )
+
+        user_queries = [
+            query for query in context.captured_queries
+            if query['sql'].startswith('SELECT')
+            and f'FROM "{User._meta.db_table}"' in query['sql']
+        ]
+        self.assertEqual(len(user_queries), 1)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            TaskFollower.objects.filter(task=self.task).count(),
+            3
+        )
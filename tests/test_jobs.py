@@ -0,0 +1,272 @@
+"""
+Job engine and duplication job tests.
+
+Run tests: python manage.py test tests.test_jobs
+"""
+
+from datetime import timedelta
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+from asana_workspaces.models.workspace import Workspace
+from asana_users.models.user import User
+from asana_projects.models.project import Project, ProjectMember
+from asana_tags.models.tag import Tag
+from asana_sections.models.section import Section
+from asana_tasks.models.task import Task
+from asana_tasks.models.task_project import TaskProject
+from asana_tasks.models.task_tag import TaskTag
+from asana_tasks.models.task_follower import TaskFollower
+from asana_tasks.models.task_dependency import TaskDependency
+from asana_tasks.storages.storage_implementation import (
+    StorageImplementation as TaskStorageImplementation
+)
+from asana_jobs.models.job import Job
+from asana_jobs.storages.storage_implementation import StorageImplementation
+from asana_jobs.workers.job_worker import JobWorker
+
+
+@override_settings(RATELIMIT_ENABLE=False, ASANA_JOBS={'RUN_IN_PROCESS': False})
+class JobsTest(TestCase):
+    """
+    POST /projects/{gid}/duplicate/, POST /tasks/{gid}/duplicate/ and
+    GET /jobs/{gid}/
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.storage = StorageImplementation()
+        self.workspace = Workspace.objects.create(name="Jobs Workspace")
+        self.user = User.objects.create(name="Ada", email="ada@example.com")
+        self.project = Project.objects.create(
+            name="Template",
+            workspace=self.workspace,
+            notes="Template notes"
+        )
+
+    def _add_project_tasks(self, count):
+        tasks = [
+            Task.objects.create(name=f"Task {i}", workspace=self.workspace)
+            for i in range(count)
+        ]
+        for task in tasks:
+            TaskProject.objects.create(task=task, project=self.project)
+        return tasks
+
+    def _get_job(self, job_gid):
+        return self.client.get(f'/api/1.0/jobs/{job_gid}/').json()['data']
+
+    def test_duplicate_project_runs_as_job(self):
+        """
+        Test Case: duplicate_project returns a not_started job; once a worker
+        runs it the job has succeeded and the copy has the tasks, subtasks,
+        tags, followers, dependencies and members.
+        """
+        first, second = self._add_project_tasks(2)
+        subtask = Task.objects.create(
+            name="Subtask",
+            workspace=self.workspace,
+            parent=first
+        )
+        tag = Tag.objects.create(name="Tag", workspace=self.workspace)
+        TaskTag.objects.create(task=first, tag=tag)
+        TaskFollower.objects.create(task=first, user=self.user)
+        TaskDependency.objects.create(predecessor=first, successor=second)
+        ProjectMember.objects.create(project=self.project, user=self.user)
+
+        response = self.client.post(
+            f'/api/1.0/projects/{self.project.gid}/duplicate/',
+            {'data': {
+                'name': 'Copy',
+                'include': 'members,notes,task_subtasks,task_tags,'
+                           'task_followers,task_dependencies',
+            }},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        job = response.json()['data']
+        self.assertEqual(job['resource_subtype'], 'duplicate_project')
+        self.assertEqual(job['status'], 'not_started')
+        self.assertEqual(self._get_job(job['gid'])['status'], 'not_started')
+
+        self.assertEqual(JobWorker(self.storage).run_pending(), 1)
+
+        job = self._get_job(job['gid'])
+        self.assertEqual(job['status'], 'succeeded')
+        copy = Project.objects.get(gid=job['new_project']['gid'])
+        self.assertEqual(copy.name, 'Copy')
+        self.assertEqual(copy.notes, 'Template notes')
+        self.assertTrue(ProjectMember.objects.filter(project=copy, user=self.user).exists())
+
+        copied = {
+            task.name: task
+            for task in Task.objects.filter(taskproject__project=copy)
+        }
+        self.assertEqual(set(copied), {'Task 0', 'Task 1'})
+        self.assertNotIn(copied['Task 0'].pk, {first.pk, second.pk})
+        self.assertEqual(
+            list(copied['Task 0'].subtasks.values_list('name', flat=True)),
+            [subtask.name]
+        )
+        self.assertTrue(TaskTag.objects.filter(task=copied['Task 0'], tag=tag).exists())
+        self.assertTrue(
+            TaskFollower.objects.filter(task=copied['Task 0'], user=self.user).exists()
+        )
+        self.assertTrue(TaskDependency.objects.filter(
+            predecessor=copied['Task 0'],
+            successor=copied['Task 1']
+        ).exists())
+        # The template is untouched
+        self.assertEqual(TaskProject.objects.filter(project=self.project).count(), 2)
+
+    def test_duplicate_project_keeps_sections_and_order(self):
+        """
+        Test Case: a duplicated project has copies of the sections, in the
+        same order, holding the copied tasks in the same rank order.
+        """
+        todo = Section.objects.create(name="To do", project=self.project)
+        done = Section.objects.create(name="Done", project=self.project)
+        layout = [
+            (None, 'Loose', 'i'),
+            (todo, 'Write', 'r'),
+            (todo, 'Plan', 'c'),
+            (todo, 'Review', 'm'),
+            (done, 'Ship', 'c'),
+            (done, 'Test', 'a'),
+        ]
+        for section, name, rank in layout:
+            TaskProject.objects.create(
+                task=Task.objects.create(name=name, workspace=self.workspace),
+                project=self.project,
+                section=section,
+                rank=rank
+            )
+
+        job = self.client.post(
+            f'/api/1.0/projects/{self.project.gid}/duplicate/',
+            {'data': {'name': 'Copy'}},
+            format='json'
+        ).json()['data']
+        JobWorker(self.storage).run_pending()
+        copy = Project.objects.get(gid=self._get_job(job['gid'])['new_project']['gid'])
+
+        def board(project):
+            return [
+                (section_name, list(
+                    TaskProject.objects.filter(project=project, section=section)
+                    .order_by('rank').values_list('task__name', flat=True)
+                ))
+                for section_name, section in [(None, None)] + [
+                    (section.name, section)
+                    for section in Section.objects.filter(project=project)
+                ]
+            ]
+
+        self.assertEqual(board(copy), [
+            (None, ['Loose']),
+            ('To do', ['Plan', 'Review', 'Write']),
+            ('Done', ['Test', 'Ship']),
+        ])
+        self.assertEqual(board(copy), board(self.project))
+        self.assertFalse(
+            Section.objects.filter(project=copy, pk__in=[todo.pk, done.pk]).exists()
+        )
+
+    def test_project_task_copy_is_constant_queries(self):
+        """
+        Test Case: copying 5 or 40 project tasks with all their relations
+        costs the same number of queries (40 tasks still fit in one SQLite
+        INSERT batch).
+        """
+        include = ['subtasks', 'tags', 'followers', 'dependencies', 'projects']
+        for task in self._add_project_tasks(5):
+            TaskFollower.objects.create(task=task, user=self.user)
+        first = Project.objects.create(name="First", workspace=self.workspace)
+        with CaptureQueriesContext(connection) as few:
+            TaskStorageImplementation().duplicate_project_tasks(
+                str(self.project.gid), str(first.gid), include
+            )
+
+        for task in self._add_project_tasks(35):
+            TaskFollower.objects.create(task=task, user=self.user)
+        second = Project.objects.create(name="Second", workspace=self.workspace)
+        with CaptureQueriesContext(connection) as many:
+            TaskStorageImplementation().duplicate_project_tasks(
+                str(self.project.gid), str(second.gid), include
+            )
+
+        self.assertEqual(len(few.captured_queries), len(many.captured_queries))
+        self.assertEqual(TaskProject.objects.filter(project=second).count(), 40)
+
+    def test_failed_job_leaves_nothing_behind(self):
+        """
+        Test Case: a job whose handler raises is marked failed and its
+        partial work is rolled back.
+        """
+        job = self.storage.create_job(
+            'duplicate_project',
+            {'project_gid': str(self.project.gid), 'name': 'Copy'}
+        )
+
+        def failing_handler(params):
+            Project.objects.create(name=params['name'], workspace=self.workspace)
+            raise RuntimeError("boom")
+
+        JobWorker(self.storage, handlers={'duplicate_project': failing_handler}).run_pending()
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'failed')
+        self.assertEqual(job.error, 'boom')
+        self.assertFalse(Project.objects.filter(name='Copy').exists())
+
+    def test_claim_hands_out_each_job_once(self):
+        """
+        Test Case: a claimed job is not claimed again until it goes stale.
+        """
+        job = self.storage.create_job('duplicate_task', {})
+        now = timezone.now()
+
+        self.assertEqual(self.storage.claim_next_job(stale_before=now).gid, job.gid)
+        self.assertIsNone(self.storage.claim_next_job(stale_before=now))
+        self.assertEqual(
+            self.storage.claim_next_job(stale_before=now + timedelta(hours=1)).gid,
+            job.gid
+        )
+
+    def test_duplicate_task_runs_as_job(self):
+        """
+        Test Case: duplicate_task returns a job whose new_task is the copy.
+        """
+        task = Task.objects.create(name="Original", workspace=self.workspace)
+        Task.objects.create(name="Child", workspace=self.workspace, parent=task)
+
+        response = self.client.post(
+            f'/api/1.0/tasks/{task.gid}/duplicate/',
+            {'data': {'name': 'Duplicate', 'include': ['subtasks']}},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        job_gid = response.json()['data']['gid']
+
+        JobWorker(self.storage).run_pending()
+
+        job = self._get_job(job_gid)
+        self.assertEqual(job['status'], 'succeeded')
+        self.assertEqual(job['new_task']['name'], 'Duplicate')
+        copy = Task.objects.get(gid=job['new_task']['gid'])
+        self.assertEqual(list(copy.subtasks.values_list('name', flat=True)), ['Child'])
+
+    def test_get_unknown_job(self):
+        """
+        Test Case: GET /jobs/{gid}/ for an unknown job is a 404.
+        """
+        response = self.client.get(
+            '/api/1.0/jobs/00000000-0000-0000-0000-000000000000/'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(Job.objects.exists())
@@ -0,0 +1,95 @@
+"""
+JSON renderer tests.
+
+Run tests: python manage.py test tests.test_json_renderer
+"""
+
+import json
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from unittest import mock
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.test import APIClient
+from asana_workspaces.models.workspace import Workspace
+from asana_backend.utils import renderers
+from asana_backend.utils.renderers import JSONRenderer, dumps
+
+
+class DumpsTest(SimpleTestCase):
+    """
+    asana_backend.utils.renderers.dumps
+    """
+
+    def setUp(self):
+        self.data = {
+            'gid': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            'created_at': datetime(2026, 1, 2, 3, 4, 5, 678000, tzinfo=timezone.utc),
+            'due_on': date(2026, 1, 31),
+            'amount': Decimal('1.50'),
+            'name': 'Ünïcode',
+            'tags': [],
+        }
+
+    def test_native_types_match_the_stdlib_encoder(self):
+        """
+        Test Case: with and without orjson, UUIDs, datetimes, dates and
+        Decimals are written the way DRF writes them.
+        """
+        fast = dumps(self.data)
+        with mock.patch.object(renderers, 'orjson', None):
+            fallback = dumps(self.data)
+
+        self.assertEqual(fast, fallback)
+        self.assertEqual(json.loads(fast), {
+            'gid': '12345678-1234-5678-1234-567812345678',
+            'created_at': '2026-01-02T03:04:05.678000Z',
+            'due_on': '2026-01-31',
+            'amount': 1.5,
+            'name': 'Ünïcode',
+            'tags': [],
+        })
+
+    def test_indents_and_out_of_range_integers(self):
+        """
+        Test Case: indented output matches the stdlib's, other indents and
+        integers orjson cannot hold fall back to it.
+        """
+        with mock.patch.object(renderers, 'orjson', None):
+            expected = dumps(self.data, indent=2)
+        self.assertEqual(dumps(self.data, indent=2), expected)
+        self.assertEqual(json.loads(dumps(self.data, indent=4)), json.loads(expected))
+        self.assertEqual(json.loads(dumps({'n': 2 ** 70})), {'n': 2 ** 70})
+
+    def test_line_separators_are_escaped(self):
+        """
+        Test Case: U+2028 and U+2029 are escaped as DRF's renderer does.
+        """
+        content = JSONRenderer().render({'text': 'a b c'})
+
+        self.assertEqual(content, b'{"text":"a\\u2028b\\u2029c"}')
+
+
+@override_settings(RATELIMIT_ENABLE=False)
+class OptPrettyTest(TestCase):
+    """
+    opt_pretty on API responses
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.workspace = Workspace.objects.create(name="Pretty Workspace")
+
+    def test_opt_pretty_indents_the_response(self):
+        """
+        Test Case: opt_pretty=true returns the same body indented; without
+        it the body is compact.
+        """
+        url = f'/api/1.0/workspaces/{self.workspace.gid}/'
+
+        compact = self.client.get(url)
+        pretty = self.client.get(url, {'opt_pretty': 'true'})
+
+        self.assertNotIn(b'\n', compact.content)
+        self.assertIn(b'\n  "data": {', pretty.content)
+        self.assertEqual(json.loads(pretty.content), json.loads(compact.content))
@@ -0,0 +1,149 @@
+"""
+Offset token (keyset) pagination tests.
+
+Run tests: python manage.py test tests.test_keyset_pagination
+"""
+
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from rest_framework import status
+from asana_workspaces.models.workspace import Workspace
+from asana_users.models.user import User
+from asana_projects.models.project import Project
+from asana_tasks.models.task import Task
+from asana_tasks.models.task_project import TaskProject
+from asana_stories.models.story import Story
+from asana_backend.utils.pagination import encode_offset_token
+
+
+@override_settings(RATELIMIT_ENABLE=False)
+class KeysetPaginationTest(TestCase):
+    """
+    next_page offset tokens on list endpoints
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.workspace = Workspace.objects.create(name="Paging Workspace")
+        self.user = User.objects.create(name="Ada", email="ada@example.com")
+        self.project = Project.objects.create(
+            name="Launch",
+            workspace=self.workspace
+        )
+        self.tasks = [
+            Task.objects.create(name=f"Task {i}", workspace=self.workspace)
+            for i in range(5)
+        ]
+        for task in self.tasks:
+            TaskProject.objects.create(task=task, project=self.project)
+
+    def _collect(self, url, params):
+        """Follow next_page offsets until the last page."""
+        gids = []
+        pages = 0
+        while True:
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            body = response.json()
+            gids.extend(item['gid'] for item in body['data'])
+            pages += 1
+            if 'next_page' not in body:
+                return gids, pages
+            params = dict(params, offset=body['next_page']['offset'])
+
+    def test_tasks_walk_all_pages_with_offset_tokens(self):
+        """
+        Test Case: GET /tasks/ pages through every task exactly once by
+        following next_page.offset.
+        """
+        gids, pages = self._collect(
+            '/api/1.0/tasks/',
+            {'workspace': str(self.workspace.gid), 'limit': 2}
+        )
+
+        self.assertEqual(pages, 3)
+        self.assertEqual(sorted(gids), sorted(str(t.gid) for t in self.tasks))
+
+    def test_next_page_shape(self):
+        """
+        Test Case: next_page carries offset, path (relative to the API base)
+        and uri, and keeps the other query parameters.
+        """
+        response = self.client.get(
+            f'/api/1.0/projects/{self.project.gid}/tasks/',
+            {'limit': 3}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        next_page = response.json()['next_page']
+        self.assertTrue(next_page['path'].startswith(
+            f'/projects/{self.project.gid}/tasks/?limit=3&offset='
+        ))
+        self.assertTrue(next_page['uri'].startswith('http://testserver/api/1.0/'))
+        self.assertTrue(next_page['uri'].endswith(next_page['offset']))
+
+        response = self.client.get(
+            f'/api/1.0/projects/{self.project.gid}/tasks/',
+            {'limit': 3, 'offset': next_page['offset']}
+        )
+        self.assertEqual(len(response.json()['data']), 2)
+        self.assertNotIn('next_page', response.json())
+
+    def test_stories_page_newest_first(self):
+        """
+        Test Case: stories are paged newest first across token boundaries.
+        """
+        task = self.tasks[0]
+        stories = [
+            Story.objects.create(task=task, text=f"Comment {i}")
+            for i in range(3)
+        ]
+
+        gids, pages = self._collect(
+            f'/api/1.0/tasks/{task.gid}/stories/',
+            {'limit': 1}
+        )
+
+        self.assertEqual(pages, 3)
+        expected = sorted(
+            stories,
+            key=lambda story: (story.created_at, str(story.gid)),
+            reverse=True
+        )
+        self.assertEqual(gids, [str(story.gid) for story in expected])
+
+    def test_malformed_offset_token_is_rejected(self):
+        """
+        Test Case: an offset that was not issued by the API is a 400.
+        """
+        response = self.client.get(
+            '/api/1.0/tasks/',
+            {'workspace': str(self.workspace.gid), 'offset': 'not-a-token'}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_offset_token_with_wrongly_typed_values_is_rejected(self):
+        """
+        Test Case: a token whose sort key values are not strings (a number
+        or a list where a date and gid are expected) is a 400 on the
+        stories and attachments lists.
+        """
+        task = self.tasks[0]
+        Story.objects.create(task=task, text="Comment")
+        paths = [
+            f'/api/1.0/tasks/{task.gid}/stories/',
+            f'/api/1.0/tasks/{task.gid}/attachments/',
+        ]
+        tokens = [[123, 456], [['2025'], {'gid': 1}], [True, 1.5]]
+        for path in paths:
+            for values in tokens:
+                response = self.client.get(
+                    path, {'offset': encode_offset_token(values)}
+                )
+
+                self.assertEqual(
+                    response.status_code,
+                    status.HTTP_400_BAD_REQUEST,
+                    (path, values)
+                )
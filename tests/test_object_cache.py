@@ -0,0 +1,177 @@
+"""
+Versioned object cache tests.
+
+Run tests: python manage.py test tests.test_object_cache
+"""
+
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework import status
+from asana_workspaces.models.workspace import Workspace
+from asana_users.models.user import User
+from asana_tags.models.tag import Tag
+from asana_tasks.models.task import Task
+from asana_tasks.models.task_tag import TaskTag
+
+OBJECT_CACHE = {
+    'ENABLED': True,
+    'CACHE': 'objects',
+    'VERSION_CACHE': 'object_versions',
+    'TIMEOUT': 300,
+    'SETTLE_SECONDS': 0,
+}
+
+
+@override_settings(RATELIMIT_ENABLE=False, ASANA_OBJECT_CACHE=OBJECT_CACHE)
+class ObjectCacheTest(TestCase):
+    """
+    asana_backend.utils.object_cache and the task, user and workspace
+    detail endpoints
+    """
+
+    def setUp(self):
+        caches['objects'].clear()
+        caches['object_versions'].clear()
+        self.client = APIClient()
+        self.workspace = Workspace.objects.create(name="Cache Workspace")
+        self.user = User.objects.create(name="Ada", email="ada@example.com")
+        self.tag = Tag.objects.create(name="urgent", workspace=self.workspace)
+        self.task = Task.objects.create(
+            name="Write spec", workspace=self.workspace, assignee=self.user
+        )
+        TaskTag.objects.create(task=self.task, tag=self.tag)
+
+    def get(self, path, params=None):
+        response = self.client.get(path, params or {})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()
+
+    def test_repeated_reads_are_served_from_cache(self):
+        """
+        Test Case: the second read of each detail endpoint runs no queries
+        and returns the same body.
+        """
+        paths = [
+            f'/api/1.0/tasks/{self.task.gid}/',
+            f'/api/1.0/users/{self.user.gid}/',
+            f'/api/1.0/workspaces/{self.workspace.gid}/',
+        ]
+        for path in paths:
+            first = self.get(path)
+            with CaptureQueriesContext(connection) as context:
+                second = self.get(path)
+
+            self.assertEqual(len(context.captured_queries), 0, path)
+            self.assertEqual(second, first)
+
+    def test_opt_fields_are_cached_separately(self):
+        """
+        Test Case: each opt_fields selection is its own entry, and a gid in
+        another case or format finds the same entry.
+        """
+        path = f'/api/1.0/tasks/{self.task.gid}/'
+        full = self.get(path)
+        names = self.get(path, {'opt_fields': 'name'})
+        upper = self.get(f'/api/1.0/tasks/{str(self.task.gid).upper()}/')
+
+        self.assertIn('tags', full['data'])
+        self.assertEqual(set(names['data']), {'gid', 'name'})
+        self.assertEqual(upper, full)
+
+    def test_saving_the_object_invalidates_it(self):
+        """
+        Test Case: saving a task, or deleting one of its tag links, changes
+        the next read.
+        """
+        path = f'/api/1.0/tasks/{self.task.gid}/'
+        self.get(path)
+
+        self.task.name = "Write the spec"
+        self.task.save()
+        self.assertEqual(self.get(path)['data']['name'], "Write the spec")
+
+        TaskTag.objects.filter(task=self.task).delete()
+        self.assertEqual(self.get(path)['data']['tags'], [])
+
+    def test_embedded_objects_invalidate_their_parents(self):
+        """
+        Test Case: renaming a tag or user changes the tasks that embed them.
+        """
+        path = f'/api/1.0/tasks/{self.task.gid}/'
+        self.get(path)
+
+        self.tag.name = "blocker"
+        self.tag.save()
+        self.user.name = "Ada Lovelace"
+        self.user.save()
+
+        task = self.get(path)['data']
+        self.assertEqual(task['tags'][0]['name'], "blocker")
+        self.assertEqual(task['assignee']['name'], "Ada Lovelace")
+
+    def test_writes_without_signals_invalidate(self):
+        """
+        Test Case: bulk-created followers and num_subtasks updates by
+        setParent show up on the next read.
+        """
+        path = f'/api/1.0/tasks/{self.task.gid}/'
+        self.get(path)
+        self.get(path, {'opt_fields': 'num_subtasks'})
+
+        self.client.post(
+            f'/api/1.0/tasks/{self.task.gid}/addFollowers/',
+            {'followers': [str(self.user.gid)]},
+            format='json'
+        )
+        child = Task.objects.create(name="Child", workspace=self.workspace)
+        self.client.post(
+            f'/api/1.0/tasks/{child.gid}/setParent/',
+            {'data': {'parent': str(self.task.gid)}},
+            format='json'
+        )
+
+        self.assertEqual(len(self.get(path)['data']['followers']), 1)
+        self.assertEqual(
+            self.get(path, {'opt_fields': 'num_subtasks'})['data']['num_subtasks'], 1
+        )
+
+    def test_unsettled_versions_are_not_cached(self):
+        """
+        Test Case: a response depending on a version changed within
+        SETTLE_SECONDS is built every time.
+        """
+        path = f'/api/1.0/tasks/{self.task.gid}/'
+        with override_settings(ASANA_OBJECT_CACHE={**OBJECT_CACHE, 'SETTLE_SECONDS': 60}):
+            self.get(path)
+            with CaptureQueriesContext(connection) as context:
+                self.get(path)
+
+        self.assertGreater(len(context.captured_queries), 0)
+
+    def test_evicted_versions_miss(self):
+        """
+        Test Case: when versions are evicted, entries built with them are
+        not served.
+        """
+        path = f'/api/1.0/tasks/{self.task.gid}/'
+        self.get(path)
+        caches['object_versions'].clear()
+
+        with CaptureQueriesContext(connection) as context:
+            self.get(path)
+
+        self.assertGreater(len(context.captured_queries), 0)
+
+    def test_missing_objects_are_not_cached(self):
+        """
+        Test Case: a 404 is not cached; the object is found once it exists.
+        """
+        gid = '123e4567-e89b-12d3-a456-426614174000'
+        missing = self.client.get(f'/api/1.0/workspaces/{gid}/')
+        Workspace.objects.create(gid=gid, name="Late")
+
+        self.assertEqual(missing.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(self.get(f'/api/1.0/workspaces/{gid}/')['data']['name'], "Late")
@@ -0,0 +1,221 @@
+"""
+Materialized project task count tests.
+
+Run tests: python manage.py test tests.test_project_task_counts
+"""
+
+from io import StringIO
+from unittest import mock
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from rest_framework import status
+from asana_workspaces.models.workspace import Workspace
+from asana_projects.models.project import Project
+from asana_projects.models.project_task_count import ProjectTaskCount
+from asana_projects.app_interfaces.service_interface import ServiceInterface
+from asana_projects.task_counts import schema
+from asana_projects.task_counts.schema import (
+    install_task_count_triggers,
+    uninstall_task_count_triggers,
+)
+from asana_tasks.models.task import Task
+from asana_tasks.models.task_project import TaskProject
+from asana_tasks.storages.storage_implementation import (
+    StorageImplementation as TaskStorageImplementation
+)
+
+
+@override_settings(RATELIMIT_ENABLE=False)
+class ProjectTaskCountsTest(TestCase):
+    """
+    GET /projects/{project_gid}/task_counts and the counter triggers
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.workspace = Workspace.objects.create(name="Counts Workspace")
+        self.project = Project.objects.create(name="Project", workspace=self.workspace)
+
+    def _add_tasks(self, count, project=None, **fields):
+        tasks = [
+            Task.objects.create(name=f"Task {i}", workspace=self.workspace, **fields)
+            for i in range(count)
+        ]
+        for task in tasks:
+            TaskProject.objects.create(task=task, project=project or self.project)
+        return tasks
+
+    def _counts(self, project=None, **params):
+        response = self.client.get(
+            f'/api/1.0/projects/{(project or self.project).gid}/task_counts',
+            params
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()['data']
+
+    def test_counts_follow_links_completion_and_subtype(self):
+        """
+        Test Case: adding and removing tasks, completing them and turning
+        them into milestones all show up in the counts.
+        """
+        tasks = self._add_tasks(4)
+        self._add_tasks(1, resource_subtype='milestone', completed=True)
+        tasks[0].completed = True
+        tasks[0].save()
+        tasks[1].resource_subtype = 'milestone'
+        tasks[1].save()
+        TaskProject.objects.get(task=tasks[3]).delete()
+
+        self.assertEqual(self._counts(), {
+            'num_tasks': 4,
+            'num_incomplete_tasks': 2,
+            'num_completed_tasks': 2,
+            'num_milestones': 2,
+            'num_incomplete_milestones': 1,
+            'num_completed_milestones': 1,
+        })
+
+    def test_bulk_writes_and_cascades_are_counted(self):
+        """
+        Test Case: QuerySet.update, bulk-created links (duplication) and
+        deleting tasks keep the counts right without any model signal
+        (copies start incomplete).
+        """
+        tasks = self._add_tasks(5)
+        Task.objects.filter(gid__in=[task.gid for task in tasks[:3]]).update(completed=True)
+        copy = Project.objects.create(name="Copy", workspace=self.workspace)
+        TaskStorageImplementation().duplicate_project_tasks(
+            str(self.project.gid), str(copy.gid), []
+        )
+        tasks[4].delete()
+
+        self.assertEqual(
+            self._counts(opt_fields='num_tasks,num_completed_tasks'),
+            {'num_tasks': 4, 'num_completed_tasks': 3}
+        )
+        self.assertEqual(
+            self._counts(copy, opt_fields='num_tasks,num_incomplete_tasks'),
+            {'num_tasks': 5, 'num_incomplete_tasks': 5}
+        )
+
+    def test_counts_roll_back_with_the_change(self):
+        """
+        Test Case: a rolled back transaction leaves the counts untouched.
+        """
+        task, = self._add_tasks(1)
+        try:
+            with transaction.atomic():
+                self._add_tasks(3)
+                task.completed = True
+                task.save()
+                raise RuntimeError("abort")
+        except RuntimeError:
+            pass
+
+        counts = ProjectTaskCount.objects.get(project=self.project)
+        self.assertEqual((counts.num_tasks, counts.num_completed_tasks), (1, 0))
+
+    def test_read_is_one_query(self):
+        """
+        Test Case: the endpoint reads one counter row; a project without
+        tasks gets zeros and an unknown project a 404.
+        """
+        self._add_tasks(3)
+        with self.assertNumQueries(1):
+            self.client.get(f'/api/1.0/projects/{self.project.gid}/task_counts')
+
+        empty = Project.objects.create(name="Empty", workspace=self.workspace)
+        self.assertEqual(self._counts(empty)['num_tasks'], 0)
+        response = self.client.get(
+            '/api/1.0/projects/00000000-0000-0000-0000-000000000000/task_counts'
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_many_projects_in_one_query(self):
+        """
+        Test Case: ServiceInterface.get_task_counts serves a page of
+        projects with a single query.
+        """
+        projects = [
+            Project.objects.create(name=f"P{i}", workspace=self.workspace)
+            for i in range(5)
+        ]
+        for i, project in enumerate(projects):
+            self._add_tasks(i, project=project)
+
+        with self.assertNumQueries(1):
+            counts = ServiceInterface.get_task_counts([str(p.gid) for p in projects])
+
+        self.assertEqual(
+            [counts[str(p.gid)]['num_tasks'] for p in projects],
+            [0, 1, 2, 3, 4]
+        )
+
+    def test_reconcile_repairs_drift(self):
+        """
+        Test Case: the reconciliation command fixes counters that drifted
+        and creates missing ones; consistent projects are left alone.
+        """
+        self._add_tasks(3, completed=True)
+        other = Project.objects.create(name="Other", workspace=self.workspace)
+        self._add_tasks(2, project=other)
+        ProjectTaskCount.objects.filter(project=self.project).update(num_tasks=99)
+        ProjectTaskCount.objects.filter(project=other).delete()
+
+        out = StringIO()
+        call_command('reconcile_project_task_counts', stdout=out)
+
+        self.assertIn('Checked 2 projects, corrected 2.', out.getvalue())
+        self.assertEqual(self._counts()['num_tasks'], 3)
+        self.assertEqual(self._counts(other)['num_incomplete_tasks'], 2)
+        out = StringIO()
+        call_command('reconcile_project_task_counts', stdout=out)
+        self.assertIn('corrected 0.', out.getvalue())
+
+    def test_reinstall_recounts(self):
+        """
+        Test Case: after the triggers were lost (as in a SQLite table
+        rebuild) reinstalling them recounts every project.
+        """
+        uninstall_task_count_triggers(connection)
+        self._add_tasks(2)
+        self.assertFalse(ProjectTaskCount.objects.exists())
+
+        install_task_count_triggers(connection)
+
+        self.assertEqual(ProjectTaskCount.objects.get(project=self.project).num_tasks, 2)
+        self._add_tasks(1)
+        self.assertEqual(self._counts()['num_tasks'], 3)
+
+    def test_installed_triggers_are_left_alone(self):
+        """
+        Test Case: installing over triggers that are in place neither
+        recreates them nor recounts; drift is left to the reconcile command.
+        """
+        self._add_tasks(2)
+        ProjectTaskCount.objects.filter(project=self.project).update(num_tasks=7)
+
+        install_task_count_triggers(connection)
+
+        self.assertEqual(ProjectTaskCount.objects.get(project=self.project).num_tasks, 7)
+
+    def test_failed_install_changes_nothing(self):
+        """
+        Test Case: an install that fails part way leaves neither triggers
+        nor emptied counts behind.
+        """
+        self._add_tasks(2)
+        uninstall_task_count_triggers(connection)
+        failing_recount = [*schema.RECOUNT, 'SELECT * FROM no_such_table']
+
+        with mock.patch.object(schema, 'RECOUNT', failing_recount):
+            with self.assertRaises(Exception):
+                install_task_count_triggers(connection)
+
+        self.assertEqual(ProjectTaskCount.objects.get(project=self.project).num_tasks, 2)
+        self._add_tasks(1)
+        self.assertEqual(ProjectTaskCount.objects.get(project=self.project).num_tasks, 2)
+        install_task_count_triggers(connection)
+        self.assertEqual(self._counts()['num_tasks'], 3)
@@ -0,0 +1,268 @@
+"""
+Token bucket rate limiting tests.
+
+Run tests: python manage.py test tests.test_rate_limiting
+"""
+
+import multiprocessing
+import os
+import tempfile
+from django.http import JsonResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from rest_framework.test import APIClient
+from rest_framework import status
+from asana_workspaces.models.workspace import Workspace
+from asana_backend.utils.decorators.ratelimit import ratelimit
+from asana_backend.utils.rate_limiting import TokenBucketLimiter, parse_rate
+from asana_backend.utils.rate_limiting.limiter import get_rate_limit_settings
+from asana_backend.utils.rate_limiting.memory_store import MemoryStore
+from asana_backend.utils.rate_limiting.sqlite_store import SQLiteStore
+
+MEMORY_STORE = {
+    'STORE': 'asana_backend.utils.rate_limiting.memory_store.MemoryStore',
+    'OPTIONS': {},
+    'LEASE_FRACTION': 0.05,
+}
+
+
+def _take_all(path, results):
+    store = SQLiteStore(path)
+    results.put(sum(store.take('shared', 50, 0.001, 1, 1000.0)[0] for _ in range(40)))
+
+
+class CountingStore(MemoryStore):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def take(self, *args, **kwargs):
+        self.calls += 1
+        return super().take(*args, **kwargs)
+
+
+class TokenBucketTest(SimpleTestCase):
+    """
+    asana_backend.utils.rate_limiting
+    """
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'buckets.sqlite3')
+
+    def test_parse_rate(self):
+        """
+        Test Case: rates read as (requests, seconds).
+        """
+        self.assertEqual(parse_rate('5/s'), (5, 1))
+        self.assertEqual(parse_rate('100/m'), (100, 60))
+        self.assertEqual(parse_rate('10/15m'), (10, 900))
+        with self.assertRaises(ValueError):
+            parse_rate('often')
+
+    def test_stores_empty_and_refill_buckets(self):
+        """
+        Test Case: a bucket gives out its capacity, then says how long until
+        the next token, and refills at the rate.
+        """
+        for store in (MemoryStore(), SQLiteStore(self.path)):
+            self.assertEqual(store.take('k', 3, 1.0, 2, 100.0), (2, 0.0))
+            self.assertEqual(store.take('k', 3, 1.0, 2, 100.0), (1, 0.0))
+            granted, retry_after = store.take('k', 3, 1.0, 1, 100.25)
+            self.assertEqual(granted, 0)
+            self.assertAlmostEqual(retry_after, 0.75)
+            self.assertEqual(store.take('k', 3, 1.0, 5, 102.0)[0], 2)
+            self.assertEqual(store.take('other', 3, 1.0, 1, 102.0)[0], 1)
+
+    def test_sqlite_store_is_shared_between_processes(self):
+        """
+        Test Case: processes taking from the same bucket in one file never
+        get more than its capacity between them.
+        """
+        results = multiprocessing.get_context('fork').Queue()
+        workers = [
+            multiprocessing.get_context('fork').Process(
+                target=_take_all, args=(self.path, results)
+            )
+            for _ in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        self.assertEqual(sum(results.get() for _ in workers), 50)
+
+    def test_limiter_spends_leases_locally(self):
+        """
+        Test Case: with leases of 10 tokens, 100 requests go to the store
+        10 times, and the 101st is refused.
+        """
+        store = CountingStore()
+        limiter = TokenBucketLimiter(store, lease_fraction=0.1)
+
+        allowed = [limiter.acquire('key', '100/h')[0] for _ in range(100)]
+        allowed_after, retry_after = limiter.acquire('key', '100/h')
+
+        self.assertTrue(all(allowed))
+        self.assertEqual(store.calls, 11)
+        self.assertFalse(allowed_after)
+        self.assertGreater(retry_after, 0)
+
+    def test_small_buckets_are_not_leased(self):
+        """
+        Test Case: buckets under 2 / LEASE_FRACTION tokens, like the
+        per-view limits, go to the store for every request.
+        """
+        store = CountingStore()
+        limiter = TokenBucketLimiter(store, lease_fraction=0.05)
+
+        for _ in range(10):
+            limiter.acquire('key', '39/s')
+
+        self.assertEqual(store.calls, 10)
+
+
+@override_settings(RATELIMIT_ENABLE=True, ASANA_RATE_LIMITS=MEMORY_STORE)
+class RateLimitDecoratorTest(TestCase):
+    """
+    @ratelimit on views
+    """
+
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def test_limited_api_request_gets_retry_after(self):
+        """
+        Test Case: a sixth request within a second to a 5/s endpoint is a
+        429 with a Retry-After header.
+        """
+        client = APIClient()
+        workspace = Workspace.objects.create(name="Limited Workspace")
+        url = '/api/1.0/tasks/'
+
+        responses = [
+            client.get(url, {'workspace': str(workspace.gid)}, REMOTE_ADDR='10.0.0.18')
+            for _ in range(6)
+        ]
+
+        self.assertEqual(
+            [response.status_code for response in responses[:5]],
+            [status.HTTP_200_OK] * 5
+        )
+        self.assertEqual(responses[5].status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(responses[5]['Retry-After'], '1')
+        self.assertEqual(responses[5].json()['res_status'], 'RATE_LIMIT_EXCEEDED')
+
+    def test_token_and_workspace_keys(self):
+        """
+        Test Case: token buckets are per API token and workspace buckets per
+        workspace; requests without a workspace are not counted by it.
+        """
+        @ratelimit(key='token', rate='2/m')
+        def by_token(request):
+            return JsonResponse({})
+
+        @ratelimit(key='workspace', rate='1/m')
+        def by_workspace(request, workspace_gid=None):
+            return JsonResponse({})
+
+        def get(token):
+            return by_token(self.factory.get('/', HTTP_AUTHORIZATION=f'Bearer {token}'))
+
+        self.assertEqual([get('a').status_code for _ in range(3)], [200, 200, 429])
+        self.assertEqual(get('b').status_code, 200)
+
+        request = self.factory.get('/')
+        self.assertEqual(by_workspace(request, workspace_gid='w1').status_code, 200)
+        self.assertEqual(by_workspace(request, workspace_gid='w1').status_code, 429)
+        self.assertEqual(by_workspace(request, workspace_gid='w2').status_code, 200)
+        self.assertEqual(by_workspace(request).status_code, 200)
+        self.assertEqual(by_workspace(request).status_code, 200)
+
+    @override_settings(RATELIMIT_ENABLE=False)
+    def test_disabled(self):
+        """
+        Test Case: RATELIMIT_ENABLE=False lets every request through.
+        """
+        @ratelimit(key='ip', rate='1/m')
+        def view(request):
+            return JsonResponse({})
+
+        request = self.factory.get('/')
+        self.assertEqual([view(request).status_code for _ in range(3)], [200] * 3)
+
+
+@override_settings(RATELIMIT_ENABLE=True)
+class ApiRateLimitMiddlewareTest(TestCase):
+    """
+    Per token and per workspace limits on every API request
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.workspace = Workspace.objects.create(name="Busy Workspace")
+        self.other = Workspace.objects.create(name="Quiet Workspace")
+
+    def limits(self, **api_limits):
+        return override_settings(
+            ASANA_RATE_LIMITS={**MEMORY_STORE, 'API_LIMITS': api_limits}
+        )
+
+    def test_token_limit_spans_endpoints(self):
+        """
+        Test Case: a token's requests to any endpoint count against one
+        bucket; other tokens have their own.
+        """
+        def get(path, token):
+            return self.client.get(path, HTTP_AUTHORIZATION=f'Bearer {token}')
+
+        with self.limits(token='3/m'):
+            responses = [
+                get('/api/1.0/workspaces/', 'a'),
+                get(f'/api/1.0/workspaces/{self.workspace.gid}/', 'a'),
+                get('/api/1.0/users/', 'a'),
+                get('/api/1.0/workspaces/', 'a'),
+            ]
+            other = get('/api/1.0/workspaces/', 'b')
+
+        self.assertEqual(
+            [response.status_code for response in responses[:3]],
+            [status.HTTP_200_OK] * 3
+        )
+        self.assertEqual(responses[3].status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(responses[3].json()['res_status'], 'RATE_LIMIT_EXCEEDED')
+        self.assertIn('Retry-After', responses[3])
+        self.assertEqual(other.status_code, status.HTTP_200_OK)
+
+    def test_workspace_limit_reads_url_and_query(self):
+        """
+        Test Case: the workspace bucket counts a workspace named in the URL
+        or the query; requests naming none are not counted.
+        """
+        busy = str(self.workspace.gid)
+        with self.limits(workspace='2/m'):
+            statuses = [
+                self.client.get(f'/api/1.0/workspaces/{busy}/').status_code,
+                self.client.get('/api/1.0/tasks/', {'workspace': busy}).status_code,
+                self.client.get(f'/api/1.0/workspaces/{busy}/').status_code,
+                self.client.get(f'/api/1.0/workspaces/{self.other.gid}/').status_code,
+                self.client.get('/api/1.0/workspaces/').status_code,
+                self.client.get('/api/1.0/workspaces/').status_code,
+                self.client.get('/api/1.0/workspaces/').status_code,
+            ]
+
+        self.assertEqual(statuses, [200, 200, 429, 200, 200, 200, 200])
+
+    def test_default_limits_are_leased(self):
+        """
+        Test Case: the default API-wide buckets are large enough to lease.
+        """
+        store = CountingStore()
+        limiter = TokenBucketLimiter(store, lease_fraction=0.05)
+        token_rate = get_rate_limit_settings()['API_LIMITS']['token']
+
+        for _ in range(20):
+            limiter.acquire('key', token_rate)
+
+        self.assertEqual(store.calls, 1)
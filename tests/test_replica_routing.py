@@ -0,0 +1,157 @@
+"""
+Read replica routing tests.
+
+Run tests: python manage.py test tests.test_replica_routing
+"""
+
+import json
+import time
+from unittest import mock
+from django.contrib.auth.models import User as AuthUser
+from django.core.cache import cache
+from django.db import connections, router
+from django.http import JsonResponse, StreamingHttpResponse
+from django.test import (
+    AsyncRequestFactory,
+    RequestFactory,
+    SimpleTestCase,
+    override_settings,
+)
+from asana_backend.utils.async_views import run_in_thread
+from asana_backend.utils.replica_routing import ReplicaRoutingMiddleware
+from asana_tasks.models.task import Task
+
+ROUTING = {
+    'REPLICAS': ['replica_1', 'replica_2'],
+    'PIN_SECONDS': 5,
+    'PIN_CACHE': 'default',
+    'APPS': ['asana_tasks'],
+}
+
+
+def read_view(request):
+    return JsonResponse({
+        'reads': [router.db_for_read(Task) for _ in range(5)],
+        'auth': router.db_for_read(AuthUser),
+    })
+
+
+def write_view(request):
+    before = router.db_for_read(Task)
+    write = router.db_for_write(Task)
+    return JsonResponse({
+        'before': before,
+        'write': write,
+        'after': router.db_for_read(Task),
+    })
+
+
+@override_settings(ASANA_DB_ROUTING=ROUTING)
+class ReplicaRoutingTest(SimpleTestCase):
+    """
+    asana_backend.utils.replica_routing
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+
+    def call(self, view, method='get', token='alice'):
+        request = getattr(self.factory, method)(
+            '/api/1.0/tasks/', HTTP_AUTHORIZATION=f'Bearer {token}'
+        )
+        return json.loads(ReplicaRoutingMiddleware(view)(request).content)
+
+    def test_get_reads_one_replica(self):
+        """
+        Test Case: a GET request reads the API's models from one replica
+        and other apps' models from the primary.
+        """
+        body = self.call(read_view)
+
+        self.assertIn(body['reads'][0], ROUTING['REPLICAS'])
+        self.assertEqual(len(set(body['reads'])), 1)
+        self.assertEqual(body['auth'], 'default')
+
+    def test_writer_is_pinned_to_primary(self):
+        """
+        Test Case: after a client writes, its reads go to the primary until
+        the pin expires; other clients keep reading replicas.
+        """
+        self.assertEqual(self.call(write_view, method='post')['write'], 'default')
+
+        self.assertEqual(self.call(read_view)['reads'][0], 'default')
+        self.assertIn(self.call(read_view, token='bob')['reads'][0], ROUTING['REPLICAS'])
+        with override_settings(ASANA_DB_ROUTING={**ROUTING, 'PIN_SECONDS': 0.05}):
+            self.call(write_view, token='carol')
+            time.sleep(0.1)
+            self.assertIn(
+                self.call(read_view, token='carol')['reads'][0], ROUTING['REPLICAS']
+            )
+
+    def test_reads_after_a_write_use_primary(self):
+        """
+        Test Case: once a request writes, its later reads go to the primary.
+        """
+        body = self.call(write_view)
+
+        self.assertIn(body['before'], ROUTING['REPLICAS'])
+        self.assertEqual(body['after'], 'default')
+
+    def test_primary_reads(self):
+        """
+        Test Case: non-GET requests, reads in a transaction, reads outside
+        a request and deployments without replicas all use the primary.
+        """
+        self.assertEqual(self.call(read_view, method='post')['reads'][0], 'default')
+        self.assertEqual(router.db_for_read(Task), 'default')
+        with mock.patch.object(connections['default'], 'in_atomic_block', True):
+            self.assertEqual(self.call(read_view)['reads'][0], 'default')
+        with override_settings(ASANA_DB_ROUTING={**ROUTING, 'REPLICAS': []}):
+            self.assertEqual(self.call(read_view)['reads'][0], 'default')
+
+    def test_streamed_body_reads_replica(self):
+        """
+        Test Case: a streamed body, produced after the middleware returns,
+        still reads from the request's replica.
+        """
+        def view(request):
+            return StreamingHttpResponse(
+                router.db_for_read(Task) for _ in range(2)
+            )
+
+        request = self.factory.get('/api/1.0/tasks/')
+        response = ReplicaRoutingMiddleware(view)(request)
+        aliases = b''.join(response.streaming_content).decode()
+
+        self.assertIn(aliases[:9], ROUTING['REPLICAS'])
+        self.assertEqual(aliases, aliases[:9] * 2)
+
+    async def test_async_requests(self):
+        """
+        Test Case: under ASGI, reads on worker threads follow the request's
+        routing and a write pins the client.
+        """
+        async def view(request):
+            read = await run_in_thread(router.db_for_read, Task)
+            if request.method == 'POST':
+                await run_in_thread(router.db_for_write, Task)
+            return JsonResponse({'read': read})
+
+        factory = AsyncRequestFactory()
+        middleware = ReplicaRoutingMiddleware(view)
+        headers = {'Authorization': 'Bearer dave'}
+
+        first = await middleware(factory.get('/api/1.0/tasks/', headers=headers))
+        await middleware(factory.post('/api/1.0/tasks/', headers=headers))
+        pinned = await middleware(factory.get('/api/1.0/tasks/', headers=headers))
+
+        self.assertIn(json.loads(first.content)['read'], ROUTING['REPLICAS'])
+        self.assertEqual(json.loads(pinned.content)['read'], 'default')
+
+    def test_replicas_are_not_migrated(self):
+        """
+        Test Case: migrations only run on the primary.
+        """
+        self.assertFalse(router.allow_migrate('replica_1', 'asana_tasks'))
+        self.assertTrue(router.allow_migrate('default', 'asana_tasks'))
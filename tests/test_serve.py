@@ -0,0 +1,39 @@
+"""
+Production launcher tests.
+
+Run tests: python manage.py test tests.test_serve
+"""
+
+from django.test import SimpleTestCase
+from asana_backend.serve import MAX_WORKERS, build_command, default_workers
+
+
+class ServeTest(SimpleTestCase):
+    """
+    asana_backend.serve
+    """
+
+    def test_default_workers(self):
+        """
+        Test Case: sync workers follow 2 * CPUs + 1, threaded and ASGI
+        workers about one per CPU, never more than MAX_WORKERS.
+        """
+        self.assertEqual(default_workers('sync', cpu_count=4), 9)
+        self.assertEqual(default_workers('gthread', cpu_count=4), 5)
+        self.assertEqual(default_workers('uvicorn', cpu_count=1), 2)
+        self.assertEqual(default_workers('sync', cpu_count=64), MAX_WORKERS)
+
+    def test_worker_class_picks_the_application(self):
+        """
+        Test Case: uvicorn workers serve the ASGI application, the others
+        the WSGI one; extra arguments go before the application.
+        """
+        command = build_command('uvicorn', bind='127.0.0.1:9000', extra_args=['--reload'])
+
+        self.assertEqual(command[-1], 'asana_backend.asgi:application')
+        self.assertIn('uvicorn_worker.UvicornWorker', command)
+        self.assertEqual(command[-2], '--reload')
+        self.assertEqual(
+            command[command.index('--bind') + 1], '127.0.0.1:9000'
+        )
+        self.assertEqual(build_command('sync')[-1], 'asana_backend.wsgi:application')
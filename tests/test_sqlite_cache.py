@@ -0,0 +1,99 @@
+"""
+SQLite cache backend tests.
+
+Run tests: python manage.py test tests.test_sqlite_cache
+"""
+
+import multiprocessing
+import os
+import tempfile
+import time
+from unittest import mock
+from django.test import SimpleTestCase
+from asana_backend.utils import sqlite_cache
+from asana_backend.utils.sqlite_cache import SQLiteCache
+
+
+def _bump(path, key, results):
+    cache = SQLiteCache(path, {})
+    cache.set(key, 'from child', None)
+    results.put(cache.get(key))
+
+
+class SQLiteCacheTest(SimpleTestCase):
+    """
+    asana_backend.utils.sqlite_cache
+    """
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'cache.sqlite3')
+
+    def make_cache(self, **options):
+        return SQLiteCache(self.path, {'OPTIONS': options})
+
+    def test_cache_operations(self):
+        """
+        Test Case: get, set, add, touch and delete behave like Django's
+        backends, expired entries included.
+        """
+        cache = self.make_cache()
+
+        cache.set('kept', {'version': 1}, None)
+        self.assertEqual(cache.get('kept'), {'version': 1})
+        self.assertEqual(cache.get('missing', 'default'), 'default')
+        self.assertFalse(cache.add('kept', 'other'))
+
+        cache.set('brief', 1, 0.01)
+        time.sleep(0.02)
+        self.assertIsNone(cache.get('brief'))
+        self.assertFalse(cache.has_key('brief'))
+        self.assertTrue(cache.add('brief', 2))
+        self.assertEqual(cache.get('brief'), 2)
+
+        cache.set_many({'a': 1, 'b': 2}, None)
+        self.assertEqual(cache.get_many(['a', 'b', 'c']), {'a': 1, 'b': 2})
+        self.assertTrue(cache.touch('a', 60))
+        self.assertTrue(cache.delete('a'))
+        self.assertFalse(cache.has_key('a'))
+        cache.clear()
+        self.assertEqual(cache.get_many(['kept', 'b']), {})
+
+    def test_full_cache_drops_least_recently_used(self):
+        """
+        Test Case: past MAX_ENTRIES, entries read recently outlive entries
+        written after them but not read since.
+        """
+        cache = self.make_cache(MAX_ENTRIES=100, CULL_FREQUENCY=4)
+        with mock.patch.multiple(sqlite_cache, TOUCH_SECONDS=0, CHECK_EVERY=1):
+            cache.set_many({f'old:{n}': n for n in range(50)}, None)
+            time.sleep(0.01)
+            cache.set_many({f'new:{n}': n for n in range(50)}, None)
+            time.sleep(0.01)
+            cache.get_many([f'old:{n}' for n in range(10)])
+            for n in range(30):
+                time.sleep(0.001)
+                cache.set(f'extra:{n}', n, None)
+
+        old = cache.get_many([f'old:{n}' for n in range(50)])
+        extra = cache.get_many([f'extra:{n}' for n in range(30)])
+        self.assertEqual(sorted(old), sorted(f'old:{n}' for n in range(10)))
+        self.assertEqual(len(extra), 30)
+
+    def test_cache_is_shared_between_processes(self):
+        """
+        Test Case: an entry set in another process is read here.
+        """
+        cache = self.make_cache()
+        cache.set('version', 'from parent', None)
+
+        results = multiprocessing.get_context('fork').Queue()
+        child = multiprocessing.get_context('fork').Process(
+            target=_bump, args=(self.path, 'version', results)
+        )
+        child.start()
+        child.join()
+
+        self.assertEqual(results.get(), 'from child')
+        self.assertEqual(cache.get('version'), 'from child')
@@ -0,0 +1,166 @@
+"""
+Streamed list response and bulk client limit tests.
+
+Run tests: python manage.py test tests.test_streaming_lists
+"""
+
+import json
+from django.http import StreamingHttpResponse
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.test import APIClient
+from rest_framework import status
+from asana_workspaces.models.workspace import Workspace
+from asana_users.models.user import User
+from asana_projects.models.project import Project
+from asana_tasks.models.task import Task
+from asana_stories.models.story import Story
+from asana_backend.utils.pagination import paginate_queryset
+from asana_backend.utils.streaming import iter_json
+
+BULK_TOKEN = 'bulk-export-token'
+
+
+@override_settings(ASANA_STREAMING={'ITEMS_PER_WRITE': 3})
+class IterJsonTest(SimpleTestCase):
+    """
+    asana_backend.utils.streaming.iter_json
+    """
+
+    def test_iterators_are_written_as_arrays_in_pieces(self):
+        """
+        Test Case: iterator values become JSON arrays written a few items
+        at a time, and callables are evaluated after what precedes them.
+        """
+        read = []
+
+        def rows():
+            for i in range(7):
+                read.append(i)
+                yield {'n': i, 'name': f"Tâche {i}"}
+
+        chunks = list(iter_json({
+            'data': rows(),
+            'next_page': lambda: {'offset': str(len(read))},
+        }))
+
+        self.assertGreater(len(chunks), 3)
+        body = json.loads(b''.join(chunks))
+        self.assertEqual([item['n'] for item in body['data']], list(range(7)))
+        self.assertEqual(body['data'][1]['name'], "Tâche 1")
+        self.assertEqual(body['next_page'], {'offset': '7'})
+
+    def test_empty_iterator(self):
+        """
+        Test Case: an empty iterator is an empty array.
+        """
+        body = json.loads(b''.join(iter_json({'data': iter(()), 'next_page': None})))
+
+        self.assertEqual(body, {'data': [], 'next_page': None})
+
+
+@override_settings(
+    RATELIMIT_ENABLE=False,
+    ASANA_STREAMING={'BULK_CLIENT_TOKENS': [BULK_TOKEN], 'BULK_MAX_LIMIT': 500}
+)
+class StreamingListsTest(TestCase):
+    """
+    GET /tasks/, /projects/, /users/ and /tasks/{gid}/stories/ above MAX_LIMIT
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.workspace = Workspace.objects.create(name="Bulk Workspace")
+        self.tasks = Task.objects.bulk_create([
+            Task(name=f"Task {i}", workspace=self.workspace) for i in range(130)
+        ])
+
+    def _get(self, url, params, token=BULK_TOKEN):
+        headers = {'HTTP_X_BULK_CLIENT_TOKEN': token} if token else {}
+        return self.client.get(url, params, **headers)
+
+    def _stream_body(self, response):
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsInstance(response, StreamingHttpResponse)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        return json.loads(b''.join(response.streaming_content))
+
+    def test_bulk_client_streams_large_task_pages(self):
+        """
+        Test Case: a bulk client asking for 120 tasks gets them streamed with
+        a next_page that leads to the rest.
+        """
+        params = {'workspace': str(self.workspace.gid), 'limit': 120}
+        body = self._stream_body(self._get('/api/1.0/tasks/', params))
+        self.assertEqual(len(body['data']), 120)
+
+        rest = self._get(
+            '/api/1.0/tasks/',
+            dict(params, offset=body['next_page']['offset'])
+        )
+        rest = self._stream_body(rest)
+        self.assertEqual(len(rest['data']), 10)
+        self.assertIsNone(rest['next_page'])
+        self.assertEqual(
+            sorted(task['gid'] for task in body['data'] + rest['data']),
+            sorted(str(task.gid) for task in self.tasks)
+        )
+
+    def test_other_list_endpoints_stream(self):
+        """
+        Test Case: projects, users and task stories stream the same way.
+        """
+        Project.objects.bulk_create([
+            Project(name=f"Project {i}", workspace=self.workspace) for i in range(110)
+        ])
+        User.objects.bulk_create([
+            User(name=f"User {i}", email=f"user{i}@example.com") for i in range(110)
+        ])
+        task = self.tasks[0]
+        Story.objects.bulk_create([
+            Story(task=task, text=f"Comment {i}") for i in range(110)
+        ])
+
+        for url, params in (
+            ('/api/1.0/projects/', {'workspace': str(self.workspace.gid)}),
+            ('/api/1.0/users/', {}),
+            (f'/api/1.0/tasks/{task.gid}/stories/', {}),
+        ):
+            body = self._stream_body(self._get(url, dict(params, limit=200)))
+            self.assertEqual(len(body['data']), 110, url)
+
+    def test_large_pages_need_a_trusted_token(self):
+        """
+        Test Case: without a trusted token, and beyond BULK_MAX_LIMIT, a
+        limit above 100 is still a 400.
+        """
+        for token, limit in ((None, 101), ('guess', 101), (BULK_TOKEN, 501)):
+            response = self._get('/api/1.0/tasks/', {'limit': limit}, token=token)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_normal_pages_are_not_streamed(self):
+        """
+        Test Case: bulk clients asking for a normal page get the usual
+        response, with next_page only when there is one.
+        """
+        response = self._get(
+            '/api/1.0/tasks/',
+            {'workspace': str(self.workspace.gid), 'limit': 100}
+        )
+
+        self.assertNotIsInstance(response, StreamingHttpResponse)
+        self.assertEqual(len(response.json()['data']), 100)
+        self.assertIn('offset', response.json()['next_page'])
+
+    def test_streaming_page_matches_list_page(self):
+        """
+        Test Case: a streamed page yields the same rows and next offset as
+        the list page it replaces.
+        """
+        queryset = Task.objects.all()
+
+        page = paginate_queryset(queryset, 0, 40, ('gid',))
+        streamed = paginate_queryset(queryset, 0, 40, ('gid',), stream=True)
+        self.assertIsNone(streamed.next_offset)
+
+        self.assertEqual(list(streamed), list(page))
+        self.assertEqual(streamed.next_offset, page.next_offset)
@@ -0,0 +1,112 @@
+"""
+Task opt_fields projection tests.
+
+Run tests: python manage.py test tests.test_task_field_projection
+"""
+
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from rest_framework import status
+from asana_workspaces.models.workspace import Workspace
+from asana_users.models.user import User
+from asana_projects.models.project import Project
+from asana_tags.models.tag import Tag
+from asana_tasks.models.task import Task
+from asana_tasks.models.task_project import TaskProject
+from asana_tasks.models.task_tag import TaskTag
+from asana_tasks.models.task_follower import TaskFollower
+
+
+@override_settings(RATELIMIT_ENABLE=False)
+class TaskFieldProjectionTest(TestCase):
+    """
+    GET /api/1.0/tasks/ and GET /api/1.0/tasks/{task_gid}/ with opt_fields
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.workspace = Workspace.objects.create(name="Projection Workspace")
+        self.user = User.objects.create(name="Ada", email="ada@example.com")
+        self.project = Project.objects.create(
+            name="Launch",
+            workspace=self.workspace
+        )
+        self.tag = Tag.objects.create(name="urgent", workspace=self.workspace)
+        self.task = Task.objects.create(
+            name="Write spec",
+            workspace=self.workspace,
+            assignee=self.user,
+            notes="A" * 1000
+        )
+        TaskProject.objects.create(task=self.task, project=self.project)
+        TaskTag.objects.create(task=self.task, tag=self.tag)
+        TaskFollower.objects.create(task=self.task, user=self.user)
+
+    def test_full_task_read_without_opt_fields(self):
+        """
+        Test Case: GET /tasks/{task_gid}/ returns the full record with
+        nested projects, tags and followers in a fixed number of queries.
+        """
+        with self.assertNumQueries(4):
+            response = self.client.get(f'/api/1.0/tasks/{self.task.gid}/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()['data']
+        self.assertEqual(data['name'], 'Write spec')
+        self.assertEqual(data['workspace']['name'], 'Projection Workspace')
+        self.assertEqual(data['assignee']['gid'], str(self.user.gid))
+        self.assertEqual(data['projects'][0]['name'], 'Launch')
+        self.assertEqual(data['tags'][0]['resource_type'], 'tag')
+        self.assertEqual(data['followers'][0]['name'], 'Ada')
+        self.assertIn('notes', data)
+
+    def test_dotted_opt_fields_on_single_task(self):
+        """
+        Test Case: opt_fields=assignee.name,projects.name only returns the
+        requested properties (plus gid).
+        """
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                f'/api/1.0/tasks/{self.task.gid}/',
+                {'opt_fields': 'name,assignee.name,projects.name'}
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['data'], {
+            'gid': str(self.task.gid),
+            'name': 'Write spec',
+            'assignee': {'gid': str(self.user.gid), 'name': 'Ada'},
+            'projects': [{'gid': str(self.project.gid), 'name': 'Launch'}],
+        })
+
+    def test_compact_list_defers_wide_columns(self):
+        """
+        Test Case: GET /tasks/ returns TaskCompact records and does not load
+        notes/html_notes.
+        """
+        response = self.client.get(
+            '/api/1.0/tasks/',
+            {'workspace': str(self.workspace.gid)}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['data'], [{
+            'gid': str(self.task.gid),
+            'resource_type': 'task',
+            'name': 'Write spec',
+            'resource_subtype': 'default_task',
+        }])
+
+        from asana_tasks.storages.storage_implementation import (
+            StorageImplementation
+        )
+        from asana_backend.utils.field_projection import FieldProjection
+        from asana_tasks.utils.task_projection import TASK_PROJECTION_SPEC
+
+        projection = FieldProjection(TASK_PROJECTION_SPEC, 'name,completed')
+        task = StorageImplementation().get_tasks(
+            workspace=str(self.workspace.gid),
+            projection=projection
+        )[0]
+        self.assertIn('notes', task.get_deferred_fields())
+        self.assertIn('html_notes', task.get_deferred_fields())
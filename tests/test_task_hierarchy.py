@@ -0,0 +1,230 @@
+"""
+Task hierarchy closure table tests.
+
+Run tests: python manage.py test tests.test_task_hierarchy
+"""
+
+from unittest import mock
+from django.db import IntegrityError, connection, transaction
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework import status
+from asana_workspaces.models.workspace import Workspace
+from asana_tasks.models.task import Task
+from asana_tasks.models.task_closure import TaskClosure
+from asana_tasks.hierarchy import schema
+from asana_tasks.hierarchy.schema import (
+    install_closure_triggers,
+    uninstall_closure_triggers,
+)
+from asana_tasks.storages.storage_implementation import StorageImplementation
+
+
+@override_settings(RATELIMIT_ENABLE=False)
+class TaskHierarchyTest(TestCase):
+    """
+    TaskClosure triggers, POST /tasks/{task_gid}/setParent/ and the
+    storage hierarchy queries
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.storage = StorageImplementation()
+        self.workspace = Workspace.objects.create(name="Hierarchy Workspace")
+
+    def _chain(self, length, parent=None):
+        tasks = []
+        for i in range(length):
+            parent = Task.objects.create(
+                name=f"Level {i}",
+                workspace=self.workspace,
+                parent=parent
+            )
+            tasks.append(parent)
+        return tasks
+
+    def _closure(self):
+        return set(TaskClosure.objects.values_list('ancestor_id', 'descendant_id', 'depth'))
+
+    def _set_parent(self, task, parent):
+        return self.client.post(
+            f'/api/1.0/tasks/{task.gid}/setParent/',
+            {'data': {'parent': str(parent.gid) if parent else None}},
+            format='json'
+        )
+
+    def test_closure_tracks_creation_and_moves(self):
+        """
+        Test Case: creating a chain records every ancestor pair; moving a
+        subtree re-links all of it under the new parent; detaching it
+        removes the links to the old ancestors.
+        """
+        a, b, c = self._chain(3)
+        d, = self._chain(1, parent=c)
+        other, = self._chain(1)
+        self.assertEqual(self._closure(), {
+            (a.pk, b.pk, 1), (a.pk, c.pk, 2), (a.pk, d.pk, 3),
+            (b.pk, c.pk, 1), (b.pk, d.pk, 2), (c.pk, d.pk, 1),
+        })
+
+        self.storage.set_task_parent(str(c.gid), str(other.gid))
+        self.assertEqual(self._closure(), {
+            (a.pk, b.pk, 1), (c.pk, d.pk, 1),
+            (other.pk, c.pk, 1), (other.pk, d.pk, 2),
+        })
+
+        self.storage.set_task_parent(str(c.gid), None)
+        self.assertEqual(self._closure(), {(a.pk, b.pk, 1), (c.pk, d.pk, 1)})
+
+    def test_set_parent_rejects_cycles_in_constant_queries(self):
+        """
+        Test Case: making a task a subtask of its own descendant is a 400,
+        and the check costs the same at depth 3 and depth 30.
+        """
+        shallow = self._chain(3)
+        deep = self._chain(30)
+
+        def queries(chain):
+            with CaptureQueriesContext(connection) as context:
+                response = self._set_parent(chain[0], chain[-1])
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            return len(context.captured_queries)
+
+        self.assertEqual(queries(shallow), queries(deep))
+        response = self._set_parent(shallow[0], shallow[0])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIsNone(Task.objects.get(pk=deep[0].pk).parent_id)
+
+    def test_database_rejects_cycles(self):
+        """
+        Test Case: a cycle written past the storage check is refused by
+        the guard trigger.
+        """
+        a, b = self._chain(2)
+        with self.assertRaises(IntegrityError):
+            with transaction.atomic():
+                Task.objects.filter(pk=a.pk).update(parent=b)
+
+    def test_set_parent_keeps_num_subtasks(self):
+        """
+        Test Case: moving a task between parents adjusts both parents'
+        num_subtasks.
+        """
+        old_parent, new_parent = self._chain(1) + self._chain(1)
+        child = Task.objects.create(name="Child", workspace=self.workspace)
+        self.assertEqual(self._set_parent(child, old_parent).status_code, status.HTTP_200_OK)
+
+        response = self._set_parent(child, new_parent)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['data']['parent']['gid'], str(new_parent.gid))
+        old_parent.refresh_from_db()
+        new_parent.refresh_from_db()
+        self.assertEqual((old_parent.num_subtasks, new_parent.num_subtasks), (0, 1))
+
+    def test_subtree_and_counts_are_single_queries(self):
+        """
+        Test Case: the whole subtree and the direct/recursive subtask
+        counts each come from one query.
+        """
+        root, child, grandchild = self._chain(3)
+        sibling, = self._chain(1, parent=root)
+
+        with self.assertNumQueries(1):
+            subtree = self.storage.get_subtree(str(root.gid))
+        with self.assertNumQueries(1):
+            counts = self.storage.get_subtask_counts([root.pk, child.pk, grandchild.pk])
+
+        self.assertEqual([task.pk for task in subtree[2:]], [grandchild.pk])
+        self.assertEqual({task.pk for task in subtree[:2]}, {child.pk, sibling.pk})
+        self.assertEqual(counts[str(root.pk)], {'num_subtasks': 2, 'num_descendants': 3})
+        self.assertEqual(counts[str(child.pk)], {'num_subtasks': 1, 'num_descendants': 1})
+        self.assertNotIn(str(grandchild.pk), counts)
+
+    def test_duplicate_copies_deep_trees(self):
+        """
+        Test Case: duplicating a task copies its whole subtask tree in the
+        same number of queries whatever its depth, closure included.
+        """
+        def duplicate(depth):
+            root = self._chain(depth)[0]
+            with CaptureQueriesContext(connection) as context:
+                copy = self.storage.duplicate_task(str(root.gid), "Copy", ['subtasks'])
+            return copy, len(context.captured_queries)
+
+        _, shallow = duplicate(2)
+        copy, deep = duplicate(8)
+
+        self.assertEqual(shallow, deep)
+        self.assertEqual(
+            [task.name for task in self.storage.get_subtree(str(copy.gid))],
+            [f"Level {i}" for i in range(1, 8)]
+        )
+
+    def test_duplicate_under_parent_counts_the_copy(self):
+        """
+        Test Case: duplicating a subtask with 'parent' adds the copy to the
+        parent's num_subtasks, and the parent's cached response shows it.
+        """
+        parent, = self._chain(1)
+        child = Task.objects.create(name="Child", workspace=self.workspace)
+        self._set_parent(child, parent)
+        path = f'/api/1.0/tasks/{parent.gid}/'
+        params = {'opt_fields': 'num_subtasks'}
+        with override_settings(ASANA_OBJECT_CACHE={'SETTLE_SECONDS': 0}):
+            self.assertEqual(self.client.get(path, params).json()['data']['num_subtasks'], 1)
+
+            self.storage.duplicate_task(str(child.gid), "Copy", ['parent'])
+
+            cached = self.client.get(path, params).json()['data']['num_subtasks']
+        parent.refresh_from_db()
+        self.assertEqual(parent.num_subtasks, 2)
+        self.assertEqual(cached, 2)
+        self.assertEqual(Task.objects.filter(parent=parent).count(), 2)
+
+    def test_reinstall_rebuilds_from_parents(self):
+        """
+        Test Case: after the triggers were lost (as in a SQLite table
+        rebuild) reinstalling them rebuilds the closure from parent_id.
+        """
+        uninstall_closure_triggers(connection)
+        a, b, c = self._chain(3)
+        self.assertFalse(TaskClosure.objects.exists())
+
+        install_closure_triggers(connection)
+
+        self.assertEqual(self._closure(), {
+            (a.pk, b.pk, 1), (a.pk, c.pk, 2), (b.pk, c.pk, 1),
+        })
+        c.delete()
+        self.assertEqual(self._closure(), {(a.pk, b.pk, 1)})
+
+    def test_installed_triggers_are_left_alone(self):
+        """
+        Test Case: installing over triggers that are in place does not
+        rebuild the closure.
+        """
+        self._chain(2)
+        TaskClosure.objects.all().delete()
+
+        install_closure_triggers(connection)
+
+        self.assertFalse(TaskClosure.objects.exists())
+
+    def test_failed_install_changes_nothing(self):
+        """
+        Test Case: a rebuild that fails part way leaves the closure as it
+        was and no half-installed triggers behind.
+        """
+        a, b = self._chain(2)
+        uninstall_closure_triggers(connection)
+        failing_rebuild = [*schema.REBUILD, 'SELECT * FROM no_such_table']
+
+        with mock.patch.object(schema, 'REBUILD', failing_rebuild):
+            with self.assertRaises(Exception):
+                install_closure_triggers(connection)
+
+        self.assertEqual(self._closure(), {(a.pk, b.pk, 1)})
+        Task.objects.create(name="Loose", workspace=self.workspace, parent=b)
+        self.assertEqual(self._closure(), {(a.pk, b.pk, 1)})
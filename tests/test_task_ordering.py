@@ -0,0 +1,232 @@
+"""
+Task placement within projects and sections tests.
+
+Run tests: python manage.py test tests.test_task_ordering
+"""
+
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework import status
+from asana_workspaces.models.workspace import Workspace
+from asana_projects.models.project import Project
+from asana_sections.models.section import Section
+from asana_tasks.models.task import Task
+from asana_tasks.models.task_project import TaskProject
+from asana_tasks.ordering import rank_between, spaced_ranks
+from asana_tasks.constants.constants import TASK_RANK_REBALANCE_LENGTH
+from asana_jobs.models.job import Job
+from asana_jobs.storages.storage_implementation import (
+    StorageImplementation as JobStorageImplementation
+)
+from asana_jobs.workers.job_worker import JobWorker
+
+
+class RankTest(SimpleTestCase):
+    """
+    asana_tasks.ordering
+    """
+
+    def test_rank_between_always_finds_room(self):
+        """
+        Test Case: ranks inserted at the front, the back and repeatedly at
+        the same spot stay strictly ordered and never end in '0'.
+        """
+        ranks = [rank_between(None, None)]
+        for _ in range(50):
+            ranks.append(rank_between(ranks[-1], None))
+            ranks.insert(0, rank_between(None, ranks[0]))
+            ranks.insert(1, rank_between(ranks[0], ranks[1]))
+
+        self.assertEqual(ranks, sorted(ranks))
+        self.assertEqual(len(set(ranks)), len(ranks))
+        self.assertFalse(any(rank.endswith('0') for rank in ranks))
+        with self.assertRaises(ValueError):
+            rank_between(ranks[1], ranks[1])
+
+    def test_spaced_ranks_are_short_and_ordered(self):
+        """
+        Test Case: rebalanced ranks are evenly spread and ascending.
+        """
+        ranks = spaced_ranks(1000)
+
+        self.assertEqual(ranks, sorted(ranks))
+        self.assertEqual(len(set(ranks)), 1000)
+        self.assertTrue(all(len(rank) <= 6 for rank in ranks))
+
+
+@override_settings(RATELIMIT_ENABLE=False, ASANA_JOBS={'RUN_IN_PROCESS': False})
+class TaskOrderingTest(TestCase):
+    """
+    POST /tasks/{gid}/addProject/, GET /sections/{gid}/tasks/,
+    GET /tasks/?section= and GET /projects/{gid}/tasks/
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.workspace = Workspace.objects.create(name="Ordering Workspace")
+        self.project = Project.objects.create(name="Board", workspace=self.workspace)
+        self.todo = Section.objects.create(name="To do", project=self.project)
+        self.done = Section.objects.create(name="Done", project=self.project)
+
+    def _make_tasks(self, count, section=None):
+        tasks = []
+        for i in range(count):
+            task = Task.objects.create(name=f"Task {i}", workspace=self.workspace)
+            TaskProject.objects.create(task=task, project=self.project, section=section)
+            tasks.append(task)
+        return tasks
+
+    def _add_project(self, task, **position):
+        return self.client.post(
+            f'/api/1.0/tasks/{task.gid}/addProject/',
+            {'project_gid': str(self.project.gid), **{
+                key: str(value.gid) for key, value in position.items()
+            }},
+            format='json'
+        )
+
+    def _section_gids(self, section):
+        return [
+            task['gid'] for task in self.client.get(
+                f'/api/1.0/sections/{section.gid}/tasks/',
+                {'limit': 100}
+            ).json()['data']
+        ]
+
+    def _gids(self, *tasks):
+        return [str(task.gid) for task in tasks]
+
+    def test_moves_write_only_the_moved_link(self):
+        """
+        Test Case: insert_before / insert_after reorder a section with a
+        single write to the link table.
+        """
+        first, second, third = self._make_tasks(3, section=self.todo)
+
+        with CaptureQueriesContext(connection) as context:
+            response = self._add_project(third, insert_before=first)
+        link_writes = [
+            query for query in context.captured_queries
+            if query['sql'].startswith(('INSERT', 'UPDATE', 'DELETE'))
+            and TaskProject._meta.db_table in query['sql'].split('SET')[0]
+        ]
+        self._add_project(first, insert_after=second)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(link_writes), 1)
+        self.assertEqual(self._section_gids(self.todo), self._gids(third, second, first))
+
+    def test_move_between_sections(self):
+        """
+        Test Case: section= puts a task at the end of that section, and
+        insert_before moves it into the anchor's section.
+        """
+        first, second = self._make_tasks(2, section=self.todo)
+        (closed,) = self._make_tasks(1, section=self.done)
+
+        self._add_project(first, section=self.done)
+        self.assertEqual(self._section_gids(self.done), self._gids(closed, first))
+        self._add_project(second, insert_before=closed)
+
+        self.assertEqual(self._section_gids(self.todo), [])
+        self.assertEqual(
+            self._section_gids(self.done),
+            self._gids(second, closed, first)
+        )
+
+    def test_invalid_positions_are_rejected(self):
+        """
+        Test Case: more than one position, a section of another project and
+        an anchor outside the project are all 400s that change nothing.
+        """
+        (task,) = self._make_tasks(1, section=self.todo)
+        other_project = Project.objects.create(name="Other", workspace=self.workspace)
+        foreign = Section.objects.create(name="Foreign", project=other_project)
+        outsider = Task.objects.create(name="Outsider", workspace=self.workspace)
+
+        for position in (
+            {'section': self.done, 'insert_before': task},
+            {'section': foreign},
+            {'insert_after': outsider},
+        ):
+            response = self._add_project(task, **position)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(TaskProject.objects.get(task=task).section, self.todo)
+
+    def test_section_tasks_page_in_rank_order(self):
+        """
+        Test Case: GET /sections/{gid}/tasks/ and GET /tasks/?section= page
+        through the section in board order.
+        """
+        tasks = self._make_tasks(5, section=self.todo)
+        self._make_tasks(2)
+        self._add_project(tasks[4], insert_before=tasks[0])
+        expected = ['Task 4', 'Task 0', 'Task 1', 'Task 2', 'Task 3']
+
+        names, url, params = [], f'/api/1.0/sections/{self.todo.gid}/tasks/', {'limit': 2}
+        while True:
+            body = self.client.get(url, params).json()
+            names.extend(task['name'] for task in body['data'])
+            if not body.get('next_page'):
+                break
+            params = {'limit': 2, 'offset': body['next_page']['offset']}
+        self.assertEqual(names, expected)
+
+        response = self.client.get('/api/1.0/tasks/', {'section': str(self.todo.gid)})
+        self.assertEqual([task['name'] for task in response.json()['data']], expected)
+
+    def test_project_tasks_page_section_by_section(self):
+        """
+        Test Case: project tasks are listed grouped by section, in rank
+        order within each, across page boundaries.
+        """
+        self._make_tasks(3, section=self.done)
+        self._make_tasks(3)
+        self._make_tasks(3, section=self.todo)
+        expected = [
+            (link.section_id, link.task.name)
+            for link in TaskProject.objects.filter(project=self.project)
+            .select_related('task').order_by('section_id', 'rank', 'gid')
+        ]
+
+        seen, params = [], {'limit': 4}
+        while True:
+            body = self.client.get(
+                f'/api/1.0/projects/{self.project.gid}/tasks/', params
+            ).json()
+            seen.extend(task['gid'] for task in body['data'])
+            if not body.get('next_page'):
+                break
+            params = {'limit': 4, 'offset': body['next_page']['offset']}
+
+        self.assertEqual(len(seen), 9)
+        sections = [
+            TaskProject.objects.get(task_id=gid, project=self.project).section_id
+            for gid in seen
+        ]
+        self.assertEqual(sections, [section for section, _ in expected])
+
+    def test_crowded_spot_is_rebalanced_in_the_background(self):
+        """
+        Test Case: inserting again and again at one spot queues a rebalance
+        job; running it shortens the ranks and keeps the order.
+        """
+        first, second = self._make_tasks(2, section=self.todo)
+        movers = self._make_tasks(80, section=self.done)
+        for mover in movers:
+            self._add_project(mover, insert_before=second)
+        order = self._section_gids(self.todo)
+
+        job = Job.objects.get(resource_subtype='rebalance_task_ranks')
+        self.assertEqual(job.params['section_gid'], str(self.todo.gid))
+        JobWorker(JobStorageImplementation()).run_pending()
+
+        self.assertEqual(self._section_gids(self.todo), order)
+        self.assertEqual(order, self._gids(first, *movers, second))
+        self.assertTrue(all(
+            len(rank) <= TASK_RANK_REBALANCE_LENGTH
+            for rank in TaskProject.objects.filter(section=self.todo)
+            .values_list('rank', flat=True)
+        ))
@@ -0,0 +1,150 @@
+"""
+Full-text task search tests.
+
+Run tests: python manage.py test tests.test_task_search
+"""
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from rest_framework import status
+from asana_workspaces.models.workspace import Workspace
+from asana_tasks.models.task import Task
+
+
+@override_settings(RATELIMIT_ENABLE=False)
+class TaskSearchTest(TestCase):
+    """
+    GET /api/1.0/workspaces/{workspace_gid}/tasks/search/
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.workspace = Workspace.objects.create(name="Search Workspace")
+        self.url = f'/api/1.0/workspaces/{self.workspace.gid}/tasks/search/'
+
+    def _task(self, name, notes='', **kwargs):
+        return Task.objects.create(
+            name=name,
+            notes=notes,
+            workspace=self.workspace,
+            **kwargs
+        )
+
+    def _search(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()
+
+    def _names(self, **params):
+        return [task['name'] for task in self._search(**params)['data']]
+
+    def test_ranked_prefix_search(self):
+        """
+        Test Case: every word must match, the last one by prefix, and name
+        matches rank above notes matches.
+        """
+        self._task("Quarterly report", notes="Numbers for the board")
+        self._task("Board meeting", notes="Prepare the quarterly numbers")
+        self._task("Unrelated", notes="Nothing to see")
+
+        self.assertEqual(self._names(text='quart'), ["Quarterly report", "Board meeting"])
+        self.assertEqual(self._names(text='BOARD'), ["Board meeting", "Quarterly report"])
+        self.assertEqual(len(self._names(text='board quar')), 2)
+        self.assertEqual(self._names(text='quar board'), [])
+        self.assertEqual(self._names(text='quarterly missing'), [])
+        self.assertEqual(self._names(text='!!!'), [])
+
+    def test_index_follows_saves_and_deletes(self):
+        """
+        Test Case: renamed tasks are found under the new name only, deleted
+        and bulk-updated tasks are reindexed too.
+        """
+        task = self._task("Draft plan")
+        other = self._task("Other")
+        task.name = "Final plan"
+        task.save()
+        Task.objects.filter(pk=other.pk).update(notes="mentions the plan")
+
+        self.assertEqual(self._names(text='draft'), [])
+        self.assertEqual(self._names(text='plan'), ["Final plan", "Other"])
+
+        task.delete()
+        self.assertEqual(self._names(text='plan'), ["Other"])
+
+    def test_search_is_scoped_and_filtered(self):
+        """
+        Test Case: results are limited to the workspace and to the other
+        filters given.
+        """
+        self._task("Release notes", completed=True)
+        self._task("Release checklist")
+        Task.objects.create(
+            name="Release elsewhere",
+            workspace=Workspace.objects.create(name="Other Workspace")
+        )
+
+        self.assertEqual(
+            sorted(self._names(text='release')),
+            ["Release checklist", "Release notes"]
+        )
+        self.assertEqual(
+            self._names(text='release', completed='false'),
+            ["Release checklist"]
+        )
+
+    def test_results_page_with_offset_tokens(self):
+        """
+        Test Case: results page through next_page offset tokens without
+        repeats.
+        """
+        for i in range(5):
+            self._task(f"Invoice {i}")
+
+        first = self._search(text='invoice', limit=2)
+        self.assertEqual(len(first['data']), 2)
+        seen = [task['gid'] for task in first['data']]
+        offset = first['next_page']['offset']
+        while offset:
+            page = self._search(text='invoice', limit=2, offset=offset)
+            seen += [task['gid'] for task in page['data']]
+            offset = (page.get('next_page') or {}).get('offset')
+
+        self.assertEqual(len(seen), 5)
+        self.assertEqual(len(set(seen)), 5)
+
+    def test_text_search_uses_fts_index(self):
+        """
+        Test Case: on SQLite the text match is answered by the FTS5 index,
+        not a scan of the task table.
+        """
+        if connection.vendor != 'sqlite':
+            self.skipTest("FTS5 plan check is SQLite specific")
+        from asana_tasks.search import get_search_backend
+        queryset = get_search_backend().search(
+            Task.objects.filter(workspace=self.workspace),
+            ['plan']
+        )
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+            plan = ' '.join(str(row[-1]) for row in cursor.fetchall())
+
+        self.assertIn('VIRTUAL TABLE INDEX', plan)
+        self.assertIn('SEARCH asana_tasks_task USING INTEGER PRIMARY KEY', plan)
+
+    def test_lost_triggers_are_reinstalled(self):
+        """
+        Test Case: when a table rebuild drops the index triggers, installing
+        the index again restores them and reindexes existing tasks.
+        """
+        if connection.vendor != 'sqlite':
+            self.skipTest("Trigger repair is SQLite specific")
+        from asana_tasks.search.schema import install_search_index
+        with connection.cursor() as cursor:
+            cursor.execute('DROP TRIGGER asana_tasks_task_fts_insert')
+        self._task("Written while unindexed")
+
+        install_search_index(connection)
+
+        self.assertEqual(self._names(text='unindexed'), ["Written while unindexed"])
@@ -0,0 +1,182 @@
+"""
+Typeahead tests.
+
+Run tests: python manage.py test tests.test_typeahead
+"""
+
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from rest_framework import status
+from asana_workspaces.models.workspace import Workspace
+from asana_users.models.user import User
+from asana_users.models.user_workspace_membership import UserWorkspaceMembership
+from asana_projects.models.project import Project
+from asana_tasks.models.task import Task
+from asana_tasks.storages.storage_implementation import (
+    StorageImplementation as TaskStorageImplementation
+)
+from asana_typeahead.index.registry import (
+    TypeaheadIndexRegistry,
+    get_index_registry,
+)
+
+
+@override_settings(RATELIMIT_ENABLE=False)
+class TypeaheadTest(TestCase):
+    """
+    GET /api/1.0/workspaces/{workspace_gid}/typeahead
+    """
+
+    def setUp(self):
+        get_index_registry().clear()
+        self.client = APIClient()
+        self.workspace = Workspace.objects.create(name="Typeahead Workspace")
+        self.other_workspace = Workspace.objects.create(name="Other Workspace")
+        self.url = f'/api/1.0/workspaces/{self.workspace.gid}/typeahead'
+
+    def _names(self, resource_type, query='', **params):
+        response = self.client.get(
+            self.url,
+            {'resource_type': resource_type, 'query': query, **params}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [result['name'] for result in response.json()['data']]
+
+    def _task(self, name, workspace=None):
+        return Task.objects.create(name=name, workspace=workspace or self.workspace)
+
+    def test_word_prefix_matching_and_order(self):
+        """
+        Test Case: results have a word starting with each query word;
+        names starting with the query come first, then shorter names.
+        """
+        for name in ["Fix login bug", "Login page redesign", "Logistics review", "Unrelated"]:
+            self._task(name)
+        self._task("Login elsewhere", workspace=self.other_workspace)
+
+        self.assertEqual(
+            self._names('task', 'log'),
+            ["Logistics review", "Login page redesign", "Fix login bug"]
+        )
+        self.assertEqual(self._names('task', 'bug LOG'), ["Fix login bug"])
+        self.assertEqual(len(self._names('task', '', count=2)), 2)
+        self.assertEqual(self._names('task', 'nothing'), [])
+
+    def test_best_match_sorting_late_in_the_vocabulary_is_found(self):
+        """
+        Test Case: a name starting with the query is returned even when
+        more than count other names have a matching word that sorts before
+        its own.
+        """
+        for name in ["Fix deal", "Code debug", "Review decks"]:
+            self._task(name)
+        self._task("Design")
+
+        self.assertEqual(self._names('task', 'de', count=2), ["Design", "Fix deal"])
+
+    def test_keystrokes_do_not_query_the_index_tables(self):
+        """
+        Test Case: once built, lookups only check the workspace exists.
+        """
+        self._task("Quarterly planning")
+        self._names('task', 'q')
+
+        with self.assertNumQueries(1):
+            self.assertEqual(self._names('task', 'qua'), ["Quarterly planning"])
+
+    def test_index_follows_committed_changes(self):
+        """
+        Test Case: created, renamed, moved and deleted objects are reflected
+        in a loaded index once their transaction commits.
+        """
+        task = self._task("Draft roadmap")
+        project = Project.objects.create(name="Roadmap", workspace=self.workspace)
+        self._names('task', 'road')
+        self._names('project', 'road')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self._task("Roadmap review")
+            task.name = "Final roadmap"
+            task.save()
+            project.workspace = self.other_workspace
+            project.save()
+        self.assertEqual(self._names('task', 'draft'), [])
+        self.assertEqual(
+            sorted(self._names('task', 'road')),
+            ["Final roadmap", "Roadmap review"]
+        )
+        self.assertEqual(self._names('project', 'road'), [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            task.delete()
+        self.assertEqual(self._names('task', 'road'), ["Roadmap review"])
+
+    def test_users_are_scoped_by_membership(self):
+        """
+        Test Case: user typeahead returns members of the workspace, and
+        follows memberships and renames.
+        """
+        ada = User.objects.create(name="Ada Lovelace", email="ada@example.com")
+        alan = User.objects.create(name="Alan Turing", email="alan@example.com")
+        UserWorkspaceMembership.objects.create(user=ada, workspace=self.workspace)
+        UserWorkspaceMembership.objects.create(user=alan, workspace=self.other_workspace)
+        self.assertEqual(self._names('user', 'a'), ["Ada Lovelace"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            UserWorkspaceMembership.objects.create(user=alan, workspace=self.workspace)
+            ada.name = "Augusta Ada King"
+            ada.save()
+        self.assertEqual(self._names('user', 'a'), ["Alan Turing", "Augusta Ada King"])
+
+    def test_duplicated_tasks_are_indexed(self):
+        """
+        Test Case: tasks copied with bulk_create are added to loaded
+        indexes too.
+        """
+        original = self._task("Template checklist")
+        self._names('task', 'check')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            TaskStorageImplementation().duplicate_task(
+                str(original.gid), "Copied checklist", []
+            )
+
+        self.assertEqual(
+            self._names('task', 'check'),
+            ["Copied checklist", "Template checklist"]
+        )
+
+    def test_registry_evicts_least_recently_used(self):
+        """
+        Test Case: the registry keeps at most max_indexes indexes, dropping
+        the least recently used.
+        """
+        registry = TypeaheadIndexRegistry(max_indexes=2)
+        first = registry.get_index(str(self.workspace.gid), 'task')
+        registry.get_index(str(self.workspace.gid), 'tag')
+        registry.get_index(str(self.workspace.gid), 'task')
+        registry.get_index(str(self.other_workspace.gid), 'task')
+
+        self.assertIs(registry.get_index(str(self.workspace.gid), 'task'), first)
+        with self.assertNumQueries(1):
+            registry.get_index(str(self.workspace.gid), 'tag')
+
+    def test_invalid_requests(self):
+        """
+        Test Case: a missing or unknown resource_type or bad count is a
+        400, an unknown workspace a 404.
+        """
+        self.assertEqual(self.client.get(self.url).status_code, 400)
+        self.assertEqual(
+            self.client.get(self.url, {'resource_type': 'goal'}).status_code,
+            400
+        )
+        self.assertEqual(
+            self.client.get(self.url, {'resource_type': 'task', 'count': 101}).status_code,
+            400
+        )
+        response = self.client.get(
+            '/api/1.0/workspaces/00000000-0000-0000-0000-000000000000/typeahead',
+            {'resource_type': 'task'}
+        )
+        self.assertEqual(response.status_code, 404)
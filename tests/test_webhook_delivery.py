@@ -0,0 +1,368 @@
+"""
+Webhook delivery engine tests.
+
+Run tests: python manage.py test tests.test_webhook_delivery
+"""
+
+import hashlib
+import hmac
+import json
+import threading
+import time
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from asana_workspaces.models.workspace import Workspace
+from asana_projects.models.project import Project
+from asana_tasks.models.task import Task
+from asana_tasks.models.task_project import TaskProject
+from asana_webhooks.models.webhook import Webhook
+from asana_webhooks.models.webhook_dead_letter import WebhookDeadLetter
+from asana_webhooks.storages.storage_implementation import StorageImplementation
+from asana_webhooks.delivery.engine import WebhookDeliveryEngine
+from asana_webhooks.delivery.subscription_index import SubscriptionIndex
+from asana_webhooks.constants.constants import (
+    MAX_DELIVERY_ATTEMPTS,
+    SIGNATURE_HEADER,
+)
+
+
+class _TargetServer(ThreadingHTTPServer):
+    """Local webhook target recording each POST and answering ``status``."""
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), _TargetHandler)
+        self.status = 200
+        self.received = []
+
+    @property
+    def url(self):
+        return f'http://127.0.0.1:{self.server_address[1]}/hook'
+
+
+class _TargetHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        self.server.received.append((dict(self.headers), body))
+        self.send_response(self.server.status)
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'ok')
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _DeliveryTestMixin:
+    """A webhook on a project, posting to a local target."""
+
+    def setUp(self):
+        self.server = _TargetServer()
+        self.server_thread = threading.Thread(target=self.server.serve_forever)
+        self.server_thread.start()
+        self.engine = WebhookDeliveryEngine(StorageImplementation(), workers=4)
+
+        self.workspace = Workspace.objects.create(name="Webhook Workspace")
+        self.project = Project.objects.create(name="Project", workspace=self.workspace)
+        self.webhook = Webhook.objects.create(
+            resource='project',
+            resource_gid=str(self.project.gid),
+            target=self.server.url,
+            secret='shh'
+        )
+
+    def tearDown(self):
+        self.engine.close()
+        self.server.shutdown()
+        self.server.server_close()
+        self.server_thread.join()
+
+    def _add_tasks(self, count):
+        for i in range(count):
+            task = Task.objects.create(name=f"Task {i}", workspace=self.workspace)
+            TaskProject.objects.create(task=task, project=self.project)
+
+    def _payloads(self):
+        return [json.loads(body) for _, body in self.server.received]
+
+    def _make_due(self):
+        Webhook.objects.filter(gid=self.webhook.gid).update(
+            next_attempt_after=timezone.now() - timedelta(seconds=1)
+        )
+
+class WebhookDeliveryTest(_DeliveryTestMixin, TestCase):
+    """
+    asana_webhooks.delivery.engine.WebhookDeliveryEngine
+    """
+
+    def test_events_are_batched_and_signed(self):
+        """
+        Test Case: several events for one webhook go out in a single POST
+        signed with HMAC-SHA256 of the body, and the cursor moves past them.
+        """
+        self._add_tasks(3)
+
+        self.engine.run_once()
+
+        self.assertEqual(len(self.server.received), 1)
+        headers, body = self.server.received[0]
+        self.assertEqual(
+            headers[SIGNATURE_HEADER],
+            hmac.new(b'shh', body, hashlib.sha256).hexdigest()
+        )
+        events = json.loads(body)['events']
+        # Each task is created, then added to the project
+        self.assertEqual([event['action'] for event in events], ['added'] * 6)
+        self.assertEqual(
+            [event['parent'] and event['parent']['gid'] for event in events[1::2]],
+            [str(self.project.gid)] * 3
+        )
+
+        self.webhook.refresh_from_db()
+        self.assertIsNotNone(self.webhook.last_success_at)
+        self.engine.run_once()
+        self.assertEqual(len(self.server.received), 1)
+
+    def test_large_backlog_is_split_into_ordered_posts(self):
+        """
+        Test Case: more than 100 pending events are sent as consecutive
+        POSTs of at most 100 events each, in journal order.
+        """
+        self._add_tasks(75)
+
+        self.engine.run_once()
+
+        batches = [payload['events'] for payload in self._payloads()]
+        self.assertEqual([len(batch) for batch in batches], [100, 50])
+        sequences = [event['created_at'] for batch in batches for event in batch]
+        self.assertEqual(sequences, sorted(sequences))
+        self.assertEqual(self.engine.metrics.snapshot()['events_delivered'], 150)
+
+    def test_new_webhook_skips_earlier_events(self):
+        """
+        Test Case: a webhook created after some events only receives the
+        events that happen later; unrelated events are not sent to it.
+        """
+        self._add_tasks(2)
+        self.engine.run_once()
+        other = Project.objects.create(name="Other", workspace=self.workspace)
+        late = Webhook.objects.create(
+            resource='project',
+            resource_gid=str(other.gid),
+            target=self.server.url + '/late',
+            secret='late'
+        )
+        task = Task.objects.create(name="Late task", workspace=self.workspace)
+        TaskProject.objects.create(task=task, project=other)
+
+        self.engine.run_once()
+
+        self.assertEqual(len(self.server.received), 2)
+        events = self._payloads()[1]['events']
+        self.assertEqual(
+            [(event['resource']['gid'], event['action']) for event in events],
+            [(str(task.gid), 'added')] * 2
+        )
+        late.refresh_from_db()
+        self.webhook.refresh_from_db()
+        self.assertEqual(late.last_event_sequence, self.webhook.last_event_sequence)
+
+    def test_failures_back_off_then_dead_letter(self):
+        """
+        Test Case: a non-2xx response keeps the cursor, records the failure
+        and backs off; after the last attempt the payload is dead-lettered
+        and delivery carries on with later events.
+        """
+        self.server.status = 500
+        self._add_tasks(1)
+        cursor = Webhook.objects.get(gid=self.webhook.gid).last_event_sequence
+
+        self.engine.run_once()
+        self.webhook.refresh_from_db()
+        self.assertEqual(self.webhook.delivery_retry_count, 1)
+        self.assertEqual(self.webhook.last_event_sequence, cursor)
+        self.assertTrue(self.webhook.last_failure_content.startswith('500'))
+        self.assertGreater(self.webhook.next_attempt_after, timezone.now())
+
+        # Backing off: nothing is sent
+        self.engine.run_once()
+        self.assertEqual(len(self.server.received), 1)
+
+        for _ in range(MAX_DELIVERY_ATTEMPTS - 1):
+            self._make_due()
+            self.engine.run_once()
+        self.assertEqual(len(self.server.received), MAX_DELIVERY_ATTEMPTS)
+
+        dead_letter = WebhookDeadLetter.objects.get(webhook=self.webhook)
+        self.assertEqual(dead_letter.attempts, MAX_DELIVERY_ATTEMPTS)
+        self.assertEqual(dead_letter.last_status_code, 500)
+        self.assertEqual(len(dead_letter.payload['events']), 2)
+        self.webhook.refresh_from_db()
+        self.assertEqual(self.webhook.delivery_retry_count, 0)
+        self.assertEqual(self.webhook.last_event_sequence, dead_letter.last_event_sequence)
+
+        self.server.status = 204
+        self._add_tasks(1)
+        self.engine.run_once()
+        self.assertEqual(len(self._payloads()[-1]['events']), 2)
+        self.assertEqual(self.engine.metrics.snapshot()['dead_lettered'], 1)
+
+    def test_unreachable_target_counts_as_failure(self):
+        """
+        Test Case: a connection error is recorded like a failed response.
+        """
+        Webhook.objects.filter(gid=self.webhook.gid).update(
+            target='http://127.0.0.1:9/unreachable'
+        )
+        self._add_tasks(1)
+
+        self.engine.run_once()
+
+        self.webhook.refresh_from_db()
+        self.assertEqual(self.webhook.delivery_retry_count, 1)
+        self.assertEqual(self.engine.metrics.snapshot()['failed'], 1)
+
+    def test_idle_round_does_not_load_webhooks(self):
+        """
+        Test Case: a round without new journal entries costs the same few
+        queries however many webhooks there are, and loads none of them.
+        """
+        def idle_round():
+            with CaptureQueriesContext(connection) as context:
+                self.assertEqual(self.engine.run_once(), 0)
+            return len(context.captured_queries)
+
+        self.engine.run_once()
+        few = idle_round()
+        Webhook.objects.bulk_create([
+            Webhook(
+                resource='project',
+                resource_gid=str(self.project.gid),
+                target=self.server.url,
+                secret='shh',
+                last_event_sequence=self.webhook.last_event_sequence
+            )
+            for _ in range(50)
+        ])
+        self.engine.run_once()
+
+        with mock.patch.object(
+            StorageImplementation, 'get_due_webhooks'
+        ) as get_due_webhooks:
+            self.assertEqual(idle_round(), few)
+        get_due_webhooks.assert_not_called()
+
+    def test_index_follows_other_processes(self):
+        """
+        Test Case: webhooks deactivated by another process leave the
+        engine's index on its next round, deleted ones on the next
+        reconcile.
+        """
+        index = SubscriptionIndex()
+        engine = WebhookDeliveryEngine(StorageImplementation(), workers=1, index=index)
+        self.addCleanup(engine.close)
+        other = Webhook.objects.create(
+            resource='project',
+            resource_gid=str(self.project.gid),
+            target=self.server.url,
+            secret='shh'
+        )
+        engine.run_once()
+        self.assertEqual(len(index), 2)
+
+        # The engine's own index is not fed by this process's signals, so
+        # these writes look to it like another process's
+        Webhook.objects.filter(gid=other.gid).update(
+            active=False, updated_at=timezone.now()
+        )
+        engine.run_once()
+        self.assertEqual(len(index), 1)
+
+        Webhook.objects.filter(gid=self.webhook.gid).delete()
+        engine.run_once()
+        self.assertEqual(len(index), 1)
+        with mock.patch(
+            'asana_webhooks.delivery.engine.INDEX_RECONCILE_SECONDS', 0
+        ):
+            engine.run_once()
+        self.assertEqual(len(index), 0)
+
+
+class WebhookJournalOrderTest(_DeliveryTestMixin, TransactionTestCase):
+    """
+    WebhookDeliveryEngine under concurrent journal writers
+    """
+
+    def tearDown(self):
+        # The flush after each test may empty the task table before the
+        # link table, and the task count triggers cannot uncount a link
+        # whose task is gone
+        TaskProject.objects.all().delete()
+        super().tearDown()
+
+    def test_event_committed_late_is_delivered(self):
+        """
+        Test Case: while one transaction holds its journal entries, rounds
+        run as another writer commits; the cursor never passes the held
+        entries, which are delivered once they commit.
+        """
+        gids = {}
+        first_wrote = threading.Event()
+        second_started = threading.Event()
+        errors = []
+
+        def add_task(name):
+            with transaction.atomic():
+                task = Task.objects.create(name=name, workspace=self.workspace)
+                TaskProject.objects.create(task=task, project=self.project)
+            gids[name] = str(task.gid)
+
+        def first_writer():
+            try:
+                with transaction.atomic():
+                    add_task("First")
+                    first_wrote.set()
+                    second_started.wait(5)
+                    # Leave the second writer time to commit ahead of us
+                    time.sleep(0.3)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                first_wrote.set()
+                connection.close()
+
+        def second_writer():
+            try:
+                first_wrote.wait(5)
+                second_started.set()
+                add_task("Second")
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connection.close()
+
+        threads = [
+            threading.Thread(target=first_writer),
+            threading.Thread(target=second_writer),
+        ]
+        for thread in threads:
+            thread.start()
+        while any(thread.is_alive() for thread in threads):
+            self.engine.run_once()
+            time.sleep(0.01)
+        for thread in threads:
+            thread.join()
+        self.engine.run_once()
+
+        delivered = [
+            event['resource']['gid']
+            for payload in self._payloads()
+            for event in payload['events']
+            if event['parent'] and event['parent']['gid'] == str(self.project.gid)
+        ]
+        self.assertEqual(errors, [])
+        self.assertEqual(delivered, [gids["First"], gids["Second"]])
@@ -0,0 +1,163 @@
+"""
+Webhook subscription index tests.
+
+Run tests: python manage.py test tests.test_webhook_subscriptions
+"""
+
+from unittest import mock
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+from asana_workspaces.models.workspace import Workspace
+from asana_projects.models.project import Project
+from asana_tasks.models.task import Task
+from asana_tasks.models.task_project import TaskProject
+from asana_stories.models.story import Story
+from asana_events.models.event import Event
+from asana_webhooks.models.webhook import Webhook
+from asana_webhooks.storages.storage_implementation import StorageImplementation
+from asana_webhooks.delivery.routing import route_events
+from asana_webhooks.delivery.subscription_index import (
+    Subscription,
+    SubscriptionIndex,
+    get_subscription_index,
+)
+
+
+class WebhookSubscriptionIndexTest(TestCase):
+    """
+    asana_webhooks.delivery.subscription_index and its use in routing
+    """
+
+    def setUp(self):
+        self.storage = StorageImplementation()
+        self.workspace = Workspace.objects.create(name="Index Workspace")
+        self.project = Project.objects.create(name="Project", workspace=self.workspace)
+        self.task = Task.objects.create(name="Task", workspace=self.workspace)
+        TaskProject.objects.create(task=self.task, project=self.project)
+
+    def _webhook(self, resource, resource_gid, filters=None):
+        return Webhook.objects.create(
+            resource=resource,
+            resource_gid=str(resource_gid),
+            target='https://example.com/hook',
+            secret='shh',
+            filters=filters or []
+        )
+
+    def _route(self, webhooks, events):
+        index = SubscriptionIndex()
+        index.sync(webhooks)
+        return {
+            webhook.resource_gid: [event.resource_type for event in routed]
+            for webhook, routed in route_events(webhooks, events, index, self.storage).items()
+        }
+
+    def test_events_match_resource_and_ancestors(self):
+        """
+        Test Case: a story on a task reaches webhooks on the task, on the
+        task's project and on the workspace, but not on another project.
+        """
+        other = Project.objects.create(name="Other", workspace=self.workspace)
+        webhooks = [
+            self._webhook('task', self.task.gid),
+            self._webhook('project', self.project.gid),
+            self._webhook('workspace', self.workspace.gid),
+            self._webhook('project', other.gid),
+        ]
+        Story.objects.create(task=self.task, text="Comment")
+        story_event = Event.objects.filter(resource_type='story').get()
+
+        with self.assertNumQueries(1):
+            routed = self._route(webhooks, [story_event])
+
+        self.assertEqual(routed, {
+            str(self.task.gid): ['story'],
+            str(self.project.gid): ['story'],
+            str(self.workspace.gid): ['story'],
+        })
+
+    def test_filters_narrow_matches(self):
+        """
+        Test Case: a webhook with filters only gets events matching one of
+        them.
+        """
+        webhook = self._webhook(
+            'project',
+            self.project.gid,
+            filters=[{'resource_type': 'task', 'action': 'changed'}]
+        )
+        self.task.name = "Renamed"
+        self.task.save()
+        Story.objects.create(task=self.task, text="Comment")
+        events = list(Event.objects.filter(sequence__gt=webhook.last_event_sequence))
+
+        self.assertEqual(self._route([webhook], events), {str(self.project.gid): ['task']})
+
+    def test_filters_are_validated(self):
+        """
+        Test Case: filters with unknown keys are rejected.
+        """
+        with self.assertRaises(ValidationError):
+            self._webhook('task', self.task.gid, filters=[{'fields': ['name']}])
+
+    def test_index_follows_webhook_saves_and_deletes(self):
+        """
+        Test Case: saving, deactivating and deleting a webhook update the
+        process index.
+        """
+        index = get_subscription_index()
+        webhook = self._webhook('task', self.task.gid)
+        event = Event(resource_gid=str(self.task.gid), resource_type='task', action='changed')
+        self.assertIn(str(webhook.gid), index.match(event))
+
+        webhook.resource_gid = str(self.project.gid)
+        webhook.save()
+        self.assertNotIn(str(webhook.gid), index.match(event))
+
+        webhook.resource_gid = str(self.task.gid)
+        webhook.active = False
+        webhook.save()
+        self.assertNotIn(str(webhook.gid), index.match(event))
+
+        webhook.active = True
+        webhook.save()
+        webhook.delete()
+        self.assertNotIn(str(webhook.gid), index.match(event))
+
+    def test_sync_drops_inactive_and_deleted_webhooks(self):
+        """
+        Test Case: syncing rows that came back inactive drops them; a
+        complete sync also drops webhooks that no longer exist.
+        """
+        index = SubscriptionIndex()
+        kept = self._webhook('task', self.task.gid)
+        paused = self._webhook('task', self.task.gid)
+        deleted = self._webhook('project', self.project.gid)
+        index.sync([kept, paused, deleted])
+        self.assertEqual(len(index), 3)
+
+        paused.active = False
+        index.sync([paused])
+        event = Event(resource_gid=str(self.task.gid), resource_type='task', action='changed')
+        self.assertEqual(index.match(event), {str(kept.gid)})
+
+        index.sync([kept], complete=True)
+        self.assertEqual(len(index), 1)
+        self.assertEqual(index.match(event), {str(kept.gid)})
+
+    def test_match_cost_does_not_grow_with_index_size(self):
+        """
+        Test Case: matching looks at the subscribed hooks only, not every
+        indexed webhook.
+        """
+        index = SubscriptionIndex()
+        for i in range(10000):
+            index.add(Subscription(webhook_gid=f'hook-{i}', resource_gid=f'resource-{i}'))
+        index.add(Subscription(webhook_gid='mine', resource_gid=str(self.task.gid)))
+        event = Event(resource_gid=str(self.task.gid), resource_type='task', action='changed')
+
+        with mock.patch.object(
+            Subscription, 'accepts', autospec=True, return_value=True
+        ) as accepts:
+            self.assertEqual(index.match(event), {'mine'})
+        self.assertEqual(accepts.call_count, 1)